@@ -0,0 +1,375 @@
+# asset_bundle.py
+"""
+사전 빌드 에셋 번들 - 해상도별로 미리 스케일한 원시 픽셀 묶음
+
+대형 JPG/PNG (배경은 최대 6000x4000)를 매번 디코딩/스케일하지 않도록,
+오프라인에서 목표 해상도로 스케일한 픽셀을 하나의 파일(images.bin)에 이어 쓰고
+index.json에 (원본, 크기, 스케일 방식) → (오프셋, 길이, 포맷)을 기록합니다.
+
+런타임에는 images.bin을 mmap 하여 pygame.image.frombuffer()로 디코딩 없이 Surface를
+만들고 convert 합니다. 원본 파일의 mtime/크기가 인덱스와 다르면(stale) 번들을 쓰지 않고
+원본 파일 로드로 폴백합니다.
+
+빌드:
+    python asset_bundle.py --size 1920x1080
+    → assets/bundles/1920x1080/{index.json, images.bin}
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import pygame
+
+import config
+
+
+PathLike = Union[str, Path]
+
+BUNDLE_FORMAT_VERSION = 1
+INDEX_FILENAME = "index.json"
+DATA_FILENAME = "images.bin"
+
+# 엔트리 시작 오프셋 정렬 (바이트)
+_ALIGNMENT = 64
+
+IMAGE_PATTERNS = ("*.jpg", "*.jpeg", "*.png")
+
+
+def _project_root() -> Path:
+    """에셋 상대 경로의 기준 (assets 폴더의 상위)"""
+    return config.ASSET_DIR.resolve().parent
+
+
+def source_key(path: PathLike) -> str:
+    """원본 경로 → 인덱스 키용 상대 경로 (posix)"""
+    resolved = Path(path).resolve()
+    try:
+        return resolved.relative_to(_project_root()).as_posix()
+    except ValueError:
+        return resolved.as_posix()
+
+
+def entry_key(path: PathLike, size: Tuple[int, int], smooth: bool) -> str:
+    """인덱스 엔트리 키 (원본|WxH|scale 방식)"""
+    return f"{source_key(path)}|{int(size[0])}x{int(size[1])}|{'smooth' if smooth else 'fast'}"
+
+
+def bundle_dir_for(screen_size: Tuple[int, int]) -> Path:
+    """해상도별 번들 폴더"""
+    return config.ASSET_BUNDLE_DIR / f"{int(screen_size[0])}x{int(screen_size[1])}"
+
+
+class AssetBundle:
+    """
+    해상도별 이미지 번들 (읽기 전용, mmap)
+
+    load()가 None을 반환하면 호출 측은 기존처럼 원본 파일을 로드합니다.
+    """
+
+    def __init__(self, bundle_dir: PathLike):
+        self.bundle_dir = Path(bundle_dir)
+        self.entries: Dict[str, dict] = {}
+        self.screen_size: Optional[Tuple[int, int]] = None
+
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._stale_sources = set()
+
+        self.stats = {"hits": 0, "misses": 0, "stale": 0}
+
+    @property
+    def is_open(self) -> bool:
+        return self._view is not None
+
+    def open(self) -> bool:
+        """인덱스 읽기 + 데이터 파일 mmap (실패 시 False)"""
+        index_path = self.bundle_dir / INDEX_FILENAME
+        data_path = self.bundle_dir / DATA_FILENAME
+        if not index_path.exists() or not data_path.exists():
+            return False
+
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"WARNING: Asset bundle index unreadable: {index_path} - {e}")
+            return False
+
+        if index.get("version") != BUNDLE_FORMAT_VERSION:
+            print(f"WARNING: Asset bundle {self.bundle_dir} has version {index.get('version')}, "
+                  f"expected {BUNDLE_FORMAT_VERSION} - rebuild with asset_bundle.py")
+            return False
+
+        try:
+            self._file = open(data_path, "rb")
+            if os.fstat(self._file.fileno()).st_size > 0:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = memoryview(self._mmap)
+            else:
+                self._view = memoryview(b"")
+        except (OSError, ValueError) as e:
+            print(f"WARNING: Asset bundle data unreadable: {data_path} - {e}")
+            self.close()
+            return False
+
+        self.entries = index.get("entries", {})
+        self.screen_size = tuple(index.get("screen_size", ())) or None
+        print(f"INFO: Asset bundle opened: {self.bundle_dir} ({len(self.entries)} images)")
+        return True
+
+    def close(self):
+        """mmap 해제 (이미 convert 된 Surface는 영향 없음)"""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def contains(self, path: PathLike, size: Tuple[int, int], smooth: bool = False) -> bool:
+        return entry_key(path, size, smooth) in self.entries
+
+    def load(
+        self,
+        path: PathLike,
+        size: Tuple[int, int],
+        smooth: bool = False,
+        alpha: bool = True,
+    ) -> Optional[pygame.Surface]:
+        """
+        번들에서 스케일 완료 Surface 생성 (없거나 stale이면 None)
+
+        Args:
+            path: 원본 이미지 경로
+            size: 목표 크기
+            smooth: True면 smoothscale로 빌드된 엔트리, False면 scale
+            alpha: True면 convert_alpha(), False면 convert()
+        """
+        if self._view is None or size is None:
+            return None
+
+        entry = self.entries.get(entry_key(path, size, smooth))
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        if self._is_stale(path, entry):
+            self.stats["stale"] += 1
+            return None
+
+        offset, length = entry["offset"], entry["length"]
+        image = pygame.image.frombuffer(
+            self._view[offset:offset + length], tuple(entry["size"]), entry["format"]
+        )
+        self.stats["hits"] += 1
+        return image.convert_alpha() if alpha else image.convert()
+
+    def _is_stale(self, path: PathLike, entry: dict) -> bool:
+        """원본 파일이 빌드 이후 변경되었는지 (mtime/크기 비교)"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return True
+        if stat.st_mtime_ns == entry["mtime_ns"] and stat.st_size == entry["file_size"]:
+            return False
+
+        source = entry["source"]
+        if source not in self._stale_sources:
+            self._stale_sources.add(source)
+            print(f"WARNING: Asset bundle entry is stale, loading source instead: {source}")
+        return True
+
+
+# =========================================================
+# 번들 빌드 (오프라인)
+# =========================================================
+
+def default_bundle_specs(screen_size: Tuple[int, int]) -> List[Tuple[Path, Tuple[int, int], bool]]:
+    """
+    기본 번들 대상 (원본 경로, 크기, smooth)
+
+    - backgrounds/*: AssetManager.get_image (scale) - WaveMode 배경 캐시 등
+    - 기지 배경: BaseHubMode._load_facility_background (smoothscale)
+    - 에피소드 배경: 컷씬/내러티브 배경 (smoothscale)
+    """
+    size = (int(screen_size[0]), int(screen_size[1]))
+    specs = []
+
+    for path in _glob_images(config.BACKGROUND_DIR):
+        specs.append((path, size, False))
+
+    for path in (
+        config.IMAGE_DIR / "base" / "basehub_bg_01.jpg",
+        config.IMAGE_DIR / "base" / "facilities" / "facility_bg.png",
+    ):
+        if path.exists():
+            specs.append((path, size, True))
+
+    episodes_dir = config.ASSET_DIR / "data" / "episodes"
+    if episodes_dir.exists():
+        for backgrounds_dir in sorted(episodes_dir.glob("*/backgrounds")):
+            for path in _glob_images(backgrounds_dir, recursive=True):
+                specs.append((path, size, True))
+
+    return specs
+
+
+def _glob_images(folder: Path, recursive: bool = False) -> List[Path]:
+    if not folder.exists():
+        return []
+    paths = set()
+    for pattern in IMAGE_PATTERNS:
+        paths.update(folder.rglob(pattern) if recursive else folder.glob(pattern))
+    return sorted(paths)
+
+
+def build_bundle(
+    screen_size: Tuple[int, int],
+    specs: Iterable[Tuple[PathLike, Tuple[int, int], bool]],
+    out_dir: PathLike = None,
+) -> dict:
+    """
+    번들 빌드 - 디스플레이가 초기화되어 있어야 함 (convert_alpha 사용)
+
+    Returns:
+        작성된 인덱스 dict
+    """
+    out_dir = Path(out_dir) if out_dir else bundle_dir_for(screen_size)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    entries: Dict[str, dict] = {}
+    data_tmp = out_dir / (DATA_FILENAME + ".tmp")
+    index_tmp = out_dir / (INDEX_FILENAME + ".tmp")
+
+    offset = 0
+    with open(data_tmp, "wb") as data:
+        for path, size, smooth in specs:
+            key = entry_key(path, size, smooth)
+            if key in entries:
+                continue
+            try:
+                source = pygame.image.load(str(path))
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"WARNING: Skipping {path}: {e}")
+                continue
+
+            has_alpha = bool(source.get_flags() & pygame.SRCALPHA)
+            image = source.convert_alpha()
+            size = (int(size[0]), int(size[1]))
+            if image.get_size() != size:
+                scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+                image = scale(image, size)
+
+            pixel_format = "BGRA" if has_alpha else "RGB"
+            pixels = pygame.image.tobytes(image, pixel_format)
+
+            padding = -offset % _ALIGNMENT
+            if padding:
+                data.write(b"\0" * padding)
+                offset += padding
+            data.write(pixels)
+
+            stat = os.stat(path)
+            entries[key] = {
+                "source": source_key(path),
+                "size": list(size),
+                "smooth": smooth,
+                "format": pixel_format,
+                "offset": offset,
+                "length": len(pixels),
+                "mtime_ns": stat.st_mtime_ns,
+                "file_size": stat.st_size,
+            }
+            offset += len(pixels)
+
+    index = {
+        "version": BUNDLE_FORMAT_VERSION,
+        "screen_size": [int(screen_size[0]), int(screen_size[1])],
+        "data_size": offset,
+        "entries": entries,
+    }
+    with open(index_tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1)
+
+    # 데이터 → 인덱스 순서로 교체 (중간 실패 시 이전 인덱스가 새 데이터를 가리키지 않도록)
+    (out_dir / INDEX_FILENAME).unlink(missing_ok=True)
+    os.replace(data_tmp, out_dir / DATA_FILENAME)
+    os.replace(index_tmp, out_dir / INDEX_FILENAME)
+    return index
+
+
+# =========================================================
+# 전역 번들 (해상도별)
+# =========================================================
+
+_bundles: Dict[Tuple[int, int], Optional[AssetBundle]] = {}
+
+
+def get_asset_bundle(screen_size: Tuple[int, int] = None) -> Optional[AssetBundle]:
+    """
+    현재 해상도의 번들 반환 (없거나 비활성화면 None)
+
+    screen_size를 생략하면 현재 디스플레이 크기를 사용합니다.
+    """
+    if not getattr(config, "ASSET_BUNDLE_ENABLED", False):
+        return None
+
+    if screen_size is None:
+        display = pygame.display.get_surface()
+        if display is None:
+            return None
+        screen_size = display.get_size()
+
+    key = (int(screen_size[0]), int(screen_size[1]))
+    if key not in _bundles:
+        bundle = AssetBundle(bundle_dir_for(key))
+        _bundles[key] = bundle if bundle.open() else None
+    return _bundles[key]
+
+
+def close_asset_bundles():
+    """열린 번들 모두 닫기"""
+    for bundle in _bundles.values():
+        if bundle is not None:
+            bundle.close()
+    _bundles.clear()
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Build pre-scaled asset bundle")
+    parser.add_argument(
+        "--size", default=f"{config.SCREEN_WIDTH_INIT}x{config.SCREEN_HEIGHT_INIT}",
+        help="target resolution WxH (default: %(default)s)",
+    )
+    parser.add_argument("--out", default=None, help="output folder (default: assets/bundles/WxH)")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    start = time.perf_counter()
+    specs = default_bundle_specs((width, height))
+    index = build_bundle((width, height), specs, args.out)
+    elapsed = time.perf_counter() - start
+
+    out_dir = Path(args.out) if args.out else bundle_dir_for((width, height))
+    print(f"INFO: Built {len(index['entries'])} images "
+          f"({index['data_size'] / (1024 * 1024):.1f} MB) into {out_dir} in {elapsed:.1f}s")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
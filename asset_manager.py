@@ -4,6 +4,8 @@ import pygame
 from typing import Dict, Tuple, List, Optional
 from pathlib import Path
 import config  # config.py에서 상수(색상 등)를 임포트합니다.
+from asset_bundle import get_asset_bundle
+from systems.segment_prefetcher import get_segment_prefetcher
 
 
 class AssetManager:
@@ -27,12 +29,21 @@ class AssetManager:
             cls._cache[path] = {}
 
         if size not in cls._cache[path]:
+            # 사전 빌드 번들에 스케일 완료 픽셀이 있으면 디코딩 생략
+            bundle = get_asset_bundle()
+            image = bundle.load(path, size) if bundle else None
+            if image is not None:
+                cls._cache[path][size] = image
+                return image
+
             try:
                 # 💡 [핵심] 이미지 로드 및 조정
-                image = pygame.image.load(path).convert_alpha()
+                # 에피소드 세그먼트 선행 로드에서 디코딩된 원본이 있으면 사용
+                raw = get_segment_prefetcher().get(path)
+                image = (raw if raw is not None else pygame.image.load(path)).convert_alpha()
                 image = pygame.transform.scale(image, size)
                 cls._cache[path][size] = image
-            except pygame.error as e:
+            except (pygame.error, FileNotFoundError) as e:
                 print(f"이미지 로드 오류: {path}, {e}")
                 # 오류 발생 시 임시 빨간색 Surface 사용 (경로 오류 해결)
                 dummy_surface = pygame.Surface(size, pygame.SRCALPHA)
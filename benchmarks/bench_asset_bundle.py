@@ -0,0 +1,73 @@
+"""
+Asset Bundle Benchmark
+- source: pygame.image.load + convert_alpha + scale (AssetManager.get_image 기존 경로)
+- bundle: 사전 스케일된 원시 픽셀 mmap → frombuffer + convert_alpha
+
+임시 폴더에 배경 이미지 번들을 빌드한 뒤 같은 이미지를 두 방식으로 로드합니다.
+
+실행: python -m benchmarks.bench_asset_bundle [--size 1920x1080] [--count 8]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pygame
+
+import config
+from asset_bundle import AssetBundle, build_bundle
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Asset bundle benchmark")
+    parser.add_argument("--size", default="1920x1080")
+    parser.add_argument("--count", type=int, default=8, help="number of background images")
+    args = parser.parse_args()
+
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    pygame.init()
+    pygame.display.set_mode(size)
+
+    paths = sorted(config.BACKGROUND_DIR.glob("*.jpg"))[:args.count]
+    if not paths:
+        print(f"No backgrounds found in {config.BACKGROUND_DIR}")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        index = build_bundle(size, [(path, size, False) for path in paths], tmp)
+        build_time = time.perf_counter() - start
+        print(f"built {len(index['entries'])} images at {size[0]}x{size[1]}: "
+              f"{index['data_size'] / (1024 * 1024):.1f} MB in {build_time:.2f}s")
+
+        start = time.perf_counter()
+        for path in paths:
+            image = pygame.image.load(path).convert_alpha()
+            pygame.transform.scale(image, size)
+        source_time = time.perf_counter() - start
+
+        bundle = AssetBundle(tmp)
+        bundle.open()
+        start = time.perf_counter()
+        for path in paths:
+            bundle.load(path, size)
+        bundle_time = time.perf_counter() - start
+        bundle.close()
+
+    print(f"{'impl':<7} | {'total ms':>9} | {'ms/image':>9}")
+    print("-" * 32)
+    for label, total in (("source", source_time), ("bundle", bundle_time)):
+        print(f"{label:<7} | {total * 1000:9.1f} | {total * 1000 / len(paths):9.2f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
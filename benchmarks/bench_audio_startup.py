@@ -0,0 +1,143 @@
+"""
+Audio Startup Benchmark (headless, dummy audio driver)
+- legacy: 모든 BGM/SFX를 pygame.mixer.Sound로 로드 (이전 SoundManager._load_sounds 동작)
+- streaming: SoundManager() - BGM은 경로만 확인, SFX는 SFX_PRELOAD만 로드
+
+BGM 파일이 없는 환경에서도 비교할 수 있도록 임시 폴더에 합성 WAV 트랙을 만들어
+config.BGM_FILES를 그 경로로 바꿔 측정합니다. (MP3는 디코딩 후 PCM이 파일보다
+훨씬 커지므로 실제 차이는 이보다 큽니다)
+모드마다 별도 프로세스에서 실행해 RSS를 분리 측정합니다.
+
+실행: python -m benchmarks.bench_audio_startup [--bgm-seconds 90] [--bgm-dir DIR]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+SAMPLE_RATE = 44100
+
+
+def _rss_mb() -> float:
+    """현재 프로세스 RSS (MB)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def _write_tracks(directory: Path, names, seconds: float):
+    """합성 스테레오 WAV 트랙 생성"""
+    paths = {}
+    t = np.arange(int(SAMPLE_RATE * seconds), dtype=np.float32) / SAMPLE_RATE
+    for index, name in enumerate(names):
+        tone = np.sin(2 * np.pi * (220.0 + 55.0 * index) * t) * 6000
+        samples = np.repeat(tone.astype(np.int16), 2)
+        path = directory / f"{name}.wav"
+        with wave.open(str(path), "wb") as track:
+            track.setnchannels(2)
+            track.setsampwidth(2)
+            track.setframerate(SAMPLE_RATE)
+            track.writeframes(samples.tobytes())
+        paths[name] = path
+    return paths
+
+
+def _child(mode: str, bgm_dir: Path):
+    import pygame
+    import config
+
+    config.BGM_FILES = {name: bgm_dir / f"{name}.wav" for name in config.BGM_FILES}
+    pygame.init()
+    base_rss = _rss_mb()
+
+    start = time.perf_counter()
+    if mode == "legacy":
+        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        sounds = {}
+        for name, path in list(config.BGM_FILES.items()) + list(config.SFX_FILES.items()):
+            if Path(path).exists():
+                sounds[name] = pygame.mixer.Sound(str(path))
+        loaded = len(sounds)
+    else:
+        from sound_manager import SoundManager
+        manager = SoundManager()
+        loaded = sum(sound is not None for sound in manager.sfx.values())
+    init_ms = (time.perf_counter() - start) * 1000.0
+    result = {"init_ms": init_ms, "rss_mb": _rss_mb() - base_rss, "loaded": loaded}
+
+    if mode == "streaming":
+        # 곡 전환: 페이드아웃 → end_frame에서 새 곡 시작까지
+        manager.play_bgm("normal", fade_ms=0)
+        manager.end_frame()
+        start = time.perf_counter()
+        manager.play_bgm("boss", fade_ms=500)
+        frames = 0
+        while manager._bgm_pending is not None and frames < 600:
+            time.sleep(1 / 60)
+            manager.end_frame()
+            frames += 1
+        result["switch_ms"] = (time.perf_counter() - start) * 1000.0
+        result["switch_frames"] = frames
+        result["playing"] = manager.current_bgm
+        manager.cleanup()
+
+    print(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audio startup benchmark")
+    parser.add_argument("--bgm-seconds", type=float, default=90.0)
+    parser.add_argument("--bgm-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--child", choices=("legacy", "streaming"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, Path(args.bgm_dir))
+        return
+
+    import config
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bgm_dir = Path(tmp)
+        paths = _write_tracks(bgm_dir, list(config.BGM_FILES), args.bgm_seconds)
+        total_mb = sum(path.stat().st_size for path in paths.values()) / (1024 * 1024)
+        print(f"{len(paths)} BGM tracks x {args.bgm_seconds:.0f}s ({total_mb:.1f} MB PCM on disk)")
+        print(f"{'impl':<10} | {'init ms':>8} | {'RSS +MB':>8} | {'sounds loaded':>13}")
+        print("-" * 50)
+
+        results = {}
+        for mode in ("legacy", "streaming"):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_audio_startup",
+                 "--child", mode, "--bgm-dir", str(bgm_dir)],
+                cwd=str(Path(__file__).parent.parent), capture_output=True, text=True, check=True,
+            ).stdout
+            results[mode] = json.loads(output.strip().splitlines()[-1])
+            r = results[mode]
+            print(f"{mode:<10} | {r['init_ms']:8.1f} | {r['rss_mb']:8.1f} | {r['loaded']:13d}")
+
+        streaming = results["streaming"]
+        print(f"\nBGM switch normal -> boss: {streaming['switch_ms']:.0f} ms "
+              f"({streaming['switch_frames']} frames), now playing: {streaming['playing']}")
+
+
+if __name__ == "__main__":
+    main()
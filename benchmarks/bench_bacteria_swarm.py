@@ -0,0 +1,143 @@
+"""
+Bacteria Swarm Benchmark
+- 기존 방식: Bacteria 객체 리스트 (개별 update, list.remove, Static Field 거리 루프, 총알 x 박테리아 colliderect 루프)
+- BacteriaSwarm: 배열 일괄 추적/달라붙기/데미지 합산, 범위/히트박스 공간 조회, blits 일괄 렌더링
+
+플레이어는 Static Field와 번개 속성을 모두 가진 상태로 가정합니다 (특수 무기 피격 루프가 매 프레임 실행).
+
+실행: python -m benchmarks.bench_bacteria_swarm [--counts 50 200 500 1000] [--bullets 300]
+"""
+
+import argparse
+import builtins
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pygame
+
+SCREEN_SIZE = (1920, 1080)
+STATIC_FIELD_RADIUS = 150
+STATIC_FIELD_DAMAGE = 100
+
+
+def _positions(rng: random.Random, count: int):
+    return [(rng.uniform(0, SCREEN_SIZE[0]), rng.uniform(0, SCREEN_SIZE[1])) for _ in range(count)]
+
+
+def _bullets(rng: random.Random, count: int):
+    from entities.bullet_store import BulletStore
+    bullets = BulletStore(screen_height=SCREEN_SIZE[1])
+    for pos in _positions(rng, count):
+        bullets.spawn(pygame.math.Vector2(pos), pygame.math.Vector2(1, 0), 10.0)
+    return bullets
+
+
+def run_legacy(positions, bullets, frames: int, screen) -> dict:
+    from entities.bacteria import Bacteria
+    swarm = [Bacteria(pos, SCREEN_SIZE, 0.0) for pos in positions]
+    player_pos = pygame.math.Vector2(SCREEN_SIZE[0] / 2, SCREEN_SIZE[1] / 2)
+    timings = {"update": 0.0, "special": 0.0, "draw": 0.0}
+    dt = 1.0 / 60.0
+    current_time = 0.0
+    for _ in range(frames):
+        current_time += dt
+
+        start = time.perf_counter()
+        attached_count, total_damage = 0, 0.0
+        for bacteria in swarm[:]:
+            is_attached, damage = bacteria.update(dt, current_time, player_pos)
+            if is_attached:
+                attached_count += 1
+                total_damage += damage
+            if bacteria.dead or not bacteria.is_alive:
+                swarm.remove(bacteria)
+        timings["update"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for bacteria in swarm[:]:
+            if bacteria.is_alive and (bacteria.pos - player_pos).length() <= STATIC_FIELD_RADIUS:
+                bacteria.take_damage(STATIC_FIELD_DAMAGE, is_special_weapon=True)
+        for bullet in bullets[:]:
+            for bacteria in swarm[:]:
+                if bacteria.is_alive and bacteria.hitbox.colliderect(bullet.hitbox):
+                    bacteria.take_damage(bullet.damage, is_special_weapon=True)
+        timings["special"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for bacteria in swarm:
+            if bacteria.is_alive:
+                bacteria.draw(screen)
+        timings["draw"] += time.perf_counter() - start
+    timings["attached"] = attached_count
+    return timings
+
+
+def run_swarm(positions, bullets, frames: int, screen) -> dict:
+    from entities.bacteria_swarm import BacteriaSwarm
+    swarm = BacteriaSwarm(SCREEN_SIZE)
+    for pos in positions:
+        swarm.spawn(pos, 0.0)
+    player_pos = pygame.math.Vector2(SCREEN_SIZE[0] / 2, SCREEN_SIZE[1] / 2)
+    timings = {"update": 0.0, "special": 0.0, "draw": 0.0}
+    dt = 1.0 / 60.0
+    current_time = 0.0
+    for _ in range(frames):
+        current_time += dt
+
+        start = time.perf_counter()
+        attached_count, total_damage = swarm.update(dt, current_time, player_pos)
+        timings["update"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        swarm.hit_radius(player_pos, STATIC_FIELD_RADIUS, STATIC_FIELD_DAMAGE)
+        swarm.hit_boxes(*bullets.hitbox_boxes())
+        timings["special"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        swarm.draw(screen)
+        timings["draw"] += time.perf_counter() - start
+    timings["attached"] = attached_count
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bacteria swarm benchmark")
+    parser.add_argument("--counts", type=int, nargs="+", default=[50, 200, 500, 1000])
+    parser.add_argument("--bullets", type=int, default=300)
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    bullets = _bullets(random.Random(1234), args.bullets)
+
+    print(f"ms/frame over {args.frames} frames, {args.bullets} lightning bullets, static field on")
+    print(f"{'bacteria':>8} | {'impl':<6} | {'update':>8} | {'special':>8} | {'draw':>8} | {'total':>8} | attached")
+    print("-" * 76)
+    quiet_print = builtins.print
+    for count in args.counts:
+        positions = _positions(random.Random(count), count)
+        for label, runner in (("legacy", run_legacy), ("swarm", run_swarm)):
+            # 달라붙기/처치 INFO 로그는 측정에서 제외
+            builtins.print = lambda *a, **k: None
+            try:
+                result = runner(positions, bullets, args.frames, screen)
+            finally:
+                builtins.print = quiet_print
+            per_frame = {k: result[k] * 1000.0 / args.frames for k in ("update", "special", "draw")}
+            total = sum(per_frame.values())
+            print(f"{count:>8} | {label:<6} | {per_frame['update']:8.3f} | {per_frame['special']:8.3f} | "
+                  f"{per_frame['draw']:8.3f} | {total:8.3f} | {result['attached']}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Bullet Store Benchmark
+- 기존 방식: Bullet 객체 리스트 (개별 update/draw, list.remove, 이중 루프 충돌)
+- BulletStore: 배열 일괄 이동/화면 밖 제거, 배열 broad-phase 충돌, blits 일괄 렌더링
+
+실행: python -m benchmarks.bench_bullet_store [--counts 500 2000 5000] [--enemies 100]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pygame
+
+SCREEN_SIZE = (1920, 1080)
+
+
+class _Target:
+    """충돌 대상 (적 대용)"""
+
+    def __init__(self, x: float, y: float, size: int):
+        self.pos = pygame.math.Vector2(x, y)
+        self.hitbox = pygame.Rect(0, 0, size, size)
+        self.hitbox.center = (int(x), int(y))
+        self.is_alive = True
+
+
+def _spawn_args(rng: random.Random, count: int):
+    args = []
+    for _ in range(count):
+        angle = rng.uniform(0, math.tau)
+        pos = pygame.math.Vector2(rng.uniform(0, SCREEN_SIZE[0]), rng.uniform(0, SCREEN_SIZE[1]))
+        direction = pygame.math.Vector2(math.cos(angle), math.sin(angle))
+        args.append((pos, direction))
+    return args
+
+
+def _fill(bullets, spawn_args):
+    from entities.weapons import spawn_bullet
+    for pos, direction in spawn_args:
+        spawn_bullet(bullets, pos, direction, 10.0, False, speed=120.0)
+
+
+def run_legacy(spawn_args, targets, frames: int, screen) -> dict:
+    bullets = []
+    _fill(bullets, spawn_args)
+    timings = {"update": 0.0, "collide": 0.0, "draw": 0.0}
+    dt = 1.0 / 60.0
+    for _ in range(frames):
+        start = time.perf_counter()
+        for bullet in bullets[:]:
+            bullet.update(dt, SCREEN_SIZE)
+            if not bullet.is_alive:
+                bullets.remove(bullet)
+        timings["update"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        hits = 0
+        for bullet in bullets:
+            for target in targets:
+                if bullet.hitbox.colliderect(target.hitbox):
+                    hits += 1
+                    break
+        timings["collide"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for bullet in bullets:
+            bullet.draw(screen)
+        timings["draw"] += time.perf_counter() - start
+    timings["hits"] = hits
+    return timings
+
+
+def run_store(spawn_args, targets, frames: int, screen) -> dict:
+    from entities.bullet_store import BulletStore
+    bullets = BulletStore(screen_height=SCREEN_SIZE[1])
+    _fill(bullets, spawn_args)
+    timings = {"update": 0.0, "collide": 0.0, "draw": 0.0}
+    dt = 1.0 / 60.0
+    rects = [target.hitbox for target in targets]
+    for _ in range(frames):
+        start = time.perf_counter()
+        bullets.update(dt, SCREEN_SIZE)
+        bullets.compact()
+        timings["update"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        hits = 0
+        for bullet, candidates in bullets.overlap_rects(rects):
+            for index in candidates:
+                if bullet.hitbox.colliderect(targets[index].hitbox):
+                    hits += 1
+                    break
+        timings["collide"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        bullets.draw(screen)
+        timings["draw"] += time.perf_counter() - start
+    timings["hits"] = hits
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bullet store benchmark")
+    parser.add_argument("--counts", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--enemies", type=int, default=100)
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+
+    rng = random.Random(1234)
+    targets = [
+        _Target(rng.uniform(0, SCREEN_SIZE[0]), rng.uniform(0, SCREEN_SIZE[1]), 60)
+        for _ in range(args.enemies)
+    ]
+
+    print(f"ms/frame over {args.frames} frames, {args.enemies} targets")
+    print(f"{'bullets':>8} | {'impl':<7} | {'update':>8} | {'collide':>8} | {'draw':>8} | {'total':>8} | hits")
+    print("-" * 72)
+    for count in args.counts:
+        spawn_args = _spawn_args(random.Random(count), count)
+        for label, runner in (("legacy", run_legacy), ("store", run_store)):
+            result = runner(spawn_args, targets, args.frames, screen)
+            per_frame = {k: result[k] * 1000.0 / args.frames for k in ("update", "collide", "draw")}
+            total = sum(per_frame.values())
+            print(f"{count:>8} | {label:<7} | {per_frame['update']:8.3f} | {per_frame['collide']:8.3f} | "
+                  f"{per_frame['draw']:8.3f} | {total:8.3f} | {result['hits']}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Collectible Field Benchmark
+- 기존 방식: CoinGem/HealItem 객체 리스트 (개별 자석 이동/colliderect/collect, 리스트 재생성, 개별 draw)
+- CollectibleField: 배열 일괄 자석 이동/획득 판정/점수 합산, 드롭 코인 병합, blits 일괄 렌더링
+
+매 프레임 플레이어가 화면을 가로지르며 코인을 끌어당기고, drop_every 프레임마다
+적 하나가 처치되어 coins_per_kill개의 코인을 떨어뜨립니다 (보스 코인 배율 상황).
+
+실행: python -m benchmarks.bench_collectibles [--counts 200 1000 3000] [--coins-per-kill 50]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pygame
+
+SCREEN_SIZE = (1920, 1080)
+
+
+class _Player:
+    """자석/회복 대상 (플레이어 대용)"""
+
+    def __init__(self):
+        self.pos = pygame.math.Vector2(0, SCREEN_SIZE[1] / 2)
+        self.image_rect = pygame.Rect(0, 0, 40, 40)
+        self.hitbox = pygame.Rect(0, 0, 40, 40)
+        self.has_coin_magnet = True
+        self.hp = 50.0
+        self.max_hp = 100.0
+
+    def move(self, frame: int):
+        self.pos.x = (frame * 12) % SCREEN_SIZE[0]
+        self.hitbox.center = (int(self.pos.x), int(self.pos.y))
+
+    def heal(self, amount: float):
+        self.hp = min(self.max_hp, self.hp + amount)
+
+
+def _positions(rng: random.Random, count: int):
+    return [(rng.uniform(0, SCREEN_SIZE[0]), rng.uniform(0, SCREEN_SIZE[1])) for _ in range(count)]
+
+
+def run_legacy(positions, drops, coins_per_kill: int, frames: int, screen) -> dict:
+    from entities.collectibles import CoinGem, HealItem
+    gems = [
+        HealItem(pos, SCREEN_SIZE[1]) if index % 20 == 0 else CoinGem(pos, SCREEN_SIZE[1])
+        for index, pos in enumerate(positions)
+    ]
+    player = _Player()
+    game_data = {"score": 0, "uncollected_score": 0}
+    timings = {"spawn": 0.0, "update": 0.0, "draw": 0.0}
+    dt = 1.0 / 60.0
+    for frame in range(frames):
+        player.move(frame)
+
+        start = time.perf_counter()
+        if frame in drops:
+            for _ in range(coins_per_kill):
+                gems.append(CoinGem(drops[frame], SCREEN_SIZE[1]))
+        timings["spawn"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for gem in gems:
+            gem.update(dt, player)
+            if player.hitbox.colliderect(gem.hitbox):
+                if isinstance(gem, CoinGem):
+                    gem.collect(game_data)
+                else:
+                    gem.collect(player)
+        gems[:] = [g for g in gems if not g.collected]
+        timings["update"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for gem in gems:
+            gem.draw(screen)
+        timings["draw"] += time.perf_counter() - start
+    timings["score"] = game_data["score"]
+    timings["left"] = len(gems)
+    return timings
+
+
+def run_field(positions, drops, coins_per_kill: int, frames: int, screen) -> dict:
+    from entities.collectibles import CoinGem, HealItem
+    from entities.collectible_field import CollectibleField, KIND_COIN, KIND_HEAL
+    gems = CollectibleField(screen_height=SCREEN_SIZE[1])
+    for index, pos in enumerate(positions):
+        if index % 20 == 0:
+            gems.spawn(KIND_HEAL, pos, HealItem.HEAL_AMOUNT)
+        else:
+            gems.spawn(KIND_COIN, pos, CoinGem.COIN_AMOUNT)
+    player = _Player()
+    game_data = {"score": 0, "uncollected_score": 0}
+    timings = {"spawn": 0.0, "update": 0.0, "draw": 0.0}
+    dt = 1.0 / 60.0
+    for frame in range(frames):
+        player.move(frame)
+
+        start = time.perf_counter()
+        if frame in drops:
+            gems.spawn_coins(drops[frame], coins_per_kill, CoinGem.COIN_AMOUNT)
+        timings["spawn"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        gems.update(dt, player)
+        gems.collect(player, game_data)
+        gems.compact()
+        timings["update"] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        gems.draw(screen)
+        timings["draw"] += time.perf_counter() - start
+    timings["score"] = game_data["score"]
+    timings["left"] = len(gems)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collectible field benchmark")
+    parser.add_argument("--counts", type=int, nargs="+", default=[200, 1000, 3000])
+    parser.add_argument("--coins-per-kill", type=int, default=50)
+    parser.add_argument("--drop-every", type=int, default=10)
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+
+    print(f"ms/frame over {args.frames} frames, {args.coins_per_kill} coins per kill "
+          f"every {args.drop_every} frames")
+    print(f"{'items':>6} | {'impl':<6} | {'spawn':>8} | {'update':>8} | {'draw':>8} | {'total':>8} | "
+          f"{'score':>6} | left")
+    print("-" * 78)
+    for count in args.counts:
+        rng = random.Random(count)
+        positions = _positions(rng, count)
+        drops = {frame: pos for frame, pos in zip(
+            range(0, args.frames, args.drop_every), _positions(rng, args.frames))}
+        for label, runner in (("legacy", run_legacy), ("field", run_field)):
+            result = runner(positions, drops, args.coins_per_kill, args.frames, screen)
+            per_frame = {k: result[k] * 1000.0 / args.frames for k in ("spawn", "update", "draw")}
+            total = sum(per_frame.values())
+            print(f"{count:>6} | {label:<6} | {per_frame['spawn']:8.3f} | {per_frame['update']:8.3f} | "
+                  f"{per_frame['draw']:8.3f} | {total:8.3f} | {result['score']:>6} | {result['left']}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
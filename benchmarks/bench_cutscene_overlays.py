@@ -0,0 +1,152 @@
+"""
+Cutscene Overlay Benchmark
+- 컷씬 효과들을 모든 페이즈에서 렌더링하며 프레임 시간 측정
+- 기존 방식 근사: 매 프레임 오버레이 캐시를 비워 레이어를 새로 생성
+- 공유 캐시: (화면 크기, 파라미터)당 한 번 생성한 레이어 재사용
+
+렌더링 중 예외가 난 페이즈는 해당 페이즈 측정을 중단하고 실패로 집계/출력하며,
+실패가 하나라도 있으면 종료 코드 1로 끝납니다.
+
+실행: python -m benchmarks.bench_cutscene_overlays [--frames 60] [--size 1920 1080]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pygame
+
+
+def _effects(screen_size):
+    from cutscenes import (
+        AndromedaWorldEffect,
+        BrokenToyEffect,
+        BurningRecordEffect,
+        CountdownEffect,
+        FilmReelEffect,
+        HologramMessageEffect,
+        StarMapEffect,
+    )
+
+    return [
+        AndromedaWorldEffect(screen_size),
+        HologramMessageEffect(screen_size, father_image_path="assets/images/base/basehub_mother_01.png"),
+        CountdownEffect(screen_size, countdown_start=3),
+        BurningRecordEffect(screen_size, film_paths=[]),
+        FilmReelEffect(screen_size, film_paths=[]),
+        BrokenToyEffect(screen_size),
+        StarMapEffect(screen_size, marker_paths=[]),
+    ]
+
+
+def _phases(effect):
+    return sorted({
+        getattr(effect, name) for name in dir(type(effect))
+        if name.startswith("PHASE_") and name != "PHASE_DONE"
+        and isinstance(getattr(effect, name), int)
+    })
+
+
+def run(effect, screen, frames: int, cached: bool):
+    """
+    모든 페이즈 렌더링 시간 측정
+
+    Returns:
+        (samples, failures) - 프레임별 ms 목록, (페이즈, 예외) 목록
+    """
+    from cutscenes import overlays
+
+    samples = []
+    failures = []
+    dt = 1.0 / 60.0
+    for phase in _phases(effect):
+        effect.phase = phase
+        effect.phase_timer = 0.2
+        effect.fade_alpha = 128
+        for _ in range(frames):
+            if not cached:
+                overlays.clear_overlay_cache()
+            start = time.perf_counter()
+            try:
+                effect.render(screen)
+            except Exception as e:
+                # 에셋 없이 특정 페이즈를 강제로 그리면 실패할 수 있음 - 해당 페이즈 측정 중단 후 실패로 기록
+                failures.append((phase, e))
+                break
+            samples.append((time.perf_counter() - start) * 1000.0)
+        effect.phase_timer += dt
+    return samples, failures
+
+
+def _print_stats(label: str, stats: dict):
+    print(f"{label}: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cutscene overlay benchmark")
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--size", type=int, nargs=2, default=[1920, 1080])
+    args = parser.parse_args()
+
+    from cutscenes import overlays
+
+    screen_size = tuple(args.size)
+    pygame.init()
+    screen = pygame.display.set_mode(screen_size)
+
+    print(f"Cutscene render ms/frame at {screen_size[0]}x{screen_size[1]}, "
+          f"{args.frames} frames per phase")
+    print(f"{'effect':<24} | {'rebuild mean':>12} | {'cached mean':>11} | {'cached p95':>10}")
+    print("-" * 68)
+    keys = ("hits", "misses", "evictions")
+    legacy_stats = dict.fromkeys(keys, 0)
+    cached_stats = dict.fromkeys(keys, 0)
+    failures = []
+    for effect in _effects(screen_size):
+        name = type(effect).__name__
+
+        # 페이즈별 통계를 분리 (기존 방식 측정의 miss가 공유 캐시 결과에 섞이지 않도록)
+        overlays.clear_overlay_cache()
+        overlays.reset_overlay_stats()
+        legacy, legacy_failures = run(effect, screen, args.frames, cached=False)
+        for key in keys:
+            legacy_stats[key] += overlays.get_overlay_stats()[key]
+
+        overlays.clear_overlay_cache()
+        overlays.reset_overlay_stats()
+        cached, cached_failures = run(effect, screen, args.frames, cached=True)
+        for key in keys:
+            cached_stats[key] += overlays.get_overlay_stats()[key]
+
+        failures.extend((name, "rebuild", phase, e) for phase, e in legacy_failures)
+        failures.extend((name, "cached", phase, e) for phase, e in cached_failures)
+        if not legacy or not cached:
+            print(f"{name:<24} | (no renderable phases)")
+            continue
+        cached.sort()
+        p95 = cached[int(len(cached) * 0.95) - 1]
+        print(f"{name:<24} | {statistics.mean(legacy):12.3f} | "
+              f"{statistics.mean(cached):11.3f} | {p95:10.3f}")
+
+    print()
+    _print_stats("overlay cache (rebuild)", legacy_stats)
+    _print_stats("overlay cache (cached) ", cached_stats)
+    pygame.quit()
+
+    if failures:
+        print(f"\n{len(failures)} phase(s) failed to render (timing stopped for those phases):")
+        for name, label, phase, e in failures:
+            print(f"  FAIL: {name} phase {phase} ({label}): {type(e).__name__}: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Enemy Archetype Benchmark
+- 기존 방식 근사: 스폰마다 레지스트리를 비워 tint/flash/freeze 이미지를 새로 생성
+- 아키타입: 타입별 공유 이미지/스탯을 참조만 하고 가변 상태만 보유
+- 적 1개당 메모리 (tracemalloc, Python 객체만; Surface 픽셀 버퍼 제외)
+
+실행: python -m benchmarks.bench_enemy_archetypes [--count 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pygame
+
+import config
+
+SCREEN_SIZE = (1920, 1080)
+
+
+def _enemy_types():
+    # 공통 함선 이미지를 쓰는 일반 타입만 (커스텀 이미지 타입 제외)
+    return [
+        name for name, data in config.ENEMY_TYPES.items()
+        if not data.get("is_boss", False) and not data.get("use_custom_image", False)
+    ]
+
+
+def spawn(count: int, cold: bool):
+    from entities.enemies import Enemy
+    from entities.enemy_archetypes import clear_enemy_archetypes
+
+    types = _enemy_types()
+    enemies = []
+    start = time.perf_counter()
+    for i in range(count):
+        if cold:
+            clear_enemy_archetypes()
+        pos = pygame.math.Vector2(i % SCREEN_SIZE[0], -50)
+        enemies.append(Enemy(pos, SCREEN_SIZE[1], 0.5, types[i % len(types)]))
+    elapsed = time.perf_counter() - start
+    return enemies, elapsed
+
+
+def measure_memory(count: int) -> float:
+    from entities.enemy_archetypes import preload_enemy_archetypes
+
+    preload_enemy_archetypes(SCREEN_SIZE[1], _enemy_types())
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    enemies, _ = spawn(count, cold=False)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del enemies
+    return total / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enemy archetype benchmark")
+    parser.add_argument("--count", type=int, default=2000)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+
+    print(f"Spawning {args.count} enemies ({len(_enemy_types())} types)")
+    print("-" * 64)
+    _, cold = spawn(args.count, cold=True)
+    _, warm = spawn(args.count, cold=False)
+    print(f"{'per-spawn images (legacy)':<28} {cold * 1e6 / args.count:9.1f} us/spawn")
+    print(f"{'shared archetype':<28} {warm * 1e6 / args.count:9.1f} us/spawn")
+    print(f"{'python bytes / enemy':<28} {measure_memory(args.count):9.0f} B")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Entity Slots Benchmark
+- __slots__ 레이아웃 vs 기존 __dict__ 레이아웃 (같은 메서드, 슬롯만 제거한 복제 클래스)
+- 엔티티 1개당 메모리 (tracemalloc, Python 객체만; 공유 Surface 픽셀 버퍼 제외)
+- 생성/파기 처리량 (웨이브마다 대량 생성 후 버리는 패턴)
+
+실행: python -m benchmarks.bench_entity_slots [--count 5000] [--rounds 5]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+import types
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pygame
+
+SCREEN_SIZE = (1920, 1080)
+
+
+def _dict_layout(cls):
+    """슬롯을 제거한 동일 클래스 (기존 방식 재현)"""
+    namespace = {
+        name: value for name, value in vars(cls).items()
+        if name not in ("__slots__", "__dict__", "__weakref__")
+        and not isinstance(value, types.MemberDescriptorType)
+    }
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+def _placeholder_missing_images():
+    """누락된 에셋은 빈 Surface로 캐시 (레이아웃 측정용, 이미지 내용 무관)"""
+    from asset_manager import AssetManager
+
+    original = AssetManager.get_image.__func__
+
+    def get_image(cls, path, size):
+        try:
+            return original(cls, path, size)
+        except FileNotFoundError:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            AssetManager._cache.setdefault(path, {})[size] = surface
+            return surface
+
+    AssetManager.get_image = classmethod(get_image)
+
+
+def _factories():
+    from effects.death_effects import ShatterFragment
+    from effects.screen_effects import Particle
+    from entities.bacteria import Bacteria
+    from entities.collectibles import CoinGem, HealItem
+    from entities.enemies import Enemy
+    from entities.sphere_droid import SphereDroid
+    from entities.weapons import Bullet
+
+    Vector2 = pygame.math.Vector2
+    height = SCREEN_SIZE[1]
+    piece = pygame.Surface((12, 12), pygame.SRCALPHA)
+    return [
+        (Enemy, lambda cls, i: cls(Vector2(i % 1920, -50), height, 0.5, "NORMAL")),
+        (Bullet, lambda cls, i: cls(Vector2(i % 1920, 500), Vector2(0, -1), 10.0)),
+        (CoinGem, lambda cls, i: cls((i % 1920, 300), height)),
+        (HealItem, lambda cls, i: cls((i % 1920, 300), height)),
+        (Particle, lambda cls, i: cls((i % 1920, 300), Vector2(30, -60), (255, 200, 0), 4, 0.6)),
+        (Bacteria, lambda cls, i: cls((i % 1920, 300), SCREEN_SIZE, 0.0)),
+        (SphereDroid, lambda cls, i: cls((i % 1920, 100), SCREEN_SIZE, "left")),
+        (ShatterFragment, lambda cls, i: cls(piece, Vector2(i % 1920, 300), Vector2(50, -80), 90.0)),
+    ]
+
+
+def bytes_per_entity(cls, factory, count: int) -> float:
+    factory(cls, 0)  # 에셋/아키타입 캐시 워밍업
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    entities = [factory(cls, i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del entities
+    return total / count
+
+
+def create_destroy_rate(cls, factory, count: int, rounds: int) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        entities = [factory(cls, i) for i in range(count)]
+        del entities
+    return count * rounds / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Entity __slots__ benchmark")
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+    _placeholder_missing_images()
+
+    print(f"{args.count} entities x {args.rounds} rounds (bytes: Python objects per entity)")
+    print(f"{'entity':<16} | {'dict B':>8} | {'slots B':>8} | {'saved':>6} | "
+          f"{'dict /s':>10} | {'slots /s':>10}")
+    print("-" * 74)
+    for cls, factory in _factories():
+        legacy = _dict_layout(cls)
+        dict_bytes = bytes_per_entity(legacy, factory, args.count)
+        slot_bytes = bytes_per_entity(cls, factory, args.count)
+        dict_rate = create_destroy_rate(legacy, factory, args.count, args.rounds)
+        slot_rate = create_destroy_rate(cls, factory, args.count, args.rounds)
+        saved = 1.0 - slot_bytes / dict_bytes if dict_bytes else 0.0
+        print(f"{cls.__name__:<16} | {dict_bytes:8.0f} | {slot_bytes:8.0f} | {saved:6.1%} | "
+              f"{dict_rate:10.0f} | {slot_rate:10.0f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Siege Formation Benchmark
+- 기존 방식 적 객체 리스트 (선형 충돌 검사) vs FormationEngine (격자 조회)
+- 포메이션 크기별 update + 총알 충돌 처리 시간 측정
+
+실행: python -m benchmarks.bench_formation [--bullets 200] [--frames 120]
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pygame
+
+from entities.siege_entities import WaveManager
+
+SCREEN_SIZE = (1920, 1080)
+
+
+class _LegacyEnemy:
+    """기존 FormationEnemy의 포메이션 이동/충돌 부분 (비교 기준)"""
+
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+        self.formation_x = x
+        self.formation_y = y
+        self.alive = True
+        self.rect = pygame.Rect(x - 20, y - 20, 40, 40)
+
+    def update(self, dt: float):
+        dx = self.formation_x - self.x
+        dy = self.formation_y - self.y
+        self.x += dx * 2.0 * dt
+        self.y += dy * 2.0 * dt
+        self.rect.centerx = int(self.x)
+        self.rect.centery = int(self.y)
+
+
+def legacy_frame(enemies, bullet_rects, dt, sway):
+    """기존 방식: 적마다 흔들림 누적 + 개별 업데이트 + 총알마다 전체 적 선형 검사"""
+    for enemy in enemies:
+        if enemy.alive:
+            enemy.formation_x += sway * dt
+    for enemy in enemies:
+        if enemy.alive:
+            enemy.update(dt)
+    for rect in bullet_rects:
+        for enemy in enemies:
+            if enemy.alive and enemy.rect.colliderect(rect):
+                break
+
+
+def engine_frame(manager, bullet_rects, dt, player_pos):
+    """FormationEngine: offset 이동 + 격자 셀 조회"""
+    manager.update(dt, 0.0, player_pos, [])
+    for rect in bullet_rects:
+        manager.formation.query_rect(rect)
+
+
+def run(rows, cols, bullets, frames):
+    rng = random.Random(1)
+    bullet_rects = [
+        pygame.Rect(rng.randint(0, SCREEN_SIZE[0]), rng.randint(0, 600), 10, 10)
+        for _ in range(bullets)
+    ]
+    player_pos = pygame.math.Vector2(SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] - 120)
+
+    enemies = [_LegacyEnemy(100 + c * 60, 100 + r * 50) for r in range(rows) for c in range(cols)]
+    start = time.perf_counter()
+    for frame in range(frames):
+        sway = math.sin((frame + 1) / 60 * 1.5) * 20
+        legacy_frame(enemies, bullet_rects, 1 / 60, sway)
+    legacy_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+    manager = WaveManager(SCREEN_SIZE)
+    manager.start_wave(1, rows=rows, cols=cols)
+    manager.dive_cooldown = 0.5
+    start = time.perf_counter()
+    for _ in range(frames):
+        engine_frame(manager, bullet_rects, 1 / 60, player_pos)
+    engine_ms = (time.perf_counter() - start) * 1000.0 / frames
+
+    print(f"{rows:>3}x{cols:<4} ({rows * cols:>5} enemies)  legacy {legacy_ms:8.3f} ms/frame  "
+          f"engine {engine_ms:8.3f} ms/frame  x{legacy_ms / max(engine_ms, 1e-6):.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Siege formation benchmark")
+    parser.add_argument("--bullets", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    pygame.init()
+    print(f"Formation update + {args.bullets} bullet queries per frame")
+    print("-" * 90)
+    for rows, cols in [(6, 10), (12, 20), (24, 40)]:
+        run(rows, cols, args.bullets, args.frames)
+
+
+if __name__ == "__main__":
+    main()
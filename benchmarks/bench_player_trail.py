@@ -0,0 +1,92 @@
+"""
+Player Trail Benchmark
+- 최고 속도로 이동하는 플레이어의 move + update + draw 프레임 시간 측정
+- 방향키를 주기적으로 바꿔 기울기/이동 각도가 계속 변하도록 함
+- 캐시 크기 0 = 기존 방식 (매 프레임 copy/rotate/smoothscale)
+
+실행: python -m benchmarks.bench_player_trail [--frames 1200] [--ship FIGHTER]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pygame
+
+import config
+
+SCREEN_SIZE = (1280, 720)
+
+# 8방향 순환 (프레임 단위로 키 입력 변경)
+DIRECTIONS = [
+    (pygame.K_RIGHT,), (pygame.K_RIGHT, pygame.K_DOWN), (pygame.K_DOWN,),
+    (pygame.K_DOWN, pygame.K_LEFT), (pygame.K_LEFT,), (pygame.K_LEFT, pygame.K_UP),
+    (pygame.K_UP,), (pygame.K_UP, pygame.K_RIGHT),
+]
+
+
+def run(label: str, ship: str, frames: int, cache_size: int, trail: bool):
+    from entities.player import Player
+
+    config.PLAYER_TRAIL_SPRITE_CACHE = cache_size
+    config.PLAYER_TRAIL_DRAW_PARTICLES = trail
+    screen = pygame.display.get_surface()
+    player = Player(pygame.math.Vector2(SCREEN_SIZE[0] / 2, SCREEN_SIZE[1] / 2),
+                    SCREEN_SIZE[1], {}, ship_type=ship)
+    renderer = player.trail_renderer
+
+    dt = 1.0 / 60.0
+    samples = []
+    for frame in range(frames):
+        keys = defaultdict(bool)
+        for key in DIRECTIONS[(frame // 20) % len(DIRECTIONS)]:
+            keys[key] = True
+        current_time = frame * dt
+
+        start = time.perf_counter()
+        player.move(keys, dt, SCREEN_SIZE, current_time)
+        if trail:
+            player._create_movement_effects(current_time)
+        player.update(dt, SCREEN_SIZE, current_time)
+        player.update_movement_effects(dt)
+        screen.fill((0, 0, 0))
+        player.draw(screen)
+        samples.append((time.perf_counter() - start) * 1000.0)
+
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    allocated = renderer.sprites.misses
+    print(f"{label:<24} mean {statistics.mean(samples):7.3f} ms | p95 {p95:7.3f} ms | "
+          f"sprite builds {allocated:6d} ({allocated / frames:5.2f}/frame) | "
+          f"cache hits {renderer.sprites.hits}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Player trail benchmark")
+    parser.add_argument("--frames", type=int, default=1200)
+    parser.add_argument("--ship", default="FIGHTER")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+
+    cache_size = getattr(config, "PLAYER_TRAIL_SPRITE_CACHE", 192)
+    print(f"Player move/update/draw at full speed, {args.frames} frames, ship {args.ship}")
+    print("-" * 100)
+    run("no cache (legacy)", args.ship, args.frames, 0, trail=False)
+    run("sprite cache", args.ship, args.frames, cache_size, trail=False)
+    run("sprite cache + trail", args.ship, args.frames, cache_size, trail=True)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
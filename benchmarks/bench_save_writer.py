@@ -0,0 +1,106 @@
+"""
+Save Latency Benchmark
+- 프레임 루프에서 체감되는 저장 지연 시간 측정
+- 기존 방식: json.dump(indent) 동기 기록
+- SaveWriter: 메인 스레드 스냅샷 + 백그라운드 원자적 기록
+
+실행: python -m benchmarks.bench_save_writer [--items 5000] [--saves 60]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from systems.save_writer import SaveWriter
+
+
+def make_save_data(item_count: int) -> dict:
+    """큰 인벤토리를 가진 저장 데이터 생성"""
+    return {
+        "score": 123456,
+        "current_ship": "FIGHTER",
+        "player_upgrades": {f"upgrade_{i}": i % 7 for i in range(64)},
+        "player_inventory": {
+            f"item_{i}": {"count": i % 13, "level": i % 5, "name": f"부품 {i}"}
+            for i in range(item_count)
+        },
+    }
+
+
+def legacy_save(path: Path, data: dict):
+    """기존 방식 - 메인 스레드에서 직접 기록"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def measure(label: str, save_fn, data: dict, saves: int) -> list:
+    """저장 호출이 프레임 루프를 막는 시간 (ms) 측정"""
+    samples = []
+    for i in range(saves):
+        data["score"] = i
+        start = time.perf_counter()
+        save_fn(data)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{label:<28} mean {statistics.mean(samples):8.3f} ms | "
+          f"p95 {p95:8.3f} ms | max {samples[-1]:8.3f} ms")
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Save latency benchmark")
+    parser.add_argument("--items", type=int, default=5000, help="inventory entries")
+    parser.add_argument("--saves", type=int, default=60, help="save calls per run")
+    args = parser.parse_args()
+
+    data = make_save_data(args.items)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        print(f"Save latency (frame-loop blocking), {args.items} items x {args.saves} saves")
+        print("-" * 80)
+
+        measure("legacy json.dump(indent)", lambda d: legacy_save(tmp_dir / "legacy.json", d),
+                data, args.saves)
+
+        sync_writer = SaveWriter(async_writes=False)
+        measure("SaveWriter (sync, fsync)", lambda d: sync_writer.submit(tmp_dir / "sync.json", d),
+                data, args.saves)
+
+        async_writer = SaveWriter(async_writes=True)
+        measure("SaveWriter (background)", lambda d: async_writer.submit(tmp_dir / "async.json", d),
+                data, args.saves)
+
+        binary_writer = SaveWriter(async_writes=True, save_format_name="binary")
+        measure("SaveWriter (binary .sav)", lambda d: binary_writer.submit(tmp_dir / "binary.json", d),
+                data, args.saves)
+        binary_writer.close()
+
+        flush_start = time.perf_counter()
+        async_writer.close()
+        flush_ms = (time.perf_counter() - flush_start) * 1000.0
+
+        stats = async_writer.stats
+        print("-" * 80)
+        print(f"background: written {stats['written']}, coalesced {stats['coalesced']}, "
+              f"failed {stats['failed']}, last write {stats['last_write_ms']:.2f} ms, "
+              f"final flush {flush_ms:.2f} ms")
+
+        loaded = async_writer.read(tmp_dir / "async.json")
+        assert loaded is not None and loaded["score"] == args.saves - 1, "checksum/round-trip failed"
+        print("round-trip: OK (checksum verified)")
+
+        json_size = (tmp_dir / "async.json").stat().st_size
+        binary_size = (tmp_dir / "binary.sav").stat().st_size
+        print(f"file size: json {json_size} bytes, binary {binary_size} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+SFX Voice Limiting Benchmark (headless, dummy audio driver)
+- legacy: 요청마다 즉시 Sound.play() (이전 SoundManager.play_sfx 동작)
+- limited: 프레임 병합 + 효과음별 동시 재생 상한 + 우선순위 예약 채널
+
+밀집 전투를 흉내내 프레임마다 enemy_hit/enemy_death/coin_pickup/shoot을 대량 요청하고,
+주기적으로 player_hit을 요청해 실제로 채널을 얻었는지 확인합니다.
+
+limited 결과가 아래 조건을 만족하지 않으면 종료 코드 1로 끝납니다.
+- 포화 상태에서도 player_hit 요청이 모두 실제로 재생됨
+- 같은 프레임 요청 병합이 한 번 이상 일어남 (merged > 0)
+- 효과음별 동시 재생 수가 config.SFX_VOICE_LIMITS 상한을 넘지 않음
+
+실행: python -m benchmarks.bench_sfx_voices [--frames 180] [--hits 40] [--coins 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pygame
+
+import config
+from sound_manager import SoundManager
+
+FRAME_SECONDS = 1.0 / 60.0
+PLAYER_HIT_INTERVAL = 30  # 프레임
+
+
+def _frame_requests(args):
+    """한 프레임의 play_sfx 요청 목록"""
+    return (
+        ["shoot"] * args.shots
+        + ["enemy_hit"] * args.hits
+        + ["enemy_death"] * args.kills
+        + ["coin_pickup"] * args.coins
+    )
+
+
+def _player_hit_playing(manager: SoundManager) -> bool:
+    sound = manager.get_sfx("player_hit")
+    if sound is None:
+        return False
+    return any(
+        pygame.mixer.Channel(i).get_sound() is sound and pygame.mixer.Channel(i).get_busy()
+        for i in range(pygame.mixer.get_num_channels())
+    )
+
+
+def _voice_limit(name: str) -> int:
+    return config.SFX_VOICE_LIMITS.get(name, config.SFX_DEFAULT_VOICE_LIMIT)
+
+
+def run(manager: SoundManager, args, legacy: bool):
+    pygame.mixer.stop()
+    manager.reset_sfx_stats()
+    requests = _frame_requests(args)
+
+    play_calls = 0
+    player_hits = 0
+    player_hits_heard = 0
+    voice_peak = {name: 0 for name in set(requests)}
+    sfx_time = 0.0
+
+    for frame in range(args.frames):
+        frame_start = time.perf_counter()
+        names = list(requests)
+        if frame % PLAYER_HIT_INTERVAL == 0:
+            names.append("player_hit")
+            player_hits += 1
+
+        start = time.perf_counter()
+        for name in names:
+            if legacy:
+                sound = manager.get_sfx(name)
+                if sound is not None:
+                    sound.set_volume(manager.sfx_volume)
+                    sound.play()
+                    play_calls += 1
+            else:
+                manager.play_sfx(name)
+        if not legacy:
+            manager.end_frame()
+            play_calls = manager.sfx_stats["played"]
+        sfx_time += time.perf_counter() - start
+
+        if "player_hit" in names and _player_hit_playing(manager):
+            player_hits_heard += 1
+        for name in voice_peak:
+            sound = manager.get_sfx(name)
+            if sound is not None:
+                voice_peak[name] = max(voice_peak[name], sound.get_num_channels())
+
+        # 실시간 진행 (채널 점유 시간이 실제와 같도록)
+        remaining = FRAME_SECONDS - (time.perf_counter() - frame_start)
+        if remaining > 0:
+            time.sleep(remaining)
+
+    busy = sum(pygame.mixer.Channel(i).get_busy() for i in range(pygame.mixer.get_num_channels()))
+    return {
+        "requests": len(requests) * args.frames + player_hits,
+        "mixer_calls": play_calls,
+        "sfx_ms_per_frame": sfx_time * 1000.0 / args.frames,
+        "player_hit": f"{player_hits_heard}/{player_hits}",
+        "player_hits": player_hits,
+        "player_hits_heard": player_hits_heard,
+        "voice_peak": voice_peak,
+        "busy_channels": busy,
+        "stats": manager.get_sfx_stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SFX voice limiting benchmark")
+    parser.add_argument("--frames", type=int, default=180)
+    parser.add_argument("--shots", type=int, default=4)
+    parser.add_argument("--hits", type=int, default=40)
+    parser.add_argument("--kills", type=int, default=10)
+    parser.add_argument("--coins", type=int, default=20)
+    args = parser.parse_args()
+
+    pygame.init()
+    manager = SoundManager()
+    if not manager.enabled:
+        print("FAIL: Sound system unavailable")
+        return 1
+    missing = [name for name in ("enemy_hit", "player_hit") if manager.get_sfx(name) is None]
+    if missing:
+        print(f"FAIL: Missing SFX files: {missing}")
+        return 1
+
+    print(f"{pygame.mixer.get_num_channels()} channels, {config.SFX_RESERVED_CHANNELS} reserved, "
+          f"{args.frames} frames")
+    print(f"{'impl':<8} | {'requests':>8} | {'mixer calls':>11} | {'ms/frame':>8} | "
+          f"{'player_hit heard':>16} | {'busy ch':>7}")
+    print("-" * 76)
+    results = {}
+    for label, legacy in (("legacy", True), ("limited", False)):
+        result = run(manager, args, legacy)
+        results[label] = result
+        print(f"{label:<8} | {result['requests']:8d} | {result['mixer_calls']:11d} | "
+              f"{result['sfx_ms_per_frame']:8.3f} | {result['player_hit']:>16} | {result['busy_channels']:7d}")
+
+    stats = results["limited"]["stats"]
+    print(f"\nlimited: played {stats['played']}, merged {stats['merged']}, dropped {stats['dropped']}, "
+          f"stolen {stats['stolen']}")
+    print(f"dropped by sound: {dict(manager.sfx_dropped)}")
+
+    limited = results["limited"]
+    print(f"voice peak: {limited['voice_peak']}")
+    failures = []
+    if limited["player_hits_heard"] != limited["player_hits"]:
+        failures.append(f"player_hit heard {limited['player_hit']} under saturation")
+    if stats["merged"] <= 0:
+        failures.append("no same-frame requests were merged")
+    for name, peak in sorted(limited["voice_peak"].items()):
+        if peak > _voice_limit(name):
+            failures.append(f"{name} played on {peak} channels (limit {_voice_limit(name)})")
+
+    manager.cleanup()
+    pygame.quit()
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        return 1
+    print("OK: player_hit always heard, requests merged, voice limits respected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
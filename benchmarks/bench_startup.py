@@ -0,0 +1,127 @@
+"""
+Startup Benchmark (cold start)
+- import 시간: `python -X importtime -c "import main"` 출력 파싱 (누적 시간 상위 모듈)
+- time-to-first-frame: 새 프로세스에서 main import → 화면/엔진 생성 →
+  IntroVideoMode push → 첫 update/render/flip 까지의 벽시계 시간
+- eager: 지연 로딩 이전처럼 modes/effects/cutscenes/systems 패키지의
+  모든 공개 이름을 시작 시 import 한 경우 (비교용)
+
+실행: python -m benchmarks.bench_startup [--runs 5] [--top 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = Path(__file__).parent.parent
+
+FIRST_FRAME_MARKER = "BENCH_FIRST_FRAME"
+
+# 새 프로세스에서 실행: 첫 프레임 출력 후 마커 출력
+_FIRST_FRAME_SCRIPT = """
+import sys
+sys.path.insert(0, {root!r})
+{eager}
+import pygame
+import main
+from engine.game_engine import GameEngine
+
+pygame.init()
+screen = pygame.display.set_mode((1280, 720))
+engine = GameEngine(screen, main.AssetManager())
+engine.push_mode("IntroVideoMode")
+engine.current_mode.update(1 / 60, 0.0)
+engine.current_mode.render(screen)
+pygame.display.flip()
+print({marker!r}, flush=True)
+"""
+
+_EAGER_IMPORTS = """
+import modes, effects, cutscenes, systems
+for _pkg in (modes, effects, cutscenes, systems):
+    for _name in _pkg.__all__:
+        getattr(_pkg, _name)
+"""
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def measure_importtime(target: str = "main"):
+    """-X importtime 출력 → [(누적 us, 자체 us, 모듈)]"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=ROOT, env=_env(), capture_output=True, text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+    return rows
+
+
+def measure_first_frame(eager: bool) -> float:
+    """프로세스 시작 → 첫 프레임 flip 까지 (ms)"""
+    script = _FIRST_FRAME_SCRIPT.format(
+        root=str(ROOT), eager=_EAGER_IMPORTS if eager else "", marker=FIRST_FRAME_MARKER
+    )
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", script],
+        cwd=ROOT, env=_env(), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    elapsed = None
+    for line in process.stdout:
+        if line.strip() == FIRST_FRAME_MARKER:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            break
+    process.kill()
+    process.wait()
+    if elapsed is None:
+        raise RuntimeError("first frame was not reached")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    # 1. import 시간
+    totals = []
+    rows = []
+    for _ in range(args.runs):
+        rows = measure_importtime()
+        totals.append(next(cum for cum, _, name in rows if name == "main") / 1000.0)
+    print(f"import main: median {statistics.median(totals):.1f} ms over {args.runs} runs, "
+          f"{len(rows)} modules imported")
+    print(f"\ntop {args.top} by cumulative time (last run)")
+    print(f"{'cumulative ms':>14} | {'self ms':>8} | module")
+    print("-" * 60)
+    for cumulative, self_us, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"{cumulative / 1000.0:14.1f} | {self_us / 1000.0:8.1f} | {name}")
+
+    # 2. time-to-first-frame
+    print("\ntime-to-first-frame (process spawn -> first flip)")
+    print(f"{'impl':<6} | {'median ms':>10} | {'min ms':>8}")
+    print("-" * 32)
+    for label, eager in (("eager", True), ("lazy", False)):
+        samples = [measure_first_frame(eager) for _ in range(args.runs)]
+        print(f"{label:<6} | {statistics.median(samples):10.1f} | {min(samples):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
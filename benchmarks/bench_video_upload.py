@@ -0,0 +1,82 @@
+"""
+Video Frame Upload Benchmark (headless)
+- legacy: cvtColor 결과(RGB)를 swapaxes → pygame.surfarray.make_surface (프레임마다 새 Surface)
+- reused: BGRA 배열을 재사용 Surface 픽셀 버퍼로 복사 (VideoPlayer._upload)
+
+디코딩 자체는 백그라운드 스레드로 옮겨졌으므로 메인 스레드에 남는 비용만 측정합니다.
+
+실행: python -m benchmarks.bench_video_upload [--frames 120] [--resolutions 1280x720,1920x1080]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pygame
+
+from systems.video_player import VideoPlayer
+
+
+def _parse_resolutions(text):
+    return [tuple(int(v) for v in item.split("x")) for item in text.split(",") if item]
+
+
+def bench_legacy(frames_rgb):
+    start = time.perf_counter()
+    for rgb in frames_rgb:
+        surface = pygame.surfarray.make_surface(rgb.swapaxes(0, 1))
+    del surface
+    return (time.perf_counter() - start) * 1000.0 / len(frames_rgb)
+
+
+def bench_reused(player, frames_bgra):
+    start = time.perf_counter()
+    for bgra in frames_bgra:
+        player._upload(bgra)
+    return (time.perf_counter() - start) * 1000.0 / len(frames_bgra)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Video frame upload benchmark")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--resolutions", default="1280x720,1920x1080")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    rng = np.random.default_rng(0)
+
+    print(f"{'resolution':<10} | {'legacy ms':>9} | {'reused ms':>9} | {'speedup':>7}")
+    print("-" * 46)
+    for width, height in _parse_resolutions(args.resolutions):
+        # 프레임 몇 장을 순환 (메모리 절약)
+        pool = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(4)]
+        frames_rgb = [pool[i % len(pool)] for i in range(args.frames)]
+        bgra_pool = [np.dstack([rgb[:, :, ::-1], np.full((height, width), 255, np.uint8)]) for rgb in pool]
+        frames_bgra = [bgra_pool[i % len(bgra_pool)] for i in range(args.frames)]
+
+        # 디코더 스레드 없이 업로드 경로만 사용
+        player = VideoPlayer("bench", (width, height))
+        player.size = (width, height)
+        player.surface = pygame.Surface(player.size, 0, 32)
+        player._direct_upload = (
+            player.surface.get_masks()[:3] == (0xFF0000, 0x00FF00, 0x0000FF)
+            and player.surface.get_pitch() == width * 4
+        )
+
+        legacy_ms = bench_legacy(frames_rgb)
+        reused_ms = bench_reused(player, frames_bgra)
+        print(f"{width}x{height:<5} | {legacy_ms:9.3f} | {reused_ms:9.3f} | {legacy_ms / reused_ms:6.1f}x")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
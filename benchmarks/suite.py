@@ -0,0 +1,616 @@
+"""
+Performance Regression Suite - 핵심 시스템 마이크로벤치마크
+
+헤드리스 SDL에서 각 벤치마크를 (엔티티 수 × 해상도) 조합으로 실행하고,
+라운드마다 새 상태를 준비(setup, 측정 제외)한 뒤 측정 대상만 시간을 잽니다.
+결과는 기준선(baseline) JSON으로 저장하고, 이후 실행과 비교 리포트를 출력합니다.
+
+실행:
+    python -m benchmarks.suite                              # 전체 실행
+    python -m benchmarks.suite --filter collision           # 이름 필터
+    python -m benchmarks.suite --save-baseline main         # benchmarks/baselines/main.json 저장
+    python -m benchmarks.suite --compare main               # 기준선 대비 리포트
+    python -m benchmarks.suite --compare main --fail-on-regression  # 회귀 시 종료 코드 1
+    python -m benchmarks.suite --compare reference          # 저장소에 포함된 기준선 대비
+
+기준선 reference.json:
+    benchmarks/baselines/reference.json은 저장소에 커밋된 기준선입니다 (생성 환경은 "meta" 참고).
+    다른 머신의 결과와 절대 시간을 비교하면 하드웨어 차이가 섞이므로, 회귀 판정은 같은
+    머신에서 만든 기준선과 하는 것이 정확합니다.
+    성능에 영향을 주는 변경을 병합하거나 벤치마크 정의(케이스/inner)를 바꾸면 다음으로 갱신해 함께 커밋합니다.
+        python -m benchmarks.suite --save-baseline reference
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pygame
+
+import config
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+DEFAULT_RESOLUTIONS = ["1280x720", "1920x1080"]
+DEFAULT_ROUNDS = 30        # 라운드가 적으면 중앙값이 실행마다 10% 이상 흔들림
+DEFAULT_THRESHOLD = 0.10
+DT = 1.0 / 60.0
+
+
+# =========================================================
+# 벤치마크 레지스트리
+# =========================================================
+
+@dataclass
+class Benchmark:
+    """
+    벤치마크 정의
+
+    factory(**params) → (setup, run)
+        setup() → 라운드별 새 상태 (측정 제외)
+        run(state) → 측정 대상 (inner번의 연산을 수행)
+    """
+    name: str
+    factory: Callable[..., Tuple[Callable[[], Any], Callable[[Any], None]]]
+    params: Dict[str, List[Any]] = field(default_factory=dict)
+    uses_resolution: bool = True
+    inner: int = 1
+
+    def cases(self, resolutions: List[str]) -> List[Dict[str, Any]]:
+        grid = dict(self.params)
+        if self.uses_resolution:
+            grid["resolution"] = resolutions
+        keys = list(grid)
+        return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, params: Dict[str, List[Any]] = None, uses_resolution: bool = True, inner: int = 1):
+    """벤치마크 등록 데코레이터"""
+    def decorator(factory):
+        BENCHMARKS.append(Benchmark(name, factory, params or {}, uses_resolution, inner))
+        return factory
+    return decorator
+
+
+def case_id(name: str, params: Dict[str, Any]) -> str:
+    return f"{name}[{','.join(f'{k}={v}' for k, v in params.items())}]"
+
+
+def _screen_size(resolution: str) -> Tuple[int, int]:
+    width, height = (int(v) for v in resolution.lower().split("x"))
+    return width, height
+
+
+def _display(resolution: str) -> pygame.Surface:
+    size = _screen_size(resolution)
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != size:
+        screen = pygame.display.set_mode(size)
+    return screen
+
+
+# =========================================================
+# 공통 픽스처
+# =========================================================
+
+def _spawn_enemies(count: int, screen_size: Tuple[int, int], rng: random.Random) -> list:
+    from entities.enemies import Enemy
+
+    types = [
+        name for name, data in config.ENEMY_TYPES.items()
+        if not data.get("is_boss", False) and not data.get("use_custom_image", False)
+    ]
+    enemies = []
+    for i in range(count):
+        pos = pygame.math.Vector2(rng.uniform(0, screen_size[0]), rng.uniform(0, screen_size[1]))
+        enemies.append(Enemy(pos, screen_size[1], 0.5, types[i % len(types)]))
+    return enemies
+
+
+def _fire_at(bullets, enemies, count: int, rng: random.Random, screen_size: Tuple[int, int]):
+    """절반은 적 위치, 절반은 무작위 위치에 총알 생성"""
+    from entities.weapons import spawn_bullet
+
+    for i in range(count):
+        if enemies and i % 2 == 0:
+            target = enemies[i % len(enemies)].pos
+            pos = pygame.math.Vector2(target.x, target.y)
+        else:
+            pos = pygame.math.Vector2(rng.uniform(0, screen_size[0]), rng.uniform(0, screen_size[1]))
+        angle = rng.uniform(0, math.tau)
+        direction = pygame.math.Vector2(math.cos(angle), math.sin(angle))
+        spawn_bullet(bullets, pos, direction, 10.0, False, speed=600.0)
+
+
+def _init_ui_fonts(screen_size: Tuple[int, int]) -> Dict[str, pygame.font.Font]:
+    """GameEngine 폰트 초기화와 같은 크기 비율로 config.UI_FONTS / EMOJI_FONTS 설정"""
+    from asset_manager import AssetManager
+
+    height = screen_size[1]
+    assets = AssetManager()
+    config.UI_FONTS = {
+        key: assets.get_font(int(height * config.FONT_SIZE_RATIOS[key.upper()]))
+        for key in ("huge", "large", "medium", "small", "tiny", "micro", "icon")
+    }
+    for key in ("light_small", "light_tiny"):
+        size_key = key.replace("light_", "").upper()
+        config.UI_FONTS[key] = assets.get_light_font(int(height * config.FONT_SIZE_RATIOS[size_key]))
+    for key in ("SMALL", "MEDIUM", "LARGE"):
+        config.EMOJI_FONTS[key] = assets.get_emoji_font(int(height * config.FONT_SIZE_RATIOS[key]))
+    return config.UI_FONTS
+
+
+# =========================================================
+# 벤치마크 정의
+# =========================================================
+
+@benchmark("update_game_objects", params={"enemies": [25, 100, 400]}, inner=5)
+def bench_update_game_objects(enemies: int, resolution: str):
+    from effects.combat_effects import DamageNumberManager
+    from effects.death_effects import DeathEffectManager
+    from effects.screen_effects import ScreenShake
+    from game_logic.helpers import reset_game
+    from game_logic.wave_manager import update_game_objects
+
+    screen_size = _display(resolution).get_size()
+
+    def setup():
+        rng = random.Random(1234)
+        random.seed(1234)
+        player, enemy_list, bullets, gems, effects, game_data = reset_game(
+            screen_size, dict(config.INITIAL_PLAYER_UPGRADES)
+        )
+        enemy_list.extend(_spawn_enemies(enemies, screen_size, rng))
+        _fire_at(bullets, enemy_list, enemies * 4, rng, screen_size)
+        return (player, enemy_list, bullets, gems, effects, game_data,
+                DamageNumberManager(), ScreenShake(), DeathEffectManager())
+
+    def run(state):
+        player, enemy_list, bullets, gems, effects, game_data, numbers, shake, deaths = state
+        current_time = 10.0
+        for _ in range(5):
+            current_time += DT
+            update_game_objects(
+                player, enemy_list, bullets, gems, effects, screen_size, DT, current_time, game_data,
+                damage_number_manager=numbers, screen_shake=shake, death_effect_manager=deaths,
+            )
+
+    return setup, run
+
+
+@benchmark("bullet_enemy_collision", params={"enemies": [25, 100, 400]}, uses_resolution=False, inner=10)
+def bench_bullet_enemy_collision(enemies: int):
+    """
+    update_game_objects 5.1 단계의 총알-적 판정만 분리 측정
+    (BulletStore.overlap_rects broad-phase + colliderect 정밀 판정)
+
+    CombatSystem.process_bullet_enemy_collision은 모드에서 호출되지 않는 경로라
+    실제 전투 루프가 쓰는 판정을 측정합니다.
+    """
+    from entities.bullet_store import BulletStore
+
+    screen_size = _display("1280x720").get_size()
+
+    def setup():
+        rng = random.Random(1234)
+        enemy_list = _spawn_enemies(enemies, screen_size, rng)
+        bullets = BulletStore(screen_height=screen_size[1])
+        _fire_at(bullets, enemy_list, enemies * 4, rng, screen_size)
+        return bullets, enemy_list
+
+    def run(state):
+        bullets, enemy_list = state
+        for _ in range(10):
+            candidates_by_bullet = bullets.overlap_rects([enemy.hitbox for enemy in enemy_list])
+            for bullet, candidate_indices in candidates_by_bullet:
+                for enemy in (enemy_list[i] for i in candidate_indices):
+                    if enemy.is_alive and bullet.hitbox.colliderect(enemy.hitbox):
+                        break
+
+    return setup, run
+
+
+@benchmark("update_visual_effects", params={"particles": [100, 500, 2000]}, inner=5)
+def bench_update_visual_effects(particles: int, resolution: str):
+    from game_logic.helpers import create_hit_particles, update_visual_effects
+
+    screen_size = _display(resolution).get_size()
+
+    def setup():
+        random.seed(1234)
+        rng = random.Random(1234)
+        effects = []
+        while len(effects) < particles:
+            create_hit_particles((rng.uniform(0, screen_size[0]), rng.uniform(0, screen_size[1])), effects)
+        return effects[:particles]
+
+    def run(effects):
+        for _ in range(5):
+            update_visual_effects(effects, DT, screen_size, [])
+
+    return setup, run
+
+
+@benchmark("Enemy.draw", params={"enemies": [25, 100, 400]}, inner=10)
+def bench_enemy_draw(enemies: int, resolution: str):
+    screen = _display(resolution)
+    screen_size = screen.get_size()
+
+    def setup():
+        return _spawn_enemies(enemies, screen_size, random.Random(1234))
+
+    def run(enemy_list):
+        for _ in range(10):
+            for enemy in enemy_list:
+                enemy.draw(screen)
+
+    return setup, run
+
+
+@benchmark("DeathEffectManager.update_draw", params={"deaths": [10, 40, 160]}, inner=10)
+def bench_death_effects(deaths: int, resolution: str):
+    from effects.death_effects import DeathEffectManager
+
+    screen = _display(resolution)
+    screen_size = screen.get_size()
+
+    def setup():
+        random.seed(1234)
+        manager = DeathEffectManager()
+        for enemy in _spawn_enemies(deaths, screen_size, random.Random(1234)):
+            manager.trigger_death_effect(enemy)
+        return manager
+
+    def run(manager):
+        for _ in range(10):
+            manager.update(DT)
+            manager.draw(screen)
+
+    return setup, run
+
+
+@benchmark("ParallaxLayer.update_draw", params={"stars": [100, 400, 1600]}, inner=10)
+def bench_parallax_layer(stars: int, resolution: str):
+    from effects.transitions import ParallaxLayer
+
+    screen = _display(resolution)
+    screen_size = screen.get_size()
+    velocity = pygame.math.Vector2(120, -40)
+
+    def setup():
+        random.seed(1234)
+        return ParallaxLayer(screen_size, stars, 0.5, 2, (200, 200, 255), twinkle=True)
+
+    def run(layer):
+        for _ in range(10):
+            layer.update(DT, velocity)
+            layer.draw(screen)
+
+    return setup, run
+
+
+@benchmark("DynamicBackground._create_color_shifted_bg")
+def bench_color_shifted_bg(resolution: str):
+    from systems.dynamic_background import DynamicBackground
+
+    screen_size = _display(resolution).get_size()
+
+    # 결정적 그라데이션 원본 (이미지 파일 의존 없음)
+    original = pygame.Surface(screen_size)
+    for x in range(0, screen_size[0], 8):
+        shade = int(255 * x / screen_size[0])
+        original.fill((shade, 40, 255 - shade), (x, 0, 8, screen_size[1]))
+
+    def setup():
+        background = DynamicBackground(screen_size)
+        background.original_image = original
+        return background
+
+    def run(background):
+        background._create_color_shifted_bg(60, 1.1, 1.05)
+
+    return setup, run
+
+
+@benchmark("AssetManager.get_image", params={"image": ["sprite", "background"], "cache": ["cold", "warm"]})
+def bench_asset_manager_get_image(image: str, cache: str, resolution: str):
+    from asset_manager import AssetManager
+
+    screen_size = _display(resolution).get_size()
+    if image == "sprite":
+        path = config.PLAYER_SHIP_IMAGE_PATH
+        size = (int(screen_size[1] * 0.14),) * 2
+    else:
+        path = sorted(config.BACKGROUND_DIR.glob("*.jpg"))[0]
+        size = screen_size
+
+    def setup():
+        if cache == "cold":
+            AssetManager._cache.pop(path, None)
+        else:
+            AssetManager.get_image(path, size)
+
+    def run(_):
+        AssetManager.get_image(path, size)
+
+    return setup, run
+
+
+@benchmark("menu_background", params={"style": ["gradient", "hangar", "facility"], "cache": ["cold", "warm"]})
+def bench_menu_background(style: str, cache: str, resolution: str):
+    """메뉴 모드 배경 (ShopMode 그라데이션 / HangarMode 글로우 / 시설 배경 이미지)"""
+    from ui_render import get_background, get_background_cache, get_image_background
+
+    screen_size = _display(resolution).get_size()
+
+    def build():
+        if style == "gradient":
+            get_background(screen_size, (15, 22, 28), (30, 37, 43))
+        elif style == "hangar":
+            get_background(screen_size, (8, 12, 24), (23, 30, 54),
+                           radial_color=(20, 40, 80), radial_alpha=30, radial_extent=0.8)
+        else:
+            get_image_background(config.ASSET_DIR / "images" / "base" / "facilities" / "facility_bg.png",
+                                 screen_size)
+
+    def setup():
+        if cache == "cold":
+            get_background_cache().clear()
+        else:
+            build()
+
+    def run(_):
+        build()
+
+    return setup, run
+
+
+@benchmark("draw_hud", params={"values": ["steady", "changing"]}, inner=10)
+def bench_draw_hud(values: str, resolution: str):
+    from game_logic.helpers import reset_game
+    from ui_render import draw_hud, draw_skill_indicators
+
+    screen = _display(resolution)
+    screen_size = screen.get_size()
+    font = _init_ui_fonts(screen_size)["small"]
+
+    def setup():
+        player, _, _, _, _, game_data = reset_game(screen_size, dict(config.INITIAL_PLAYER_UPGRADES))
+        for skill_name in ("toggle_piercing", "add_explosive", "add_frost", "increase_max_hp"):
+            player.acquired_skills[skill_name] = 1
+        return player, game_data
+
+    def run(state):
+        player, game_data = state
+        current_time = 10.0
+        for frame in range(10):
+            current_time += DT
+            if values == "changing":
+                # 매 프레임 HP/코인/EXP 변경 (모든 패널 재생성)
+                player.hp = player.max_hp - frame - 1
+                game_data["score"] += 1
+                game_data["uncollected_score"] += 1
+                game_data["kill_count"] += 1
+            draw_hud(screen, screen_size, font, player, game_data)
+            draw_skill_indicators(screen, screen_size, player, current_time)
+
+    return setup, run
+
+
+@benchmark("modal_screen", params={"screen": ["pause", "shop", "level_up", "wave_clear", "victory", "boss_bar"]},
+           inner=10)
+def bench_modal_screen(screen: str, resolution: str):
+    """일시정지/상점/레벨업/웨이브 클리어/승리 화면과 보스 HP 바 (정지 상태 10프레임)"""
+    from game_logic.helpers import reset_game
+    from game_logic.upgrades import generate_tactical_options
+    from ui_render import (
+        draw_pause_and_over_screens, draw_shop_screen, draw_tactical_menu,
+        draw_wave_clear_screen, draw_victory_screen, draw_boss_health_bar,
+    )
+
+    surface = _display(resolution)
+    screen_size = surface.get_size()
+    fonts = _init_ui_fonts(screen_size)
+
+    def setup():
+        random.seed(1234)
+        player, _, _, _, _, game_data = reset_game(screen_size, dict(config.INITIAL_PLAYER_UPGRADES))
+        game_data["game_state"] = config.GAME_STATE_PAUSED
+        game_data["tactical_options"] = generate_tactical_options(player, game_data)
+        boss = _spawn_enemies(1, screen_size, random.Random(1234))[0]
+        boss.hp = boss.max_hp * 0.4
+        return player, game_data, boss
+
+    def run(state):
+        player, game_data, boss = state
+        for _ in range(10):
+            if screen == "pause":
+                draw_pause_and_over_screens(surface, screen_size, fonts["large"], fonts["medium"], game_data)
+            elif screen == "shop":
+                draw_shop_screen(surface, screen_size, fonts["large"], fonts["medium"], 1500, player.upgrades)
+            elif screen == "level_up":
+                draw_tactical_menu(surface, screen_size, fonts["large"], fonts["medium"], game_data)
+            elif screen == "wave_clear":
+                draw_wave_clear_screen(surface, screen_size, fonts["large"], fonts["medium"], game_data)
+            elif screen == "victory":
+                draw_victory_screen(surface, game_data, player, fonts)
+            else:
+                draw_boss_health_bar(surface, screen_size, fonts["medium"], boss, enemy_count=1, current_wave=5)
+
+    return setup, run
+
+
+# =========================================================
+# 실행 / 기준선 / 리포트
+# =========================================================
+
+def run_case(bench: Benchmark, params: Dict[str, Any], rounds: int, warmup: int) -> Dict[str, Any]:
+    setup, run = bench.factory(**params)
+    samples = []
+    gc_enabled = gc.isenabled()
+    for index in range(warmup + rounds):
+        state = setup()
+        # 측정 구간에서 GC 일시정지가 끼어들지 않도록 (setup 쓰레기는 미리 수거)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run(state)
+            elapsed = (time.perf_counter() - start) * 1000.0 / bench.inner
+        finally:
+            if gc_enabled:
+                gc.enable()
+        if index >= warmup:
+            samples.append(elapsed)
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "mean_ms": statistics.fmean(samples),
+        "stddev_ms": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "rounds": rounds,
+        "inner": bench.inner,
+    }
+
+
+def run_suite(name_filter: str = None, resolutions: List[str] = None,
+              rounds: int = DEFAULT_ROUNDS, warmup: int = 1) -> Dict[str, Dict[str, Any]]:
+    resolutions = resolutions or DEFAULT_RESOLUTIONS
+    results = {}
+    for bench in BENCHMARKS:
+        if name_filter and name_filter.lower() not in bench.name.lower():
+            continue
+        for params in bench.cases(resolutions):
+            cid = case_id(bench.name, params)
+            result = run_case(bench, params, rounds, warmup)
+            results[cid] = result
+            print(f"{cid:<72} median {result['median_ms']:9.3f} ms  "
+                  f"(min {result['min_ms']:.3f}, sd {result['stddev_ms']:.3f})", flush=True)
+    return results
+
+
+def _metadata() -> Dict[str, str]:
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def save_baseline(name: str, results: Dict[str, Dict[str, Any]]) -> Path:
+    BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+    path = BASELINE_DIR / f"{name}.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": _metadata(), "results": results}, f, indent=2)
+    return path
+
+
+def load_baseline(name: str) -> Optional[dict]:
+    path = Path(name) if name.endswith(".json") else BASELINE_DIR / f"{name}.json"
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(baseline: dict, results: Dict[str, Dict[str, Any]], threshold: float) -> List[str]:
+    """기준선 비교 리포트 출력, 회귀한 케이스 id 목록 반환"""
+    base_results = baseline.get("results", {})
+    meta = baseline.get("meta", {})
+    print(f"\ncomparison vs baseline ({meta.get('created', '?')}, {meta.get('platform', '?')}), "
+          f"threshold {threshold * 100:.0f}%")
+    print(f"{'case':<72} | {'base ms':>9} | {'now ms':>9} | {'delta':>7} | status")
+    print("-" * 114)
+
+    regressions = []
+    for cid, result in results.items():
+        base = base_results.get(cid)
+        if base is None:
+            print(f"{cid:<72} | {'-':>9} | {result['median_ms']:9.3f} | {'-':>7} | new")
+            continue
+        delta = (result["median_ms"] - base["median_ms"]) / base["median_ms"] if base["median_ms"] else 0.0
+        # 양쪽 표준편차보다 작은 변화는 잡음으로 간주
+        noise = max(base.get("stddev_ms", 0.0), result["stddev_ms"])
+        significant = abs(result["median_ms"] - base["median_ms"]) > noise
+        if delta > threshold and significant:
+            status = "REGRESSION"
+            regressions.append(cid)
+        elif delta < -threshold and significant:
+            status = "improved"
+        else:
+            status = "ok"
+        print(f"{cid:<72} | {base['median_ms']:9.3f} | {result['median_ms']:9.3f} | "
+              f"{delta * 100:+6.1f}% | {status}")
+
+    missing = sorted(set(base_results) - set(results))
+    if missing:
+        print(f"({len(missing)} baseline cases not run)")
+    print(f"\n{len(regressions)} regression(s)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Core systems performance regression suite")
+    parser.add_argument("--filter", help="run benchmarks whose name contains this text")
+    parser.add_argument("--resolutions", nargs="+", default=DEFAULT_RESOLUTIONS)
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--save-baseline", metavar="NAME", help="store results as benchmarks/baselines/NAME.json")
+    parser.add_argument("--compare", metavar="NAME", help="compare against a stored baseline (name or .json path)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative median slowdown reported as regression")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    parser.add_argument("--list", action="store_true", help="list benchmark cases and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for bench in BENCHMARKS:
+            for params in bench.cases(args.resolutions):
+                print(case_id(bench.name, params))
+        return
+
+    baseline = None
+    if args.compare:
+        baseline = load_baseline(args.compare)
+        if baseline is None:
+            print(f"ERROR: Baseline not found: {args.compare}")
+            sys.exit(2)
+
+    pygame.init()
+    random.seed(1234)
+    results = run_suite(args.filter, args.resolutions, args.rounds, args.warmup)
+
+    if args.save_baseline:
+        path = save_baseline(args.save_baseline, results)
+        print(f"\nbaseline saved: {path}")
+
+    if baseline is not None:
+        regressions = compare(baseline, results, args.threshold)
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
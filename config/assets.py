@@ -20,6 +20,30 @@ FONT_PATH = FONT_DIR / "NanumGothicBold.ttf"
 BACKGROUND_DIR = ASSET_DIR / "backgrounds"
 BACKGROUND_IMAGE_PATH = BACKGROUND_DIR / "bg_default.png"
 
+# 사전 빌드 에셋 번들 (해상도별 스케일 완료 원시 픽셀, python asset_bundle.py --size 1920x1080)
+# 번들이 없거나 원본이 변경된 이미지는 원본 파일에서 로드
+ASSET_BUNDLE_ENABLED = True
+ASSET_BUNDLE_DIR = ASSET_DIR / "bundles"
+
+# 컴파일된 대화/에피소드 콘텐츠 스토어 (SQLite, python -m systems.content_store)
+# 스토어가 없거나 원본 JSON이 변경된 항목은 원본 파일에서 로드
+CONTENT_STORE_ENABLED = True
+CONTENT_STORE_PATH = ASSET_BUNDLE_DIR / "content.db"
+
+# 컷씬 이미지 서비스 캐시 상한 (systems/cutscene_image_service.py) - 초과 시 오래 안 쓴 이미지부터 해제
+CUTSCENE_IMAGE_DECODED_MAX_BYTES = 128 * 1024 * 1024  # 디코딩 원본 (convert 전, 프리로드 결과 포함)
+CUTSCENE_IMAGE_SURFACE_MAX_BYTES = 192 * 1024 * 1024  # convert/스케일 완료 Surface
+
+# 에피소드 세그먼트 선행 로드 (systems/segment_prefetcher.py)
+# 현재 세그먼트 진행 중 다음 세그먼트들의 배경/초상화/컷씬 이미지를 워커 스레드에서 미리 디코딩
+SEGMENT_PREFETCH_ENABLED = True
+SEGMENT_PREFETCH_LOOKAHEAD = 2  # 미리 로드할 다음 세그먼트 수
+SEGMENT_PREFETCH_MAX_BYTES = 256 * 1024 * 1024  # 선행 디코딩 결과 메모리 상한 (초과분은 요청 시 디코딩)
+
+# 동영상 재생 (systems/video_player.py) - 백그라운드 스레드 디코딩 링 버퍼
+VIDEO_BUFFER_FRAMES = 8  # 미리 디코딩/리사이즈해 둘 프레임 수
+VIDEO_SKIP_DECODE_BEHIND = 4  # 재생 위치보다 이만큼 뒤처지면 디코딩 없이 grab()으로 건너뜀
+
 # 스토리 모드 배경 이미지 (웨이브별 고유 배경)
 STORY_BACKGROUNDS = {
     1: "story_bg_01.jpg",  # wallpaperbetter 이미지 (붉은색 테마)
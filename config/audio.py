@@ -84,3 +84,62 @@ DEFAULT_SFX_VOLUME = 0.5   # 효과음 볼륨
 
 # 사운드 활성화 기본값
 SOUND_ENABLED = True       # 사운드 시스템 활성화 여부
+
+# =========================================================
+# 3.6. 🎚️ 효과음 보이스 제한 (sound_manager.py)
+# =========================================================
+
+# 믹서 채널 수 (pygame 기본값 8)
+SFX_NUM_CHANNELS = 16
+
+# 우선순위 사운드 전용 예약 채널 수 (일반 SFX는 이 채널을 사용하지 않음)
+SFX_RESERVED_CHANNELS = 2
+
+# 효과음별 동시 재생 상한 (없으면 SFX_DEFAULT_VOICE_LIMIT)
+SFX_VOICE_LIMITS = {
+    "shoot": 3,
+    "enemy_hit": 3,
+    "enemy_death": 3,
+    "explosion": 2,
+    "coin_pickup": 2,
+    "heal_pickup": 1,
+    "typing": 1,
+}
+SFX_DEFAULT_VOICE_LIMIT = 2
+
+# 우선순위 (높을수록 중요). SFX_PRIORITY_RESERVED 이상은 예약 채널에서 재생하며
+# 예약 채널이 모두 사용 중이면 더 낮은 우선순위의 재생을 끊고 재생
+SFX_PRIORITY = {
+    "player_hit": 3,
+    "boss_spawn": 3,
+    "level_up": 2,
+    "wave_clear": 2,
+    "ability_evasion": 2,
+    "ability_bomb": 2,
+    "ability_cloak": 2,
+    "ability_shield": 2,
+}
+SFX_PRIORITY_RESERVED = 2
+SFX_PRIORITY_BOSS = 3  # 보스 처치 폭발 등 호출 측에서 지정하는 우선순위
+
+# 프레임 내 같은 효과음 병합: 요청 수에 따라 볼륨을 키움 (1 + step * (n - 1), 최대 max_boost배)
+SFX_COALESCE_VOLUME_STEP = 0.15
+SFX_COALESCE_MAX_BOOST = 1.6
+
+# =========================================================
+# 3.7. 📼 BGM 스트리밍 / SFX 지연 로드 (sound_manager.py)
+# =========================================================
+
+# BGM은 pygame.mixer.music으로 스트리밍 (전체 PCM 디코딩 없음)
+# 트랙 전환 시 이전 곡 페이드아웃 시간 (밀리초), 이후 새 곡은 play_bgm의 fade_ms로 페이드인
+BGM_CROSSFADE_OUT_MS = 800
+
+# 시작 시 미리 로드할 효과음 (나머지는 첫 재생 시 로드)
+# 전투 중 첫 재생 지연이 눈에 띄는 자주 쓰는 효과음만 지정
+SFX_PRELOAD = [
+    "shoot",
+    "enemy_hit",
+    "enemy_death",
+    "coin_pickup",
+    "player_hit",
+]
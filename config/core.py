@@ -279,3 +279,27 @@ UI_ICONS = {
     "EXP": "✨",           # 경험치
     "GUN": "🚦",           # 총
 }
+
+# =========================================================
+# 1.3 💾 저장 시스템 설정
+# =========================================================
+
+SAVE_ASYNC_WRITES = True      # 백그라운드 스레드에서 저장 파일 기록 (False: 즉시 동기 기록)
+SAVE_BACKUP_COUNT = 3         # 회전 백업 개수 (save.json.1 ~ save.json.N)
+SAVE_FLUSH_TIMEOUT = 5.0      # 종료 시 대기 중인 저장을 기다리는 최대 시간 (초)
+SAVE_FORMAT = "json"          # "json": 체크섬 포함 JSON / "binary": 섹션별 압축 바이너리 (.sav)
+
+# =========================================================
+# 1.4 🎬 입력 기록 / 리플레이 (성능 문제 재현용)
+# =========================================================
+
+INPUT_RECORDING_ENABLED = False   # True: 아래 모드 진입 시 입력/dt/RNG 시드 기록
+INPUT_RECORDING_MODES = ("WaveMode", "SiegeMode", "TrainingMode")
+REPLAY_DIR = Path("replays")      # 기록 파일 저장 폴더 (*.replay.json.gz)
+
+# =========================================================
+# 1.5 🔁 에셋 핫 리로드 (개발용, systems/hot_reload.py)
+# =========================================================
+
+HOT_RELOAD_ENABLED = False        # True: VFX 설정/이미지, 에피소드/대화 JSON 변경 시 해당 항목만 다시 로드
+HOT_RELOAD_POLL_INTERVAL = 0.5    # 파일 수정 시각 확인 간격 (초)
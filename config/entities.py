@@ -60,6 +60,8 @@ BULLET_DAMAGE_BASE = 20.0  # 기본 총알 데미지 (12.0 → 10.0 밸런스 
 BULLET_HITBOX_RATIO = 0.3  # 총알 이미지 대비 히트박스 비율
 WEAPON_COOLDOWN_BASE = 1.0  # 기본 발사 쿨다운 (초)
 PIERCING_HIT_COUNT = 3 # 관통 총알의 최대 관통 횟수(50)
+BULLET_STORE_CAPACITY = 1024  # 총알 저장소 초기 슬롯 수 (가득 차면 2배로 확장)
+BACTERIA_SWARM_CAPACITY = 256  # 박테리아 군집 초기 슬롯 수 (가득 차면 2배로 확장)
 
 ENEMY_BASE_HP = 100.0  # 기본 적 체력 (80 → 100으로 증가)
 ENEMY_BASE_SPEED = 120  # 기본 적 이동 속도 (150 → 120으로 낮춤)
@@ -207,6 +209,7 @@ ENEMY_TYPES = {
         "is_generator": True,  # 생성기 플래그
         "spawn_bacteria_count": 50,  # 박테리아 투하 개수 (10회 x 5개)
         "spawn_bacteria_interval": 3.0,  # 투하 간격 3초
+        "spawn_bacteria_batch": 5,  # 1회 투하 개수
         "orbit_radius_ratio": 0.2,  # 원운동 반지름 (화면 너비의 20%)
     },
     "BACTERIA": {
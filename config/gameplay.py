@@ -33,6 +33,12 @@ BOSS_RUSH_COMPLETED_WAVES = []  # 보스 러시에서 완료한 웨이브 목록
 BASE_COIN_DROP_PER_KILL = 5  # 적 처치 시 기본 코인 드롭량 (1 → 5)
 HEAL_AMOUNT = 15  # 힐링 아이템 획득 시 회복량
 GEM_HITBOX_RATIO = 0.8  # 젬 이미지 대비 히트박스 비율
+GEM_MAGNET_RANGE_RATIO = 10  # 코인 자석 범위 (플레이어 이미지 너비 배수)
+GEM_MAGNET_SPEED = 500.0  # 코인 자석 끌어당김 속도 (픽셀/초)
+COLLECTIBLE_FIELD_CAPACITY = 256  # 아이템 저장소 초기 슬롯 수 (가득 차면 2배로 확장)
+COIN_MERGE_THRESHOLD = 48  # 필드의 코인이 이 수를 넘으면 가까운 코인끼리 병합
+COIN_MERGE_RADIUS = 40  # 병합 격자 크기 (픽셀, 0이면 병합 안 함)
+COIN_MERGE_TIERS = ((25, 1.2), (100, 1.4))  # 병합 코인 크기 배율 (최소 값, 배율)
 
 ENEMY_SPAWN_INTERVAL = 1.5  # 적 스폰 간격 (초)
 
@@ -170,6 +170,18 @@ SCREEN_SHAKE_SETTINGS = {
     "ENEMY_DEATH": {"intensity": 3, "duration": 3},  # 일반 적 사망
 }
 
+# 피격/처치 이벤트 일괄 처리 설정 (game_logic/combat_events.py)
+# 충돌 루프는 이벤트만 기록하고, 프레임당 한 번 모아서 처리
+# (사운드 중복 제거, 근접 폭발 병합, 프레임당 이펙트 상한)
+KILL_EVENT_SETTINGS = {
+    "merge_radius": 48,  # 이 거리(px) 이내의 폭발/충격 이펙트는 하나로 병합
+    "max_death_effects": 12,  # 프레임당 사망 효과(Shatter 등) 최대 개수
+    "max_explosions": 10,  # 프레임당 폭발 파티클 묶음 최대 개수
+    "max_hit_particles": 24,  # 프레임당 피격 파티클 묶음 최대 개수
+    "max_impacts": 12,  # 프레임당 총알 충돌 이펙트(임팩트 + 충격파) 최대 개수
+    "max_shockwaves": 8,  # 프레임당 Explosive Bullets 충격파 최대 개수
+}
+
 # 타임 슬로우 설정
 TIME_SLOW_SETTINGS = {
     "BOSS_DEATH": {
@@ -187,6 +199,15 @@ FREEZE_FLASH_COLOR = (120, 140, 180)  # 푸른-흰색 (동결 효과)
 BULLET_TRAIL_LENGTH = 4  # 트레일 잔상 개수
 BULLET_TRAIL_ALPHA_DECAY = 0.6  # 트레일 투명도 감소 비율
 
+# 플레이어 트레일/잔상/배기가스 렌더러 (entities/player_trail.py)
+PLAYER_TRAIL_SLOTS = 64           # 트레일 파티클 링 버퍼 크기
+PLAYER_AFTERIMAGE_SLOTS = 16      # 잔상 링 버퍼 크기
+PLAYER_TRAIL_SPRITE_CACHE = 192   # 회전/스케일된 스프라이트 캐시 최대 개수 (LRU)
+PLAYER_TRAIL_ANGLE_STEP = 5.0     # 배기가스 회전 각도 버킷 (도)
+PLAYER_TRAIL_TILT_STEP = 1.0      # 잔상/기체 기울기 버킷 (도)
+PLAYER_TRAIL_SCALE_STEP = 0.05    # 스케일 버킷 (원근감/속도)
+PLAYER_TRAIL_DRAW_PARTICLES = False  # 트레일 파티클 렌더링 (기존 화면에는 그려지지 않던 파티클, 기본 꺼짐)
+
 # 배경 패럴랙스 설정 (3개 레이어)
 # 기존 패럴랙스 레이어 (별) - 원래대로 3개
 PARALLAX_LAYERS = [
@@ -331,6 +352,24 @@ SKILL_INDICATOR_SETTINGS = {
     "synergy_glow_size": 8,  # 시너지 글로우 크기
 }
 
+# HUD 패널 캐시 설정 (ui_render/hud.py) - 표시 값이 바뀔 때만 패널을 다시 그림
+HUD_CACHE_SETTINGS = {
+    "cooldown_step": 0.1,  # 쿨다운 표시 갱신 단위 (초)
+    "blink_levels": 8,  # 패시브 깜박임 밝기 단계 수 (sin 값 양자화)
+}
+
+# UI 배경 Surface 캐시 (ui_render/surfaces.py) - 오버레이/패널/카드 재사용
+UI_SURFACE_CACHE_SETTINGS = {
+    "max_entries": 128,  # 최대 항목 수
+    "max_bytes": 64 * 1024 * 1024,  # 최대 픽셀 메모리 (1080p 전체 화면 오버레이 약 8MB)
+}
+
+# 메뉴 모드 절차적 배경 캐시 (ui_render/backgrounds.py) - (크기, 파라미터)당 한 번만 생성
+UI_BACKGROUND_CACHE_SETTINGS = {
+    "max_entries": 8,  # 최대 항목 수
+    "max_bytes": 48 * 1024 * 1024,  # 최대 픽셀 메모리 (1080p 배경 1장 약 8MB)
+}
+
 # 스킬별 아이콘 및 색상 정의
 SKILL_ICONS = {
     # 공격 스킬 (왼쪽)
@@ -1,26 +1,34 @@
 """
 cutscenes package
 All cutscene effect classes organized by category
+
+Effect classes are loaded lazily (PEP 562): the defining module is imported
+on first attribute access, so importing `cutscenes.overlays` or one effect
+module does not pull in every other effect.
 """
 
-from .base import BaseCutsceneEffect, render_dialogue_box
-from .story_effects import StoryBriefingEffect
-from .memory_effects import (
-    PolaroidMemoryEffect,
-    ShatteredMirrorEffect,
-    DualMemoryEffect,
-    SeasonMemoryEffect,
-    BrokenToyEffect,
-)
-from .document_effects import (
-    ClassifiedDocumentEffect,
-    BurningRecordEffect,
-    FilmReelEffect,
-)
-from .world_effects import StarMapEffect, AndromedaWorldEffect, TwoWorldsEffect
-from .communication_effects import HologramMessageEffect, RadioWaveEffect, CountdownEffect
-from .animation_effects import ShipEntranceEffect
-from .combat_effects import BunkerCannonEffect, CombatMotionEffect, CannonShell
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import BaseCutsceneEffect, render_dialogue_box
+    from .story_effects import StoryBriefingEffect
+    from .memory_effects import (
+        PolaroidMemoryEffect,
+        ShatteredMirrorEffect,
+        DualMemoryEffect,
+        SeasonMemoryEffect,
+        BrokenToyEffect,
+    )
+    from .document_effects import (
+        ClassifiedDocumentEffect,
+        BurningRecordEffect,
+        FilmReelEffect,
+    )
+    from .world_effects import StarMapEffect, AndromedaWorldEffect, TwoWorldsEffect
+    from .communication_effects import HologramMessageEffect, RadioWaveEffect, CountdownEffect
+    from .animation_effects import ShipEntranceEffect
+    from .combat_effects import BunkerCannonEffect, CombatMotionEffect, CannonShell
 
 __all__ = [
     # Base
@@ -53,3 +61,41 @@ __all__ = [
     "CombatMotionEffect",
     "CannonShell",
 ]
+
+# name -> defining module
+_LAZY_IMPORTS = {
+    "BaseCutsceneEffect": ".base",
+    "render_dialogue_box": ".base",
+    "StoryBriefingEffect": ".story_effects",
+    "PolaroidMemoryEffect": ".memory_effects",
+    "ShatteredMirrorEffect": ".memory_effects",
+    "DualMemoryEffect": ".memory_effects",
+    "SeasonMemoryEffect": ".memory_effects",
+    "BrokenToyEffect": ".memory_effects",
+    "ClassifiedDocumentEffect": ".document_effects",
+    "BurningRecordEffect": ".document_effects",
+    "FilmReelEffect": ".document_effects",
+    "StarMapEffect": ".world_effects",
+    "AndromedaWorldEffect": ".world_effects",
+    "TwoWorldsEffect": ".world_effects",
+    "HologramMessageEffect": ".communication_effects",
+    "RadioWaveEffect": ".communication_effects",
+    "CountdownEffect": ".communication_effects",
+    "ShipEntranceEffect": ".animation_effects",
+    "BunkerCannonEffect": ".combat_effects",
+    "CombatMotionEffect": ".combat_effects",
+    "CannonShell": ".combat_effects",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,8 @@ import math
 import random
 from pathlib import Path
 from cutscenes.base import BaseCutsceneEffect, render_dialogue_box
+from cutscenes import overlays
+from systems.cutscene_image_service import get_cutscene_image_service
 
 
 class ShipEntranceEffect:
@@ -139,28 +141,11 @@ class ShipEntranceEffect:
         if speaker in self.portrait_cache:
             return self.portrait_cache[speaker]
 
-        try:
-            from mode_configs.config_story_dialogue import CHARACTER_PORTRAITS
-
-            path = CHARACTER_PORTRAITS.get(speaker)
-        except ImportError:
-            portrait_paths = {
-                "ARTEMIS": "assets/data/episodes/ep1/portraits/portrait_artemis.jpg",
-                "PILOT": "assets/data/episodes/ep1/portraits/portrait_pilot.png",
-            }
-            path = portrait_paths.get(speaker)
-
-        if path:
-            try:
-                img = pygame.image.load(path).convert_alpha()
-                target_size = (180, 180)
-                img = pygame.transform.smoothscale(img, target_size)
-                self.portrait_cache[speaker] = img
-                return img
-            except Exception as e:
-                print(f"WARNING: Failed to load portrait for {speaker}: {e}")
-
-        return None
+        # 공유 이미지 서비스 (에피소드 선택 시 백그라운드 프리로드됨)
+        img = get_cutscene_image_service().get_portrait(speaker, (180, 180))
+        if img is not None:
+            self.portrait_cache[speaker] = img
+        return img
 
     def set_fonts(self, fonts: dict):
         """폰트 설정"""
@@ -320,9 +305,7 @@ class ShipEntranceEffect:
             screen.fill((20, 20, 30))
 
         # 반투명 오버레이 (분위기)
-        overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        screen.blit(overlay, (0, 0))
+        screen.blit(overlays.get_tint_layer(self.screen_size, (0, 0, 0, 100)), (0, 0))
 
         # 플레이어 그리기
         if self.player:
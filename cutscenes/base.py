@@ -6,6 +6,7 @@ Base class and helper functions for all cutscene effects
 import pygame
 import math
 from typing import Tuple, List, Callable, Dict, Optional
+from systems.cutscene_image_service import get_cutscene_image_service
 
 
 # =========================================================
@@ -95,18 +96,21 @@ class BaseCutsceneEffect:
             path: 이미지 경로
             overlay_alpha: 어두운 오버레이 알파값 (0=없음, 220=어둡게)
         """
-        try:
-            img = pygame.image.load(path).convert()
-            self.background = pygame.transform.smoothscale(img, self.screen_size)
-
-            if overlay_alpha > 0:
-                overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-                overlay.fill((0, 0, 0, overlay_alpha))
-                self.background.blit(overlay, (0, 0))
-        except Exception as e:
-            print(f"WARNING: Failed to load background: {path} - {e}")
+        img = get_cutscene_image_service().get_image(path, self.screen_size, alpha=False)
+        if img is None:
+            print(f"WARNING: Failed to load background: {path}")
             self.background = pygame.Surface(self.screen_size)
             self.background.fill((20, 20, 30))
+            return
+
+        if overlay_alpha > 0:
+            # 공유 Surface는 수정하지 않고 복사본에 오버레이 적용
+            self.background = img.copy()
+            overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, overlay_alpha))
+            self.background.blit(overlay, (0, 0))
+        else:
+            self.background = img
 
     def set_fonts(self, fonts: dict):
         """폰트 설정"""
@@ -117,24 +121,11 @@ class BaseCutsceneEffect:
         if speaker in self.portrait_cache:
             return self.portrait_cache[speaker]
 
-        try:
-            from mode_configs.config_story_dialogue import CHARACTER_PORTRAITS
-
-            path = CHARACTER_PORTRAITS.get(speaker)
-        except ImportError:
-            path = None
-
-        if path:
-            try:
-                img = pygame.image.load(path).convert_alpha()
-                target_size = (120, 120)
-                img = pygame.transform.smoothscale(img, target_size)
-                self.portrait_cache[speaker] = img
-                return img
-            except Exception as e:
-                print(f"WARNING: Failed to load portrait for {speaker}: {e}")
-
-        return None
+        # 공유 이미지 서비스 (에피소드 선택 시 백그라운드 프리로드됨)
+        img = get_cutscene_image_service().get_portrait(speaker, (120, 120))
+        if img is not None:
+            self.portrait_cache[speaker] = img
+        return img
 
     def _start_dialogue(self):
         """현재 대화 시작"""
@@ -9,6 +9,7 @@ import random
 from typing import Tuple, List, Optional
 from pathlib import Path
 from cutscenes.base import BaseCutsceneEffect, render_dialogue_box
+from cutscenes import overlays
 
 
 class CannonShell:
@@ -886,9 +887,12 @@ class CombatMotionEffect:
             # 플래시 오버레이 (워프 시작 시 강한 빛)
             flash_alpha = int(200 * (1 - intro_progress**0.5))
             if flash_alpha > 0:
-                flash_surf = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-                flash_surf.fill((255, 255, 255, flash_alpha))
-                screen.blit(flash_surf, (0, 0))
+                screen.blit(
+                    overlays.get_fade_layer(
+                        self.screen_size, (255, 255, 255), flash_alpha
+                    ),
+                    (0, 0),
+                )
             return
 
         # === 메인 페이즈: 기존 속도감 이미지 (투명도 적용) ===
@@ -929,9 +933,12 @@ class CombatMotionEffect:
 
         # 플래시 오버레이
         if self.flash_alpha > 0:
-            flash_surf = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-            flash_surf.fill((255, 255, 255, self.flash_alpha))
-            screen.blit(flash_surf, (0, 0))
+            screen.blit(
+                overlays.get_fade_layer(
+                    self.screen_size, (255, 255, 255), self.flash_alpha
+                ),
+                (0, 0),
+            )
 
 
 # =========================================================
@@ -8,6 +8,7 @@ import math
 import random
 from pathlib import Path
 from cutscenes.base import BaseCutsceneEffect, render_dialogue_box
+from cutscenes import overlays
 
 
 class HologramMessageEffect(BaseCutsceneEffect):
@@ -189,33 +190,33 @@ class HologramMessageEffect(BaseCutsceneEffect):
                 )
                 screen.blit(holo_surf, pos)
 
-                # 스캔라인 효과
-                for y in range(0, self.screen_size[1], 4):
-                    alpha = 30 if (y + int(self.scanline_offset)) % 8 < 4 else 0
-                    if alpha > 0:
-                        pygame.draw.line(
-                            screen, (0, 0, 0, alpha), (0, y), (self.screen_size[0], y)
-                        )
+                # 스캔라인 효과 (8px 간격 라인을 오프셋 위상에 따라 0/4px 내려 blit)
+                # 화면에 직접 그리던 기존 방식과 같이 불투명 라인
+                scanline_phase = 0 if int(self.scanline_offset) % 8 < 4 else 4
+                screen.blit(
+                    overlays.get_scanline_layer(self.screen_size, 8, (0, 0, 0, 255)),
+                    (0, scanline_phase),
+                )
 
                 # 홀로그램 외곽 글로우
-                glow_surf = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-                glow_rect = pygame.Rect(
-                    pos[0] - 20,
-                    pos[1] - 20,
-                    self.hologram_size[0] + 40,
-                    self.hologram_size[1] + 40,
-                )
-                pygame.draw.rect(
-                    glow_surf, (*self.holo_color, 30), glow_rect, border_radius=10
+                screen.blit(
+                    overlays.get_rect_glow_layer(
+                        (self.hologram_size[0] + 40, self.hologram_size[1] + 40),
+                        self.holo_color,
+                        30,
+                        border_radius=10,
+                    ),
+                    (pos[0] - 20, pos[1] - 20),
                 )
-                screen.blit(glow_surf, (0, 0))
 
         # 페이드
         if self.phase == self.PHASE_FADEIN:
-            fade_surf = pygame.Surface(self.screen_size)
-            fade_surf.fill((0, 0, 0))
-            fade_surf.set_alpha(255 - int(self.fade_alpha))
-            screen.blit(fade_surf, (0, 0))
+            screen.blit(
+                overlays.get_fade_layer(
+                    self.screen_size, (0, 0, 0), 255 - int(self.fade_alpha)
+                ),
+                (0, 0),
+            )
 
         # 대사
         if self.phase == self.PHASE_DIALOGUE:
@@ -488,10 +489,12 @@ class RadioWaveEffect(BaseCutsceneEffect):
 
         # 페이드
         if self.phase == self.PHASE_FADEIN:
-            fade_surf = pygame.Surface(self.screen_size)
-            fade_surf.fill((0, 0, 0))
-            fade_surf.set_alpha(255 - int(self.fade_alpha))
-            screen.blit(fade_surf, (0, 0))
+            screen.blit(
+                overlays.get_fade_layer(
+                    self.screen_size, (0, 0, 0), 255 - int(self.fade_alpha)
+                ),
+                (0, 0),
+            )
 
         # 대사
         if self.phase == self.PHASE_DIALOGUE:
@@ -704,9 +707,12 @@ class CountdownEffect(BaseCutsceneEffect):
         # 경고 플래시 오버레이
         flash_intensity = (math.sin(self.warning_flash) + 1) / 2
         if self.current_count <= 3:
-            flash_surf = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-            flash_surf.fill((100, 20, 20, int(flash_intensity * 50)))
-            screen.blit(flash_surf, (0, 0))
+            screen.blit(
+                overlays.get_fade_layer(
+                    self.screen_size, (100, 20, 20), int(flash_intensity * 50)
+                ),
+                (0, 0),
+            )
 
         # 원형 웨이브 (숫자 주변)
         center = (
@@ -785,9 +791,14 @@ class CountdownEffect(BaseCutsceneEffect):
             # 화면 전체 플래시
             flash_progress = min(1.0, self.phase_timer / 0.5)
             if flash_progress < 1.0:
-                flash_surf = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-                flash_surf.fill((255, 255, 255, int(255 * (1 - flash_progress))))
-                screen.blit(flash_surf, (0, 0))
+                screen.blit(
+                    overlays.get_fade_layer(
+                        self.screen_size,
+                        (255, 255, 255),
+                        int(255 * (1 - flash_progress)),
+                    ),
+                    (0, 0),
+                )
 
             # "전투 개시" 텍스트
             if self.phase_timer > 0.5 and "large" in self.fonts:
@@ -801,10 +812,12 @@ class CountdownEffect(BaseCutsceneEffect):
 
         # 페이드
         if self.phase == self.PHASE_FADEIN:
-            fade_surf = pygame.Surface(self.screen_size)
-            fade_surf.fill((0, 0, 0))
-            fade_surf.set_alpha(255 - int(self.fade_alpha))
-            screen.blit(fade_surf, (0, 0))
+            screen.blit(
+                overlays.get_fade_layer(
+                    self.screen_size, (0, 0, 0), 255 - int(self.fade_alpha)
+                ),
+                (0, 0),
+            )
 
         # 대사
         if self.phase == self.PHASE_DIALOGUE:
@@ -8,6 +8,8 @@ import math
 import random
 from pathlib import Path
 from cutscenes.base import BaseCutsceneEffect, render_dialogue_box
+from cutscenes import overlays
+from systems.cutscene_image_service import get_cutscene_image_service
 
 
 class ClassifiedDocumentEffect:
@@ -640,9 +642,10 @@ class ClassifiedDocumentEffect:
 
         # 어두운 오버레이 (건물 내부로 들어가는 느낌)
         darkness = min(220, int((self.zoom_scale - 1.0) * 100))
-        dark_overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        dark_overlay.fill((0, 0, 0, darkness))
-        screen.blit(dark_overlay, (0, 0))
+        screen.blit(
+            overlays.get_fade_layer(self.screen_size, (0, 0, 0), darkness),
+            (0, 0),
+        )
 
     def _render_gate_sequence(self, screen: pygame.Surface):
         """gate 이미지 시퀀스 렌더링"""
@@ -693,9 +696,12 @@ class ClassifiedDocumentEffect:
 
         # 페이드 오버레이 (gate에서 전환 시)
         if self.fade_alpha > 0:
-            fade_surf = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-            fade_surf.fill((0, 0, 0, int(self.fade_alpha)))
-            screen.blit(fade_surf, (0, 0))
+            screen.blit(
+                overlays.get_fade_layer(
+                    self.screen_size, (0, 0, 0), int(self.fade_alpha)
+                ),
+                (0, 0),
+            )
 
         # 캐비닛 렌더링
         if self.cabinet_y_offset > 0:
@@ -869,10 +875,11 @@ class ClassifiedDocumentEffect:
 
         # 확대 보기 중이면 배경 어둡게
         if self.viewing_doc_index >= 0:
-            dark_overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
             alpha = int(180 * self.view_zoom_progress)
-            dark_overlay.fill((0, 0, 0, alpha))
-            screen.blit(dark_overlay, (0, 0))
+            screen.blit(
+                overlays.get_fade_layer(self.screen_size, (0, 0, 0), alpha),
+                (0, 0),
+            )
 
         # 정렬된 문서들 렌더링
         mouse_pos = pygame.mouse.get_pos()
@@ -997,24 +1004,11 @@ class ClassifiedDocumentEffect:
         if speaker in self.portrait_cache:
             return self.portrait_cache[speaker]
 
-        try:
-            from mode_configs.config_story_dialogue import CHARACTER_PORTRAITS
-
-            path = CHARACTER_PORTRAITS.get(speaker)
-        except ImportError:
-            path = None
-
-        if path:
-            try:
-                img = pygame.image.load(path).convert_alpha()
-                target_size = (120, 120)
-                img = pygame.transform.smoothscale(img, target_size)
-                self.portrait_cache[speaker] = img
-                return img
-            except Exception as e:
-                print(f"WARNING: Failed to load portrait for {speaker}: {e}")
-
-        return None
+        # 공유 이미지 서비스 (에피소드 선택 시 백그라운드 프리로드됨)
+        img = get_cutscene_image_service().get_portrait(speaker, (120, 120))
+        if img is not None:
+            self.portrait_cache[speaker] = img
+        return img
 
     def _render_progress(self, screen: pygame.Surface):
         """진행 상태 표시"""
@@ -1603,7 +1597,15 @@ class BurningRecordEffect:
         max_dist = math.sqrt((w // 2) ** 2 + (h // 2) ** 2)
         burn_radius = int(max_dist * (1.0 - self.burn_progress))
 
-        glow_surf = pygame.Surface(self.screen_size, pygame.SRCALPHA)
+        # 반지름이 매 프레임 바뀌므로 공유 작업 Surface의 링 영역만 지우고 합성
+        glow_surf = overlays.get_scratch_layer(self.screen_size)
+        extent = burn_radius + 4 * 15 + 1
+        area = pygame.Rect(center_x - extent, center_y - extent, extent * 2, extent * 2)
+        area = area.clip(glow_surf.get_rect())
+        if area.width <= 0 or area.height <= 0:
+            return
+        glow_surf.fill((0, 0, 0, 0), area)
+
         # 빛나는 원 (불꽃 색)
         for i in range(5):
             alpha = 40 - i * 7
@@ -1615,7 +1617,7 @@ class BurningRecordEffect:
                 4,
             )
 
-        screen.blit(glow_surf, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        screen.blit(glow_surf, area.topleft, area, special_flags=pygame.BLEND_RGBA_ADD)
 
     def _render_particles(self, screen: pygame.Surface):
         """파티클 렌더링"""
@@ -1639,19 +1641,10 @@ class BurningRecordEffect:
 
     def _render_vignette(self, screen: pygame.Surface):
         """비네트 효과 (붉은 톤)"""
-        vignette = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        screen_w, screen_h = self.screen_size
-        center_x, center_y = screen_w // 2, screen_h // 2
-        max_dist = math.sqrt(center_x**2 + center_y**2)
-
         # 가장자리 어둡게 + 붉은 톤
-        for i in range(10):
-            radius = int(max_dist * (1.0 - i * 0.08))
-            alpha = i * 15
-            pygame.draw.circle(
-                vignette, (30, 10, 5, alpha), (center_x, center_y), radius, 50
-            )
-
+        vignette = overlays.get_ring_vignette_layer(
+            self.screen_size, (30, 10, 5), rings=10, alpha_step=15, ring_width=50
+        )
         screen.blit(vignette, (0, 0))
 
     def _render_dialogue(self, screen: pygame.Surface):
@@ -1691,24 +1684,11 @@ class BurningRecordEffect:
         if speaker in self.portrait_cache:
             return self.portrait_cache[speaker]
 
-        try:
-            from mode_configs.config_story_dialogue import CHARACTER_PORTRAITS
-
-            path = CHARACTER_PORTRAITS.get(speaker)
-        except ImportError:
-            path = None
-
-        if path:
-            try:
-                img = pygame.image.load(path).convert_alpha()
-                target_size = (120, 120)
-                img = pygame.transform.smoothscale(img, target_size)
-                self.portrait_cache[speaker] = img
-                return img
-            except Exception as e:
-                print(f"WARNING: Failed to load portrait for {speaker}: {e}")
-
-        return None
+        # 공유 이미지 서비스 (에피소드 선택 시 백그라운드 프리로드됨)
+        img = get_cutscene_image_service().get_portrait(speaker, (120, 120))
+        if img is not None:
+            self.portrait_cache[speaker] = img
+        return img
 
     def _render_hint(self, screen: pygame.Surface, text: str):
         if "small" not in self.fonts:
@@ -2185,25 +2165,19 @@ class FilmReelEffect:
     def _render_flicker(self, screen: pygame.Surface):
         """필름 깜빡임 렌더링"""
         if self.flicker_alpha > 0:
-            flicker_surf = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-            flicker_surf.fill((255, 250, 240, self.flicker_alpha))
-            screen.blit(flicker_surf, (0, 0))
+            screen.blit(
+                overlays.get_fade_layer(
+                    self.screen_size, (255, 250, 240), self.flicker_alpha
+                ),
+                (0, 0),
+            )
 
     def _render_vignette(self, screen: pygame.Surface):
         """비네트 효과 (약하게, 중립 색상)"""
-        vignette = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        screen_w, screen_h = self.screen_size
-        center_x, center_y = screen_w // 2, screen_h // 2
-        max_dist = math.sqrt(center_x**2 + center_y**2)
-
-        # 가장자리만 약간 어둡게 (중립 톤)
-        for i in range(8):
-            radius = int(max_dist * (1.0 - i * 0.08))
-            alpha = i * 10  # 약한 비네트
-            pygame.draw.circle(
-                vignette, (15, 15, 20, alpha), (center_x, center_y), radius, 60
-            )
-
+        # 가장자리만 약간 어둡게 (중립 톤, 약한 비네트)
+        vignette = overlays.get_ring_vignette_layer(
+            self.screen_size, (15, 15, 20), rings=8, alpha_step=10, ring_width=60
+        )
         screen.blit(vignette, (0, 0))
 
     def _render_dialogue(self, screen: pygame.Surface):
@@ -8,6 +8,8 @@ import math
 import random
 from pathlib import Path
 from cutscenes.base import BaseCutsceneEffect, render_dialogue_box
+from cutscenes import overlays
+from systems.cutscene_image_service import get_cutscene_image_service
 
 
 class PolaroidMemoryEffect:
@@ -130,11 +132,13 @@ class PolaroidMemoryEffect:
 
     def _load_background(self, path: str):
         """배경 이미지 로드"""
-        try:
-            img = pygame.image.load(path).convert()
-            self.background = pygame.transform.scale(img, self.screen_size)
-        except Exception as e:
-            print(f"WARNING: Failed to load background: {path} - {e}")
+        img = get_cutscene_image_service().get_image(
+            path, self.screen_size, alpha=False, smooth=False
+        )
+        if img is not None:
+            self.background = img
+        else:
+            print(f"WARNING: Failed to load background: {path}")
 
     def _prepare_polaroids(self):
         """폴라로이드 사진 준비 - 자연스럽게 흩어진 배치"""
@@ -192,16 +196,12 @@ class PolaroidMemoryEffect:
                 break
 
             # 이미지 로드
-            photo_img = None
-            try:
-                loaded_img = pygame.image.load(path).convert_alpha()
-
-                # 모든 사진을 정사각형으로 리사이즈
-                photo_img = pygame.transform.smoothscale(
-                    loaded_img, (photo_size, photo_size)
-                )
-            except Exception as e:
-                print(f"WARNING: Failed to load polaroid: {path} - {e}")
+            # 모든 사진을 정사각형으로 리사이즈 (공유 Surface, 수정 금지)
+            photo_img = get_cutscene_image_service().get_image(
+                path, (photo_size, photo_size)
+            )
+            if photo_img is None:
+                print(f"WARNING: Failed to load polaroid: {path}")
                 # 플레이스홀더 생성
                 photo_img = pygame.Surface((photo_size, photo_size))
                 photo_img.fill((100, 100, 100))
@@ -400,22 +400,10 @@ class PolaroidMemoryEffect:
         w, h = result.get_size()
 
         # 전체적으로 약간 따뜻한 톤 추가 (세피아 느낌)
-        sepia_overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        sepia_overlay.fill((255, 240, 200, 30))  # 따뜻한 세피아 톤
-        result.blit(sepia_overlay, (0, 0))
+        result.blit(overlays.get_tint_layer((w, h), (255, 240, 200, 30)), (0, 0))
 
         # 비네트 효과 (가장자리 어둡게)
-        vignette = pygame.Surface((w, h), pygame.SRCALPHA)
-        for i in range(20):
-            alpha = 3 * (20 - i)
-            # 상단
-            pygame.draw.line(vignette, (0, 0, 0, alpha), (0, i), (w, i))
-            # 하단
-            pygame.draw.line(vignette, (0, 0, 0, alpha), (0, h - 1 - i), (w, h - 1 - i))
-            # 좌측
-            pygame.draw.line(vignette, (0, 0, 0, alpha), (i, 0), (i, h))
-            # 우측
-            pygame.draw.line(vignette, (0, 0, 0, alpha), (w - 1 - i, 0), (w - 1 - i, h))
+        vignette = overlays.get_edge_vignette_layer((w, h), depth=20, alpha_step=3)
         result.blit(vignette, (0, 0))
 
         return result
@@ -676,29 +664,12 @@ class PolaroidMemoryEffect:
         if speaker in self.portrait_cache:
             return self.portrait_cache[speaker]
 
-        # config_story_dialogue에서 경로 가져오기
-        try:
-            from mode_configs.config_story_dialogue import CHARACTER_PORTRAITS
-
-            path = CHARACTER_PORTRAITS.get(speaker)
-        except ImportError:
-            # 폴백: 에피소드 경로
-            portrait_paths = {
-                "ARTEMIS": "assets/data/episodes/ep1/portraits/portrait_artemis.jpg",
-                "PILOT": "assets/data/episodes/ep1/portraits/portrait_pilot.png",
-            }
-            path = portrait_paths.get(speaker)
-
-        if path:
-            try:
-                # 원본 크기로 로드 (render_dialogue_box가 화자에 따라 크기 조정)
-                img = pygame.image.load(path).convert_alpha()
-                self.portrait_cache[speaker] = img
-                return img
-            except Exception as e:
-                print(f"WARNING: Failed to load portrait for {speaker}: {e}")
-
-        return None
+        # 공유 이미지 서비스 (에피소드 선택 시 백그라운드 프리로드됨)
+        # 원본 크기 (render_dialogue_box가 화자에 따라 크기 조정)
+        img = get_cutscene_image_service().get_portrait(speaker)
+        if img is not None:
+            self.portrait_cache[speaker] = img
+        return img
 
     def _prepare_dialogue(self, index: int):
         """대사 준비 및 음성 재생"""
@@ -854,9 +825,12 @@ class PolaroidMemoryEffect:
             screen.fill((30, 30, 40))
 
         # 어두운 오버레이
-        overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, int(150 * self.fade_alpha)))
-        screen.blit(overlay, (0, 0))
+        screen.blit(
+            overlays.get_fade_layer(
+                self.screen_size, (0, 0, 0), int(150 * self.fade_alpha)
+            ),
+            (0, 0),
+        )
 
         # FINAL_ZOOM 단계에서는 최종 사진만 확대 렌더링
         if self.phase == self.PHASE_FINAL_ZOOM and self.final_photo_index >= 0:
@@ -1101,14 +1075,9 @@ class ShatteredMirrorEffect(BaseCutsceneEffect):
         radius = min(screen_w, screen_h) * 0.25
 
         for i, path in enumerate(self.fragment_paths):
-            frag_img = None
-            try:
-                frag_img = pygame.image.load(path).convert_alpha()
-                frag_img = pygame.transform.smoothscale(
-                    frag_img, (frag_size, frag_size)
-                )
-            except Exception as e:
-                print(f"WARNING: Failed to load fragment: {path} - {e}")
+            frag_img = get_cutscene_image_service().get_image(path, (frag_size, frag_size))
+            if frag_img is None:
+                print(f"WARNING: Failed to load fragment: {path}")
                 frag_img = pygame.Surface((frag_size, frag_size), pygame.SRCALPHA)
                 frag_img.fill((100, 100, 120, 200))
 
@@ -1597,10 +1566,12 @@ class DualMemoryEffect(BaseCutsceneEffect):
 
         # 페이드
         if self.phase == self.PHASE_FADEIN:
-            fade_surf = pygame.Surface(self.screen_size)
-            fade_surf.fill((0, 0, 0))
-            fade_surf.set_alpha(255 - int(self.fade_alpha))
-            screen.blit(fade_surf, (0, 0))
+            screen.blit(
+                overlays.get_fade_layer(
+                    self.screen_size, (0, 0, 0), 255 - int(self.fade_alpha)
+                ),
+                (0, 0),
+            )
 
         # 대사
         if self.phase == self.PHASE_DIALOGUE:
@@ -2087,37 +2058,35 @@ class BrokenToyEffect(BaseCutsceneEffect):
 
             # 스포트라이트 효과
             if self.phase in [self.PHASE_ZOOM_IN, self.PHASE_MEMORIES]:
-                spotlight = pygame.Surface(self.screen_size, pygame.SRCALPHA)
+                spotlight = overlays.get_radial_glow_layer(
+                    150, (255, 240, 200), 30, step=10
+                )
                 center = self.toy_pos
-                for r in range(150, 0, -10):
-                    alpha = int(30 * (r / 150))
-                    pygame.draw.circle(spotlight, (255, 240, 200, alpha), center, r)
-                screen.blit(spotlight, (0, 0))
+                screen.blit(spotlight, (center[0] - 150, center[1] - 150))
 
         # 회상 플래시
         if self.flash_alpha > 0:
-            flash_surf = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-            flash_surf.fill((255, 255, 255, int(self.flash_alpha)))
-            screen.blit(flash_surf, (0, 0))
+            screen.blit(
+                overlays.get_fade_layer(
+                    self.screen_size, (255, 255, 255), int(self.flash_alpha)
+                ),
+                (0, 0),
+            )
 
         # 비네트 효과
-        vignette = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        for i in range(100):
-            alpha = int(i * 1.5)
-            pygame.draw.rect(
-                vignette,
-                (0, 0, 0, alpha),
-                (i, i, self.screen_size[0] - i * 2, self.screen_size[1] - i * 2),
-                1,
-            )
+        vignette = overlays.get_frame_vignette_layer(
+            self.screen_size, depth=100, alpha_step=1.5
+        )
         screen.blit(vignette, (0, 0))
 
         # 페이드
         if self.phase == self.PHASE_FADEIN:
-            fade_surf = pygame.Surface(self.screen_size)
-            fade_surf.fill((0, 0, 0))
-            fade_surf.set_alpha(255 - int(self.fade_alpha))
-            screen.blit(fade_surf, (0, 0))
+            screen.blit(
+                overlays.get_fade_layer(
+                    self.screen_size, (0, 0, 0), 255 - int(self.fade_alpha)
+                ),
+                (0, 0),
+            )
 
         # 대사
         if self.phase == self.PHASE_DIALOGUE:
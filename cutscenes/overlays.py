@@ -0,0 +1,257 @@
+"""
+cutscenes/overlays.py
+Shared cached overlay layers for cutscene post-effects
+
+컷씬 후처리 레이어(스캔라인, 그리드, 비네트, 세피아/어둡게, 페이드, 글로우)를
+(화면 크기, 파라미터)당 한 번만 생성해 모든 BaseCutsceneEffect 서브클래스가 공유합니다.
+
+주의: 반환된 Surface는 공유 객체이므로 수정하지 말고 바로 blit 하세요.
+      get_fade_layer()는 호출마다 set_alpha()를 갱신합니다.
+"""
+
+import math
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple
+
+import pygame
+
+
+# 캐시 최대 항목 수 (전체 화면 레이어 1개 = 1080p 기준 약 8MB)
+OVERLAY_CACHE_MAX_ENTRIES = 24
+
+_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _get_or_build(key: tuple, builder: Callable[[], pygame.Surface]) -> pygame.Surface:
+    """캐시 조회 (없으면 생성 후 LRU 갱신)"""
+    surface = _cache.get(key)
+    if surface is not None:
+        _cache.move_to_end(key)
+        _stats["hits"] += 1
+        return surface
+
+    _stats["misses"] += 1
+    surface = builder()
+    _cache[key] = surface
+    while len(_cache) > OVERLAY_CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+        _stats["evictions"] += 1
+    return surface
+
+
+# =========================================================
+# 단색 레이어 (페이드 / 어둡게 / 플래시 / 세피아)
+# =========================================================
+def get_fade_layer(size: Tuple[int, int], color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+    """
+    단색 전체 화면 레이어 (Surface 알파로 투명도 적용)
+
+    SRCALPHA Surface를 (r, g, b, alpha)로 채워 blit 하는 것과 같은 결과이며,
+    알파값마다 새 Surface를 만들지 않습니다.
+    """
+    size = (int(size[0]), int(size[1]))
+    color = tuple(color[:3])
+
+    def build():
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        return surface
+
+    surface = _get_or_build(("fade", size, color), build)
+    surface.set_alpha(max(0, min(255, int(alpha))))
+    return surface
+
+
+def get_tint_layer(size: Tuple[int, int], rgba: Tuple[int, int, int, int]) -> pygame.Surface:
+    """고정 알파 색조 레이어 (세피아 톤, 배경 어둡게 등)"""
+    size = (int(size[0]), int(size[1]))
+    rgba = tuple(rgba)
+
+    def build():
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill(rgba)
+        return surface
+
+    return _get_or_build(("tint", size, rgba), build)
+
+
+# =========================================================
+# 라인 레이어 (스캔라인 / 그리드)
+# =========================================================
+def get_scanline_layer(
+    size: Tuple[int, int],
+    spacing: int = 4,
+    color: Tuple[int, int, int, int] = (0, 0, 0, 30),
+) -> pygame.Surface:
+    """수평 스캔라인 레이어 (CRT 느낌)"""
+    size = (int(size[0]), int(size[1]))
+    color = tuple(color)
+
+    def build():
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        for y in range(0, size[1], spacing):
+            pygame.draw.line(surface, color, (0, y), (size[0], y))
+        return surface
+
+    return _get_or_build(("scanline", size, spacing, color), build)
+
+
+def get_grid_layer(
+    size: Tuple[int, int],
+    spacing: int = 50,
+    color: Tuple[int, int, int, int] = (100, 150, 255, 30),
+) -> pygame.Surface:
+    """홀로그램 그리드 레이어 (수평선 + 수직선)"""
+    size = (int(size[0]), int(size[1]))
+    color = tuple(color)
+
+    def build():
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        for y in range(0, size[1], spacing):
+            pygame.draw.line(surface, color, (0, y), (size[0], y))
+        for x in range(0, size[0], spacing):
+            pygame.draw.line(surface, color, (x, 0), (x, size[1]))
+        return surface
+
+    return _get_or_build(("grid", size, spacing, color), build)
+
+
+# =========================================================
+# 비네트 레이어
+# =========================================================
+def get_ring_vignette_layer(
+    size: Tuple[int, int],
+    color: Tuple[int, int, int],
+    rings: int,
+    alpha_step: int,
+    ring_width: int,
+    shrink: float = 0.08,
+) -> pygame.Surface:
+    """원형 링 비네트 (가장자리부터 안쪽으로 링을 그려 어둡게)"""
+    size = (int(size[0]), int(size[1]))
+    color = tuple(color[:3])
+
+    def build():
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        center_x, center_y = size[0] // 2, size[1] // 2
+        max_dist = math.sqrt(center_x**2 + center_y**2)
+        for i in range(rings):
+            radius = int(max_dist * (1.0 - i * shrink))
+            pygame.draw.circle(
+                surface, (*color, i * alpha_step), (center_x, center_y), radius, ring_width
+            )
+        return surface
+
+    return _get_or_build(("ring_vignette", size, color, rings, alpha_step, ring_width, shrink), build)
+
+
+def get_frame_vignette_layer(
+    size: Tuple[int, int], depth: int = 100, alpha_step: float = 1.5
+) -> pygame.Surface:
+    """사각 프레임 비네트 (바깥 테두리부터 1px 사각형을 겹쳐 그림)"""
+    size = (int(size[0]), int(size[1]))
+
+    def build():
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        for i in range(depth):
+            pygame.draw.rect(
+                surface,
+                (0, 0, 0, int(i * alpha_step)),
+                (i, i, size[0] - i * 2, size[1] - i * 2),
+                1,
+            )
+        return surface
+
+    return _get_or_build(("frame_vignette", size, depth, alpha_step), build)
+
+
+def get_edge_vignette_layer(
+    size: Tuple[int, int], depth: int = 20, alpha_step: int = 3
+) -> pygame.Surface:
+    """가장자리 선형 비네트 (사진 빈티지 효과용, 바깥쪽일수록 어둡게)"""
+    size = (int(size[0]), int(size[1]))
+
+    def build():
+        w, h = size
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        for i in range(depth):
+            color = (0, 0, 0, alpha_step * (depth - i))
+            pygame.draw.line(surface, color, (0, i), (w, i))
+            pygame.draw.line(surface, color, (0, h - 1 - i), (w, h - 1 - i))
+            pygame.draw.line(surface, color, (i, 0), (i, h))
+            pygame.draw.line(surface, color, (w - 1 - i, 0), (w - 1 - i, h))
+        return surface
+
+    return _get_or_build(("edge_vignette", size, depth, alpha_step), build)
+
+
+# =========================================================
+# 글로우 레이어
+# =========================================================
+def get_radial_glow_layer(
+    radius: int, color: Tuple[int, int, int], max_alpha: int, step: int = 10
+) -> pygame.Surface:
+    """
+    원형 그라데이션 글로우 (스포트라이트 등)
+
+    반환 Surface 크기는 (radius * 2, radius * 2) - 중심 좌표에서 radius만큼 빼서 blit
+    """
+    radius = int(radius)
+    color = tuple(color[:3])
+
+    def build():
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        for r in range(radius, 0, -step):
+            alpha = int(max_alpha * (r / radius))
+            pygame.draw.circle(surface, (*color, alpha), (radius, radius), r)
+        return surface
+
+    return _get_or_build(("radial_glow", radius, color, max_alpha, step), build)
+
+
+def get_rect_glow_layer(
+    size: Tuple[int, int], color: Tuple[int, int, int], alpha: int, border_radius: int = 10
+) -> pygame.Surface:
+    """둥근 사각형 글로우 (홀로그램 외곽 등) - 사각형 좌상단에 blit"""
+    size = (int(size[0]), int(size[1]))
+    color = tuple(color[:3])
+
+    def build():
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(
+            surface, (*color, alpha), surface.get_rect(), border_radius=border_radius
+        )
+        return surface
+
+    return _get_or_build(("rect_glow", size, color, alpha, border_radius), build)
+
+
+def get_scratch_layer(size: Tuple[int, int]) -> pygame.Surface:
+    """
+    매 프레임 모양이 바뀌는 효과용 재사용 작업 Surface (SRCALPHA)
+
+    내용은 보존되지 않으므로 사용할 영역을 투명하게 지운 뒤 그리고,
+    blit 시 area로 해당 영역만 합성하세요.
+    """
+    size = (int(size[0]), int(size[1]))
+    return _get_or_build(("scratch", size), lambda: pygame.Surface(size, pygame.SRCALPHA))
+
+
+# =========================================================
+# 캐시 관리
+# =========================================================
+def clear_overlay_cache():
+    """캐시 비우기 (화면 크기 변경 시 등)"""
+    _cache.clear()
+
+
+def get_overlay_stats() -> Dict[str, int]:
+    """캐시 통계 (hits, misses, evictions, entries)"""
+    return {**_stats, "entries": len(_cache)}
+
+
+def reset_overlay_stats():
+    """캐시 통계 초기화 (캐시 내용은 유지)"""
+    for key in _stats:
+        _stats[key] = 0
@@ -8,6 +8,7 @@ import math
 from pathlib import Path
 from effects.visual_novel_effects import TextBoxExpand
 from cutscenes.base import _load_dialogue_bars
+from systems.cutscene_image_service import get_cutscene_image_service
 
 
 class StoryBriefingEffect:
@@ -153,47 +154,11 @@ class StoryBriefingEffect:
         if speaker in self.portrait_cache:
             return self.portrait_cache[speaker]
 
-        # config_story_dialogue에서 경로 가져오기
-        try:
-            from mode_configs.config_story_dialogue import CHARACTER_PORTRAITS
-
-            path = CHARACTER_PORTRAITS.get(speaker)
-        except ImportError:
-            path = None
-
-        # 폴백: 여러 경로 시도 (.png 우선)
-        if not path or not Path(path).exists():
-            # NARRATOR는 android 이미지 파일명 사용
-            filename = "android" if speaker == "NARRATOR" else speaker.lower()
-
-            portrait_paths = [
-                Path("assets/data/episodes/ep1/portraits") / f"portrait_{filename}.png",
-                Path("assets/data/episodes/ep1/portraits") / f"portrait_{filename}.jpg",
-                Path("assets/data/episodes/shared/portraits")
-                / f"portrait_{filename}.png",
-                Path("assets/data/episodes/shared/portraits")
-                / f"portrait_{filename}.jpg",
-            ]
-
-            for p in portrait_paths:
-                if p.exists():
-                    path = str(p)
-                    break
-            else:
-                return None
-
-        if path:
-            try:
-                img = pygame.image.load(path).convert_alpha()
-                # 크기 조정 (200x200)
-                target_size = (200, 200)
-                img = pygame.transform.smoothscale(img, target_size)
-                self.portrait_cache[speaker] = img
-                return img
-            except Exception as e:
-                print(f"WARNING: Failed to load portrait for {speaker}: {e}")
-
-        return None
+        # 공유 이미지 서비스 (에피소드 선택 시 백그라운드 프리로드됨)
+        img = get_cutscene_image_service().get_portrait(speaker, (200, 200))
+        if img is not None:
+            self.portrait_cache[speaker] = img
+        return img
 
     def set_fonts(self, fonts: dict):
         """폰트 설정"""
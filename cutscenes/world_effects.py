@@ -8,6 +8,7 @@ import math
 import random
 from pathlib import Path
 from cutscenes.base import BaseCutsceneEffect, render_dialogue_box
+from cutscenes import overlays
 
 
 class StarMapEffect(BaseCutsceneEffect):
@@ -258,17 +259,7 @@ class StarMapEffect(BaseCutsceneEffect):
 
     def _render_grid(self, screen: pygame.Surface):
         """홀로그램 그리드"""
-        grid_surf = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        grid_color = (100, 150, 255, 30)
-
-        # 수평선
-        for y in range(0, self.screen_size[1], 50):
-            pygame.draw.line(grid_surf, grid_color, (0, y), (self.screen_size[0], y))
-
-        # 수직선
-        for x in range(0, self.screen_size[0], 50):
-            pygame.draw.line(grid_surf, grid_color, (x, 0), (x, self.screen_size[1]))
-
+        grid_surf = overlays.get_grid_layer(self.screen_size, 50, (100, 150, 255, 30))
         screen.blit(grid_surf, (0, 0))
 
     def _render_route(self, screen: pygame.Surface):
@@ -603,7 +594,7 @@ class AndromedaWorldEffect(BaseCutsceneEffect):
         circuit_surf = pygame.Surface(self.screen_size, pygame.SRCALPHA)
         for circuit in self.circuit_lines:
             pulse = 0.3 + 0.7 * math.sin(self.glow_timer * 3 + circuit["pulse_offset"])
-            alpha = int(200 * pulse)
+            alpha = max(0, int(200 * pulse))  # pulse가 음수일 때 잘못된 색상 방지
             color = (*circuit["color"], alpha)
 
             start = circuit["start"]
@@ -652,11 +643,7 @@ class AndromedaWorldEffect(BaseCutsceneEffect):
 
     def _render_scanlines(self, screen: pygame.Surface):
         """스캔라인 효과 (CRT 느낌)"""
-        scanline_surf = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        for y in range(0, self.screen_size[1], 4):
-            pygame.draw.line(
-                scanline_surf, (0, 0, 0, 30), (0, y), (self.screen_size[0], y)
-            )
+        scanline_surf = overlays.get_scanline_layer(self.screen_size, 4, (0, 0, 0, 30))
         screen.blit(scanline_surf, (0, 0))
 
     def _render_dialogue(self, screen: pygame.Surface):
@@ -8,59 +8,66 @@ This package contains all visual effect classes organized by category:
 - death_effects: Enemy death effects (shatter, vortex, pixelate)
 - transitions: Scene and background transitions
 - game_animations: Victory, wave clear, base arrival animations
+
+Classes are loaded lazily (PEP 562): a submodule is imported on first attribute access.
+클래스는 처음 접근할 때 해당 모듈만 import 합니다.
 '''
 
-# Screen effects (particles, flashes, shakes, basic effects)
-from .screen_effects import (
-    Particle,
-    ScreenFlash,
-    ScreenShake,
-    DamageFlash,
-    DynamicTextEffect,
-    ReviveTextEffect,
-    NebulaParticle,
-    SmokeParticle,
-    BurstParticle,
-    DissolveEffect,
-    FadeEffect,
-    ImplodeEffect,
-    TimeSlowEffect,
-    LevelUpEffect
-)
-
-# Combat effects (damage numbers, combat animations)
-from .combat_effects import (
-    DamageNumber,
-    DamageNumberManager,
-    AnimatedEffect
-)
-
-# Death effects (enemy death animations)
-from .death_effects import (
-    ShatterFragment,
-    VortexEffect,
-    PixelateEffect,
-    DeathEffectManager
-)
-
-# Transition effects (scene and background transitions)
-from .transitions import (
-    WaveTransitionEffect,
-    BackgroundTransition,
-    ParallaxLayer
-)
-
-# Game animations (victory, wave clear, base arrival, etc.)
-from .game_animations import (
-    PlayerVictoryAnimation,
-    WaveClearFireworksEffect,
-    ReturnToBaseAnimation,
-    BaseArrivalAnimation,
-    DialogueShipAnimation,
-    Meteor,
-    StaticField,
-    SpawnEffect
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Screen effects (particles, flashes, shakes, basic effects)
+    from .screen_effects import (
+        Particle,
+        ScreenFlash,
+        ScreenShake,
+        DamageFlash,
+        DynamicTextEffect,
+        ReviveTextEffect,
+        NebulaParticle,
+        SmokeParticle,
+        BurstParticle,
+        DissolveEffect,
+        FadeEffect,
+        ImplodeEffect,
+        TimeSlowEffect,
+        LevelUpEffect
+    )
+
+    # Combat effects (damage numbers, combat animations)
+    from .combat_effects import (
+        DamageNumber,
+        DamageNumberManager,
+        AnimatedEffect
+    )
+
+    # Death effects (enemy death animations)
+    from .death_effects import (
+        ShatterFragment,
+        VortexEffect,
+        PixelateEffect,
+        DeathEffectManager
+    )
+
+    # Transition effects (scene and background transitions)
+    from .transitions import (
+        WaveTransitionEffect,
+        BackgroundTransition,
+        ParallaxLayer
+    )
+
+    # Game animations (victory, wave clear, base arrival, etc.)
+    from .game_animations import (
+        PlayerVictoryAnimation,
+        WaveClearFireworksEffect,
+        ReturnToBaseAnimation,
+        BaseArrivalAnimation,
+        DialogueShipAnimation,
+        Meteor,
+        StaticField,
+        SpawnEffect
+    )
 
 __all__ = [
     # Screen effects
@@ -105,3 +112,52 @@ __all__ = [
     'StaticField',
     'SpawnEffect',
 ]
+
+# 이름 → 정의 모듈 (지연 로딩)
+_LAZY_IMPORTS = {
+    'Particle': '.screen_effects',
+    'ScreenFlash': '.screen_effects',
+    'ScreenShake': '.screen_effects',
+    'DamageFlash': '.screen_effects',
+    'DynamicTextEffect': '.screen_effects',
+    'ReviveTextEffect': '.screen_effects',
+    'NebulaParticle': '.screen_effects',
+    'SmokeParticle': '.screen_effects',
+    'BurstParticle': '.screen_effects',
+    'DissolveEffect': '.screen_effects',
+    'FadeEffect': '.screen_effects',
+    'ImplodeEffect': '.screen_effects',
+    'TimeSlowEffect': '.screen_effects',
+    'LevelUpEffect': '.screen_effects',
+    'DamageNumber': '.combat_effects',
+    'DamageNumberManager': '.combat_effects',
+    'AnimatedEffect': '.combat_effects',
+    'ShatterFragment': '.death_effects',
+    'VortexEffect': '.death_effects',
+    'PixelateEffect': '.death_effects',
+    'DeathEffectManager': '.death_effects',
+    'WaveTransitionEffect': '.transitions',
+    'BackgroundTransition': '.transitions',
+    'ParallaxLayer': '.transitions',
+    'PlayerVictoryAnimation': '.game_animations',
+    'WaveClearFireworksEffect': '.game_animations',
+    'ReturnToBaseAnimation': '.game_animations',
+    'BaseArrivalAnimation': '.game_animations',
+    'DialogueShipAnimation': '.game_animations',
+    'Meteor': '.game_animations',
+    'StaticField': '.game_animations',
+    'SpawnEffect': '.game_animations',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -98,6 +98,9 @@ class DamageNumber:
         },
     }
 
+    # 크기별 기본 폰트 캐시 {font_size: Font}
+    _font_cache: Dict[int, pygame.font.Font] = {}
+
     def __init__(
         self,
         damage: float,
@@ -130,11 +133,8 @@ class DamageNumber:
             self.color = (255, 50, 100)
             font_size = int(font_size * 1.2)
 
-        # 폰트 설정
-        if font is None:
-            self.font = pygame.font.Font(None, font_size)
-        else:
-            self.font = font
+        # 폰트 설정 (크기별 공유 - 다중 처치 시 폰트 파일 반복 로드 방지)
+        self.font = font if font is not None else self._get_font(font_size)
 
         # 초기 스케일 (팝업 효과용)
         self.scale = 1.5 if is_accumulated else 1.0
@@ -150,6 +150,15 @@ class DamageNumber:
         # 위로 떠오르는 속도 (누적은 더 느리게)
         self.rise_speed = 30 if is_accumulated else 60
 
+    @classmethod
+    def _get_font(cls, font_size: int) -> pygame.font.Font:
+        """크기별 기본 폰트 캐시"""
+        font = cls._font_cache.get(font_size)
+        if font is None:
+            font = pygame.font.Font(None, font_size)
+            cls._font_cache[font_size] = font
+        return font
+
     def _get_damage_tier(self) -> str:
         """데미지 크기에 따른 티어 반환"""
         tier = "small"
@@ -351,6 +360,24 @@ class DamageNumberManager:
             )
             del self.accumulated_damage[target_id]
 
+    def flush_targets(self, target_ids: List[int]):
+        """여러 대상의 누적 데미지 일괄 표시 (한 프레임 다중 처치 시)
+
+        max_numbers 제한으로 곧바로 잘려나갈 앞쪽 숫자는 생성하지 않습니다.
+        """
+        pending = [
+            self.accumulated_damage.pop(target_id)
+            for target_id in target_ids
+            if target_id in self.accumulated_damage
+        ]
+        for acc in pending[-self.max_numbers:]:
+            self._create_damage_number(
+                acc["damage"],
+                acc["pos"],
+                is_accumulated=True,
+                is_critical=acc.get("is_critical", False),
+            )
+
     def draw(self, screen: pygame.Surface):
         """모든 데미지 숫자 그리기"""
         for dmg_num in self.damage_numbers:
@@ -22,6 +22,12 @@ from .screen_effects import BurstParticle, DissolveEffect, FadeEffect, ImplodeEf
 class ShatterFragment:
     """적 사망 시 생성되는 이미지 파편"""
 
+    __slots__ = (
+        "original_image", "image", "pos", "velocity",
+        "rotation", "rotation_speed", "alpha",
+        "lifetime", "max_lifetime", "gravity", "is_alive",
+    )
+
     def __init__(
         self,
         image_piece: pygame.Surface,
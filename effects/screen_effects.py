@@ -19,6 +19,8 @@ import config
 class Particle:
     """파티클 효과 클래스 - 폭발, 충돌 등에 사용"""
 
+    __slots__ = ("pos", "velocity", "color", "size", "lifetime", "age", "gravity", "is_alive")
+
     def __init__(self, pos: Tuple[float, float], velocity: pygame.math.Vector2,
                  color: Tuple[int, int, int], size: int, lifetime: float, gravity: bool = True):
         self.pos = pygame.math.Vector2(pos)
@@ -6,7 +6,7 @@ GameEngine - 게임 엔진 코어
 
 import pygame
 import sys
-from typing import List, Dict, Any, Optional, Type
+from typing import List, Dict, Any, Optional, Type, Union
 from pathlib import Path
 
 # 상위 디렉토리 임포트를 위한 경로 추가
@@ -15,6 +15,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import config
 from asset_manager import AssetManager
 from sound_manager import SoundManager
+from modes.registry import resolve_mode
+from engine.replay import InputRecorder
 
 
 class GameEngine:
@@ -57,6 +59,20 @@ class GameEngine:
             "unlocked_modes": ["wave"],   # 해금된 모드
         }
 
+        # 입력 기록 (성능 문제 재현용, config.INPUT_RECORDING_ENABLED)
+        self.input_recorder: Optional[InputRecorder] = (
+            InputRecorder() if config.INPUT_RECORDING_ENABLED else None
+        )
+        self._frame_phase = "idle"   # 현재 프레임 처리 단계 (events/update/render/idle)
+        self._event_index = 0        # events 단계에서 처리 중인 이벤트 인덱스
+
+        # 에셋 핫 리로드 (개발용, config.HOT_RELOAD_ENABLED)
+        self.hot_reloader = None
+        if config.HOT_RELOAD_ENABLED:
+            from systems.hot_reload import get_hot_reloader
+            self.hot_reloader = get_hot_reloader()
+            self.hot_reloader.subscribe(self._on_asset_reload)
+
         # 폰트 초기화
         self._init_fonts()
 
@@ -130,24 +146,38 @@ class GameEngine:
         """현재 활성 모드 반환"""
         return self.mode_stack[-1] if self.mode_stack else None
 
-    def push_mode(self, mode_class: Type["GameMode"], **kwargs):
+    def push_mode(self, mode_class: Union[str, Type["GameMode"]], **kwargs):
         """
         새 모드를 스택에 추가 (현재 모드 일시정지)
 
         Args:
-            mode_class: 추가할 모드 클래스
+            mode_class: 추가할 모드 클래스 또는 등록된 모드 이름 (최초 요청 시 import)
             **kwargs: 모드 초기화 인자
         """
+        mode_class = resolve_mode(mode_class)
+
         # 현재 모드 일시정지
         if self.current_mode:
             self.current_mode.on_pause()
 
+        # 기록 대상 모드면 생성 전에 기록 시작 (RNG 시드 고정)
+        recorder = self.input_recorder
+        start_recording = (
+            recorder is not None
+            and not recorder.active
+            and mode_class.__name__ in config.INPUT_RECORDING_MODES
+        )
+        if start_recording:
+            recorder.start(mode_class.__name__, kwargs, self, self._frame_phase, self._event_index)
+
         # 새 모드 생성 및 초기화
         new_mode = mode_class(
             engine=self,
             **kwargs
         )
         new_mode.init()
+        if start_recording:
+            recorder.mode = new_mode
         self.mode_stack.append(new_mode)
         new_mode.on_enter()
 
@@ -174,14 +204,16 @@ class GameEngine:
 
         print(f"INFO: Popped to {self.current_mode.__class__.__name__ if self.current_mode else 'None'}")
 
-    def switch_mode(self, mode_class: Type["GameMode"], **kwargs):
+    def switch_mode(self, mode_class: Union[str, Type["GameMode"]], **kwargs):
         """
         현재 모드를 완전히 교체 (상태 보존 안함)
 
         Args:
-            mode_class: 전환할 모드 클래스
+            mode_class: 전환할 모드 클래스 또는 등록된 모드 이름
             **kwargs: 모드 초기화 인자
         """
+        mode_class = resolve_mode(mode_class)
+
         # 전환 중 커서 깜빡임 방지 - 숨긴 상태 유지
         pygame.mouse.set_visible(False)
 
@@ -195,6 +227,14 @@ class GameEngine:
 
         print(f"INFO: Switched to {mode_class.__name__}")
 
+    def _on_asset_reload(self, kind: str, key: str):
+        """핫 리로드 알림을 스택의 모든 모드에 전달"""
+        for mode in list(self.mode_stack):
+            try:
+                mode.on_asset_reload(kind, key)
+            except Exception as e:
+                print(f"ERROR: Exception in on_asset_reload: {e}")
+
     def quit(self):
         """게임 종료"""
         self.running = False
@@ -208,45 +248,34 @@ class GameEngine:
             try:
                 # 델타 타임 계산
                 raw_dt = clock.tick(config.FPS) / 1000.0
-                current_time = pygame.time.get_ticks() / 1000.0
+                if self.input_recorder:
+                    ticks = self.input_recorder.real_ticks()
+                else:
+                    ticks = pygame.time.get_ticks()
 
-                # 이벤트 처리
+                events = []
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
                         self.running = False
                     else:
-                        # 현재 모드에 이벤트 전달 (ESC 키 포함)
-                        try:
-                            self.current_mode.handle_event(event)
-                        except Exception as e:
-                            print(f"ERROR: Exception in handle_event: {e}")
-                            import traceback
-                            traceback.print_exc()
-
-                # 현재 모드 업데이트
-                try:
-                    self.current_mode.update(raw_dt, current_time)
-                except Exception as e:
-                    print(f"ERROR: Exception in update: {e}")
-                    import traceback
-                    traceback.print_exc()
-
-                # 화면 렌더링
-                try:
-                    self.current_mode.render(self.screen)
-                except Exception as e:
-                    print(f"ERROR: Exception in render: {e}")
-                    import traceback
-                    traceback.print_exc()
-
-                # 화면 업데이트
-                pygame.display.flip()
+                        events.append(event)
+
+                if self.input_recorder:
+                    self.input_recorder.begin_frame(raw_dt, ticks, events)
+
+                self.step(events, raw_dt, ticks / 1000.0)
+
+                if self.input_recorder:
+                    self.input_recorder.end_frame(self)
 
             except Exception as e:
                 print(f"ERROR: Unhandled exception in game loop: {e}")
                 import traceback
                 traceback.print_exc()
 
+        if self.input_recorder:
+            self.input_recorder.stop()
+
         # 종료 원인 디버깅
         if not self.running:
             print("INFO: Game loop ended (running=False)")
@@ -255,6 +284,60 @@ class GameEngine:
         else:
             print("INFO: Game loop ended (unknown reason)")
 
+    def step(self, events: List[pygame.event.Event], raw_dt: float, current_time: float, update: bool = True):
+        """
+        한 프레임 처리 (이벤트 → 업데이트 → 렌더 → flip)
+
+        run()과 리플레이(engine.replay)가 같은 경로를 사용합니다.
+
+        Args:
+            events: 현재 모드에 전달할 이벤트 (QUIT 제외)
+            update: False면 업데이트 생략 (리플레이 첫 프레임 보정용)
+        """
+        # 바뀐 에셋 파일 리로드 (프레임 시작 시점 - 모드 처리 도중에 데이터가 바뀌지 않도록)
+        if self.hot_reloader:
+            self.hot_reloader.poll()
+
+        # 이벤트 처리 - 현재 모드에 이벤트 전달 (ESC 키 포함)
+        self._frame_phase = "events"
+        for index, event in enumerate(events):
+            if not self.current_mode:
+                break
+            self._event_index = index
+            try:
+                self.current_mode.handle_event(event)
+            except Exception as e:
+                print(f"ERROR: Exception in handle_event: {e}")
+                import traceback
+                traceback.print_exc()
+
+        # 현재 모드 업데이트
+        self._frame_phase = "update"
+        if update and self.current_mode:
+            try:
+                self.current_mode.update(raw_dt, current_time)
+            except Exception as e:
+                print(f"ERROR: Exception in update: {e}")
+                import traceback
+                traceback.print_exc()
+
+        # 화면 렌더링
+        self._frame_phase = "render"
+        if self.current_mode:
+            try:
+                self.current_mode.render(self.screen)
+            except Exception as e:
+                print(f"ERROR: Exception in render: {e}")
+                import traceback
+                traceback.print_exc()
+
+        # 이번 프레임에 모인 효과음 재생 (같은 효과음 병합, 보이스 제한)
+        self.sound_manager.end_frame()
+
+        # 화면 업데이트
+        pygame.display.flip()
+        self._frame_phase = "idle"
+
     def load_shared_state(self):
         """저장된 공유 상태 로드"""
         from main import load_game_data  # 순환 참조 방지
@@ -0,0 +1,494 @@
+# engine/replay.py
+"""
+입력 기록 / 리플레이 - 전투 모드 성능 문제 재현용
+
+기록 (config.INPUT_RECORDING_ENABLED = True):
+    INPUT_RECORDING_MODES의 모드가 push 될 때 RNG 시드를 고정하고,
+    해당 모드가 스택에서 빠질 때까지 프레임마다
+    dt / 틱 / 입력 이벤트 / 키·마우스 상태(변경 시에만)를 기록합니다.
+    기록 중 pygame.time.get_ticks()는 프레임 시작 틱을 반환합니다 (재생과 같은 시계).
+    → replays/<Mode>_<시각>.replay.json.gz
+
+재생:
+    python -m engine.replay replays/WaveMode_20260101_120000.replay.json.gz
+        [--window] [--realtime] [--csv frame_times.csv] [--profile replay.prof]
+
+    기본은 헤드리스(SDL dummy) + 최대 속도. 같은 시드, 같은 dt, 같은 입력을
+    모드에 그대로 전달하며, pygame.key.get_pressed / mouse.get_pos /
+    mouse.get_pressed / time.get_ticks를 기록된 값으로 대체합니다.
+    기록 시 60프레임마다 저장한 상태 지문(플레이어 위치/HP, 적 수, 점수)과
+    비교해 처음 어긋난 프레임을 보고합니다.
+"""
+
+import gzip
+import json
+import random
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+import numpy as np
+import pygame
+
+import config
+
+if TYPE_CHECKING:
+    from engine.game_engine import GameEngine
+    from modes.base_mode import GameMode
+
+
+REPLAY_FORMAT_VERSION = 1
+
+# 상태 지문 기록 간격 (프레임)
+FINGERPRINT_INTERVAL = 60
+
+# 기록 대상 입력 이벤트
+RECORDED_EVENT_TYPES = frozenset({
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEWHEEL,
+    pygame.TEXTINPUT,
+})
+
+# 재생 시 tuple로 복원할 이벤트 속성
+_TUPLE_ATTRS = ("pos", "rel", "buttons")
+
+
+# =========================================================
+# 직렬화 헬퍼
+# =========================================================
+
+def _encode_event(event: pygame.event.Event) -> list:
+    data = {}
+    for key, value in event.dict.items():
+        if isinstance(value, tuple):
+            value = list(value)
+        if value is None or isinstance(value, (bool, int, float, str, list)):
+            data[key] = value
+    return [event.type, data]
+
+
+def _decode_event(encoded: list) -> pygame.event.Event:
+    event_type, data = encoded
+    data = dict(data)
+    for key in _TUPLE_ATTRS:
+        if key in data:
+            data[key] = tuple(data[key])
+    return pygame.event.Event(event_type, data)
+
+
+def _json_safe(values: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON으로 저장 가능한 항목만 복사 (엔진 객체 등은 제외)"""
+    safe = {}
+    for key, value in values.items():
+        try:
+            safe[key] = json.loads(json.dumps(value))
+        except (TypeError, ValueError):
+            continue
+    return safe
+
+
+def _pressed_scancodes() -> List[int]:
+    return [index for index, pressed in enumerate(pygame.key.get_pressed()) if pressed]
+
+
+def _fingerprint(mode: Optional["GameMode"]) -> list:
+    """모드 상태 지문 (기록/재생 일치 확인용)"""
+    if mode is None:
+        return []
+    player = getattr(mode, "player", None)
+    game_data = getattr(mode, "game_data", None) or {}
+    values = [type(mode).__name__]
+    if player is not None:
+        values += [round(player.pos.x, 2), round(player.pos.y, 2), round(float(player.hp), 2)]
+    values.append(len(getattr(mode, "enemies", ()) or ()))
+    values.append(game_data.get("score"))
+    return values
+
+
+def seed_random(seed: int):
+    """게임 로직이 쓰는 전역 RNG 시드 고정 (random, numpy)"""
+    random.seed(seed)
+    np.random.seed(seed & 0xFFFFFFFF)
+
+
+# =========================================================
+# 기록
+# =========================================================
+
+class InputRecorder:
+    """
+    전투 세션 입력 기록기 (GameEngine이 소유)
+
+    엔진 루프는 프레임마다 begin_frame() → (이벤트/업데이트/렌더) → end_frame()을 호출하고,
+    push_mode()가 기록 대상 모드를 만들 때 start()를 호출합니다.
+    """
+
+    def __init__(self, replay_dir: Path = None):
+        self.replay_dir = Path(replay_dir or config.REPLAY_DIR)
+        self.mode: Optional["GameMode"] = None
+        self.header: Dict[str, Any] = {}
+        self.frames: List[dict] = []
+
+        # 현재 프레임 (begin_frame에서 채움)
+        self._frame_events: List[pygame.event.Event] = []
+        self._frame_dt = 0.0
+        self._frame_ticks = 0
+
+        self._last_keys: List[int] = []
+        self._last_mouse_pos = (0, 0)
+        self._last_mouse_buttons = (False, False, False)
+
+        # 기록 중에는 get_ticks()가 프레임 시작 틱을 반환 (재생과 같은 시계)
+        self._clock_ticks = 0
+        self._original_get_ticks = None
+
+    @property
+    def active(self) -> bool:
+        return bool(self.header)
+
+    def start(
+        self,
+        mode_name: str,
+        mode_kwargs: Dict[str, Any],
+        engine: "GameEngine",
+        phase: str,
+        event_index: int,
+    ):
+        """
+        기록 시작 (모드 생성 직전에 호출 - RNG 시드 고정)
+
+        Args:
+            phase: 엔진 프레임 단계 ("events", "update", "render", "idle")
+            event_index: phase가 "events"일 때 처리 중인 이벤트 인덱스
+        """
+        seed = time.time_ns() & 0x7FFFFFFF
+        seed_random(seed)
+
+        safe_kwargs = _json_safe(mode_kwargs)
+        if len(safe_kwargs) != len(mode_kwargs):
+            dropped = sorted(set(mode_kwargs) - set(safe_kwargs))
+            print(f"WARNING: Replay cannot store mode kwargs {dropped}; replay may diverge")
+
+        self._last_keys = _pressed_scancodes()
+        self._last_mouse_pos = tuple(pygame.mouse.get_pos())
+        self._last_mouse_buttons = tuple(pygame.mouse.get_pressed())
+
+        start_ticks = pygame.time.get_ticks()
+        self._install_clock(start_ticks)
+
+        self.header = {
+            "version": REPLAY_FORMAT_VERSION,
+            "pygame": pygame.version.ver,
+            "mode": mode_name,
+            "mode_kwargs": safe_kwargs,
+            "seed": seed,
+            "screen_size": list(engine.screen_size),
+            "shared_state": _json_safe(engine.shared_state),
+            "start_ticks": start_ticks,
+            "keys": self._last_keys,
+            "mouse_pos": list(self._last_mouse_pos),
+            "mouse_buttons": list(self._last_mouse_buttons),
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        self.frames = []
+
+        # 프레임 도중 push 된 경우, 같은 프레임의 나머지 처리를 첫 프레임으로 기록
+        if phase in ("events", "update"):
+            remaining = self._frame_events[event_index + 1:] if phase == "events" else []
+            self.frames.append({
+                "dt": self._frame_dt,
+                "t": start_ticks,
+                "ev": [_encode_event(e) for e in remaining if e.type in RECORDED_EVENT_TYPES],
+                "update": phase == "events",
+            })
+        print(f"INFO: Recording input for {mode_name} (seed {seed})")
+
+    def begin_frame(self, raw_dt: float, ticks: int, events: List[pygame.event.Event]):
+        """프레임 시작 - 이벤트 처리 전에 호출"""
+        self._frame_events = events
+        self._frame_dt = raw_dt
+        self._frame_ticks = ticks
+        if not self.active:
+            return
+        self._clock_ticks = ticks
+
+        frame = {
+            "dt": raw_dt,
+            "t": ticks,
+            "ev": [_encode_event(e) for e in events if e.type in RECORDED_EVENT_TYPES],
+        }
+
+        keys = _pressed_scancodes()
+        if keys != self._last_keys:
+            frame["keys"] = self._last_keys = keys
+        mouse_pos = tuple(pygame.mouse.get_pos())
+        if mouse_pos != self._last_mouse_pos:
+            self._last_mouse_pos = mouse_pos
+            frame["mouse"] = list(mouse_pos)
+        mouse_buttons = tuple(pygame.mouse.get_pressed())
+        if mouse_buttons != self._last_mouse_buttons:
+            self._last_mouse_buttons = mouse_buttons
+            frame["buttons"] = list(mouse_buttons)
+
+        self.frames.append(frame)
+
+    def end_frame(self, engine: "GameEngine"):
+        """프레임 종료 - 지문 기록, 기록 모드가 스택에서 빠졌으면 저장"""
+        if not self.active or self.mode is None:
+            return
+        if self.frames and len(self.frames) % FINGERPRINT_INTERVAL == 0:
+            self.frames[-1]["fp"] = _fingerprint(engine.current_mode)
+        if self.mode not in engine.mode_stack:
+            self.stop()
+
+    def stop(self) -> Optional[Path]:
+        """기록 종료 및 파일 저장"""
+        if not self.active:
+            return None
+
+        self._restore_clock()
+        data = dict(self.header, frames=self.frames)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = self.replay_dir / f"{self.header['mode']}_{stamp}.replay.json.gz"
+
+        self.header = {}
+        self.frames = []
+        self.mode = None
+
+        try:
+            self.replay_dir.mkdir(parents=True, exist_ok=True)
+            with gzip.open(path, "wt", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+        except OSError as e:
+            print(f"ERROR: Could not save replay: {e}")
+            return None
+
+        print(f"INFO: Replay saved: {path} ({len(data['frames'])} frames)")
+        return path
+
+    def real_ticks(self) -> int:
+        """실제 SDL 틱 (기록 중 고정된 get_ticks와 무관)"""
+        return (self._original_get_ticks or pygame.time.get_ticks)()
+
+    def _install_clock(self, ticks: int):
+        self._clock_ticks = ticks
+        if self._original_get_ticks is None:
+            self._original_get_ticks = pygame.time.get_ticks
+            pygame.time.get_ticks = lambda: self._clock_ticks
+
+    def _restore_clock(self):
+        if self._original_get_ticks is not None:
+            pygame.time.get_ticks = self._original_get_ticks
+            self._original_get_ticks = None
+
+
+# =========================================================
+# 재생
+# =========================================================
+
+def load_replay(path) -> dict:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != REPLAY_FORMAT_VERSION:
+        raise ValueError(f"Unsupported replay version: {data.get('version')}")
+    if data.get("pygame") != pygame.version.ver:
+        print(f"WARNING: Replay recorded with pygame {data.get('pygame')}, running {pygame.version.ver}")
+    return data
+
+
+class ReplayInput:
+    """
+    재생 중 pygame 입력/시계 조회를 기록된 값으로 대체하는 컨텍스트
+
+    with ReplayInput(replay) as replay_input:
+        replay_input.apply(frame)
+    """
+
+    def __init__(self, replay: dict):
+        self._key_count = len(pygame.key.get_pressed())
+        self._set_keys(replay.get("keys", []))
+        self.mouse_pos = tuple(replay.get("mouse_pos", (0, 0)))
+        self.mouse_buttons = tuple(replay.get("mouse_buttons", (False, False, False)))
+        self.ticks = replay.get("start_ticks", 0)
+        self._originals = {}
+
+    def _set_keys(self, scancodes: List[int]):
+        pressed = [False] * self._key_count
+        for index in scancodes:
+            pressed[index] = True
+        self.keys = pygame.key.ScancodeWrapper(pressed)
+
+    def apply(self, frame: dict):
+        """프레임 입력 상태 반영"""
+        self.ticks = frame["t"]
+        if "keys" in frame:
+            self._set_keys(frame["keys"])
+        if "mouse" in frame:
+            self.mouse_pos = tuple(frame["mouse"])
+        if "buttons" in frame:
+            self.mouse_buttons = tuple(frame["buttons"])
+
+    def _get_pressed_mouse(self, num_buttons: int = 3):
+        buttons = self.mouse_buttons + (False,) * max(0, num_buttons - len(self.mouse_buttons))
+        return buttons[:num_buttons]
+
+    def __enter__(self):
+        replacements = {
+            (pygame.key, "get_pressed"): lambda: self.keys,
+            (pygame.mouse, "get_pos"): lambda: self.mouse_pos,
+            (pygame.mouse, "get_pressed"): self._get_pressed_mouse,
+            (pygame.time, "get_ticks"): lambda: self.ticks,
+        }
+        for (module, name), replacement in replacements.items():
+            self._originals[(module, name)] = getattr(module, name)
+            setattr(module, name, replacement)
+        return self
+
+    def __exit__(self, *exc_info):
+        for (module, name), original in self._originals.items():
+            setattr(module, name, original)
+        self._originals.clear()
+        return False
+
+
+def run_replay(
+    engine: "GameEngine",
+    replay: dict,
+    realtime: bool = False,
+    on_frame=None,
+) -> Dict[str, Any]:
+    """
+    기록된 세션을 엔진에서 재생
+
+    Args:
+        realtime: True면 기록된 dt만큼 대기 (기본은 최대 속도)
+        on_frame: 프레임마다 호출 (frame_index, frame_ms)
+
+    Returns:
+        frame_ms 목록, 지문 불일치 정보 등
+    """
+    engine.input_recorder = None
+    engine.shared_state.update(replay.get("shared_state", {}))
+
+    frame_ms: List[float] = []
+    divergence = None
+
+    with ReplayInput(replay) as replay_input:
+        seed_random(replay["seed"])
+        engine.push_mode(replay["mode"], **replay.get("mode_kwargs", {}))
+
+        for index, frame in enumerate(replay["frames"]):
+            if not engine.running or not engine.current_mode:
+                break
+
+            replay_input.apply(frame)
+            events = [_decode_event(e) for e in frame["ev"]]
+
+            start = time.perf_counter()
+            engine.step(events, frame["dt"], frame["t"] / 1000.0, update=frame.get("update", True))
+            elapsed = time.perf_counter() - start
+            frame_ms.append(elapsed * 1000.0)
+
+            if divergence is None and "fp" in frame:
+                actual = _fingerprint(engine.current_mode)
+                if actual != frame["fp"]:
+                    divergence = {"frame": index, "expected": frame["fp"], "actual": actual}
+
+            if on_frame:
+                on_frame(index, frame_ms[-1])
+            if realtime and elapsed < frame["dt"]:
+                time.sleep(frame["dt"] - elapsed)
+
+    return {
+        "frame_ms": frame_ms,
+        "recorded_seconds": sum(f["dt"] for f in replay["frames"][:len(frame_ms)]),
+        "divergence": divergence,
+    }
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    import argparse
+    import cProfile
+    import os
+
+    parser = argparse.ArgumentParser(description="Replay a recorded combat session")
+    parser.add_argument("replay", help="*.replay.json.gz file")
+    parser.add_argument("--window", action="store_true", help="open a real window (default: headless)")
+    parser.add_argument("--realtime", action="store_true", help="wait recorded dt between frames")
+    parser.add_argument("--csv", help="write per-frame milliseconds to this file")
+    parser.add_argument("--profile", help="write cProfile stats to this file")
+    parser.add_argument("--worst", type=int, default=5, help="number of slowest frames to list")
+    args = parser.parse_args()
+
+    if not args.window:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from asset_manager import AssetManager
+    from engine.game_engine import GameEngine
+
+    replay = load_replay(args.replay)
+
+    pygame.init()
+    screen = pygame.display.set_mode(tuple(replay["screen_size"]))
+    engine = GameEngine(screen, AssetManager())
+
+    profiler = cProfile.Profile() if args.profile else None
+    wall_start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    result = run_replay(engine, replay, realtime=args.realtime)
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+    wall = time.perf_counter() - wall_start
+
+    frame_ms = result["frame_ms"]
+    if not frame_ms:
+        print("Replay has no frames")
+        return
+
+    frames_seconds = sum(frame_ms) / 1000.0
+    print(f"\nreplayed {len(frame_ms)}/{len(replay['frames'])} frames of {replay['mode']} "
+          f"(seed {replay['seed']}) in {frames_seconds:.2f}s + {wall - frames_seconds:.2f}s mode init "
+          f"({result['recorded_seconds'] / frames_seconds:.1f}x recorded speed)")
+    print(f"frame ms: mean {sum(frame_ms) / len(frame_ms):.2f}  p50 {_percentile(frame_ms, 0.5):.2f}  "
+          f"p95 {_percentile(frame_ms, 0.95):.2f}  p99 {_percentile(frame_ms, 0.99):.2f}  "
+          f"max {max(frame_ms):.2f}")
+
+    worst = sorted(range(len(frame_ms)), key=frame_ms.__getitem__, reverse=True)[:args.worst]
+    print("slowest frames:")
+    for index in worst:
+        ticks = replay["frames"][index]["t"] - replay.get("start_ticks", 0)
+        print(f"  #{index:<6} at {ticks / 1000.0:8.2f}s  {frame_ms[index]:7.2f} ms")
+
+    if result["divergence"]:
+        d = result["divergence"]
+        print(f"WARNING: state diverged at frame {d['frame']}: expected {d['expected']}, got {d['actual']}")
+    else:
+        print("state fingerprints match")
+
+    if args.csv:
+        with open(args.csv, "w", encoding="utf-8") as f:
+            f.write("frame,ticks,ms\n")
+            for index, ms in enumerate(frame_ms):
+                f.write(f"{index},{replay['frames'][index]['t']},{ms:.3f}\n")
+        print(f"frame times written to {args.csv}")
+    if args.profile:
+        print(f"profile written to {args.profile}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
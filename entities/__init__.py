@@ -2,15 +2,23 @@
 # 모든 게임 엔티티 클래스를 중앙에서 관리
 
 from .weapons import Weapon, Bullet, BurnProjectile
+from .bullet_store import BulletStore, BulletView
+from .bacteria_swarm import BacteriaSwarm, BacteriaView
 from .player import Player
 from .enemies import Enemy, Boss
+from .enemy_archetypes import EnemyArchetype, get_enemy_archetype
 from .collectibles import CoinGem, HealItem
+from .collectible_field import CollectibleField, CollectibleView
 from .support_units import Turret, Drone
 
 __all__ = [
     'Weapon', 'Bullet', 'BurnProjectile',
+    'BulletStore', 'BulletView',
+    'BacteriaSwarm', 'BacteriaView',
     'Player',
     'Enemy', 'Boss',
+    'EnemyArchetype', 'get_enemy_archetype',
     'CoinGem', 'HealItem',
+    'CollectibleField', 'CollectibleView',
     'Turret', 'Drone'
 ]
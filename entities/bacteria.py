@@ -15,6 +15,19 @@ from asset_manager import AssetManager
 class Bacteria:
     """박테리아 - 플레이어 추적 및 달라붙기"""
 
+    __slots__ = (
+        "screen_width", "screen_height", "pos", "spawn_time", "type_config",
+        # 스탯
+        "max_hp", "hp", "damage_per_second", "speed",
+        # 이미지 및 히트박스
+        "original_image", "image", "image_rect", "hitbox",
+        # 이동 AI / 달라붙기
+        "target_pos", "move_timer", "move_interval",
+        "attached_to_player", "attach_overlap_ratio", "last_damage_time", "damage_interval",
+        # 듀레이션 및 상태
+        "duration", "despawn_time", "vulnerable_to_special", "is_alive", "dead",
+    )
+
     def __init__(
         self,
         spawn_pos: Tuple[float, float],
@@ -73,6 +73,7 @@ class BacteriaGenerator:
         # 박테리아 투하 시스템
         self.spawn_bacteria_count = self.type_config["spawn_bacteria_count"]  # 50개
         self.spawn_bacteria_interval = self.type_config["spawn_bacteria_interval"]  # 3초
+        self.spawn_bacteria_batch = self.type_config.get("spawn_bacteria_batch", 5)  # 1회 투하 개수
         self.bacteria_spawned = 0  # 투하한 박테리아 개수
         self.last_spawn_time = 0.0
         self.spawned_bacteria: List = []  # 생성된 박테리아 리스트
@@ -84,11 +85,14 @@ class BacteriaGenerator:
         # 상태
         self.dead = False
 
-    def update(self, dt: float, current_time: float) -> List:
+    def update(self, dt: float, current_time: float, swarm=None) -> List:
         """업데이트 - 박테리아 투하 포함
 
+        Args:
+            swarm: BacteriaSwarm (지정 시 Bacteria 객체 없이 군집 배열에 직접 투하)
+
         Returns:
-            새로 생성된 박테리아 리스트
+            새로 생성된 박테리아 리스트 (swarm 지정 시 BacteriaView 핸들)
         """
         newly_spawned_bacteria = []
 
@@ -116,30 +120,34 @@ class BacteriaGenerator:
             self.pos.x = self.center_x + self.orbit_radius_x * math.cos(self.orbit_angle)
             self.pos.y = self.orbit_center_y + self.orbit_radius_y * math.sin(self.orbit_angle)
 
-            # 박테리아 투하 (5개씩)
+            # 박테리아 투하 (spawn_bacteria_batch개씩)
             if self.bacteria_spawned < self.spawn_bacteria_count:
                 if current_time - self.last_spawn_time >= self.spawn_bacteria_interval:
                     from entities.bacteria import Bacteria
 
-                    # 5개 생성 (원형으로 분산, 뭉치지 않게)
-                    for i in range(5):
-                        # 원형으로 균등 분산 (각도를 5등분)
-                        angle = (2 * math.pi / 5) * i + random.uniform(-0.3, 0.3)  # 약간의 랜덤성 추가
+                    batch = min(self.spawn_bacteria_batch, self.spawn_bacteria_count - self.bacteria_spawned)
+                    # batch개 생성 (원형으로 분산, 뭉치지 않게)
+                    for i in range(batch):
+                        # 원형으로 균등 분산 (각도를 batch등분)
+                        angle = (2 * math.pi / batch) * i + random.uniform(-0.3, 0.3)  # 약간의 랜덤성 추가
                         distance = random.uniform(80, 150)  # 거리도 랜덤하게 (더 넓게 분산)
                         random_x = self.pos.x + distance * math.cos(angle)
                         random_y = self.pos.y + distance * math.sin(angle)
 
-                        bacteria = Bacteria(
-                            spawn_pos=(random_x, random_y),
-                            screen_size=(self.screen_width, self.screen_height),
-                            spawn_time=current_time
-                        )
+                        if swarm is not None:
+                            bacteria = swarm.spawn((random_x, random_y), current_time)
+                        else:
+                            bacteria = Bacteria(
+                                spawn_pos=(random_x, random_y),
+                                screen_size=(self.screen_width, self.screen_height),
+                                spawn_time=current_time
+                            )
                         newly_spawned_bacteria.append(bacteria)
                         self.spawned_bacteria.append(bacteria)
                         self.bacteria_spawned += 1
 
                     self.last_spawn_time = current_time
-                    print(f"INFO: Generator spawned 5 bacteria ({self.bacteria_spawned}/{self.spawn_bacteria_count})")
+                    print(f"INFO: Generator spawned {batch} bacteria ({self.bacteria_spawned}/{self.spawn_bacteria_count})")
 
             # 모든 박테리아 투하 완료 시 페이드아웃 시작
             if self.bacteria_spawned >= self.spawn_bacteria_count:
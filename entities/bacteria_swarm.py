@@ -0,0 +1,498 @@
+# entities/bacteria_swarm.py
+# 박테리아 군집 저장소 (구조체 배열 + 슬롯 재사용 + 특수 무기 공간 조회)
+
+import random
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+import config
+from asset_manager import AssetManager
+from .bacteria import Bacteria
+
+# 무작위 이동 타겟 범위 (화면 밖 여유, 픽셀)
+WANDER_MARGIN = 100
+# 무작위 이동 타겟 도달 판정 거리 (픽셀)
+WANDER_ARRIVE_DISTANCE = 10
+# 무작위 이동 타겟 변경 간격 (초)
+WANDER_INTERVAL_RANGE = (1.0, 3.0)
+
+
+class BacteriaView:
+    """
+    저장소 슬롯을 가리키는 박테리아 핸들 (기존 Bacteria 인터페이스 호환)
+
+    슬롯이 재사용되면 generation이 바뀌므로, 이전 핸들은 is_alive=False로 보입니다.
+    """
+
+    __slots__ = ("swarm", "slot", "generation")
+
+    def __init__(self, swarm: "BacteriaSwarm", slot: int, generation: int):
+        self.swarm = swarm
+        self.slot = slot
+        self.generation = generation
+
+    def _valid(self) -> bool:
+        return self.swarm.generation[self.slot] == self.generation
+
+    @property
+    def pos(self) -> pygame.math.Vector2:
+        return pygame.math.Vector2(float(self.swarm.x[self.slot]), float(self.swarm.y[self.slot]))
+
+    @pos.setter
+    def pos(self, value):
+        self.swarm.x[self.slot] = value[0]
+        self.swarm.y[self.slot] = value[1]
+
+    @property
+    def hp(self) -> float:
+        return float(self.swarm.hp[self.slot])
+
+    @property
+    def is_alive(self) -> bool:
+        return self._valid() and bool(self.swarm.alive[self.slot])
+
+    @is_alive.setter
+    def is_alive(self, value: bool):
+        if self._valid():
+            self.swarm.alive[self.slot] = value
+
+    @property
+    def dead(self) -> bool:
+        return not self.is_alive
+
+    @property
+    def attached_to_player(self) -> bool:
+        return self.is_alive and bool(self.swarm.attached[self.slot])
+
+    @property
+    def hitbox(self) -> pygame.Rect:
+        size = self.swarm.hitbox_size
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = (int(self.swarm.x[self.slot]), int(self.swarm.y[self.slot]))
+        return rect
+
+    @property
+    def image(self) -> pygame.Surface:
+        return self.swarm.get_image()
+
+    @property
+    def image_rect(self) -> pygame.Rect:
+        return self.image.get_rect(center=(int(self.swarm.x[self.slot]), int(self.swarm.y[self.slot])))
+
+    def take_damage(self, damage: float, is_special_weapon: bool = False):
+        """피격 처리 (특수 무기만 유효 - 일괄 처리는 BacteriaSwarm.damage_slots 사용)"""
+        if is_special_weapon and self.is_alive:
+            self.swarm.damage_slots(np.array([self.slot]), damage)
+
+    def draw(self, screen: pygame.Surface):
+        """단일 박테리아 그리기 (일괄 처리는 BacteriaSwarm.draw 사용)"""
+        if self.is_alive:
+            self.swarm.draw_slots(screen, np.array([self.slot]))
+
+    def __repr__(self) -> str:
+        return f"BacteriaView(slot={self.slot}, generation={self.generation}, alive={self.is_alive})"
+
+
+class BacteriaSwarm:
+    """
+    박테리아 군집 저장소
+
+    - 위치/무작위 이동 타겟/HP/달라붙기 상태를 미리 할당된 numpy 배열에 저장
+    - 추적·달라붙기·무작위 이동, 달라붙은 수와 데미지 합산, 소멸을 한 번에 벡터 연산으로 처리
+    - 특수 무기 피격은 공간 조회 (원 범위 / x축 정렬 sweep으로 히트박스 쌍 조회)로 처리
+    - 리스트 호환 인터페이스 (append/remove/in/len/반복/슬라이스/clear)
+      덕분에 Bacteria 객체를 extend하는 기존 호출부가 그대로 동작
+    """
+
+    def __init__(self, screen_size: Tuple[int, int], capacity: Optional[int] = None):
+        capacity = capacity or getattr(config, "BACTERIA_SWARM_CAPACITY", 256)
+        self.type_config = config.ENEMY_TYPES["BACTERIA"]
+
+        # 스탯 (Bacteria와 같은 규칙)
+        self.max_hp = config.ENEMY_BASE_HP * self.type_config["hp_mult"]
+        self.damage_per_second = config.ENEMY_ATTACK_DAMAGE * self.type_config["damage_mult"]
+        self.speed = config.ENEMY_BASE_SPEED * self.type_config["speed_mult"]
+        self.duration = self.type_config["duration"]
+        self.attach_overlap_ratio = self.type_config["attach_overlap"]
+        self.vulnerable_to_special = self.type_config.get("vulnerable_to_special", True)
+        self.damage_interval = 1.0  # 1초마다 데미지
+
+        self._allocate(capacity)
+
+        self._image: Optional[pygame.Surface] = None
+        self.image_size = 0
+        self.hitbox_size = 0
+        self._init_sizes(screen_size)
+
+    # =========================================================
+    # 배열 관리
+    # =========================================================
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.target_x = np.zeros(capacity, dtype=np.float64)
+        self.target_y = np.zeros(capacity, dtype=np.float64)
+        self.move_timer = np.zeros(capacity, dtype=np.float64)
+        self.move_interval = np.zeros(capacity, dtype=np.float64)
+        self.hp = np.zeros(capacity, dtype=np.float64)
+        self.despawn_time = np.zeros(capacity, dtype=np.float64)
+        self.last_damage_time = np.zeros(capacity, dtype=np.float64)
+        self.attached = np.zeros(capacity, dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.generation = np.zeros(capacity, dtype=np.int64)
+        self.registered = np.zeros(capacity, dtype=bool)  # 핸들이 발급된 슬롯
+        self._views: List[Optional[BacteriaView]] = [None] * capacity
+        # 빈 슬롯 (pop 시 작은 인덱스부터 사용)
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+
+    _ARRAYS = (
+        "x", "y", "target_x", "target_y", "move_timer", "move_interval", "hp",
+        "despawn_time", "last_damage_time", "attached", "alive", "generation", "registered",
+    )
+
+    def _grow(self):
+        """슬롯이 가득 찼을 때 용량 2배 확장 (기존 핸들 유지)"""
+        old_capacity = self.capacity
+        new_capacity = old_capacity * 2
+        for name in self._ARRAYS:
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:old_capacity] = old
+            setattr(self, name, new)
+        self._views.extend([None] * old_capacity)
+        self._free = list(range(new_capacity - 1, old_capacity - 1, -1)) + self._free
+        self.capacity = new_capacity
+        print(f"INFO: BacteriaSwarm grown to {new_capacity} slots")
+
+    def _init_sizes(self, screen_size: Tuple[int, int]):
+        """화면 크기에 맞춰 이미지/히트박스 크기 계산 (Bacteria와 같은 규칙)"""
+        self.screen_width, self.screen_height = screen_size
+        image_size = int(
+            self.screen_height * config.IMAGE_SIZE_RATIOS["ENEMY"] * self.type_config["size_mult"]
+        )
+        if image_size != self.image_size:
+            self._image = None
+        self.image_size = image_size
+        self.hitbox_size = int(image_size * config.ENEMY_HITBOX_RATIO)
+
+    def get_image(self) -> pygame.Surface:
+        if self._image is None:
+            size = self.image_size
+            image_path = config.ASSET_DIR / "images" / "gameplay" / "enemies" / self.type_config["image"]
+            try:
+                self._image = AssetManager.get_image(image_path, (size, size))
+            except Exception as e:
+                # 폴백: 녹색 원
+                self._image = pygame.Surface((size, size), pygame.SRCALPHA)
+                pygame.draw.circle(self._image, (0, 255, 100), (size // 2, size // 2), size // 2)
+                print(f"WARNING: coli_bacteria.png not found, using fallback. Error: {e}")
+        return self._image
+
+    # =========================================================
+    # 생성 / 제거
+    # =========================================================
+
+    def spawn(self, pos, spawn_time: float) -> BacteriaView:
+        """새 박테리아 생성 후 핸들 반환"""
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+
+        self.x[slot] = pos[0]
+        self.y[slot] = pos[1]
+        self.target_x[slot] = random.uniform(-WANDER_MARGIN, self.screen_width + WANDER_MARGIN)
+        self.target_y[slot] = random.uniform(-WANDER_MARGIN, self.screen_height + WANDER_MARGIN)
+        self.move_timer[slot] = 0.0
+        self.move_interval[slot] = random.uniform(*WANDER_INTERVAL_RANGE)
+        self.hp[slot] = self.max_hp
+        self.despawn_time[slot] = spawn_time + self.duration
+        self.last_damage_time[slot] = 0.0
+        self.attached[slot] = False
+        self.alive[slot] = True
+        self.registered[slot] = True
+        self.generation[slot] += 1
+
+        view = BacteriaView(self, slot, int(self.generation[slot]))
+        self._views[slot] = view
+        return view
+
+    def append(self, bacteria):
+        """기존 Bacteria 객체 추가 (리스트 호환 - 배열 슬롯으로 복사)"""
+        if bacteria in self or not bacteria.is_alive:
+            return
+        if isinstance(bacteria, BacteriaView):
+            view = self.spawn(bacteria.pos, 0.0)
+            source = bacteria.swarm
+            self.despawn_time[view.slot] = source.despawn_time[bacteria.slot]
+            self.hp[view.slot] = source.hp[bacteria.slot]
+        elif isinstance(bacteria, Bacteria):
+            view = self.spawn(bacteria.pos, bacteria.spawn_time)
+            self.target_x[view.slot] = bacteria.target_pos.x
+            self.target_y[view.slot] = bacteria.target_pos.y
+            self.move_timer[view.slot] = bacteria.move_timer
+            self.move_interval[view.slot] = bacteria.move_interval
+            self.hp[view.slot] = bacteria.hp
+            self.despawn_time[view.slot] = bacteria.despawn_time
+            self.last_damage_time[view.slot] = bacteria.last_damage_time
+            self.attached[view.slot] = bacteria.attached_to_player
+        else:
+            raise TypeError(f"BacteriaSwarm.append: unsupported item {type(bacteria).__name__}")
+
+    def extend(self, bacteria_list):
+        for bacteria in bacteria_list:
+            self.append(bacteria)
+
+    def remove(self, bacteria: BacteriaView):
+        """박테리아 제거 (슬롯 즉시 해제)"""
+        if bacteria not in self:
+            raise ValueError("BacteriaSwarm.remove(x): x not in swarm")
+        self._release(bacteria.slot)
+
+    def _release(self, slot: int):
+        self.alive[slot] = False
+        self.attached[slot] = False
+        self.registered[slot] = False
+        self._views[slot] = None
+        self.generation[slot] += 1
+        self._free.append(slot)
+
+    def compact(self):
+        """죽은(is_alive=False) 박테리아 슬롯 회수"""
+        for slot in np.flatnonzero(self.registered & ~self.alive).tolist():
+            self._release(slot)
+
+    def clear(self):
+        for slot in np.flatnonzero(self.registered).tolist():
+            self._release(slot)
+
+    # =========================================================
+    # 리스트 호환 인터페이스
+    # =========================================================
+
+    def views(self) -> List[BacteriaView]:
+        """핸들 목록 (is_alive=False로 표시만 되고 아직 회수 전인 박테리아 포함)"""
+        return [self._views[slot] for slot in np.flatnonzero(self.registered).tolist()]
+
+    def __iter__(self) -> Iterator[BacteriaView]:
+        return iter(self.views())
+
+    def __len__(self) -> int:
+        return self.capacity - len(self._free)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __contains__(self, bacteria) -> bool:
+        return (
+            isinstance(bacteria, BacteriaView)
+            and bacteria.swarm is self
+            and self._views[bacteria.slot] is bacteria
+        )
+
+    def __getitem__(self, index):
+        return self.views()[index]
+
+    def __setitem__(self, index, bacteria_list):
+        """swarm[:] = [...] 형태의 필터링만 지원 (목록에 없는 슬롯 해제)"""
+        if not isinstance(index, slice) or index != slice(None):
+            raise TypeError("BacteriaSwarm only supports full-slice assignment")
+        keep = {id(bacteria) for bacteria in bacteria_list}
+        for view in self.views():
+            if id(view) not in keep:
+                self._release(view.slot)
+        for bacteria in bacteria_list:
+            if bacteria not in self:
+                self.append(bacteria)
+
+    # =========================================================
+    # 업데이트 (벡터화)
+    # =========================================================
+
+    def update(self, dt: float, current_time: float,
+               player_pos: Optional[pygame.math.Vector2] = None) -> Tuple[int, float]:
+        """
+        소멸 → 추적/달라붙기 (플레이어 없으면 무작위 이동) → 소멸한 슬롯 회수
+
+        Returns:
+            (달라붙은 박테리아 수, 이번 프레임 데미지 합계)
+        """
+        slots = np.flatnonzero(self.alive)
+        if slots.size == 0:
+            self.compact()
+            return 0, 0.0
+
+        # 듀레이션 체크
+        expired = self.despawn_time[slots] <= current_time
+        if expired.any():
+            self.alive[slots[expired]] = False
+            self.attached[slots[expired]] = False
+            print(f"INFO: {int(expired.sum())} bacteria expired after {self.duration}s")
+            slots = slots[~expired]
+
+        attached_count, damage = 0, 0.0
+        if slots.size:
+            if player_pos is not None:
+                attached_count, damage = self._seek(slots, dt, current_time, player_pos)
+            else:
+                self.attached[slots] = False
+                self._wander(slots, dt)
+
+        self.compact()
+        return attached_count, damage
+
+    def _seek(self, slots: np.ndarray, dt: float, current_time: float,
+              player_pos: pygame.math.Vector2) -> Tuple[int, float]:
+        """플레이어 추적 + 달라붙기 (10% 겹침) + 달라붙은 박테리아 1초마다 데미지"""
+        ddx = player_pos.x - self.x[slots]
+        ddy = player_pos.y - self.y[slots]
+        distance = np.sqrt(ddx * ddx + ddy * ddy)
+        near = distance <= self.hitbox_size * (1.0 - self.attach_overlap_ratio)
+
+        # 달라붙은 박테리아: 플레이어 위치로 이동, 처음 붙으면 데미지 타이머 시작
+        attached = slots[near]
+        newly = attached[~self.attached[attached]]
+        if newly.size:
+            self.last_damage_time[newly] = current_time
+            print(f"INFO: {newly.size} bacteria attached to player!")
+        self.attached[slots] = near
+        self.x[attached] = player_pos.x
+        self.y[attached] = player_pos.y
+
+        due = attached[current_time - self.last_damage_time[attached] >= self.damage_interval]
+        self.last_damage_time[due] = current_time
+
+        # 나머지: 플레이어를 향해 이동
+        moving = ~near & (distance > 0)
+        if moving.any():
+            step = self.speed * dt / distance[moving]
+            self.x[slots[moving]] += ddx[moving] * step
+            self.y[slots[moving]] += ddy[moving] * step
+
+        return int(attached.size), float(due.size * self.damage_per_second)
+
+    def _wander(self, slots: np.ndarray, dt: float):
+        """무작위 이동 (타겟 도달 또는 간격 경과 시 새 타겟)"""
+        ddx = self.target_x[slots] - self.x[slots]
+        ddy = self.target_y[slots] - self.y[slots]
+        arrived = np.sqrt(ddx * ddx + ddy * ddy) < WANDER_ARRIVE_DISTANCE
+        self._retarget(slots[arrived], reset_timer=False)
+
+        ddx = self.target_x[slots] - self.x[slots]
+        ddy = self.target_y[slots] - self.y[slots]
+        distance = np.sqrt(ddx * ddx + ddy * ddy)
+        moving = distance > 0
+        step = self.speed * dt / distance[moving]
+        self.x[slots[moving]] += ddx[moving] * step
+        self.y[slots[moving]] += ddy[moving] * step
+
+        self.move_timer[slots] += dt
+        self._retarget(slots[self.move_timer[slots] >= self.move_interval[slots]], reset_timer=True)
+
+    def _retarget(self, slots: np.ndarray, reset_timer: bool):
+        if slots.size == 0:
+            return
+        self.target_x[slots] = np.random.uniform(-WANDER_MARGIN, self.screen_width + WANDER_MARGIN, slots.size)
+        self.target_y[slots] = np.random.uniform(-WANDER_MARGIN, self.screen_height + WANDER_MARGIN, slots.size)
+        self.move_interval[slots] = np.random.uniform(*WANDER_INTERVAL_RANGE, slots.size)
+        if reset_timer:
+            self.move_timer[slots] = 0.0
+
+    # =========================================================
+    # 특수 무기 피격 (공간 조회)
+    # =========================================================
+
+    def query_radius(self, center, radius: float) -> np.ndarray:
+        """중심과의 거리가 radius 이하인 살아있는 박테리아 슬롯"""
+        slots = np.flatnonzero(self.alive)
+        ddx = self.x[slots] - center[0]
+        ddy = self.y[slots] - center[1]
+        return slots[ddx * ddx + ddy * ddy <= radius * radius]
+
+    def query_boxes(self, boxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        히트박스가 겹치는 (box 인덱스, 박테리아 슬롯) 쌍 (Rect.colliderect와 같은 판정)
+
+        박테리아를 히트박스 left 기준으로 정렬해 두고, box마다 x 범위가 겹칠 수 있는 구간만
+        searchsorted로 잘라 후보 쌍을 만든 뒤 y 범위를 확인합니다 (전체 쌍 비교 없음).
+
+        Args:
+            boxes: (M, 4) 정수 (left, top, right, bottom)
+        """
+        slots = np.flatnonzero(self.alive)
+        if slots.size == 0 or len(boxes) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+
+        size = self.hitbox_size
+        left = self.x[slots].astype(np.int64) - size // 2
+        top = self.y[slots].astype(np.int64) - size // 2
+        order = np.argsort(left, kind="stable")
+        sorted_left = left[order]
+
+        # left < box.right 이고 left + size > box.left 인 구간
+        start = np.searchsorted(sorted_left, boxes[:, 0] - size, side="right")
+        end = np.searchsorted(sorted_left, boxes[:, 2], side="left")
+        counts = np.maximum(end - start, 0)
+        box_index = np.repeat(np.arange(len(boxes)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        candidates = order[np.repeat(start, counts) + offsets]
+
+        hits = (top[candidates] < boxes[box_index, 3]) & (top[candidates] + size > boxes[box_index, 1])
+        return box_index[hits], slots[candidates[hits]]
+
+    def damage_slots(self, slots: np.ndarray, damage) -> int:
+        """
+        특수 무기 데미지 일괄 적용 (같은 슬롯이 여러 번 나오면 데미지 합산)
+
+        Returns:
+            이번에 처치된 박테리아 수
+        """
+        if slots.size == 0 or not self.vulnerable_to_special:
+            return 0
+        before = self.alive.copy()
+        np.subtract.at(self.hp, slots, damage)
+        killed = np.flatnonzero(before & (self.hp <= 0))
+        self.hp[killed] = 0
+        self.alive[killed] = False
+        self.attached[killed] = False
+        if killed.size:
+            print(f"INFO: {killed.size} bacteria destroyed by special weapon!")
+        return int(killed.size)
+
+    def hit_radius(self, center, radius: float, damage: float) -> int:
+        """범위 피격 (Static Field)"""
+        return self.damage_slots(self.query_radius(center, radius), damage)
+
+    def hit_boxes(self, boxes: np.ndarray, damages: np.ndarray) -> int:
+        """히트박스 피격 (번개 총알 - 관통하므로 총알은 그대로)"""
+        box_index, slots = self.query_boxes(boxes)
+        return self.damage_slots(slots, damages[box_index])
+
+    # =========================================================
+    # 렌더링
+    # =========================================================
+
+    def draw(self, screen: pygame.Surface):
+        """모든 박테리아 그리기 (screen.blits 일괄 호출)"""
+        self.draw_slots(screen, np.flatnonzero(self.alive))
+
+    def draw_slots(self, screen: pygame.Surface, slots: np.ndarray):
+        if slots.size == 0:
+            return
+
+        image = self.get_image()
+        half_w, half_h = image.get_width() // 2, image.get_height() // 2
+        xs = self.x[slots].astype(np.int64).tolist()
+        ys = self.y[slots].astype(np.int64).tolist()
+        screen.blits([(image, (x - half_w, y - half_h)) for x, y in zip(xs, ys)], doreturn=False)
+
+        # 달라붙은 상태 표시 (작은 초록색 링) - 달라붙은 박테리아는 같은 위치에 겹치므로 위치별 한 번
+        attached = slots[self.attached[slots]]
+        if attached.size:
+            centers = set(zip(self.x[attached].astype(np.int64).tolist(), self.y[attached].astype(np.int64).tolist()))
+            for center in centers:
+                pygame.draw.circle(screen, (0, 255, 0), center, self.hitbox_size // 2 + 5, 2)
@@ -0,0 +1,529 @@
+# entities/bullet_store.py
+# 플레이어 총알 저장소 (구조체 배열 + 슬롯 재사용)
+
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pygame
+
+import config
+from asset_manager import AssetManager
+
+# 플래그 비트
+FLAG_PIERCING = 1
+
+# 화면 밖 제거 여유 (픽셀)
+CULL_MARGIN = 50
+
+
+class BulletView:
+    """
+    저장소 슬롯을 가리키는 총알 핸들 (기존 Bullet 인터페이스 호환)
+
+    슬롯이 재사용되면 generation이 바뀌므로, 이전 핸들은 is_alive=False로 보입니다.
+    """
+
+    __slots__ = ("store", "slot", "generation")
+
+    def __init__(self, store: "BulletStore", slot: int, generation: int):
+        self.store = store
+        self.slot = slot
+        self.generation = generation
+
+    def _valid(self) -> bool:
+        return self.store.generation[self.slot] == self.generation
+
+    # ----- 위치 / 이동 -----
+
+    @property
+    def pos(self) -> pygame.math.Vector2:
+        return pygame.math.Vector2(float(self.store.x[self.slot]), float(self.store.y[self.slot]))
+
+    @pos.setter
+    def pos(self, value):
+        self.store.x[self.slot] = value[0]
+        self.store.y[self.slot] = value[1]
+
+    @property
+    def direction(self) -> pygame.math.Vector2:
+        return pygame.math.Vector2(float(self.store.dx[self.slot]), float(self.store.dy[self.slot]))
+
+    @direction.setter
+    def direction(self, value):
+        self.store.dx[self.slot] = value[0]
+        self.store.dy[self.slot] = value[1]
+
+    @property
+    def speed(self) -> float:
+        return float(self.store.speed[self.slot])
+
+    @speed.setter
+    def speed(self, value: float):
+        self.store.speed[self.slot] = value
+
+    # ----- 스탯 -----
+
+    @property
+    def damage(self) -> float:
+        return float(self.store.damage[self.slot])
+
+    @damage.setter
+    def damage(self, value: float):
+        self.store.damage[self.slot] = value
+
+    @property
+    def is_alive(self) -> bool:
+        return self._valid() and bool(self.store.alive[self.slot])
+
+    @is_alive.setter
+    def is_alive(self, value: bool):
+        if self._valid():
+            self.store.alive[self.slot] = bool(value)
+
+    @property
+    def is_piercing(self) -> bool:
+        return bool(self.store.flags[self.slot] & FLAG_PIERCING)
+
+    @is_piercing.setter
+    def is_piercing(self, value: bool):
+        if value:
+            self.store.flags[self.slot] |= FLAG_PIERCING
+        else:
+            self.store.flags[self.slot] &= ~FLAG_PIERCING
+
+    @property
+    def pierce_count(self) -> int:
+        return int(self.store.pierce_count[self.slot])
+
+    @pierce_count.setter
+    def pierce_count(self, value: int):
+        self.store.pierce_count[self.slot] = value
+
+    @property
+    def hit_enemies(self) -> Set[int]:
+        return self.store.hit_enemies.setdefault(self.slot, set())
+
+    @property
+    def spawn_time(self) -> int:
+        return int(self.store.spawn_time[self.slot])
+
+    # ----- 충돌 / 렌더링 -----
+
+    @property
+    def hitbox(self) -> pygame.Rect:
+        size = self.store.hitbox_size
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = (int(self.store.x[self.slot]), int(self.store.y[self.slot]))
+        return rect
+
+    @property
+    def image(self) -> pygame.Surface:
+        return self.store.get_image()
+
+    @property
+    def image_rect(self) -> pygame.Rect:
+        return self.image.get_rect(center=(int(self.store.x[self.slot]), int(self.store.y[self.slot])))
+
+    @property
+    def trail_positions(self) -> List[pygame.math.Vector2]:
+        return [pygame.math.Vector2(float(x), float(y)) for x, y in self.store.trail_of(self.slot)]
+
+    def update(self, dt: float, screen_size: tuple):
+        """단일 총알 업데이트 (일괄 처리는 BulletStore.update 사용)"""
+        if self.is_alive:
+            self.store.update_slots(np.array([self.slot]), dt, screen_size)
+
+    def draw(self, screen: pygame.Surface):
+        """단일 총알 그리기 (일괄 처리는 BulletStore.draw 사용)"""
+        if self.is_alive:
+            self.store.draw_slots(screen, np.array([self.slot]))
+
+    def __repr__(self) -> str:
+        return f"BulletView(slot={self.slot}, generation={self.generation}, alive={self.is_alive})"
+
+
+class BulletStore:
+    """
+    플레이어 총알 저장소
+
+    - 위치/방향/속도/데미지/플래그를 미리 할당된 numpy 배열에 저장
+    - 이동, 트레일 기록, 화면 밖 제거를 한 번에 벡터 연산으로 처리
+    - 슬롯 단위 핸들(BulletView)로 충돌 코드가 총알을 안정적으로 참조
+    - 리스트 호환 인터페이스 (append/remove/in/len/반복/슬라이스/clear)
+      덕분에 Weapon.fire, Turret/Drone.update 등 기존 호출부가 그대로 동작
+    """
+
+    def __init__(self, capacity: Optional[int] = None, screen_height: Optional[int] = None):
+        capacity = capacity or getattr(config, "BULLET_STORE_CAPACITY", 1024)
+        self.trail_length = max(1, config.BULLET_TRAIL_LENGTH)
+        self.screen_height = screen_height or config.SCREEN_HEIGHT_INIT
+
+        self._allocate(capacity)
+        self.hit_enemies: Dict[int, Set[int]] = {}
+        # append로 복사된 원본 Bullet → 슬롯 (원본 객체로도 remove / in 가능)
+        self._source_slots: Dict[int, Tuple[object, int]] = {}
+        self._slot_sources: Dict[int, int] = {}
+
+        self._image: Optional[pygame.Surface] = None
+        self._image_height = 0
+        self._sprite_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        self.hitbox_size = 0
+        self._init_sizes(self.screen_height)
+
+    # =========================================================
+    # 배열 관리
+    # =========================================================
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.dx = np.zeros(capacity, dtype=np.float64)
+        self.dy = np.zeros(capacity, dtype=np.float64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.damage = np.zeros(capacity, dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        self.pierce_count = np.zeros(capacity, dtype=np.int16)
+        self.spawn_time = np.zeros(capacity, dtype=np.int64)
+        self.generation = np.zeros(capacity, dtype=np.int64)
+        self.registered = np.zeros(capacity, dtype=bool)  # 핸들이 발급된 슬롯
+        self.trail = np.zeros((capacity, self.trail_length, 2), dtype=np.float64)
+        self.trail_count = np.zeros(capacity, dtype=np.int16)
+        self.trail_head = np.zeros(capacity, dtype=np.int16)
+        self._views: List[Optional[BulletView]] = [None] * capacity
+        # 빈 슬롯 (pop 시 작은 인덱스부터 사용)
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+
+    def _grow(self):
+        """슬롯이 가득 찼을 때 용량 2배 확장 (기존 핸들 유지)"""
+        old_capacity = self.capacity
+        new_capacity = old_capacity * 2
+        for name in ("x", "y", "dx", "dy", "speed", "damage", "alive", "flags",
+                     "pierce_count", "spawn_time", "generation", "registered", "trail",
+                     "trail_count", "trail_head"):
+            old = getattr(self, name)
+            new = np.zeros((new_capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:old_capacity] = old
+            setattr(self, name, new)
+        self._views.extend([None] * old_capacity)
+        self._free = list(range(new_capacity - 1, old_capacity - 1, -1)) + self._free
+        self.capacity = new_capacity
+        print(f"INFO: BulletStore grown to {new_capacity} slots")
+
+    def _init_sizes(self, screen_height: int):
+        """화면 높이에 맞춰 이미지/히트박스 크기 계산"""
+        self.screen_height = screen_height
+        image_size = int(screen_height * config.IMAGE_SIZE_RATIOS["BULLET"])
+        self.image_size = image_size
+        self.hitbox_size = int(image_size * config.BULLET_HITBOX_RATIO)
+
+    def get_image(self) -> pygame.Surface:
+        if self._image is None or self._image_height != self.screen_height:
+            self._image = AssetManager.get_image(
+                config.PLAYER_BULLET_IMAGE_PATH, (self.image_size, self.image_size)
+            )
+            self._image_height = self.screen_height
+            self._sprite_cache.clear()
+        return self._image
+
+    # =========================================================
+    # 생성 / 제거
+    # =========================================================
+
+    def spawn(self, pos, direction, damage: float, piercing: bool = False,
+              speed: Optional[float] = None) -> BulletView:
+        """새 총알 생성 후 핸들 반환"""
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+
+        dir_x, dir_y = float(direction[0]), float(direction[1])
+        length = (dir_x * dir_x + dir_y * dir_y) ** 0.5
+        if length > 0:
+            dir_x /= length
+            dir_y /= length
+
+        self.x[slot] = pos[0]
+        self.y[slot] = pos[1]
+        self.dx[slot] = dir_x
+        self.dy[slot] = dir_y
+        self.speed[slot] = config.BULLET_SPEED if speed is None else speed
+        self.damage[slot] = damage
+        self.alive[slot] = True
+        self.registered[slot] = True
+        self.flags[slot] = FLAG_PIERCING if piercing else 0
+        self.pierce_count[slot] = 0
+        self.spawn_time[slot] = pygame.time.get_ticks()
+        self.trail_count[slot] = 0
+        self.trail_head[slot] = 0
+        self.generation[slot] += 1
+        self.hit_enemies.pop(slot, None)
+
+        view = BulletView(self, slot, int(self.generation[slot]))
+        self._views[slot] = view
+        return view
+
+    def append(self, bullet) -> BulletView:
+        """
+        기존 Bullet 객체 추가 (리스트 호환 - 배열 슬롯으로 복사)
+
+        원본 객체는 슬롯이 해제될 때까지 그 슬롯을 가리키므로
+        bullets.remove(bullet) / bullet in bullets를 원본으로도 호출할 수 있습니다.
+
+        Returns:
+            복사된 슬롯의 핸들
+        """
+        slot = self._slot_of(bullet)
+        if slot is not None:
+            return self._views[slot]
+        view = self.spawn(bullet.pos, bullet.direction, bullet.damage,
+                          getattr(bullet, "is_piercing", False), bullet.speed)
+        view.is_alive = bullet.is_alive
+        if not isinstance(bullet, BulletView):
+            self._source_slots[id(bullet)] = (bullet, view.slot)
+            self._slot_sources[view.slot] = id(bullet)
+        return view
+
+    def extend(self, bullets):
+        for bullet in bullets:
+            self.append(bullet)
+
+    def remove(self, bullet):
+        """총알 제거 (슬롯 즉시 해제) - 핸들 또는 append한 원본 객체"""
+        slot = self._slot_of(bullet)
+        if slot is None:
+            raise ValueError("BulletStore.remove(x): x not in store")
+        self._release(slot)
+
+    def _slot_of(self, bullet) -> Optional[int]:
+        """핸들 또는 append한 원본 객체가 가리키는 슬롯 (없으면 None)"""
+        if isinstance(bullet, BulletView):
+            if bullet.store is self and self._views[bullet.slot] is bullet:
+                return bullet.slot
+            return None
+        entry = self._source_slots.get(id(bullet))
+        if entry is not None and entry[0] is bullet:
+            return entry[1]
+        return None
+
+    def _release(self, slot: int):
+        self.alive[slot] = False
+        self.registered[slot] = False
+        self._views[slot] = None
+        self.generation[slot] += 1
+        self.hit_enemies.pop(slot, None)
+        source_id = self._slot_sources.pop(slot, None)
+        if source_id is not None:
+            del self._source_slots[source_id]
+        self._free.append(slot)
+
+    def compact(self):
+        """사망 처리(is_alive=False)된 총알의 슬롯 회수"""
+        for slot in np.flatnonzero(self.registered & ~self.alive).tolist():
+            self._release(slot)
+
+    def clear(self):
+        for slot in np.flatnonzero(self.registered).tolist():
+            self._release(slot)
+
+    # =========================================================
+    # 리스트 호환 인터페이스
+    # =========================================================
+
+    def views(self) -> List[BulletView]:
+        """핸들 목록 (is_alive=False로 표시만 되고 아직 회수 전인 총알 포함)"""
+        return [self._views[slot] for slot in np.flatnonzero(self.registered).tolist()]
+
+    def __iter__(self) -> Iterator[BulletView]:
+        return iter(self.views())
+
+    def __len__(self) -> int:
+        return self.capacity - len(self._free)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __contains__(self, bullet) -> bool:
+        return self._slot_of(bullet) is not None
+
+    def __getitem__(self, index):
+        return self.views()[index]
+
+    def __setitem__(self, index, bullets):
+        """bullets[:] = [...] 형태의 필터링만 지원 (목록에 없는 슬롯 해제)"""
+        if not isinstance(index, slice) or index != slice(None):
+            raise TypeError("BulletStore only supports full-slice assignment")
+        keep = {self._slot_of(b) for b in bullets}
+        for view in self.views():
+            if view.slot not in keep:
+                self._release(view.slot)
+        for bullet in bullets:
+            if bullet not in self:
+                self.append(bullet)
+
+    # =========================================================
+    # 업데이트 (벡터화)
+    # =========================================================
+
+    def update(self, dt: float, screen_size: tuple):
+        """모든 총알 이동 + 트레일 기록 + 화면 밖 제거"""
+        self.update_slots(np.flatnonzero(self.alive), dt, screen_size)
+
+    def update_slots(self, slots: np.ndarray, dt: float, screen_size: tuple):
+        if screen_size[1] != self.screen_height:
+            self._init_sizes(screen_size[1])
+        if slots.size == 0:
+            return
+
+        # 현재 위치를 트레일 링 버퍼에 기록
+        head = self.trail_head[slots]
+        self.trail[slots, head, 0] = self.x[slots]
+        self.trail[slots, head, 1] = self.y[slots]
+        self.trail_head[slots] = (head + 1) % self.trail_length
+        self.trail_count[slots] = np.minimum(self.trail_count[slots] + 1, self.trail_length)
+
+        step = self.speed[slots] * dt
+        x = self.x[slots] + self.dx[slots] * step
+        y = self.y[slots] + self.dy[slots] * step
+        self.x[slots] = x
+        self.y[slots] = y
+
+        # 화면 밖으로 나가면 제거
+        screen_width, screen_height = screen_size
+        outside = (
+            (x < -CULL_MARGIN) | (x > screen_width + CULL_MARGIN)
+            | (y < -CULL_MARGIN) | (y > screen_height + CULL_MARGIN)
+        )
+        if outside.any():
+            self.alive[slots[outside]] = False
+
+    def trail_of(self, slot: int) -> np.ndarray:
+        """오래된 순서의 트레일 좌표 (N, 2)"""
+        count = int(self.trail_count[slot])
+        head = int(self.trail_head[slot])
+        order = (head - count + np.arange(count)) % self.trail_length
+        return self.trail[slot, order]
+
+    # =========================================================
+    # 충돌 조회 (벡터화 broad-phase)
+    # =========================================================
+
+    def hitbox_boxes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        살아있는 총알 히트박스와 데미지 배열 (다른 저장소의 공간 조회용)
+
+        Returns:
+            ((N, 4) 정수 (left, top, right, bottom), (N,) 데미지)
+        """
+        slots = np.flatnonzero(self.alive)
+        size = self.hitbox_size
+        left = self.x[slots].astype(np.int64) - size // 2
+        top = self.y[slots].astype(np.int64) - size // 2
+        boxes = np.stack((left, top, left + size, top + size), axis=1)
+        return boxes, self.damage[slots]
+
+    def overlap_rects(self, rects: Sequence[pygame.Rect]) -> List[Tuple[BulletView, np.ndarray]]:
+        """
+        살아있는 총알 히트박스와 겹치는 rect 인덱스 목록
+
+        Returns:
+            [(총알 핸들, 겹치는 rect 인덱스 배열), ...] - 슬롯 순서, 겹침이 있는 총알만
+        """
+        slots = np.flatnonzero(self.alive)
+        if slots.size == 0 or not rects:
+            return []
+
+        boxes = np.array([(r.left, r.top, r.right, r.bottom) for r in rects], dtype=np.int64)
+        # BulletView.hitbox와 동일한 정수 좌표 (Rect.center 규칙)
+        size = self.hitbox_size
+        left = (self.x[slots].astype(np.int64) - size // 2)[:, None]
+        top = (self.y[slots].astype(np.int64) - size // 2)[:, None]
+        right = left + size
+        bottom = top + size
+
+        hits = (
+            (left < boxes[:, 2]) & (right > boxes[:, 0])
+            & (top < boxes[:, 3]) & (bottom > boxes[:, 1])
+        )
+        rows = np.flatnonzero(hits.any(axis=1))
+        return [(self._views[slots[row]], np.flatnonzero(hits[row])) for row in rows]
+
+    def overlap_circles(self, centers: np.ndarray, radii: np.ndarray) -> List[Tuple[BulletView, np.ndarray]]:
+        """
+        총알 중심과의 거리가 (총알 반경 + 대상 반경)보다 작은 대상 인덱스 목록
+
+        Args:
+            centers: (N, 2) 대상 중심
+            radii: (N,) 대상 반경
+        """
+        slots = np.flatnonzero(self.alive)
+        if slots.size == 0 or len(centers) == 0:
+            return []
+
+        ddx = self.x[slots][:, None] - centers[:, 0]
+        ddy = self.y[slots][:, None] - centers[:, 1]
+        limit = self.hitbox_size / 2.0 + radii
+        hits = ddx * ddx + ddy * ddy < limit * limit
+        rows = np.flatnonzero(hits.any(axis=1))
+        return [(self._views[slots[row]], np.flatnonzero(hits[row])) for row in rows]
+
+    # =========================================================
+    # 렌더링
+    # =========================================================
+
+    def _perspective_scales(self, slots: np.ndarray, screen_height: int) -> np.ndarray:
+        """Y 위치 기반 원근감 스케일 (0.05 단위 버킷, 정수 키)"""
+        if not config.PERSPECTIVE_ENABLED or not config.PERSPECTIVE_APPLY_TO_BULLETS:
+            return np.full(slots.size, 20, dtype=np.int64)
+        depth = np.clip(self.y[slots] / screen_height, 0.0, 1.0)
+        scale = config.PERSPECTIVE_SCALE_MIN + depth * (
+            config.PERSPECTIVE_SCALE_MAX - config.PERSPECTIVE_SCALE_MIN
+        )
+        return np.rint(scale * 20).astype(np.int64)
+
+    def _sprite(self, scale_key: int, alpha: int) -> pygame.Surface:
+        """스케일/투명도가 적용된 총알 스프라이트 (캐시)"""
+        key = (scale_key, alpha)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            image = self.get_image()
+            if scale_key != 20:
+                scale = scale_key / 20.0
+                image = pygame.transform.scale(
+                    image,
+                    (max(1, int(image.get_width() * scale)), max(1, int(image.get_height() * scale))),
+                )
+            if alpha < 255:
+                image = image.copy()
+                image.set_alpha(alpha)
+            sprite = image
+            self._sprite_cache[key] = sprite
+        return sprite
+
+    def draw(self, screen: pygame.Surface):
+        """모든 총알과 트레일 그리기 (screen.blits 일괄 호출)"""
+        self.draw_slots(screen, np.flatnonzero(self.alive))
+
+    def draw_slots(self, screen: pygame.Surface, slots: np.ndarray):
+        if slots.size == 0:
+            return
+
+        decay = config.BULLET_TRAIL_ALPHA_DECAY
+        scale_keys = self._perspective_scales(slots, screen.get_height())
+        blit_list = []
+        for slot, scale_key in zip(slots.tolist(), scale_keys.tolist()):
+            # 트레일 (뒤에서부터 앞으로, 점점 투명하게)
+            trail = self.trail_of(slot)
+            count = len(trail)
+            for i in range(count):
+                alpha = max(0, min(255, int(255 * (i + 1) / count * decay)))
+                sprite = self._sprite(scale_key, alpha)
+                blit_list.append((sprite, sprite.get_rect(center=(int(trail[i, 0]), int(trail[i, 1])))))
+
+            # 총알 본체
+            sprite = self._sprite(scale_key, 255)
+            blit_list.append((sprite, sprite.get_rect(center=(int(self.x[slot]), int(self.y[slot])))))
+
+        screen.blits(blit_list, doreturn=False)
+
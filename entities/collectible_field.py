@@ -0,0 +1,456 @@
+# entities/collectible_field.py
+# 코인/회복 아이템 저장소 (구조체 배열 + 슬롯 재사용 + 코인 병합)
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+import config
+from asset_manager import AssetManager
+from .collectibles import CoinGem, HealItem
+
+# 아이템 종류
+KIND_COIN = 0
+KIND_HEAL = 1
+
+
+class CollectibleView:
+    """
+    저장소 슬롯을 가리키는 아이템 핸들 (기존 CoinGem/HealItem 인터페이스 호환)
+
+    슬롯이 재사용되면 generation이 바뀌므로, 이전 핸들은 collected=True로 보입니다.
+    """
+
+    __slots__ = ("field", "slot", "generation")
+
+    def __init__(self, field: "CollectibleField", slot: int, generation: int):
+        self.field = field
+        self.slot = slot
+        self.generation = generation
+
+    def _valid(self) -> bool:
+        return self.field.generation[self.slot] == self.generation
+
+    @property
+    def pos(self) -> pygame.math.Vector2:
+        return pygame.math.Vector2(float(self.field.x[self.slot]), float(self.field.y[self.slot]))
+
+    @pos.setter
+    def pos(self, value):
+        self.field.x[self.slot] = value[0]
+        self.field.y[self.slot] = value[1]
+
+    @property
+    def kind(self) -> int:
+        return int(self.field.kind[self.slot])
+
+    @property
+    def is_coin(self) -> bool:
+        return self.kind == KIND_COIN
+
+    @property
+    def value(self) -> int:
+        """코인 점수 (병합된 코인은 합계) 또는 회복량"""
+        return int(self.field.value[self.slot])
+
+    @property
+    def collected(self) -> bool:
+        return not (self._valid() and bool(self.field.alive[self.slot]))
+
+    @collected.setter
+    def collected(self, value: bool):
+        if self._valid():
+            self.field.alive[self.slot] = not value
+
+    @property
+    def hitbox(self) -> pygame.Rect:
+        size = int(self.field.hitbox_sizes[self.kind])
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = (int(self.field.x[self.slot]), int(self.field.y[self.slot]))
+        return rect
+
+    @property
+    def image(self) -> pygame.Surface:
+        return self.field.get_image(self.kind)
+
+    @property
+    def image_rect(self) -> pygame.Rect:
+        return self.image.get_rect(center=(int(self.field.x[self.slot]), int(self.field.y[self.slot])))
+
+    def update(self, dt: float, player):
+        """단일 아이템 자석 이동 (일괄 처리는 CollectibleField.update 사용)"""
+        if not self.collected:
+            self.field.update_slots(np.array([self.slot]), dt, player)
+
+    def collect(self, target) -> bool:
+        """기존 인터페이스: 코인은 collect(game_data), 회복 아이템은 collect(player)"""
+        if self.collected:
+            return False
+        if self.is_coin:
+            target["score"] += self.value
+            target["uncollected_score"] += self.value
+        else:
+            target.heal(self.value)
+        self.collected = True
+        return True
+
+    def draw(self, screen: pygame.Surface):
+        """단일 아이템 그리기 (일괄 처리는 CollectibleField.draw 사용)"""
+        if not self.collected:
+            self.field.draw_slots(screen, np.array([self.slot]))
+
+    def __repr__(self) -> str:
+        return f"CollectibleView(slot={self.slot}, kind={self.kind}, value={self.value}, collected={self.collected})"
+
+
+class CollectibleField:
+    """
+    필드 위 코인/회복 아이템 저장소
+
+    - 위치/종류/값을 미리 할당된 numpy 배열에 저장
+    - 자석 이동, 플레이어 획득 판정, 점수/회복량 합산을 한 번에 벡터 연산으로 처리
+    - 한 번에 여러 개 드롭되는 코인은 값을 합친 코인 하나로 생성하고,
+      필드의 코인이 config.COIN_MERGE_THRESHOLD를 넘으면 가까운 코인끼리 병합해 개수 상한 유지
+    - 리스트 호환 인터페이스 (append/remove/in/len/반복/슬라이스/clear)
+      덕분에 HealItem/CoinGem을 append하는 기존 호출부가 그대로 동작
+    """
+
+    def __init__(self, capacity: Optional[int] = None, screen_height: Optional[int] = None):
+        capacity = capacity or getattr(config, "COLLECTIBLE_FIELD_CAPACITY", 256)
+        self.screen_height = screen_height or config.SCREEN_HEIGHT_INIT
+
+        self._allocate(capacity)
+
+        self._images: Dict[int, pygame.Surface] = {}
+        self._image_height = 0
+        self._sprite_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        self.image_sizes = np.zeros(2, dtype=np.int64)
+        self.hitbox_sizes = np.zeros(2, dtype=np.int64)
+        self._init_sizes(self.screen_height)
+
+        # 병합 통계 (병합으로 제거된 코인 수)
+        self.merged_count = 0
+
+    # =========================================================
+    # 배열 관리
+    # =========================================================
+
+    def _allocate(self, capacity: int):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.value = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.generation = np.zeros(capacity, dtype=np.int64)
+        self.registered = np.zeros(capacity, dtype=bool)  # 핸들이 발급된 슬롯
+        self._views: List[Optional[CollectibleView]] = [None] * capacity
+        # 빈 슬롯 (pop 시 작은 인덱스부터 사용)
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+
+    def _grow(self):
+        """슬롯이 가득 찼을 때 용량 2배 확장 (기존 핸들 유지)"""
+        old_capacity = self.capacity
+        new_capacity = old_capacity * 2
+        for name in ("x", "y", "kind", "value", "alive", "generation", "registered"):
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:old_capacity] = old
+            setattr(self, name, new)
+        self._views.extend([None] * old_capacity)
+        self._free = list(range(new_capacity - 1, old_capacity - 1, -1)) + self._free
+        self.capacity = new_capacity
+        print(f"INFO: CollectibleField grown to {new_capacity} slots")
+
+    def _init_sizes(self, screen_height: int):
+        """화면 높이에 맞춰 이미지/히트박스 크기 계산 (CoinGem/HealItem과 같은 규칙)"""
+        self.screen_height = screen_height
+        for kind, ratio_key in ((KIND_COIN, "COINGEM"), (KIND_HEAL, "GEMHP")):
+            image_size = int(screen_height * config.IMAGE_SIZE_RATIOS[ratio_key])
+            self.image_sizes[kind] = image_size
+            self.hitbox_sizes[kind] = int(image_size * config.GEM_HITBOX_RATIO)
+
+    def get_image(self, kind: int) -> pygame.Surface:
+        if self._image_height != self.screen_height:
+            self._images.clear()
+            self._sprite_cache.clear()
+            self._image_height = self.screen_height
+        image = self._images.get(kind)
+        if image is None:
+            path = config.COIN_GEM_IMAGE_PATH if kind == KIND_COIN else config.GEM_HP_IMAGE_PATH
+            size = int(self.image_sizes[kind])
+            image = AssetManager.get_image(path, (size, size))
+            self._images[kind] = image
+        return image
+
+    # =========================================================
+    # 생성 / 제거
+    # =========================================================
+
+    def spawn(self, kind: int, pos, value: int, screen_height: Optional[int] = None) -> CollectibleView:
+        """새 아이템 생성 후 핸들 반환"""
+        if screen_height and screen_height != self.screen_height:
+            self._init_sizes(screen_height)
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+
+        self.x[slot] = pos[0]
+        self.y[slot] = pos[1]
+        self.kind[slot] = kind
+        self.value[slot] = value
+        self.alive[slot] = True
+        self.registered[slot] = True
+        self.generation[slot] += 1
+
+        view = CollectibleView(self, slot, int(self.generation[slot]))
+        self._views[slot] = view
+        return view
+
+    def spawn_coins(self, pos, count: int, value: int = CoinGem.COIN_AMOUNT,
+                    screen_height: Optional[int] = None) -> Optional[CollectibleView]:
+        """
+        같은 위치에 떨어지는 코인 count개를 값을 합친 코인 하나로 생성
+
+        Returns:
+            생성된 코인 핸들 (count가 0 이하면 None)
+        """
+        if count <= 0:
+            return None
+        return self.spawn(KIND_COIN, pos, value * count, screen_height)
+
+    def append(self, item):
+        """기존 CoinGem/HealItem 객체 추가 (리스트 호환 - 배열 슬롯으로 복사)"""
+        if item in self or getattr(item, "collected", False):
+            return
+        if isinstance(item, HealItem):
+            self.spawn(KIND_HEAL, item.pos, item.HEAL_AMOUNT)
+        elif isinstance(item, CoinGem):
+            self.spawn(KIND_COIN, item.pos, item.COIN_AMOUNT)
+        elif isinstance(item, CollectibleView):
+            self.spawn(item.kind, item.pos, item.value)
+        else:
+            raise TypeError(f"CollectibleField.append: unsupported item {type(item).__name__}")
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def remove(self, item: CollectibleView):
+        """아이템 제거 (슬롯 즉시 해제)"""
+        if item not in self:
+            raise ValueError("CollectibleField.remove(x): x not in field")
+        self._release(item.slot)
+
+    def _release(self, slot: int):
+        self.alive[slot] = False
+        self.registered[slot] = False
+        self._views[slot] = None
+        self.generation[slot] += 1
+        self._free.append(slot)
+
+    def compact(self):
+        """수집 처리(collected=True)된 아이템의 슬롯 회수"""
+        for slot in np.flatnonzero(self.registered & ~self.alive).tolist():
+            self._release(slot)
+
+    def clear(self, kind: Optional[int] = None):
+        """모든 아이템 (kind 지정 시 해당 종류만) 제거"""
+        mask = self.registered if kind is None else self.registered & (self.kind == kind)
+        for slot in np.flatnonzero(mask).tolist():
+            self._release(slot)
+
+    # =========================================================
+    # 리스트 호환 인터페이스
+    # =========================================================
+
+    def views(self) -> List[CollectibleView]:
+        """핸들 목록 (collected=True로 표시만 되고 아직 회수 전인 아이템 포함)"""
+        return [self._views[slot] for slot in np.flatnonzero(self.registered).tolist()]
+
+    def __iter__(self) -> Iterator[CollectibleView]:
+        return iter(self.views())
+
+    def __len__(self) -> int:
+        return self.capacity - len(self._free)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __contains__(self, item) -> bool:
+        return (
+            isinstance(item, CollectibleView)
+            and item.field is self
+            and self._views[item.slot] is item
+        )
+
+    def __getitem__(self, index):
+        return self.views()[index]
+
+    def __setitem__(self, index, items):
+        """gems[:] = [...] 형태의 필터링만 지원 (목록에 없는 슬롯 해제)"""
+        if not isinstance(index, slice) or index != slice(None):
+            raise TypeError("CollectibleField only supports full-slice assignment")
+        keep = {id(item) for item in items}
+        for view in self.views():
+            if id(view) not in keep:
+                self._release(view.slot)
+        for item in items:
+            if item not in self:
+                self.append(item)
+
+    # =========================================================
+    # 업데이트 (벡터화)
+    # =========================================================
+
+    def update(self, dt: float, player):
+        """자석 이동 + (코인이 많으면) 코인 병합"""
+        self.update_slots(np.flatnonzero(self.alive), dt, player)
+        self.merge_coins()
+
+    def update_slots(self, slots: np.ndarray, dt: float, player):
+        """코인 자석이 있으면 범위 안의 아이템을 플레이어 쪽으로 이동 (CoinGem.update와 같은 규칙)"""
+        if slots.size == 0 or not getattr(player, "has_coin_magnet", False):
+            return
+
+        ddx = player.pos.x - self.x[slots]
+        ddy = player.pos.y - self.y[slots]
+        distance = np.sqrt(ddx * ddx + ddy * ddy)
+        magnet_range = player.image_rect.width * config.GEM_MAGNET_RANGE_RATIO
+        pulled = (distance < magnet_range) & (distance > 0)
+        if not pulled.any():
+            return
+
+        step = config.GEM_MAGNET_SPEED * dt / distance[pulled]
+        moving = slots[pulled]
+        self.x[moving] += ddx[pulled] * step
+        self.y[moving] += ddy[pulled] * step
+
+    def merge_coins(self, threshold: Optional[int] = None, radius: Optional[float] = None) -> int:
+        """
+        코인 수가 threshold를 넘으면 radius 격자 칸마다 코인을 하나로 병합 (값 합산, 값 가중 중심)
+
+        Returns:
+            병합으로 제거된 코인 수
+        """
+        threshold = config.COIN_MERGE_THRESHOLD if threshold is None else threshold
+        radius = config.COIN_MERGE_RADIUS if radius is None else radius
+        if radius <= 0:
+            return 0
+        slots = np.flatnonzero(self.alive & (self.kind == KIND_COIN))
+        if slots.size <= threshold:
+            return 0
+
+        cells = np.stack((np.floor(self.x[slots] / radius), np.floor(self.y[slots] / radius)), axis=1)
+        _, first, inverse = np.unique(cells, axis=0, return_index=True, return_inverse=True)
+        if first.size == slots.size:
+            return 0
+        inverse = inverse.reshape(-1)
+
+        values = self.value[slots].astype(np.float64)
+        totals = np.bincount(inverse, weights=values)
+        weights = np.maximum(totals, 1e-9)
+        survivors = slots[first]
+        self.x[survivors] = np.bincount(inverse, weights=self.x[slots] * values) / weights
+        self.y[survivors] = np.bincount(inverse, weights=self.y[slots] * values) / weights
+        self.value[survivors] = np.rint(totals).astype(np.int64)
+
+        merged = np.setdiff1d(slots, survivors, assume_unique=True)
+        for slot in merged.tolist():
+            self._release(slot)
+        self.merged_count += merged.size
+        return int(merged.size)
+
+    def collect(self, player, game_data: dict, sound_manager=None) -> Tuple[int, int]:
+        """
+        플레이어 히트박스와 겹친 아이템을 한 번에 획득 (점수/회복량 합산 후 한 번만 반영)
+
+        Returns:
+            (획득한 코인 점수, 회복량)
+        """
+        slots = np.flatnonzero(self.alive)
+        if slots.size == 0:
+            return 0, 0
+
+        # Rect.colliderect와 동일한 정수 좌표 판정 (Rect.center 규칙)
+        hitbox = player.hitbox
+        size = self.hitbox_sizes[self.kind[slots]]
+        left = self.x[slots].astype(np.int64) - size // 2
+        top = self.y[slots].astype(np.int64) - size // 2
+        hits = (
+            (left < hitbox.right) & (left + size > hitbox.left)
+            & (top < hitbox.bottom) & (top + size > hitbox.top)
+        )
+        if not hits.any():
+            return 0, 0
+
+        picked = slots[hits]
+        is_coin = self.kind[picked] == KIND_COIN
+        coin_total = int(self.value[picked][is_coin].sum())
+        heal_total = int(self.value[picked][~is_coin].sum())
+        for slot in picked.tolist():
+            self._release(slot)
+
+        if coin_total:
+            game_data["score"] += coin_total
+            game_data["uncollected_score"] += coin_total
+            if sound_manager:
+                sound_manager.play_sfx("coin_pickup")
+        if heal_total:
+            player.heal(heal_total)
+            if sound_manager:
+                sound_manager.play_sfx("heal_pickup")
+        return coin_total, heal_total
+
+    # =========================================================
+    # 렌더링
+    # =========================================================
+
+    def _scale_keys(self, slots: np.ndarray, screen_height: int) -> np.ndarray:
+        """원근감(코인만) x 병합 코인 크기 배율 (0.05 단위 버킷, 정수 키)"""
+        scale = np.ones(slots.size, dtype=np.float64)
+        is_coin = self.kind[slots] == KIND_COIN
+        if config.PERSPECTIVE_ENABLED and config.PERSPECTIVE_APPLY_TO_GEMS:
+            depth = np.clip(self.y[slots] / screen_height, 0.0, 1.0)
+            perspective = config.PERSPECTIVE_SCALE_MIN + depth * (
+                config.PERSPECTIVE_SCALE_MAX - config.PERSPECTIVE_SCALE_MIN
+            )
+            scale = np.where(is_coin, perspective, scale)
+
+        tier = np.ones(slots.size, dtype=np.float64)
+        values = self.value[slots]
+        for min_value, tier_scale in sorted(config.COIN_MERGE_TIERS):
+            tier = np.where(is_coin & (values >= min_value), tier_scale, tier)
+        return np.rint(scale * tier * 20).astype(np.int64)
+
+    def _sprite(self, kind: int, scale_key: int) -> pygame.Surface:
+        """종류/스케일별 스프라이트 (캐시)"""
+        image = self.get_image(kind)
+        key = (kind, scale_key)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            sprite = image
+            if scale_key != 20:
+                scale = scale_key / 20.0
+                sprite = pygame.transform.scale(
+                    image,
+                    (max(1, int(image.get_width() * scale)), max(1, int(image.get_height() * scale))),
+                )
+            self._sprite_cache[key] = sprite
+        return sprite
+
+    def draw(self, screen: pygame.Surface):
+        """모든 아이템 그리기 (screen.blits 일괄 호출)"""
+        self.draw_slots(screen, np.flatnonzero(self.alive))
+
+    def draw_slots(self, screen: pygame.Surface, slots: np.ndarray):
+        if slots.size == 0:
+            return
+
+        scale_keys = self._scale_keys(slots, screen.get_height())
+        blit_list = []
+        for slot, kind, scale_key in zip(slots.tolist(), self.kind[slots].tolist(), scale_keys.tolist()):
+            sprite = self._sprite(kind, scale_key)
+            blit_list.append((sprite, sprite.get_rect(center=(int(self.x[slot]), int(self.y[slot])))))
+        screen.blits(blit_list, doreturn=False)
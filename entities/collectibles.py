@@ -10,6 +10,8 @@ from asset_manager import AssetManager
 class CoinGem:
     """코인/젬 클래스 (적을 죽이면 드롭)"""
 
+    __slots__ = ("pos", "collected", "image", "image_rect", "hitbox")
+
     COIN_AMOUNT = config.BASE_COIN_DROP_PER_KILL  # 코인 획득 시 점수
 
     def __init__(self, pos: Tuple[float, float], screen_height: int):
@@ -45,12 +47,12 @@ class CoinGem:
             direction = player.pos - self.pos
             distance = direction.length()
 
-            # 자석 효과 범위 (플레이어 이미지 크기의 10배 정도로 가정)
-            MAGNET_RANGE = player.image_rect.width * 10
+            # 자석 효과 범위 (플레이어 이미지 크기의 배수)
+            MAGNET_RANGE = player.image_rect.width * config.GEM_MAGNET_RANGE_RATIO
 
             if distance < MAGNET_RANGE:
                 # 플레이어에게 끌어당기는 속도 (거리와 비례)
-                MAGNET_SPEED = 500.0
+                MAGNET_SPEED = config.GEM_MAGNET_SPEED
                 if distance > 0:
                     direction = direction.normalize()
                     # 이동 속도를 dt와 MAGNET_SPEED로 계산
@@ -111,6 +113,8 @@ class CoinGem:
 class HealItem:
     """체력 회복 아이템 클래스"""
 
+    __slots__ = ("pos", "collected", "image", "image_rect", "hitbox")
+
     HEAL_AMOUNT = config.HEAL_AMOUNT  # 회복량
 
     def __init__(self, pos: Tuple[float, float], screen_height: int):
@@ -146,12 +150,12 @@ class HealItem:
             direction = player.pos - self.pos
             distance = direction.length()
 
-            # 자석 효과 범위 (플레이어 이미지 크기의 10배 정도로 가정)
-            MAGNET_RANGE = player.image_rect.width * 10
+            # 자석 효과 범위 (플레이어 이미지 크기의 배수)
+            MAGNET_RANGE = player.image_rect.width * config.GEM_MAGNET_RANGE_RATIO
 
             if distance < MAGNET_RANGE:
                 # 플레이어에게 끌어당기는 속도 (거리와 비례)
-                MAGNET_SPEED = 500.0
+                MAGNET_SPEED = config.GEM_MAGNET_SPEED
                 if distance > 0:
                     direction = direction.normalize()
                     # 이동 속도를 dt와 MAGNET_SPEED로 계산
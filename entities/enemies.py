@@ -8,10 +8,56 @@ from typing import Tuple
 import config
 from asset_manager import AssetManager
 from entities.weapons import BurnProjectile
+from entities.enemy_archetypes import ArchetypeStat, get_enemy_archetype
 
 
 class Enemy:
-    """적 우주선 클래스"""
+    """
+    적 우주선 클래스
+
+    타입별 불변 데이터(스탯 배율, tint/플래시/화상 이미지, 특수 능력)는
+    EnemyArchetype이 공유하고, 인스턴스는 참조 + 변경 가능한 상태만 보관합니다.
+    """
+
+    __slots__ = (
+        "archetype",
+        # 위치 및 이동
+        "pos", "speed", "base_speed", "chase_probability",
+        "wander_direction", "wander_timer", "wander_change_interval",
+        "angle", "velocity",
+        # 스탯
+        "max_hp", "hp", "damage", "last_attack_time", "is_alive",
+        # 이미지 및 히트박스 (이미지는 아키타입 공유 Surface를 가리킴)
+        "image", "original_image", "image_rect", "hitbox",
+        # 피격/상태 이펙트
+        "hit_flash_timer", "is_flashing", "is_burning",
+        "is_frozen", "freeze_timer", "is_slowed", "slow_timer", "slow_ratio",
+        # 특수 능력 상태
+        "enemy_id", "last_regen_time", "last_burn_attack_time", "burn_projectiles", "has_exploded",
+        # 웨이브 전환 AI
+        "is_retreating", "is_circling", "circle_angle", "retreat_target", "escaped",
+        # 모드/시스템에서 붙이는 플래그
+        "_kill_counted", "_original_speed", "_slow_timer", "_freeze_timer",
+    )
+
+    # 아키타입 공유 값 (읽기 전용)
+    enemy_type = ArchetypeStat()
+    type_config = ArchetypeStat()
+    coin_multiplier = ArchetypeStat()
+    color = ArchetypeStat()
+    size = ArchetypeStat()
+    is_boss = ArchetypeStat()
+    use_rotation = ArchetypeStat()
+    burn_image = ArchetypeStat()
+    has_shield = ArchetypeStat()
+    shield_regen_rate = ArchetypeStat()
+    summon_on_death = ArchetypeStat()
+    summon_count = ArchetypeStat()
+    explode_on_contact = ArchetypeStat()
+    explosion_damage = ArchetypeStat()
+    explosion_radius = ArchetypeStat()
+    has_burn_attack = ArchetypeStat()
+    is_respawned = ArchetypeStat()
 
     def __init__(
         self,
@@ -21,15 +67,14 @@ class Enemy:
         enemy_type: str = "NORMAL",
     ):
 
-        # 0. 적 타입 설정
-        self.enemy_type = enemy_type
-        self.type_config = config.ENEMY_TYPES.get(
-            enemy_type, config.ENEMY_TYPES["NORMAL"]
-        )
+        # 0. 적 타입 아키타입 (타입/화면 높이별 1회 생성 후 공유)
+        archetype = get_enemy_archetype(enemy_type, screen_height)
+        self.archetype = archetype
 
         # 1. 위치 및 이동
         self.pos = pos
-        self.speed = config.ENEMY_BASE_SPEED * self.type_config["speed_mult"]
+        self.speed = archetype.speed
+        self.base_speed = self.speed  # 기본 속도 저장
         self.chase_probability = chase_probability  # 플레이어 추적 확률 (0.0 ~ 1.0)
         self.wander_direction = pygame.math.Vector2(
             random.uniform(-1, 1), random.uniform(-1, 1)
@@ -37,70 +82,29 @@ class Enemy:
         self.wander_timer = 0.0
         self.wander_change_interval = 2.0  # 방황 방향 변경 간격 (초)
 
+        # 회전 관련 속성 (블루 드래곤용)
+        self.angle = 0.0  # 현재 회전 각도
+        self.velocity = pygame.math.Vector2(0, 0)  # 이동 속도 벡터 (회전 계산용)
+
         # 2. 스탯 (타입 배율 적용)
-        self.max_hp = config.ENEMY_BASE_HP * self.type_config["hp_mult"]
+        self.max_hp = archetype.max_hp
         self.hp = self.max_hp
-        self.damage = config.ENEMY_ATTACK_DAMAGE * self.type_config["damage_mult"]
+        self.damage = archetype.damage
         self.last_attack_time = 0.0
-        self.coin_multiplier = self.type_config["coin_mult"]  # 코인 드롭 배율
-
-        # 3. 이미지 및 히트박스 (타입별 크기 적용)
-        size_ratio = config.IMAGE_SIZE_RATIOS["ENEMY"]
-        image_size = int(screen_height * size_ratio * self.type_config["size_mult"])
-
-        # 커스텀 이미지 사용 여부 확인
-        use_custom_image = self.type_config.get("use_custom_image", False)
-        if use_custom_image:
-            # 블루 드래곤 같은 커스텀 이미지
-            custom_image_name = self.type_config.get("image", "enemy_ship.png")
-            custom_image_path = config.ASSET_DIR / "images" / "gameplay" / "enemies" / custom_image_name
-            original_image = AssetManager.get_image(custom_image_path, (image_size, image_size))
-            self.color = self.type_config["color_tint"]  # 사망 효과용 색상 저장
-            self.size = image_size // 2  # 사망 효과용 크기 저장 (반지름)
-            self.image = original_image  # 커스텀 이미지는 tint 적용 안함
-        else:
-            # 기존 일반 이미지 로드 및 색상 tint 적용
-            original_image = AssetManager.get_image(
-                config.ENEMY_SHIP_IMAGE_PATH, (image_size, image_size)
-            )
-            self.color = self.type_config["color_tint"]  # 사망 효과용 색상 저장
-            self.size = image_size // 2  # 사망 효과용 크기 저장 (반지름)
-            self.image = self._apply_color_tint(original_image, self.color)
+        self.is_alive = True
 
+        # 3. 이미지 및 히트박스
+        self.image = archetype.image
+        self.original_image = archetype.image
         self.image_rect = self.image.get_rect(center=(self.pos.x, self.pos.y))
 
-        hitbox_size = int(image_size * config.ENEMY_HITBOX_RATIO)
-        self.hitbox = pygame.Rect(0, 0, hitbox_size, hitbox_size)
+        self.hitbox = pygame.Rect(0, 0, archetype.hitbox_size, archetype.hitbox_size)
         self.hitbox.center = (int(self.pos.x), int(self.pos.y))
 
-        self.is_alive = True
-        self.is_boss = self.type_config.get("is_boss", False)  # 보스 여부
-
-        # 회전 관련 속성 (블루 드래곤용)
-        self.use_rotation = self.type_config.get("use_rotation", False)
-        self.angle = 0.0  # 현재 회전 각도
-        self.velocity = pygame.math.Vector2(0, 0)  # 이동 속도 벡터 (회전 계산용)
-
-        # 4. 히트 플래시 효과 속성
+        # 4. 히트 플래시 / 화상 (플레이어 접촉 중 여부)
         self.hit_flash_timer = 0.0
         self.is_flashing = False
-        self.original_image = self.image.copy()
-
-        # 4-1. 플레이어 접촉 시 화상 이미지
-        self.is_burning = False  # 플레이어와 접촉 중 여부
-
-        # 커스텀 이미지는 burn 이미지 사용 안함 (원본 이미지 그대로 표시)
-        if use_custom_image:
-            self.burn_image = self.image  # 커스텀 이미지는 burn 효과 없이 원본 표시
-        else:
-            # Burn 이미지를 10% 작게 표시
-            burn_size = int(image_size * 0.9)
-            burn_image = AssetManager.get_image(
-                config.ENEMY_SHIP_BURN_IMAGE_PATH,
-                (burn_size, burn_size),
-            )
-            # 화상 이미지는 불꽃 효과이므로 색상 tint를 적용하지 않음 (원본 그대로 사용)
-            self.burn_image = burn_image
+        self.is_burning = False
 
         # 5. 속성 스킬 상태 이펙트
         self.is_frozen = False  # 완전 동결 상태
@@ -108,59 +112,23 @@ class Enemy:
         self.is_slowed = False  # 슬로우 상태
         self.slow_timer = 0.0
         self.slow_ratio = 0.0  # 슬로우 비율 (0.0 ~ 1.0)
-        self.base_speed = self.speed  # 기본 속도 저장
 
-        # 6. 포위 공격용 고유 ID (해시값 사용)
-        self.enemy_id = id(self)  # 객체의 고유 ID
+        # 6. 포위 공격용 고유 ID (전역 RNG 사용 - 리플레이 시드로 재현 가능, id()는 실행마다 다름)
+        self.enemy_id = random.getrandbits(31)
 
-        # 7. 타입별 특수 능력
-        # SHIELDED: 재생 보호막
-        self.has_shield = self.type_config.get("has_shield", False)
-        self.shield_regen_rate = self.type_config.get("shield_regen_rate", 0.0)
+        # 7. 타입별 특수 능력 상태 (SHIELDED 재생, BURN_ATTACK, KAMIKAZE)
         self.last_regen_time = 0.0
-
-        # SUMMONER: 사망 시 소환
-        self.summon_on_death = self.type_config.get("summon_on_death", False)
-        self.summon_count = self.type_config.get("summon_count", 0)
-
-        # KAMIKAZE: 자폭
-        self.explode_on_contact = self.type_config.get("explode_on_contact", False)
-        self.explosion_damage = self.type_config.get("explosion_damage", 0.0)
-        self.explosion_radius = self.type_config.get("explosion_radius", 0)
-
-        # 8. BURN_ATTACK 패턴 (보스급 적용)
-        self.has_burn_attack = self.type_config.get("has_burn_attack", False)
         self.last_burn_attack_time = 0.0
         self.burn_projectiles = []  # 발사된 burn 발사체 리스트
         self.has_exploded = False  # 자폭 여부 (한 번만 폭발)
 
         # 8. 웨이브 전환 AI 모드
-        self.is_respawned = self.type_config.get(
-            "is_respawned", False
-        )  # 리스폰 적 여부
         self.is_retreating = False  # 퇴각 모드 (기존 적)
         self.is_circling = False  # 회전 공격 모드 (빨간 적)
         self.circle_angle = random.uniform(0, 2 * math.pi)  # 회전 시작 각도 (랜덤)
         self.retreat_target = None  # 퇴각 목표 위치
         self.escaped = False  # 화면 밖으로 도망 성공 여부 (킬 카운트 제외용)
 
-    def _apply_color_tint(
-        self, image: pygame.Surface, tint_color: tuple
-    ) -> pygame.Surface:
-        """이미지에 색상 tint를 적용합니다."""
-        if tint_color == (255, 255, 255):
-            return image  # 원본 색상 그대로
-
-        # 새 surface 생성 (알파 채널 유지)
-        tinted = image.copy()
-
-        # 색상 overlay 적용 (BLEND_RGB_MULT 대신 BLEND_RGBA_MULT 사용)
-        color_overlay = pygame.Surface(image.get_size(), pygame.SRCALPHA)
-        color_overlay.fill((*tint_color, 128))  # 반투명 색상
-        tinted.blit(color_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-
-        return tinted
-
     def move_towards_player(
         self, player_pos: pygame.math.Vector2, dt: float, other_enemies: list = None, current_time: float = 0.0, screen_size: tuple = None
     ):
@@ -351,7 +319,7 @@ class Enemy:
                     self.hit_flash_timer -= dt
                     if self.hit_flash_timer <= 0:
                         self.is_flashing = False
-                        self.image = self.original_image.copy()
+                        self.image = self.original_image
                 return
 
             # === 일반 AI 모드 ===
@@ -381,7 +349,7 @@ class Enemy:
                 self.hit_flash_timer -= dt
                 if self.hit_flash_timer <= 0:
                     self.is_flashing = False
-                    self.image = self.original_image.copy()
+                    self.image = self.original_image
 
     def _retreat_to_edge(self, dt: float, screen_size: tuple = None):
         """화면 상부로 서서히 퇴각"""
@@ -467,19 +435,11 @@ class Enemy:
             # 플레이어와 접촉 중 - 화상 이미지 사용
             current_image = self.burn_image
         elif self.is_flashing:
-            # 피격 시 - 히트 플래시 (붉은색 가미)
-            flash_surface = self.original_image.copy()
-            flash_surface.fill(
-                config.HIT_FLASH_COLOR, special_flags=pygame.BLEND_RGB_ADD
-            )
-            current_image = flash_surface
+            # 피격 시 - 히트 플래시 (붉은색 가미, 아키타입 공유 이미지)
+            current_image = self.archetype.flash_image
         elif self.is_frozen:
-            # 동결 상태 - 흰색-푸른색 가미
-            freeze_surface = self.original_image.copy()
-            freeze_surface.fill(
-                config.FREEZE_FLASH_COLOR, special_flags=pygame.BLEND_RGB_ADD
-            )
-            current_image = freeze_surface
+            # 동결 상태 - 흰색-푸른색 가미 (아키타입 공유 이미지)
+            current_image = self.archetype.freeze_image
         else:
             # 기본 이미지
             current_image = self.image
@@ -705,7 +665,7 @@ class Boss(Enemy):
         self.base_speed = self.speed
 
         # 7. 포위 공격용 고유 ID
-        self.enemy_id = id(self)
+        self.enemy_id = random.getrandbits(31)
 
         # 7.5. 회전 관련 속성 (Enemy와 동일하게 추가)
         self.use_rotation = False  # 보스는 기본적으로 회전 안함
@@ -0,0 +1,150 @@
+# entities/enemy_archetypes.py
+# 적 타입별 공유 데이터 (플라이웨이트)
+
+from typing import Dict, Tuple
+
+import pygame
+
+import config
+from asset_manager import AssetManager
+
+
+class EnemyArchetype:
+    """
+    적 타입별 불변 데이터 - (enemy_type, screen_height)당 한 번만 생성
+
+    - 타입 배율이 적용된 기본 스탯
+    - 색상 tint / 히트 플래시 / 동결 / 화상 이미지 (모든 적이 공유, 수정 금지)
+    - 특수 능력 플래그 (보호막, 소환, 자폭, Burn 공격 등)
+    """
+
+    __slots__ = (
+        "enemy_type", "type_config", "screen_height",
+        "speed", "max_hp", "damage", "coin_multiplier",
+        "image_size", "hitbox_size", "color", "size", "is_boss", "use_rotation",
+        "image", "flash_image", "freeze_image", "burn_image",
+        "has_shield", "shield_regen_rate", "summon_on_death", "summon_count",
+        "explode_on_contact", "explosion_damage", "explosion_radius",
+        "has_burn_attack", "is_respawned",
+    )
+
+    def __init__(self, enemy_type: str, screen_height: int):
+        type_config = config.ENEMY_TYPES.get(enemy_type, config.ENEMY_TYPES["NORMAL"])
+        self.enemy_type = enemy_type
+        self.type_config = type_config
+        self.screen_height = screen_height
+
+        # 1. 스탯 (타입 배율 적용)
+        self.speed = config.ENEMY_BASE_SPEED * type_config["speed_mult"]
+        self.max_hp = config.ENEMY_BASE_HP * type_config["hp_mult"]
+        self.damage = config.ENEMY_ATTACK_DAMAGE * type_config["damage_mult"]
+        self.coin_multiplier = type_config["coin_mult"]  # 코인 드롭 배율
+
+        # 2. 이미지 및 히트박스 (타입별 크기 적용)
+        size_ratio = config.IMAGE_SIZE_RATIOS["ENEMY"]
+        image_size = int(screen_height * size_ratio * type_config["size_mult"])
+        self.image_size = image_size
+        self.hitbox_size = int(image_size * config.ENEMY_HITBOX_RATIO)
+        self.color = type_config["color_tint"]  # 사망 효과용 색상
+        self.size = image_size // 2  # 사망 효과용 크기 (반지름)
+        self.is_boss = type_config.get("is_boss", False)
+        self.use_rotation = type_config.get("use_rotation", False)
+
+        use_custom_image = type_config.get("use_custom_image", False)
+        if use_custom_image:
+            # 블루 드래곤 같은 커스텀 이미지 (tint 적용 안함)
+            custom_image_name = type_config.get("image", "enemy_ship.png")
+            custom_image_path = config.ASSET_DIR / "images" / "gameplay" / "enemies" / custom_image_name
+            self.image = AssetManager.get_image(custom_image_path, (image_size, image_size))
+            # 커스텀 이미지는 burn 효과 없이 원본 표시
+            self.burn_image = self.image
+        else:
+            original_image = AssetManager.get_image(
+                config.ENEMY_SHIP_IMAGE_PATH, (image_size, image_size)
+            )
+            self.image = _apply_color_tint(original_image, self.color)
+            # Burn 이미지를 10% 작게 표시 (불꽃 효과이므로 tint 미적용)
+            burn_size = int(image_size * 0.9)
+            self.burn_image = AssetManager.get_image(
+                config.ENEMY_SHIP_BURN_IMAGE_PATH, (burn_size, burn_size)
+            )
+
+        # 3. 상태 이미지 (피격 시 붉은색, 동결 시 청백색 가미)
+        self.flash_image = _add_color(self.image, config.HIT_FLASH_COLOR)
+        self.freeze_image = _add_color(self.image, config.FREEZE_FLASH_COLOR)
+
+        # 4. 타입별 특수 능력
+        self.has_shield = type_config.get("has_shield", False)
+        self.shield_regen_rate = type_config.get("shield_regen_rate", 0.0)
+        self.summon_on_death = type_config.get("summon_on_death", False)
+        self.summon_count = type_config.get("summon_count", 0)
+        self.explode_on_contact = type_config.get("explode_on_contact", False)
+        self.explosion_damage = type_config.get("explosion_damage", 0.0)
+        self.explosion_radius = type_config.get("explosion_radius", 0)
+        self.has_burn_attack = type_config.get("has_burn_attack", False)
+        self.is_respawned = type_config.get("is_respawned", False)
+
+
+def _apply_color_tint(image: pygame.Surface, tint_color: tuple) -> pygame.Surface:
+    """이미지에 색상 tint를 적용합니다."""
+    if tint_color == (255, 255, 255):
+        return image  # 원본 색상 그대로
+
+    # 새 surface 생성 (알파 채널 유지)
+    tinted = image.copy()
+
+    # 색상 overlay 적용 (BLEND_RGB_MULT 대신 BLEND_RGBA_MULT 사용)
+    color_overlay = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+    color_overlay.fill((*tint_color, 128))  # 반투명 색상
+    tinted.blit(color_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+
+    return tinted
+
+
+def _add_color(image: pygame.Surface, color: tuple) -> pygame.Surface:
+    surface = image.copy()
+    surface.fill(color, special_flags=pygame.BLEND_RGB_ADD)
+    return surface
+
+
+class ArchetypeStat:
+    """
+    아키타입의 불변 값을 읽는 디스크립터 (적 인스턴스에 복사하지 않음)
+
+    archetype이 없는 서브클래스(Boss)는 AttributeError → 기존처럼 hasattr() False
+    """
+
+    __slots__ = ("name",)
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return getattr(instance.archetype, self.name)
+
+
+# 전역 레지스트리
+_archetypes: Dict[Tuple[str, int], EnemyArchetype] = {}
+
+
+def get_enemy_archetype(enemy_type: str, screen_height: int) -> EnemyArchetype:
+    """적 타입 아키타입 조회 (최초 요청 시 생성)"""
+    key = (enemy_type, screen_height)
+    archetype = _archetypes.get(key)
+    if archetype is None:
+        archetype = EnemyArchetype(enemy_type, screen_height)
+        _archetypes[key] = archetype
+    return archetype
+
+
+def preload_enemy_archetypes(screen_height: int, enemy_types=None):
+    """웨이브 시작 전 아키타입 미리 생성 (첫 스폰 프레임 지연 방지)"""
+    for enemy_type in enemy_types or config.ENEMY_TYPES.keys():
+        get_enemy_archetype(enemy_type, screen_height)
+
+
+def clear_enemy_archetypes():
+    """레지스트리 비우기 (에셋/설정 변경 시)"""
+    _archetypes.clear()
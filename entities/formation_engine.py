@@ -0,0 +1,304 @@
+"""
+Formation Engine - 배열 기반 갈라그 포메이션 엔진
+
+포메이션 적은 격자(rows x cols) 슬롯에 배치되므로 개별 객체 대신 배열로 관리합니다.
+- 위치/HP/상태를 numpy 배열에 저장 (슬롯 인덱스 = row * cols + col)
+- 포메이션 전체 이동은 offset 하나로 처리 (슬롯 위치 + offset)
+- 총알 충돌은 격자 셀 역산으로 O(1) 조회, 다이브 중인 적만 별도 소규모 리스트로 검사
+- 다이브 경로는 시작 시 Catmull-Rom 스플라인을 등간격(호 길이) 샘플로 미리 계산
+"""
+import math
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+
+# 적 상태
+STATE_FORMATION = 0   # 포메이션 슬롯에 고정
+STATE_DIVING = 1      # 다이브 경로 이동 중
+STATE_RETURNING = 2   # 화면 상단에서 슬롯으로 복귀 중
+
+
+def catmull_rom_path(points: Sequence[Tuple[float, float]], step: float = 4.0,
+                     samples_per_segment: int = 24) -> np.ndarray:
+    """
+    제어점을 지나는 Catmull-Rom 스플라인을 등간격(호 길이 기준)으로 샘플링
+
+    Args:
+        points: 제어점 목록 (2개 이상)
+        step: 샘플 간 거리 (픽셀)
+        samples_per_segment: 호 길이 계산용 세그먼트당 샘플 수
+
+    Returns:
+        (N, 2) float32 배열 - 인덱스 i는 경로 시작점에서 i * step 픽셀 떨어진 위치
+    """
+    ctrl = np.asarray(points, dtype=np.float64)
+    # 양 끝점 복제 (곡선이 첫/마지막 제어점을 지나도록)
+    ctrl = np.vstack([ctrl[0], ctrl, ctrl[-1]])
+
+    t = np.linspace(0.0, 1.0, samples_per_segment, endpoint=False)[:, None]
+    t2 = t * t
+    t3 = t2 * t
+
+    dense = []
+    for i in range(1, len(ctrl) - 2):
+        p0, p1, p2, p3 = ctrl[i - 1], ctrl[i], ctrl[i + 1], ctrl[i + 2]
+        dense.append(0.5 * (
+            2.0 * p1
+            + (-p0 + p2) * t
+            + (2.0 * p0 - 5.0 * p1 + 4.0 * p2 - p3) * t2
+            + (-p0 + 3.0 * p1 - 3.0 * p2 + p3) * t3
+        ))
+    dense.append(ctrl[-2][None, :])
+    dense = np.vstack(dense)
+
+    # 누적 호 길이 → 등간격 재샘플링
+    seg_len = np.hypot(*np.diff(dense, axis=0).T)
+    cumulative = np.concatenate([[0.0], np.cumsum(seg_len)])
+    total = cumulative[-1]
+    if total <= 0.0:
+        return dense[:1].astype(np.float32)
+
+    targets = np.arange(0.0, total + step, step)
+    targets[-1] = min(targets[-1], total)
+    xs = np.interp(targets, cumulative, dense[:, 0])
+    ys = np.interp(targets, cumulative, dense[:, 1])
+    return np.column_stack([xs, ys]).astype(np.float32)
+
+
+class FormationEngine:
+    """
+    격자 포메이션 적 저장소
+
+    Attributes:
+        rows, cols: 포메이션 격자 크기
+        x, y: 적 중심 위치 (포메이션 상태는 draw/조회 시 슬롯 + offset으로 갱신)
+        hp, max_hp: 체력
+        alive: 생존 여부
+        state: STATE_FORMATION / STATE_DIVING / STATE_RETURNING
+        divers: 다이브/복귀 중인 슬롯 인덱스 (소규모 리스트)
+    """
+
+    PATH_STEP = 4.0  # 다이브 경로 샘플 간격 (픽셀)
+
+    # 적 이미지 캐시 (클래스 변수)
+    _image_cache = {}
+
+    def __init__(self, screen_size: Tuple[int, int], enemy_size: Tuple[int, int] = (40, 40),
+                 spacing: Tuple[float, float] = (60.0, 50.0)):
+        self.screen_size = screen_size
+        self.enemy_w, self.enemy_h = enemy_size
+        self.spacing_x, self.spacing_y = spacing
+
+        # 포메이션 원점 (0행 0열 슬롯 중심) 및 전체 이동 offset
+        self.origin_x = 0.0
+        self.origin_y = 0.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+
+        self.divers: List[int] = []
+        self._dive_paths: Dict[int, np.ndarray] = {}
+        self._newly_killed = 0
+
+        self.reset(0, 0)
+
+    @classmethod
+    def reset_image_cache(cls):
+        """이미지 캐시 초기화"""
+        cls._image_cache.clear()
+
+    # =========================================================
+    # 생성
+    # =========================================================
+
+    def reset(self, rows: int, cols: int, hp: float = 50.0,
+              origin: Tuple[float, float] = (0.0, 0.0), elite_rows: int = 1):
+        """포메이션 배열 재할당"""
+        self.rows = rows
+        self.cols = cols
+        self.origin_x, self.origin_y = origin
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+
+        count = rows * cols
+        index = np.arange(count)
+        self.slot_col = (index % max(cols, 1)).astype(np.int32)
+        self.slot_row = (index // max(cols, 1)).astype(np.int32)
+        self.slot_x = (self.origin_x + self.slot_col * self.spacing_x).astype(np.float32)
+        self.slot_y = (self.origin_y + self.slot_row * self.spacing_y).astype(np.float32)
+
+        self.x = self.slot_x.copy()
+        self.y = self.slot_y.copy()
+        self.hp = np.full(count, hp, dtype=np.float32)
+        self.max_hp = np.full(count, hp, dtype=np.float32)
+        self.alive = np.ones(count, dtype=bool)
+        self.state = np.full(count, STATE_FORMATION, dtype=np.int8)
+        self.elite = self.slot_row < elite_rows
+        self.dive_dist = np.zeros(count, dtype=np.float32)
+        self.dive_speed = np.zeros(count, dtype=np.float32)
+
+        self.divers = []
+        self._dive_paths = {}
+        self._newly_killed = 0
+
+    # =========================================================
+    # 업데이트
+    # =========================================================
+
+    def set_offset(self, offset_x: float, offset_y: float = 0.0):
+        """포메이션 전체 이동 (슬롯 위치 + offset)"""
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+
+    def update(self, dt: float, return_speed: float = 2.0):
+        """포메이션 위치 동기화 + 다이브/복귀 중인 적만 개별 이동"""
+        formation = self.state == STATE_FORMATION
+        self.x[formation] = self.slot_x[formation] + self.offset_x
+        self.y[formation] = self.slot_y[formation] + self.offset_y
+
+        finished = []
+        for index in self.divers:
+            if not self.alive[index]:
+                finished.append(index)
+                continue
+
+            if self.state[index] == STATE_DIVING:
+                path = self._dive_paths[index]
+                self.dive_dist[index] += self.dive_speed[index] * dt
+                pos = self.dive_dist[index] / self.PATH_STEP
+                i = int(pos)
+                if i >= len(path) - 1:
+                    # 다이브 완료 - 화면 상단에서 슬롯으로 복귀
+                    self.state[index] = STATE_RETURNING
+                    self.x[index] = self.slot_x[index] + self.offset_x
+                    self.y[index] = -self.enemy_h
+                    del self._dive_paths[index]
+                else:
+                    frac = pos - i
+                    self.x[index] = path[i, 0] + (path[i + 1, 0] - path[i, 0]) * frac
+                    self.y[index] = path[i, 1] + (path[i + 1, 1] - path[i, 1]) * frac
+            else:
+                target_x = self.slot_x[index] + self.offset_x
+                target_y = self.slot_y[index] + self.offset_y
+                dx = target_x - self.x[index]
+                dy = target_y - self.y[index]
+                if dx * dx + dy * dy < 4.0:
+                    self.state[index] = STATE_FORMATION
+                    finished.append(index)
+                else:
+                    blend = min(1.0, return_speed * dt)
+                    self.x[index] += dx * blend
+                    self.y[index] += dy * blend
+
+        for index in finished:
+            self.divers.remove(index)
+            self._dive_paths.pop(index, None)
+
+    def start_dive(self, index: int, player_pos: Tuple[float, float], speed: float = 300.0):
+        """다이브 시작 - 경로 스플라인을 한 번만 계산"""
+        if not self.alive[index] or self.state[index] != STATE_FORMATION:
+            return
+
+        start_x = float(self.slot_x[index] + self.offset_x)
+        start_y = float(self.slot_y[index] + self.offset_y)
+        target_x, target_y = float(player_pos[0]), float(player_pos[1])
+        screen_h = self.screen_size[1]
+
+        # 바깥쪽으로 작은 루프를 돈 뒤 플레이어를 향해 급강하
+        side = -1.0 if start_x < self.screen_size[0] / 2 else 1.0
+        points = [
+            (start_x, start_y),
+            (start_x + side * 40.0, start_y - 40.0),
+            (start_x + side * 80.0, start_y + 20.0),
+            (target_x, target_y),
+            (target_x - side * 60.0, screen_h + self.enemy_h),
+        ]
+
+        self._dive_paths[index] = catmull_rom_path(points, self.PATH_STEP)
+        self.state[index] = STATE_DIVING
+        self.dive_dist[index] = 0.0
+        self.dive_speed[index] = speed
+        self.x[index] = start_x
+        self.y[index] = start_y
+        self.divers.append(index)
+
+    def pick_diver(self) -> Optional[int]:
+        """포메이션에 있는 생존 적 중 무작위 1명"""
+        candidates = np.flatnonzero(self.alive & (self.state == STATE_FORMATION))
+        if candidates.size == 0:
+            return None
+        return int(candidates[random.randrange(candidates.size)])
+
+    # =========================================================
+    # 충돌 조회
+    # =========================================================
+
+    def _cell_range(self, low: float, high: float, origin: float, spacing: float,
+                    size: float, count: int) -> range:
+        """[low, high) 구간과 겹치는 격자 인덱스 범위 (슬롯 중심 ± size/2 기준)"""
+        half = size / 2.0
+        first = math.floor((low - origin - half) / spacing) + 1
+        last = math.ceil((high - origin + half) / spacing) - 1
+        return range(max(first, 0), min(last, count - 1) + 1)
+
+    def query_rect(self, rect: pygame.Rect) -> List[int]:
+        """rect와 겹치는 생존 적 인덱스 (포메이션: 격자 조회, 다이버: 선형 검사)"""
+        hits = []
+
+        origin_x = self.origin_x + self.offset_x
+        origin_y = self.origin_y + self.offset_y
+        rows = self._cell_range(rect.top, rect.bottom, origin_y, self.spacing_y, self.enemy_h, self.rows)
+        cols = self._cell_range(rect.left, rect.right, origin_x, self.spacing_x, self.enemy_w, self.cols)
+        for row in rows:
+            base = row * self.cols
+            for col in cols:
+                index = base + col
+                if self.alive[index] and self.state[index] == STATE_FORMATION:
+                    hits.append(index)
+
+        half_w = self.enemy_w / 2.0
+        half_h = self.enemy_h / 2.0
+        for index in self.divers:
+            if not self.alive[index]:
+                continue
+            ex = self.x[index]
+            ey = self.y[index]
+            if (ex - half_w < rect.right and ex + half_w > rect.left and
+                    ey - half_h < rect.bottom and ey + half_h > rect.top):
+                hits.append(index)
+
+        return hits
+
+    def damage(self, index: int, amount: float) -> bool:
+        """데미지 적용. 사망시 True 반환"""
+        if not self.alive[index]:
+            return False
+        self.hp[index] -= amount
+        if self.hp[index] <= 0:
+            self.alive[index] = False
+            self._newly_killed += 1
+            return True
+        return False
+
+    def collect_kills(self) -> int:
+        """마지막 호출 이후 사망한 적 수"""
+        killed = self._newly_killed
+        self._newly_killed = 0
+        return killed
+
+    # =========================================================
+    # 조회
+    # =========================================================
+
+    def alive_count(self) -> int:
+        return int(np.count_nonzero(self.alive))
+
+    def alive_indices(self) -> np.ndarray:
+        return np.flatnonzero(self.alive)
+
+    def get_rect(self, index: int) -> pygame.Rect:
+        rect = pygame.Rect(0, 0, self.enemy_w, self.enemy_h)
+        rect.center = (int(self.x[index]), int(self.y[index]))
+        return rect
@@ -8,6 +8,7 @@ from typing import Tuple, List, Dict
 import config
 from asset_manager import AssetManager
 from entities.weapons import Weapon
+from entities.player_trail import PlayerTrailRenderer
 
 
 class Player:
@@ -220,10 +221,6 @@ class Player:
 
         # 10. 이동 효과 시스템
         self.velocity = pygame.math.Vector2(0, 0)  # 현재 이동 속도 벡터
-        self.trail_particles = (
-            []
-        )  # 이동 트레일 파티클 [(pos, lifetime, color, size), ...]
-        self.afterimages = []  # 잔상 효과 [(image, pos, alpha, lifetime), ...]
         self.last_trail_spawn = 0.0  # 마지막 트레일 생성 시간
         self.trail_spawn_interval = 0.02  # 트레일 생성 간격 (초)
         self.disable_afterimages = False  # 잔상 비활성화 플래그 (공성 모드용)
@@ -232,6 +229,9 @@ class Player:
         # 10-2. 배기가스 이미지 로드
         self._load_gas_effect_image()
 
+        # 10-3. 트레일/잔상/배기가스 렌더러 (링 버퍼 + 스프라이트 캐시)
+        self.trail_renderer = PlayerTrailRenderer(self)
+
         # 10-1. 이동 방향 기울기(틸트) 시스템
         self.current_tilt = 0.0  # 현재 기울기 각도 (도)
         self.target_tilt = 0.0  # 목표 기울기 각도 (도)
@@ -460,22 +460,10 @@ class Player:
             speed_magnitude = self.velocity.length()
             speed_ratio = speed_magnitude / self.speed if self.speed > 0 else 0
             if speed_ratio > 0.7 and not self.disable_afterimages:
-                # 잔상 생성 (투명도 있는 플레이어 이미지)
-                afterimage = self.image.copy()
-                alpha = int(100 * speed_ratio)
-                afterimage.set_alpha(alpha)
-
-                # 잔상에 현재 기울기 적용
-                if abs(self.current_tilt) > 0.5:
-                    afterimage = pygame.transform.rotate(afterimage, self.current_tilt)
-
-                self.afterimages.append({
-                    "image": afterimage,
-                    "pos": self.pos.copy(),
-                    "alpha": alpha,
-                    "lifetime": 0.15,
-                    "max_lifetime": 0.15,
-                })
+                # 잔상 생성 (현재 기울기 적용, 이미지는 렌더러 캐시 공유)
+                self.trail_renderer.spawn_afterimage(
+                    self.pos, int(100 * speed_ratio), 0.15, self.current_tilt
+                )
         else:
             self.velocity = pygame.math.Vector2(0, 0)
 
@@ -663,22 +651,8 @@ class Player:
 
         self.last_trail_spawn = current_time
 
-        # 이동 방향의 반대로 파티클 생성
-        if self.velocity.length_squared() > 0:
-            direction = self.velocity.normalize()
-            # 플레이어 뒤쪽에서 파티클 생성
-            offset = -direction * (self.image_rect.width * 0.3)
-            spawn_pos = self.pos + offset
-
-            # 속도에 따른 파티클 수 (빠를수록 많이)
-            particle_count = int(2 + speed_ratio * 3)
-
-            for _ in range(particle_count):
-                # 약간의 랜덤 분산
-                spread = pygame.math.Vector2(
-                    random.uniform(-10, 10), random.uniform(-10, 10)
-                )
-            particle_pos = spawn_pos + spread
+        if self.velocity.length_squared() <= 0:
+            return
 
         if speed_ratio < 0.5:
             color = (100, 150, 255)  # 파란색
@@ -687,42 +661,29 @@ class Player:
         else:
             color = (255, 215, 0)  # 주황색
 
-            # 속도에 따른 파티클 크기
-            size = int(3 + speed_ratio * 5)
-
-            # 파티클 수명 (속도가 빠를수록 길게)
-            lifetime = 0.3 + speed_ratio * 0.3
-
-            self.trail_particles.append(
-                {
-                    "pos": particle_pos.copy(),
-                    "lifetime": lifetime,
-                    "max_lifetime": lifetime,
-                    "color": color,
-                    "size": size,
-                }
+        # 이동 방향의 반대로 파티클 생성 (플레이어 뒤쪽)
+        direction = self.velocity.normalize()
+        spawn_pos = self.pos - direction * (self.image_rect.width * 0.3)
+        rotation = -math.degrees(math.atan2(direction.y, direction.x)) - 90
+
+        # 속도에 따른 파티클 수/크기/수명 (빠를수록 많고, 크고, 길게)
+        particle_count = int(2 + speed_ratio * 3)
+        scale = 0.2 + speed_ratio * 0.3
+        lifetime = 0.3 + speed_ratio * 0.3
+
+        for _ in range(particle_count):
+            # 약간의 랜덤 분산 + 뒤쪽으로 퍼지는 속도
+            spread = pygame.math.Vector2(random.uniform(-10, 10), random.uniform(-10, 10))
+            velocity = -direction * 40.0 + spread * 3.0
+            self.trail_renderer.spawn_trail(
+                spawn_pos + spread, (velocity.x, velocity.y), lifetime, scale, rotation, color
             )
 
-            # 고속 이동 시 잔상 효과 추가 (공성 모드에서는 비활성화)
-            if speed_ratio > 0.7 and not self.disable_afterimages:
-                # 잔상 생성 (투명도 있는 플레이어 이미지)
-                afterimage = self.image.copy()
-                alpha = int(100 * speed_ratio)  # 속도에 따라 투명도 조절
-                afterimage.set_alpha(alpha)
-
-                # 잔상에 현재 기울기 적용
-                if abs(self.current_tilt) > 0.5:
-                    afterimage = pygame.transform.rotate(afterimage, self.current_tilt)
-
-                self.afterimages.append(
-                    {
-                        "image": afterimage,
-                        "pos": self.pos.copy(),
-                        "alpha": alpha,
-                        "lifetime": 0.15,  # 잔상 지속 시간
-                        "max_lifetime": 0.15,
-                    }
-                )
+        # 고속 이동 시 잔상 효과 추가 (공성 모드에서는 비활성화)
+        if speed_ratio > 0.7 and not self.disable_afterimages:
+            self.trail_renderer.spawn_afterimage(
+                self.pos, int(100 * speed_ratio), 0.15, self.current_tilt
+            )
 
     def activate_ultimate(self, enemies: List):
         """궁극기를 발동합니다 (Q 키)
@@ -1173,27 +1134,7 @@ class Player:
 
     def update_movement_effects(self, dt: float):
         """이동 효과 업데이트 (파티클 트레일과 잔상)"""
-        # 트레일 파티클 업데이트
-        for particle in self.trail_particles[:]:
-            particle["lifetime"] -= dt
-            if particle["lifetime"] <= 0:
-                self.trail_particles.remove(particle)
-            else:
-                # 확산 효과 적용 (배기가스가 퍼짐)
-                if 'velocity' in particle:
-                    particle['pos'] += particle['velocity'] * dt
-                    # 속도 감소 (마찰)
-                    particle['velocity'] *= 0.95
-
-        # 잔상 업데이트
-        for afterimage in self.afterimages[:]:
-            afterimage["lifetime"] -= dt
-            if afterimage["lifetime"] <= 0:
-                self.afterimages.remove(afterimage)
-            else:
-                # 페이드 아웃 효과
-                fade_ratio = afterimage["lifetime"] / afterimage["max_lifetime"]
-                afterimage["image"].set_alpha(int(afterimage["alpha"] * fade_ratio))
+        self.trail_renderer.update(dt)
 
     def _calculate_perspective_scale(self, screen_height: int) -> float:
         """Y 위치 기반 원근감 스케일 계산"""
@@ -1215,144 +1156,15 @@ class Player:
         # 원근감 스케일 계산
         perspective_scale = self._calculate_perspective_scale(screen.get_height())
 
-        # 1. 잔상 효과 그리기 (플레이어 뒤에)
-        for afterimage in self.afterimages:
-            # 잔상에도 원근감 적용
-            if (
-                config.PERSPECTIVE_ENABLED
-                and config.PERSPECTIVE_APPLY_TO_PLAYER
-                and perspective_scale != 1.0
-            ):
-                afterimage_scale = self._calculate_perspective_scale(
-                    screen.get_height()
-                )
-                scaled_afterimage = pygame.transform.smoothscale(
-                    afterimage["image"],
-                    (
-                        int(afterimage["image"].get_width() * afterimage_scale),
-                        int(afterimage["image"].get_height() * afterimage_scale),
-                    ),
-                )
-                rect = scaled_afterimage.get_rect(
-                    center=(int(afterimage["pos"].x), int(afterimage["pos"].y))
-                )
-                screen.blit(scaled_afterimage, rect)
-            else:
-                rect = afterimage["image"].get_rect(
-                    center=(int(afterimage["pos"].x), int(afterimage["pos"].y))
-                )
-                screen.blit(afterimage["image"], rect)
-
-        # 2. 배기가스 이미지 직접 그리기 (플레이어 뒤, 타원 궤도 기반)
-        if self.gas_effect_image and not self.disable_trail:
-            # 속도 계산
-            speed = self.velocity.length()
-            max_speed = self.speed * 1.5  # 최대 속도 추정
-            speed_ratio = min(1.0, speed / max_speed) if max_speed > 0 else 0
-
-            # 최소 속도 체크 (낮은 속도에서도 배기가스 표시)
-            if speed_ratio > 0.1:
-                # 이동 방향 계산
-                if self.velocity.length_squared() > 0:
-                    direction = self.velocity.normalize()
-
-                    # 이동 방향 각도 계산
-                    move_angle = math.atan2(direction.y, direction.x)
-
-                    # 우주선 뒤쪽 타원 궤도의 가장자리 지점 계산
-                    # 타원: 가로(a) = 우주선 너비의 25%, 세로(b) = 우주선 높이의 15%
-                    ellipse_a = self.image_rect.width * 0.25  # 가로 반지름 (줄임)
-                    ellipse_b = self.image_rect.height * 0.15  # 세로 반지름 (줄임)
-
-                    # 이동 방향의 반대쪽 타원 경계 지점 (배기가스 시작점)
-                    # 반대 방향이므로 angle + π
-                    back_angle = move_angle + math.pi
-                    ellipse_x = ellipse_a * math.cos(back_angle)
-                    ellipse_y = ellipse_b * math.sin(back_angle)
-
-                    # 배기가스 시작 위치 (우주선 중심 + 타원 경계)
-                    # 우주선 바로 뒤에 배치 (배율 감소: 1.5 → 0.8)
-                    exhaust_offset = pygame.math.Vector2(ellipse_x, ellipse_y) * 0.8
-                    exhaust_base_pos = self.pos + exhaust_offset
-
-                    # 배기가스 타입에 따라 다른 크기 및 크롭 설정
-                    exhaust_filename = self.ship_data.get("exhaust_effect", "gas_effect_01.png")
-
-                    # 원본 이미지 크롭 (속도에 따라)
-                    orig_height = self.gas_effect_image.get_height()
-                    orig_width = self.gas_effect_image.get_width()
-
-                    if "gas_effect_02" in exhaust_filename:
-                        # 플라즈마: 크기 축소, 머리부분(밝은 부분) 잘라냄
-                        gas_length = int(self.image_rect.height * (0.3 + speed_ratio * 0.8) * perspective_scale)  # 길이 축소
-                        gas_width = int(self.image_rect.width * 0.5 * perspective_scale)  # 너비 축소
-
-                        # 하단 40% 잘라내기 (60-80% 구간의 밝은 부분 제거)
-                        # 180도 회전 후 밝은 부분이 우주선 쪽으로 가는 것을 방지
-                        crop_start = 0
-                        crop_height = int(orig_height * 0.6)  # 상단 60%만 사용
-                    else:
-                        # 화염: 더 넓게, 블러 효과 위해 너비 증가
-                        gas_length = int(self.image_rect.height * (0.4 + speed_ratio * 1.2) * perspective_scale)
-                        gas_width = int(self.image_rect.width * 1.0 * perspective_scale)  # 0.6 → 1.0 (넓게)
-
-                        # 상단 20% 잘라내기 (꼬리 부분, 배기가스 적은 곳 제거)
-                        # 하단 80%만 사용 (밝은 배기가스 부분만)
-                        crop_start = int(orig_height * 0.2)
-                        crop_height = orig_height - crop_start
-
-                    if crop_height > 0:
-                        # 크롭된 부분만 추출
-                        cropped_gas = self.gas_effect_image.subsurface(
-                            pygame.Rect(0, crop_start, orig_width, crop_height)
-                        ).copy()
-
-                        # 스케일 (크롭된 이미지를 목표 크기로)
-                        scaled_gas = pygame.transform.smoothscale(
-                            cropped_gas,
-                            (gas_width, gas_length)
-                        )
-
-                        # 타입별 투명도 조절
-                        if "gas_effect_02" in exhaust_filename:
-                            # 플라즈마: 약간 더 투명하게
-                            alpha = int(60 + speed_ratio * 120)  # 60 ~ 180
-                        else:
-                            # 화염: 블러 효과를 위해 더 투명하게
-                            alpha = int(50 + speed_ratio * 100)  # 50 ~ 150 (더 투명)
-
-                        scaled_gas.set_alpha(alpha)
-
-                        # 이미지를 180도 회전 (밝은 부분이 우주선 쪽으로)
-                        scaled_gas = pygame.transform.rotate(scaled_gas, 180)
-
-                        # 회전 (이동 방향에 맞춤)
-                        # 배기가스는 항상 우주선 반대 방향을 향해야 함
-                        angle_deg = math.degrees(move_angle) + 90  # 이동 방향의 반대 방향
-                        rotated_gas = pygame.transform.rotate(scaled_gas, -angle_deg)
-
-                        # 배기가스 최종 위치 계산
-                        # 회전된 이미지의 한쪽 끝(밝은 부분)이 우주선 엔진 출구에 오도록 조정
-                        rotated_rect = rotated_gas.get_rect()
-
-                        # 배기가스 이미지 타입에 따라 다른 오프셋 적용
-                        # gas_effect_01 (화염): 상단 20% 잘림, 밝은 부분만 사용
-                        # gas_effect_02 (플라즈마): 하단 40% 잘림, 어두운 꼬리 부분만 사용
-                        if "gas_effect_02" in exhaust_filename:
-                            offset_ratio = 0.25  # 플라즈마: 밝은 부분 제거로 감소
-                        else:
-                            offset_ratio = 0.4  # 화염: 상단 잘림으로 감소 (0.5 → 0.4)
-
-                        offset_distance = gas_length * offset_ratio
-                        final_offset = pygame.math.Vector2(
-                            -direction.x * offset_distance,
-                            -direction.y * offset_distance
-                        )
-                        exhaust_pos = exhaust_base_pos + final_offset
-
-                        # 화면에 그리기
-                        rect = rotated_gas.get_rect(center=(int(exhaust_pos.x), int(exhaust_pos.y)))
-                        screen.blit(rotated_gas, rect)
+        # 1. 잔상 효과 그리기 (플레이어 뒤에, 원근감 적용)
+        afterimage_scale = perspective_scale if (
+            config.PERSPECTIVE_ENABLED and config.PERSPECTIVE_APPLY_TO_PLAYER
+        ) else 1.0
+        self.trail_renderer.draw_afterimages(screen, afterimage_scale)
+        self.trail_renderer.draw_trail(screen)
+
+        # 2. 배기가스 그리기 (플레이어 뒤, 타원 궤도 기반)
+        self.trail_renderer.draw_exhaust(screen, perspective_scale)
 
         # 3. 그릴 이미지 결정 (히트 플래시 적용 + 능력 효과)
         if self.is_flashing:
@@ -1383,32 +1195,37 @@ class Player:
             )
             draw_image = evasion_surface
         else:
-            draw_image = self.image
-
-        # 3-1. 이동 방향 기울기(틸트) 적용
-        if abs(self.current_tilt) > 0.5:
-            # 이미지 회전 (기울기 각도 적용)
-            draw_image = pygame.transform.rotate(draw_image, self.current_tilt)
-
-        # 4. 플레이어 이미지 그리기 (원근감 + 틸트 적용)
-        if (
-            config.PERSPECTIVE_ENABLED
-            and config.PERSPECTIVE_APPLY_TO_PLAYER
-            and perspective_scale != 1.0
-        ):
-            scaled_image = pygame.transform.smoothscale(
-                draw_image,
-                (
-                    int(draw_image.get_width() * perspective_scale),
-                    int(draw_image.get_height() * perspective_scale),
-                ),
-            )
-            scaled_rect = scaled_image.get_rect(center=self.image_rect.center)
-            screen.blit(scaled_image, scaled_rect)
+            draw_image = None
+
+        if draw_image is None:
+            # 3-1/4. 기본 상태 - 틸트/원근감 적용된 기체 스프라이트를 캐시에서 재사용
+            ship_sprite = self.trail_renderer.get_ship_sprite(self.current_tilt, afterimage_scale)
+            screen.blit(ship_sprite, ship_sprite.get_rect(center=self.image_rect.center))
         else:
-            # 기울기가 있을 경우 중심점 유지
-            draw_rect = draw_image.get_rect(center=self.image_rect.center)
-            screen.blit(draw_image, draw_rect)
+            # 3-1. 이동 방향 기울기(틸트) 적용
+            if abs(self.current_tilt) > 0.5:
+                # 이미지 회전 (기울기 각도 적용)
+                draw_image = pygame.transform.rotate(draw_image, self.current_tilt)
+
+            # 4. 플레이어 이미지 그리기 (원근감 + 틸트 적용)
+            if (
+                config.PERSPECTIVE_ENABLED
+                and config.PERSPECTIVE_APPLY_TO_PLAYER
+                and perspective_scale != 1.0
+            ):
+                scaled_image = pygame.transform.smoothscale(
+                    draw_image,
+                    (
+                        int(draw_image.get_width() * perspective_scale),
+                        int(draw_image.get_height() * perspective_scale),
+                    ),
+                )
+                scaled_rect = scaled_image.get_rect(center=self.image_rect.center)
+                screen.blit(scaled_image, scaled_rect)
+            else:
+                # 기울기가 있을 경우 중심점 유지
+                draw_rect = draw_image.get_rect(center=self.image_rect.center)
+                screen.blit(draw_image, draw_rect)
 
         # 5. 궁극기 시각 효과 렌더링
         for effect in self.ultimate_effects:
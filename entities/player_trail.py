@@ -0,0 +1,332 @@
+# entities/player_trail.py
+# 플레이어 이동 트레일 / 잔상 / 배기가스 렌더러
+
+import math
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import numpy as np
+import pygame
+
+import config
+
+
+class _SpriteCache:
+    """크기 제한이 있는 LRU 스프라이트 캐시"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, factory) -> pygame.Surface:
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = factory()
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PlayerTrailRenderer:
+    """
+    플레이어 트레일/잔상/배기가스 렌더러
+
+    - 트레일 파티클과 잔상은 고정 크기 링 버퍼(numpy 배열)에 저장
+    - 틴트/회전/스케일된 스프라이트는 (틴트, 각도 버킷, 스케일 버킷) 키로 캐싱
+    - 정상 상태(캐시 적중)에서는 프레임당 Surface를 새로 만들지 않음
+      (투명도는 공유 스프라이트에 blit 직전 set_alpha로 적용)
+    """
+
+    def __init__(self, player):
+        self.player = player
+
+        self.angle_step = getattr(config, "PLAYER_TRAIL_ANGLE_STEP", 5.0)
+        self.tilt_step = getattr(config, "PLAYER_TRAIL_TILT_STEP", 1.0)
+        self.scale_step = getattr(config, "PLAYER_TRAIL_SCALE_STEP", 0.05)
+        self.sprites = _SpriteCache(getattr(config, "PLAYER_TRAIL_SPRITE_CACHE", 192))
+        self.draw_particles = getattr(config, "PLAYER_TRAIL_DRAW_PARTICLES", False)
+
+        # 트레일 파티클 링 버퍼
+        trail_slots = getattr(config, "PLAYER_TRAIL_SLOTS", 64)
+        self.trail_pos = np.zeros((trail_slots, 2), dtype=np.float32)
+        self.trail_vel = np.zeros((trail_slots, 2), dtype=np.float32)
+        self.trail_life = np.zeros(trail_slots, dtype=np.float32)
+        self.trail_max_life = np.ones(trail_slots, dtype=np.float32)
+        self.trail_scale = np.ones(trail_slots, dtype=np.float32)
+        self.trail_angle = np.zeros(trail_slots, dtype=np.float32)
+        self.trail_tint = [(255, 255, 255)] * trail_slots
+        self._trail_head = 0
+
+        # 잔상 링 버퍼
+        afterimage_slots = getattr(config, "PLAYER_AFTERIMAGE_SLOTS", 16)
+        self.after_pos = np.zeros((afterimage_slots, 2), dtype=np.float32)
+        self.after_life = np.zeros(afterimage_slots, dtype=np.float32)
+        self.after_max_life = np.ones(afterimage_slots, dtype=np.float32)
+        self.after_alpha = np.zeros(afterimage_slots, dtype=np.float32)
+        self.after_tilt = np.zeros(afterimage_slots, dtype=np.int16)
+        self._after_head = 0
+
+        # 기체 이미지가 바뀌면(히트 플래시 복구 등) 기체 기반 스프라이트 무효화
+        self._ship_source: Optional[pygame.Surface] = None
+        self._gas_crop: Optional[pygame.Surface] = None
+        self._gas_source: Optional[pygame.Surface] = None
+
+    # =========================================================
+    # 버킷 계산
+    # =========================================================
+
+    def _tilt_bucket(self, tilt: float) -> int:
+        return int(round(tilt / self.tilt_step))
+
+    def _scale_bucket(self, scale: float) -> int:
+        return max(1, int(round(scale / self.scale_step)))
+
+    def _angle_bucket(self, angle_deg: float) -> int:
+        buckets = int(round(360.0 / self.angle_step))
+        return int(round(angle_deg / self.angle_step)) % buckets
+
+    def _check_ship_source(self):
+        if self.player.image is not self._ship_source:
+            self._ship_source = self.player.image
+            self.sprites.clear()
+
+    # =========================================================
+    # 생성 (링 버퍼 슬롯 재사용)
+    # =========================================================
+
+    def spawn_trail(self, pos: pygame.math.Vector2, velocity: Tuple[float, float],
+                    lifetime: float, scale: float, rotation: float,
+                    tint: Tuple[int, int, int]):
+        """트레일 파티클 1개 (가장 오래된 슬롯을 덮어씀)"""
+        i = self._trail_head
+        self._trail_head = (i + 1) % len(self.trail_life)
+        self.trail_pos[i] = (pos.x, pos.y)
+        self.trail_vel[i] = velocity
+        self.trail_life[i] = lifetime
+        self.trail_max_life[i] = lifetime
+        self.trail_scale[i] = scale
+        self.trail_angle[i] = rotation
+        self.trail_tint[i] = tint
+
+    def spawn_afterimage(self, pos: pygame.math.Vector2, alpha: int, lifetime: float, tilt: float):
+        """잔상 1개 (기체 이미지 복사 없이 위치/투명도/기울기만 기록)"""
+        i = self._after_head
+        self._after_head = (i + 1) % len(self.after_life)
+        self.after_pos[i] = (pos.x, pos.y)
+        self.after_life[i] = lifetime
+        self.after_max_life[i] = lifetime
+        self.after_alpha[i] = alpha
+        self.after_tilt[i] = self._tilt_bucket(tilt) if abs(tilt) > 0.5 else 0
+
+    def clear(self):
+        """모든 트레일/잔상 제거"""
+        self.trail_life[:] = 0.0
+        self.after_life[:] = 0.0
+
+    @property
+    def trail_count(self) -> int:
+        return int(np.count_nonzero(self.trail_life > 0.0))
+
+    @property
+    def afterimage_count(self) -> int:
+        return int(np.count_nonzero(self.after_life > 0.0))
+
+    # =========================================================
+    # 업데이트 (벡터화)
+    # =========================================================
+
+    def update(self, dt: float):
+        """수명 감소 + 트레일 확산 (마찰 적용)"""
+        active = self.trail_life > 0.0
+        if active.any():
+            self.trail_life[active] -= dt
+            self.trail_pos[active] += self.trail_vel[active] * dt
+            self.trail_vel[active] *= 0.95
+
+        self.after_life -= dt
+        np.maximum(self.after_life, 0.0, out=self.after_life)
+
+    # =========================================================
+    # 스프라이트 팩토리 (캐시 미스 시에만 호출)
+    # =========================================================
+
+    def _ship_sprite(self, tilt_bucket: int, scale_bucket: int) -> pygame.Surface:
+        """기울기/원근 스케일이 적용된 기체 스프라이트"""
+        def build():
+            image = self._ship_source
+            if tilt_bucket:
+                image = pygame.transform.rotate(image, tilt_bucket * self.tilt_step)
+            scale = scale_bucket * self.scale_step
+            if abs(scale - 1.0) > 1e-6:
+                image = pygame.transform.smoothscale(
+                    image,
+                    (max(1, int(image.get_width() * scale)), max(1, int(image.get_height() * scale))),
+                )
+            elif image is self._ship_source:
+                image = image.copy()  # set_alpha가 원본에 영향 주지 않도록
+            return image
+
+        return self.sprites.get(("ship", tilt_bucket, scale_bucket), build)
+
+    def get_ship_sprite(self, tilt: float, scale: float) -> pygame.Surface:
+        """Player.draw용 - 기울기/원근 스케일 적용된 기체 이미지 (캐시)"""
+        self._check_ship_source()
+        tilt_bucket = self._tilt_bucket(tilt) if abs(tilt) > 0.5 else 0
+        return self._ship_sprite(tilt_bucket, self._scale_bucket(scale))
+
+    def _gas_base(self) -> Optional[pygame.Surface]:
+        """배기가스 원본에서 사용할 부분만 크롭 (이미지 교체 시에만 재생성)"""
+        gas_image = self.player.gas_effect_image
+        if gas_image is None:
+            return None
+        if gas_image is not self._gas_source:
+            self._gas_source = gas_image
+            orig_width, orig_height = gas_image.get_size()
+            if self._is_plasma():
+                # 플라즈마: 상단 60%만 사용 (밝은 머리 부분 제거)
+                crop_start, crop_height = 0, int(orig_height * 0.6)
+            else:
+                # 화염: 상단 20% 잘라내기 (꼬리 부분 제거)
+                crop_start = int(orig_height * 0.2)
+                crop_height = orig_height - crop_start
+            if crop_height <= 0:
+                self._gas_crop = None
+            else:
+                self._gas_crop = gas_image.subsurface(
+                    pygame.Rect(0, crop_start, orig_width, crop_height)
+                ).copy()
+        return self._gas_crop
+
+    def _is_plasma(self) -> bool:
+        exhaust_filename = self.player.ship_data.get("exhaust_effect", "gas_effect_01.png")
+        return "gas_effect_02" in exhaust_filename
+
+    def _gas_sprite(self, size: Tuple[int, int], angle_bucket: int) -> pygame.Surface:
+        """스케일 + 180도 뒤집기 + 이동 방향 회전이 적용된 배기가스 스프라이트"""
+        def build():
+            scaled = pygame.transform.smoothscale(self._gas_crop, size)
+            scaled = pygame.transform.rotate(scaled, 180)
+            angle_deg = angle_bucket * self.angle_step + 90
+            return pygame.transform.rotate(scaled, -angle_deg)
+
+        return self.sprites.get(("gas", size, angle_bucket), build)
+
+    def _trail_sprite(self, tint: Tuple[int, int, int], scale_bucket: int, angle_bucket: int):
+        """틴트된 트레일 파티클 스프라이트 (배기가스 이미지 기반)"""
+        def build():
+            base = self._gas_base()
+            size = max(2, int(16 * scale_bucket * self.scale_step))
+            sprite = pygame.transform.smoothscale(base, (size, size))
+            if tint != (255, 255, 255):
+                sprite.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+            return pygame.transform.rotate(sprite, angle_bucket * self.angle_step)
+
+        return self.sprites.get(("trail", tint, scale_bucket, angle_bucket), build)
+
+    # =========================================================
+    # 렌더링
+    # =========================================================
+
+    def draw_afterimages(self, screen: pygame.Surface, perspective_scale: float):
+        """잔상 그리기 (기체 뒤)"""
+        active = np.flatnonzero(self.after_life > 0.0)
+        if active.size == 0:
+            return
+
+        self._check_ship_source()
+        scale_bucket = self._scale_bucket(perspective_scale)
+        used = []
+        for i in active:
+            sprite = self._ship_sprite(int(self.after_tilt[i]), scale_bucket)
+            fade_ratio = self.after_life[i] / self.after_max_life[i]
+            sprite.set_alpha(int(self.after_alpha[i] * fade_ratio))
+            rect = sprite.get_rect(center=(int(self.after_pos[i, 0]), int(self.after_pos[i, 1])))
+            screen.blit(sprite, rect)
+            used.append(sprite)
+        # 공유 스프라이트 투명도 복원 (기체 본체 렌더링에도 사용됨)
+        for sprite in used:
+            sprite.set_alpha(None)
+
+    def draw_trail(self, screen: pygame.Surface):
+        """트레일 파티클 그리기 (PLAYER_TRAIL_DRAW_PARTICLES 켜짐 + 배기가스 이미지가 있을 때만)"""
+        if not self.draw_particles or self._gas_base() is None:
+            return
+        active = np.flatnonzero(self.trail_life > 0.0)
+        for i in active:
+            sprite = self._trail_sprite(
+                self.trail_tint[i],
+                self._scale_bucket(float(self.trail_scale[i])),
+                self._angle_bucket(float(self.trail_angle[i])),
+            )
+            sprite.set_alpha(int(255 * self.trail_life[i] / self.trail_max_life[i]))
+            rect = sprite.get_rect(center=(int(self.trail_pos[i, 0]), int(self.trail_pos[i, 1])))
+            screen.blit(sprite, rect)
+
+    def draw_exhaust(self, screen: pygame.Surface, perspective_scale: float):
+        """배기가스 그리기 (플레이어 뒤, 타원 궤도 기반)"""
+        player = self.player
+        if player.disable_trail or self._gas_base() is None:
+            return
+
+        # 속도 계산
+        speed = player.velocity.length()
+        max_speed = player.speed * 1.5  # 최대 속도 추정
+        speed_ratio = min(1.0, speed / max_speed) if max_speed > 0 else 0
+
+        # 최소 속도 체크 (낮은 속도에서도 배기가스 표시)
+        if speed_ratio <= 0.1 or player.velocity.length_squared() <= 0:
+            return
+
+        direction = player.velocity.normalize()
+        move_angle = math.atan2(direction.y, direction.x)
+
+        # 우주선 뒤쪽 타원 궤도의 가장자리 지점 (이동 방향의 반대쪽)
+        ellipse_a = player.image_rect.width * 0.25
+        ellipse_b = player.image_rect.height * 0.15
+        back_angle = move_angle + math.pi
+        exhaust_offset = pygame.math.Vector2(
+            ellipse_a * math.cos(back_angle), ellipse_b * math.sin(back_angle)
+        ) * 0.8
+        exhaust_base_pos = player.pos + exhaust_offset
+
+        # 속도/원근 스케일 버킷 단위로 크기 결정 (캐시 키 안정화)
+        speed_bucket = self._scale_bucket(speed_ratio) * self.scale_step
+        scale = self._scale_bucket(perspective_scale) * self.scale_step
+        if self._is_plasma():
+            # 플라즈마: 크기 축소, 약간 더 투명하게
+            gas_length = int(player.image_rect.height * (0.3 + speed_bucket * 0.8) * scale)
+            gas_width = int(player.image_rect.width * 0.5 * scale)
+            alpha = int(60 + speed_ratio * 120)  # 60 ~ 180
+            offset_ratio = 0.25
+        else:
+            # 화염: 더 넓게, 블러 효과를 위해 더 투명하게
+            gas_length = int(player.image_rect.height * (0.4 + speed_bucket * 1.2) * scale)
+            gas_width = int(player.image_rect.width * 1.0 * scale)
+            alpha = int(50 + speed_ratio * 100)  # 50 ~ 150
+            offset_ratio = 0.4
+
+        if gas_length <= 0 or gas_width <= 0:
+            return
+
+        sprite = self._gas_sprite((gas_width, gas_length), self._angle_bucket(math.degrees(move_angle)))
+        sprite.set_alpha(alpha)
+
+        # 회전된 이미지의 밝은 끝이 엔진 출구에 오도록 이동 반대 방향으로 오프셋
+        offset_distance = gas_length * offset_ratio
+        exhaust_pos = exhaust_base_pos - direction * offset_distance
+        rect = sprite.get_rect(center=(int(exhaust_pos.x), int(exhaust_pos.y)))
+        screen.blit(sprite, rect)
@@ -13,6 +13,18 @@ from asset_manager import AssetManager
 class SphereDroid:
     """사각형 순찰 패턴을 가진 스피어 드로이드"""
 
+    __slots__ = (
+        "screen_width", "screen_height", "pos", "direction", "type_config",
+        # 스탯
+        "max_hp", "hp", "damage", "speed",
+        # 이미지 및 히트박스
+        "image", "original_image", "image_rect", "hitbox",
+        # 순찰 패턴
+        "patrol_state", "spawn_x", "spawn_y", "waypoints", "current_target",
+        # 상태 / 히트 플래시
+        "is_alive", "color", "size", "hit_flash_timer", "is_flashing",
+    )
+
     def __init__(
         self,
         spawn_pos: Tuple[float, float],
@@ -6,7 +6,7 @@ import math
 from typing import Tuple, List
 from pathlib import Path
 import config
-from entities.weapons import Bullet
+from entities.weapons import spawn_bullet
 
 
 class Turret:
@@ -94,10 +94,8 @@ class Turret:
             if closest_enemy:
                 direction = (closest_enemy.pos - self.pos).normalize()
 
-                # 총알 생성 (Bullet 클래스 사용)
-                bullet = Bullet(self.pos.copy(), direction, self.damage, piercing=False)
-                bullet.speed = self.bullet_speed
-                bullets.append(bullet)
+                # 총알 생성 (BulletStore 슬롯 또는 Bullet 객체)
+                spawn_bullet(bullets, self.pos, direction, self.damage, speed=self.bullet_speed)
 
                 # 회전 각도 업데이트 (시각 효과용)
                 import math
@@ -243,9 +241,7 @@ class Drone:
                 direction = (closest_enemy.pos - self.pos).normalize()
 
                 # 총알 생성
-                bullet = Bullet(self.pos.copy(), direction, self.damage, piercing=False)
-                bullet.speed = self.bullet_speed
-                bullets.append(bullet)
+                spawn_bullet(bullets, self.pos, direction, self.damage, speed=self.bullet_speed)
 
                 self.shoot_timer = self.shoot_cooldown
 
@@ -6,6 +6,7 @@ import math
 from typing import List
 import config
 from asset_manager import AssetManager
+from entities.bullet_store import BulletStore
 
 
 class Weapon:
@@ -72,14 +73,8 @@ class Weapon:
                 math.cos(new_angle), math.sin(new_angle)
             ).normalize()
 
-            # 새 총알 객체 생성 및 리스트에 추가
-            bullet = Bullet(
-                start_pos.copy(),
-                bullet_direction,
-                bullet_damage,
-                piercing_state,  # 피어싱 상태를 Bullet에 전달
-            )
-            bullets.append(bullet)
+            # 새 총알 생성 및 리스트(저장소)에 추가
+            spawn_bullet(bullets, start_pos, bullet_direction, bullet_damage, piercing_state)
 
     # 전술 레벨업을 위한 메서드 (utils.py에서 호출)
     def increase_damage(self, ratio: float):
@@ -95,9 +90,38 @@ class Weapon:
         print(f"INFO: Bullet count increased to {self.bullet_count}")
 
 
+def spawn_bullet(
+    bullets,
+    pos: pygame.math.Vector2,
+    direction: pygame.math.Vector2,
+    damage: float,
+    piercing: bool = False,
+    speed: float = None,
+):
+    """
+    총알 생성 - BulletStore면 배열 슬롯에 직접 생성, 일반 리스트면 Bullet 객체 추가
+    """
+    if isinstance(bullets, BulletStore):
+        return bullets.spawn(pos, direction, damage, piercing, speed)
+
+    bullet = Bullet(pos.copy(), direction, damage, piercing)
+    if speed is not None:
+        bullet.speed = speed
+    bullets.append(bullet)
+    return bullet
+
+
 class Bullet:
     """총알 클래스"""
 
+    __slots__ = (
+        "pos", "direction", "speed", "damage", "is_alive",
+        "is_piercing", "pierce_count", "hit_enemies",
+        "trail_positions", "spawn_time",
+        # 첫 update 시 initialize_image()로 설정 (그 전엔 hasattr False)
+        "image", "image_rect", "hitbox",
+    )
+
     def __init__(
         self,
         pos: pygame.math.Vector2,
@@ -24,6 +24,12 @@ from .wave_manager import (
     draw_objects,
 )
 
+# Combat events (batched hit/kill side effects)
+from .combat_events import (
+    CombatEventQueue,
+    get_combat_event_queue,
+)
+
 # Spawning
 from .spawning import (
     spawn_enemy,
@@ -80,6 +86,9 @@ __all__ = [
     'select_enemy_type',
     'update_game_objects',
     'draw_objects',
+    # Combat events
+    'CombatEventQueue',
+    'get_combat_event_queue',
     # Spawning
     'spawn_enemy',
     'handle_spawning',
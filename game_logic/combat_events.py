@@ -0,0 +1,320 @@
+# game_logic/combat_events.py
+"""
+Combat event queue for hit/kill side effects.
+Collision code only records hit, kill and impact events; one flush per frame
+applies sounds, damage numbers, particles, shockwaves, screen shake and
+on-kill skills in batches (deduped sounds, merged explosions, per-frame caps).
+"""
+
+import pygame
+import random
+import numpy as np
+import config
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from entities.collectibles import HealItem
+from effects.combat_effects import AnimatedEffect, DamageNumber
+
+
+@dataclass
+class HitEvent:
+    """총알 피격 이벤트 (killed=True면 이 피격으로 처치됨)"""
+    enemy: object
+    pos: Tuple[float, float]
+    damage: float
+    is_boss: bool
+    killed: bool
+
+
+@dataclass
+class ImpactEvent:
+    """총알 충돌 지점 이벤트 (임팩트 애니메이션 + 충격파)"""
+    pos: Tuple[float, float]
+    direction: Optional[pygame.math.Vector2]
+
+
+def merge_positions(items: List, radius: float, limit: int, key=None) -> List:
+    """
+    가까운 항목을 하나로 병합 (앞에서부터 탐욕적으로, 최대 limit개)
+
+    이미 선택된 항목과 radius 이내면 건너뜁니다. key가 주어지면 key(item)을 위치로 사용합니다.
+    """
+    merged = []
+    kept = []
+    radius_sq = radius * radius
+    for item in items:
+        if len(merged) >= limit:
+            break
+        x, y = key(item) if key else item
+        if any((x - mx) ** 2 + (y - my) ** 2 <= radius_sq for mx, my in kept):
+            continue
+        kept.append((x, y))
+        merged.append(item)
+    return merged
+
+
+class CombatEventQueue:
+    """
+    프레임 단위 전투 이벤트 큐
+
+    사용법:
+        queue = get_combat_event_queue()
+        queue.record_hit(enemy, damage, is_boss, killed)   # 충돌 루프 안
+        queue.record_impact(bullet.pos, bullet.direction)
+        queue.flush(player, enemies, gems, effects, ...)   # 충돌 루프 뒤 한 번
+    """
+
+    def __init__(self):
+        self.hits: List[HitEvent] = []
+        self.impacts: List[ImpactEvent] = []
+
+    # ===== 기록 =====
+
+    def record_hit(self, enemy, damage: float, is_boss: bool, killed: bool):
+        """총알 피격 기록 (처치 여부 포함)"""
+        self.hits.append(HitEvent(enemy, (enemy.pos.x, enemy.pos.y), damage, is_boss, killed))
+
+    def record_impact(self, pos: pygame.math.Vector2, direction: Optional[pygame.math.Vector2]):
+        """총알 충돌 지점 기록"""
+        direction = pygame.math.Vector2(direction) if direction is not None else None
+        self.impacts.append(ImpactEvent((pos.x, pos.y), direction))
+
+    def clear(self):
+        self.hits.clear()
+        self.impacts.clear()
+
+    # ===== 일괄 처리 =====
+
+    def flush(
+        self,
+        player,
+        enemies: List,
+        gems: List,
+        effects: List,
+        screen_size: Tuple[int, int],
+        damage_numbers: List = None,
+        damage_number_manager=None,
+        screen_shake=None,
+        sound_manager=None,
+        death_effect_manager=None,
+    ) -> int:
+        """
+        기록된 이벤트를 한 번에 처리하고 큐를 비웁니다.
+
+        Returns:
+            이번 프레임 처치 수
+        """
+        if not self.hits and not self.impacts:
+            return 0
+
+        settings = config.KILL_EVENT_SETTINGS
+        kills = [hit for hit in self.hits if hit.killed]
+
+        self._apply_damage_numbers(damage_numbers, damage_number_manager)
+        self._play_sounds(kills, sound_manager)
+        self._apply_screen_shake(kills, screen_shake)
+
+        if kills:
+            self._apply_kills(kills, player, enemies, gems, effects, screen_size,
+                              death_effect_manager, settings)
+
+        self._spawn_hit_particles(effects, settings)
+        self._spawn_impacts(effects, screen_size, settings)
+
+        self.clear()
+        return len(kills)
+
+    def _apply_damage_numbers(self, damage_numbers, damage_number_manager):
+        """데미지 넘버 (매니저 사용 시 누적, 처치 대상은 즉시 표시)"""
+        if damage_number_manager is not None:
+            for hit in self.hits:
+                damage_number_manager.add_damage(
+                    hit.damage, (hit.pos[0], hit.pos[1] - 20), target_id=id(hit.enemy)
+                )
+            damage_number_manager.flush_targets([id(hit.enemy) for hit in self.hits if hit.killed])
+        elif damage_numbers is not None:
+            for hit in self.hits:
+                damage_numbers.append(DamageNumber(hit.damage, hit.pos))
+
+    def _play_sounds(self, kills: List[HitEvent], sound_manager):
+        """사운드 중복 제거 - 종류별로 프레임당 한 번만 재생"""
+        if not sound_manager:
+            return
+        sound_manager.play_sfx("enemy_hit")
+        if any(hit.is_boss for hit in kills):
+            sound_manager.play_sfx("explosion", volume_override=1.0, priority=config.SFX_PRIORITY_BOSS)
+        if any(not hit.is_boss for hit in kills):
+            sound_manager.play_sfx("enemy_death")
+
+    def _apply_screen_shake(self, kills: List[HitEvent], screen_shake):
+        """화면 떨림 - 더 강한 떨림이 덮어쓰므로 종류별로 한 번씩만 트리거"""
+        if not screen_shake:
+            return
+        from .helpers import trigger_screen_shake
+
+        shake_types = set()
+        for hit in self.hits:
+            if hit.killed:
+                shake_types.add("BOSS_DEATH" if hit.is_boss else "ENEMY_DEATH")
+            elif hit.is_boss:
+                shake_types.add("BOSS_HIT")
+        for shake_type in shake_types:
+            trigger_screen_shake(shake_type, screen_shake)
+
+    def _apply_kills(
+        self, kills, player, enemies, gems, effects, screen_size, death_effect_manager, settings
+    ):
+        from .helpers import (
+            create_explosion_particles, create_shockwave, create_time_slow_effect, create_dynamic_text
+        )
+
+        screen_width, screen_height = screen_size
+
+        # 사망 효과 (보스 우선, 프레임당 상한)
+        if death_effect_manager:
+            ordered = sorted(kills, key=lambda hit: not hit.is_boss)
+            for hit in ordered[:settings["max_death_effects"]]:
+                death_effect_manager.trigger_death_effect(hit.enemy)
+
+        explosion_positions = [hit.pos for hit in kills]
+
+        # 속성 스킬: Explosive Bullets - 모든 폭발을 한 번의 배열 연산으로 처리
+        if player.has_explosive:
+            chain_killed = self._apply_explosions(kills, enemies, effects, settings)
+            if player.has_chain_explosion:
+                # 연쇄 폭발: 폭발로 죽은 적은 파티클만 추가 (재귀 없음)
+                explosion_positions.extend(chain_killed)
+
+        # 폭발 파티클 (근접 병합 + 상한)
+        for pos in merge_positions(explosion_positions, settings["merge_radius"], settings["max_explosions"]):
+            create_explosion_particles(pos, effects)
+
+        for hit in kills:
+            # 속성 스킬: Static Field (정전기장 생성) - 게임플레이 효과이므로 병합하지 않음
+            if player.has_static_field:
+                from effects.game_animations import StaticField
+                field_settings = config.ATTRIBUTE_SKILL_SETTINGS["STATIC_FIELD"]
+                effects.append(StaticField(
+                    pos=hit.pos,
+                    radius=field_settings["radius"],
+                    duration=field_settings["duration"],
+                    damage_per_sec=field_settings["damage_per_sec"],
+                ))
+
+            # 보스 처치 시 특별 효과
+            if hit.is_boss:
+                create_shockwave(hit.pos, "BOSS_DEATH", effects)
+                create_time_slow_effect(effects)
+                boss_name = getattr(hit.enemy, 'boss_name', 'BOSS')
+                create_dynamic_text(f"{boss_name} DEFEATED!", (screen_width // 2, screen_height // 2), "BOSS_SPAWN", effects)
+
+            # 힐링 젬 스폰 (적 사망 시 10% 확률)
+            if random.random() < 0.1:
+                gems.append(HealItem(hit.pos, screen_height))
+
+    def _apply_explosions(self, kills, enemies, effects, settings) -> List[Tuple[float, float]]:
+        """
+        Explosive Bullets 일괄 처리
+
+        처치 위치(M)와 살아있는 적(N)의 거리 행렬로 적마다 받을 폭발 피해를 합산해
+        한 번에 적용합니다. 폭발로 처치된 적의 위치 목록을 반환합니다.
+        """
+        from effects.screen_effects import Shockwave
+        from .helpers import create_hit_particles
+
+        explosive = config.ATTRIBUTE_SKILL_SETTINGS["EXPLOSIVE"]
+        radius = explosive["radius"]
+
+        # 폭발 시각 효과 (근접 병합 + 상한)
+        for pos in merge_positions([hit.pos for hit in kills], settings["merge_radius"], settings["max_shockwaves"]):
+            effects.append(Shockwave(center=pos, max_radius=radius, duration=0.4, color=(255, 150, 50), width=4))
+
+        targets = [enemy for enemy in enemies if enemy.is_alive]
+        if not targets:
+            return []
+
+        centers = np.array([hit.pos for hit in kills], dtype=np.float32)
+        damages = np.array([hit.damage for hit in kills], dtype=np.float32) * explosive["damage_ratio"]
+        positions = np.array([(enemy.pos.x, enemy.pos.y) for enemy in targets], dtype=np.float32)
+
+        deltas = positions[:, None, :] - centers[None, :, :]
+        in_range = (deltas ** 2).sum(axis=2) <= radius * radius
+        total_damage = in_range.astype(np.float32) @ damages
+
+        chain_killed = []
+        hit_positions = []
+        for index in np.flatnonzero(total_damage):
+            enemy = targets[index]
+            enemy.take_damage(float(total_damage[index]))
+            hit_positions.append((enemy.pos.x, enemy.pos.y))
+            if not enemy.is_alive:
+                chain_killed.append((enemy.pos.x, enemy.pos.y))
+
+        for pos in merge_positions(hit_positions, settings["merge_radius"], settings["max_hit_particles"]):
+            create_hit_particles(pos, effects)
+
+        return chain_killed
+
+    def _spawn_hit_particles(self, effects, settings):
+        """처치되지 않은 피격의 파티클 (보스 피격은 병합/상한 없이 항상 생성)"""
+        from .helpers import create_hit_particles, create_boss_hit_particles
+
+        normal_hits = []
+        for hit in self.hits:
+            if hit.killed:
+                continue
+            if hit.is_boss:
+                create_boss_hit_particles(hit.pos, effects)
+            else:
+                normal_hits.append(hit.pos)
+
+        for pos in merge_positions(normal_hits, settings["merge_radius"], settings["max_hit_particles"]):
+            create_hit_particles(pos, effects)
+
+    def _spawn_impacts(self, effects, screen_size, settings):
+        """총알 충돌 이펙트 - 근접 병합 + 상한"""
+        from effects.screen_effects import ImageShockwave
+
+        if not self.impacts:
+            return
+
+        screen_height = screen_size[1]
+        shockwave = config.SHOCKWAVE_SETTINGS["BULLET_HIT"]
+        wave_count = shockwave.get("wave_count", 3)
+        wave_interval = shockwave.get("wave_interval", 0.1)
+
+        impacts = merge_positions(
+            self.impacts, settings["merge_radius"], settings["max_impacts"], key=lambda event: event.pos
+        )
+
+        for impact in impacts:
+            effects.append(AnimatedEffect(impact.pos, screen_height, config.IMPACT_FX_IMAGE_PATH, "HITIMPACT"))
+
+            # 총알이 날아가는 방향으로 오프셋 → 적의 내부에서 충격파 시작
+            impact_pos = pygame.math.Vector2(impact.pos)
+            if impact.direction is not None and impact.direction.length_squared() > 0:
+                impact_pos += impact.direction * 20
+
+            for i in range(wave_count):
+                effects.append(ImageShockwave(
+                    center=(impact_pos.x, impact_pos.y),
+                    max_size=shockwave.get("max_radius", 120) * 2,
+                    duration=shockwave.get("duration", 0.8),
+                    delay=i * wave_interval,
+                    color_tint=shockwave.get("color", (255, 255, 255)),
+                ))
+
+
+# =========================================================
+# 전역 인스턴스
+# =========================================================
+
+_combat_event_queue: Optional[CombatEventQueue] = None
+
+
+def get_combat_event_queue() -> CombatEventQueue:
+    """전역 전투 이벤트 큐 반환"""
+    global _combat_event_queue
+    if _combat_event_queue is None:
+        _combat_event_queue = CombatEventQueue()
+    return _combat_event_queue
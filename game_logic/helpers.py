@@ -12,8 +12,8 @@ from typing import Dict, List, Tuple
 from pathlib import Path
 from entities.player import Player
 from entities.enemies import Enemy
-from entities.weapons import Bullet
-from entities.collectibles import CoinGem, HealItem
+from entities.bullet_store import BulletStore
+from entities.collectible_field import CollectibleField
 from effects.combat_effects import AnimatedEffect
 
 
@@ -263,8 +263,8 @@ def reset_game(screen_size: Tuple[int, int], player_upgrades: Dict[str, int]):
     )
 
     enemies: List[Enemy] = []
-    bullets: List[Bullet] = []
-    gems: List[CoinGem | HealItem] = []
+    bullets = BulletStore(screen_height=screen_size[1])
+    gems = CollectibleField(screen_height=screen_size[1])
     effects: List[AnimatedEffect] = [] # HitImpact 대신 AnimatedEffect 사용
 
     # 스폰 시간을 game_data 내부 값으로 초기화
@@ -13,6 +13,7 @@ from entities.player import Player
 from entities.enemies import Enemy
 from entities.weapons import Bullet
 from entities.collectibles import CoinGem, HealItem
+from entities.collectible_field import CollectibleField, KIND_COIN
 from effects.combat_effects import AnimatedEffect
 
 
@@ -118,7 +119,7 @@ def handle_tactical_upgrade(
     player: Player,
     enemies: List[Enemy],
     bullets: List[Bullet],
-    gems: List[CoinGem | HealItem],
+    gems: CollectibleField,
     effects: List[AnimatedEffect],
     game_data: Dict,
     current_tactical_options: List[Dict], # 현재 선택 가능한 옵션 목록
@@ -220,8 +221,7 @@ def handle_tactical_upgrade(
                 game_data["uncollected_score"] = 0
 
                 # 필드 위의 모든 코인 젬 제거
-                new_gems = [g for g in gems if not isinstance(g, CoinGem)]
-                gems[:] = new_gems
+                gems.clear(kind=KIND_COIN)
 
                 print(f"INFO: Coin Recovery! Gained {recovery_amount} coins.")
 
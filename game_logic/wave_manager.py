@@ -10,9 +10,11 @@ import config
 from typing import Dict, List, Tuple
 from entities.player import Player
 from entities.enemies import Enemy, Boss
-from entities.weapons import Bullet
-from entities.collectibles import CoinGem, HealItem
+from entities.bullet_store import BulletStore
+from entities.collectibles import CoinGem
+from entities.collectible_field import CollectibleField
 from effects.combat_effects import AnimatedEffect, DamageNumber, DamageNumberManager
+from .combat_events import get_combat_event_queue
 
 
 def start_wave(game_data: Dict, current_time: float, enemies: List = None):
@@ -165,8 +167,8 @@ def select_enemy_type(wave: int) -> str:
 def update_game_objects(
     player: Player,
     enemies: List[Enemy],
-    bullets: List[Bullet],
-    gems: List[CoinGem | HealItem],
+    bullets: BulletStore,
+    gems: CollectibleField,
     effects: List,
     screen_size: Tuple[int, int],
     dt: float,
@@ -185,10 +187,7 @@ def update_game_objects(
         damage_numbers: (deprecated) 기존 데미지 숫자 리스트
         damage_number_manager: (권장) 데미지 누적 매니저
     """
-    from .helpers import (
-        create_hit_particles, create_boss_hit_particles, create_explosion_particles,
-        create_shockwave, trigger_screen_shake, create_time_slow_effect, create_dynamic_text
-    )
+    from .helpers import create_hit_particles, trigger_screen_shake
 
     SCREEN_WIDTH, SCREEN_HEIGHT = screen_size
 
@@ -203,9 +202,8 @@ def update_game_objects(
     for enemy in enemies:
         enemy.update(player.pos, effective_dt, enemies, screen_size, current_time)
 
-    # 3. 총알 업데이트
-    for bullet in bullets:
-        bullet.update(dt, screen_size)
+    # 3. 총알 업데이트 (BulletStore 일괄 이동 + 화면 밖 제거)
+    bullets.update(dt, screen_size)
 
     # 4. 이펙트 업데이트는 main.py의 update_visual_effects()에서 처리됨
 
@@ -219,12 +217,16 @@ def update_game_objects(
     # 5. 충돌 처리
 
     # 5.1 총알 vs 적 충돌
-    for bullet in bullets:
+    # 히트박스 겹침 후보를 배열 연산으로 한 번에 구한 뒤 (broad-phase),
+    # 후보 적에 대해서만 기존 순서대로 정밀 판정/처리
+    events = get_combat_event_queue()
+    candidates_by_bullet = bullets.overlap_rects([enemy.hitbox for enemy in enemies])
+    for bullet, candidate_indices in candidates_by_bullet:
         if not bullet.is_alive:
             continue
 
         hit_enemy = None
-        for enemy in enemies:
+        for enemy in (enemies[i] for i in candidate_indices):
             if not enemy.is_alive:
                 continue
 
@@ -234,10 +236,6 @@ def update_game_objects(
 
                 enemy.take_damage(bullet.damage, player)  # Execute 스킬용
 
-                # 적 피격 사운드
-                if sound_manager:
-                    sound_manager.play_sfx("enemy_hit")
-
                 # 속성 스킬: Frost Bullets (슬로우)
                 if player.has_frost and not is_boss:
                     enemy.is_slowed = True
@@ -288,107 +286,8 @@ def update_game_objects(
                         else:
                             break
 
-                # 데미지 넘버 생성 (매니저 사용 시 누적, 아니면 개별 표시)
-                if damage_number_manager is not None:
-                    # 적 id 사용하여 데미지 누적
-                    damage_number_manager.add_damage(
-                        bullet.damage,
-                        (enemy.pos.x, enemy.pos.y - 20),  # 적 머리 위에 표시
-                        target_id=id(enemy)
-                    )
-                elif damage_numbers is not None:
-                    damage_num = DamageNumber(bullet.damage, (enemy.pos.x, enemy.pos.y))
-                    damage_numbers.append(damage_num)
-
-                # 적이 방금 사망한 경우
-                if was_alive and not enemy.is_alive:
-                    # 적 사망 시 누적 데미지 즉시 표시
-                    if damage_number_manager is not None:
-                        damage_number_manager.flush_target(id(enemy))
-
-                    # 적 사망 사운드
-                    if sound_manager:
-                        if is_boss:
-                            sound_manager.play_sfx("explosion", volume_override=1.0)
-                        else:
-                            sound_manager.play_sfx("enemy_death")
-
-                    # 사망 효과 (Shatter Effect 등)
-                    if death_effect_manager:
-                        death_effect_manager.trigger_death_effect(enemy)
-
-                    # 폭발 파티클 생성
-                    create_explosion_particles((enemy.pos.x, enemy.pos.y), effects)
-
-                    # 속성 스킬: Explosive Bullets (적 사망 시 폭발)
-                    if player.has_explosive:
-                        from effects.screen_effects import Shockwave
-                        explosion_radius = config.ATTRIBUTE_SKILL_SETTINGS["EXPLOSIVE"]["radius"]
-                        explosion_damage = bullet.damage * config.ATTRIBUTE_SKILL_SETTINGS["EXPLOSIVE"]["damage_ratio"]
-
-                        # 폭발 시각 효과 추가
-                        effects.append(Shockwave(
-                            center=(enemy.pos.x, enemy.pos.y),
-                            max_radius=explosion_radius,
-                            duration=0.4,
-                            color=(255, 150, 50),  # 주황색
-                            width=4
-                        ))
-
-                        # 폭발 범위 내 적들에게 데미지
-                        for other_enemy in enemies:
-                            if other_enemy != enemy and other_enemy.is_alive:
-                                distance = (other_enemy.pos - enemy.pos).length()
-                                if distance <= explosion_radius:
-                                    other_enemy.take_damage(explosion_damage)
-                                    create_hit_particles((other_enemy.pos.x, other_enemy.pos.y), effects)
-
-                                    # 속성 스킬: Chain Reaction (연쇄 폭발)
-                                    # 폭발로 죽은 적도 폭발 (재귀적 효과는 깊이 제한으로 방지)
-                                    if player.has_chain_explosion and not other_enemy.is_alive:
-                                        # 간단한 연쇄: 폭발 파티클만 추가 (무한 루프 방지)
-                                        create_explosion_particles((other_enemy.pos.x, other_enemy.pos.y), effects)
-
-                    # 속성 스킬: Static Field (정전기장 생성)
-                    if player.has_static_field:
-                        from effects.game_animations import StaticField
-                        static_field = StaticField(
-                            pos=(enemy.pos.x, enemy.pos.y),
-                            radius=config.ATTRIBUTE_SKILL_SETTINGS["STATIC_FIELD"]["radius"],
-                            duration=config.ATTRIBUTE_SKILL_SETTINGS["STATIC_FIELD"]["duration"],
-                            damage_per_sec=config.ATTRIBUTE_SKILL_SETTINGS["STATIC_FIELD"]["damage_per_sec"]
-                        )
-                        effects.append(static_field)
-
-                    # 보스 처치 시 특별 효과
-                    if is_boss:
-                        # 충격파
-                        create_shockwave((enemy.pos.x, enemy.pos.y), "BOSS_DEATH", effects)
-                        # 화면 떨림
-                        if screen_shake:
-                            trigger_screen_shake("BOSS_DEATH", screen_shake)
-                        # 타임 슬로우
-                        create_time_slow_effect(effects)
-                        # 보스 이름 텍스트
-                        boss_name = getattr(enemy, 'boss_name', 'BOSS')
-                        create_dynamic_text(f"{boss_name} DEFEATED!", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), "BOSS_SPAWN", effects)
-                    else:
-                        # 일반 적 사망 시 작은 화면 떨림
-                        if screen_shake:
-                            trigger_screen_shake("ENEMY_DEATH", screen_shake)
-
-                    # 힐링 젬 스폰 로직 (적 사망 시 10% 확률)
-                    if random.random() < 0.1:
-                        new_heal_gem = HealItem((enemy.pos.x, enemy.pos.y), SCREEN_HEIGHT)
-                        gems.append(new_heal_gem)
-                else:
-                    # 피격 파티클 (보스 또는 일반 적)
-                    if is_boss:
-                        create_boss_hit_particles((enemy.pos.x, enemy.pos.y), effects)
-                        if screen_shake:
-                            trigger_screen_shake("BOSS_HIT", screen_shake)
-                    else:
-                        create_hit_particles((enemy.pos.x, enemy.pos.y), effects)
+                # 피격/처치 이벤트 기록 (사운드/이펙트/처치 스킬은 루프 뒤에서 일괄 처리)
+                events.record_hit(enemy, bullet.damage, is_boss, killed=was_alive and not enemy.is_alive)
 
                 # 피어싱(관통) 여부 확인
                 if not player.is_piercing:
@@ -397,36 +296,20 @@ def update_game_objects(
                 hit_enemy = enemy
                 break  # 한 적에게 맞으면 다음 총알로 넘어갑니다. (관통이 아닌 경우)
 
-        # 충돌 이펙트 생성
+        # 충돌 이펙트 기록
         if hit_enemy:
-            impact = AnimatedEffect((bullet.pos.x, bullet.pos.y), SCREEN_HEIGHT, config.IMPACT_FX_IMAGE_PATH, "HITIMPACT")
-            effects.append(impact)
-
-            # 총알 충격파 효과 생성 (적의 내부에서 시작하여 밖으로 확장, 다중 파동)
-            # 총알이 날아가는 방향으로 오프셋하여 적의 안쪽 깊숙이 배치
-            if hasattr(bullet, 'direction') and bullet.direction.length_squared() > 0:
-                # 총알이 날아가는 방향으로 오프셋 → 적의 내부로 들어감
-                offset_distance = 20  # 픽셀 (15 → 20, 더 깊숙이)
-                impact_pos = pygame.math.Vector2(bullet.pos.x, bullet.pos.y) + bullet.direction * offset_distance
-            else:
-                impact_pos = pygame.math.Vector2(bullet.pos.x, bullet.pos.y)
-
-            # 다중 파동 효과 생성 (ImageShockwave 사용)
-            settings = config.SHOCKWAVE_SETTINGS["BULLET_HIT"]
-            wave_count = settings.get("wave_count", 3)
-            wave_interval = settings.get("wave_interval", 0.1)
-
-            for i in range(wave_count):
-                # 각 파동마다 약간의 지연을 가진 이미지 기반 충격파 생성
-                from effects.screen_effects import ImageShockwave
-                shockwave = ImageShockwave(
-                    center=(impact_pos.x, impact_pos.y),
-                    max_size=settings.get("max_radius", 120) * 2,  # 이미지는 지름이므로 반경*2
-                    duration=settings.get("duration", 0.8),
-                    delay=i * wave_interval,
-                    color_tint=settings.get("color", (255, 255, 255)),
-                )
-                effects.append(shockwave)
+            events.record_impact(bullet.pos, getattr(bullet, 'direction', None))
+
+    # 5.1.5 피격/처치 이벤트 일괄 처리
+    # (사운드 중복 제거, 근접 폭발 병합, 프레임당 이펙트 상한, Explosive 범위 피해 일괄 계산)
+    events.flush(
+        player, enemies, gems, effects, screen_size,
+        damage_numbers=damage_numbers,
+        damage_number_manager=damage_number_manager,
+        screen_shake=screen_shake,
+        sound_manager=sound_manager,
+        death_effect_manager=death_effect_manager,
+    )
 
     # 5.2 적 vs 플레이어 충돌
     # 먼저 모든 적의 화상 상태를 초기화
@@ -495,23 +378,9 @@ def update_game_objects(
                         trigger_screen_shake("PLAYER_HIT", screen_shake)
 
     # 5.3 젬 vs 플레이어 충돌
-    for gem in gems:
-        # 젬 자석 효과를 위해 update를 호출합니다.
-        gem.update(dt, player)
-
-        if player.hitbox.colliderect(gem.hitbox):
-            if isinstance(gem, CoinGem):
-                # CoinGem.collect(game_data)는 uncollected_score를 증가시킵니다.
-                if gem.collect(game_data):
-                    # 코인 획득 사운드
-                    if sound_manager:
-                        sound_manager.play_sfx("coin_pickup")
-            elif isinstance(gem, HealItem):
-                # HealItem.collect(player)는 player의 HP를 회복시킵니다.
-                if gem.collect(player):
-                    # 힐 아이템 획득 사운드
-                    if sound_manager:
-                        sound_manager.play_sfx("heal_pickup")
+    # 자석 이동 + 코인 병합 후, 겹친 아이템의 점수/회복량을 합산해 한 번에 반영
+    gems.update(dt, player)
+    gems.collect(player, game_data, sound_manager)
 
 
     # 6. 객체 정리
@@ -538,9 +407,8 @@ def update_game_objects(
             coin_mult = getattr(enemy, 'coin_multiplier', 1.0)
             actual_coins = int(base_coins * coin_mult)
 
-            for _ in range(actual_coins):
-                coin_gem = CoinGem((enemy.pos.x, enemy.pos.y), SCREEN_HEIGHT)
-                gems.append(coin_gem)
+            # 같은 위치에 떨어지는 코인은 값을 합친 코인 하나로 생성
+            gems.spawn_coins((enemy.pos.x, enemy.pos.y), actual_coins, CoinGem.COIN_AMOUNT, SCREEN_HEIGHT)
 
             # SUMMONER 타입: 사망 시 작은 적 소환
             if hasattr(enemy, 'summon_on_death') and enemy.summon_on_death:
@@ -583,13 +451,8 @@ def update_game_objects(
 
     # 죽은 객체/수집된 객체 제거
     enemies[:] = [e for e in enemies if e.is_alive]
-    bullets[:] = [b for b in bullets if b.is_alive]
-    # CoinGem과 HealItem 모두 객체 내부에 collected 상태를 가질 것으로 가정하고 이 로직을 유지
-    gems[:] = [
-        g
-        for g in gems
-        if not (hasattr(g, 'collected') and g.collected)
-    ]
+    bullets.compact()
+    gems.compact()
     # effects는 update_visual_effects()에서 정리됨
 
     # 데미지 넘버 정리
@@ -601,8 +464,8 @@ def draw_objects(
     screen: pygame.Surface,
     player_list: List[Player], # main.py에서 리스트로 전달하므로 player_list로 받습니다.
     enemies: List[Enemy],
-    bullets: List[Bullet],
-    gems: List[CoinGem | HealItem],
+    bullets: BulletStore,
+    gems: CollectibleField,
     effects: List[AnimatedEffect],
 ):
     """모든 게임 객체를 그립니다."""
@@ -610,10 +473,7 @@ def draw_objects(
     player = player_list[0] # 리스트에서 플레이어 객체 추출
 
     # 1. 젬 그리기 (가장 아래)
-    for gem in gems:
-        # collected 상태를 객체 내부에서 관리한다고 가정하고, 이 로직을 유지
-        if not (hasattr(gem, 'collected') and gem.collected):
-            gem.draw(screen)
+    gems.draw(screen)
 
     # 2. 적 그리기
     for enemy in enemies:
@@ -627,8 +487,7 @@ def draw_objects(
     player.draw(screen)
 
     # 4. 총알 그리기
-    for bullet in bullets:
-        bullet.draw(screen)
+    bullets.draw(screen)
 
     # 5. AnimatedEffect 그리기 (가장 위) - 나머지 효과는 draw_visual_effects에서 처리
     from effects.combat_effects import AnimatedEffect
@@ -12,7 +12,8 @@ from pathlib import Path
 import config
 from asset_manager import AssetManager
 from engine.game_engine import GameEngine
-from modes.intro_video_mode import IntroVideoMode
+from systems.save_format import SCHEMA_VERSIONS, migrate
+from systems.save_writer import get_save_writer
 
 
 # =========================================================
@@ -24,17 +25,18 @@ SAVE_FILE_PATH = Path("save_data.json")
 
 def load_game_data():
     """저장된 영구 업그레이드 및 코인 데이터를 로드합니다."""
-    import json
-
     default_upgrades = config.INITIAL_PLAYER_UPGRADES
     default_score = 0
     default_ship = "FIGHTER"
     default_inventory = {}
 
-    if SAVE_FILE_PATH.exists():
+    writer = get_save_writer()
+    if writer.exists(SAVE_FILE_PATH):
         try:
-            with open(SAVE_FILE_PATH, "r") as f:
-                data = json.load(f)
+            data = writer.read(SAVE_FILE_PATH)
+            if data is None:
+                raise ValueError("save file corrupted and no valid backup")
+            data = migrate("game", data)
 
             upgrades = data.get("player_upgrades", default_upgrades)
             score = data.get("score", default_score)
@@ -62,32 +64,32 @@ def save_game_data(
     current_ship: str = "FIGHTER",
     player_inventory: dict = None,
 ):
-    """현재 영구 업그레이드 및 코인 데이터를 저장합니다."""
-    import json
+    """현재 영구 업그레이드 및 코인 데이터를 저장합니다.
 
+    스냅샷만 만들고 즉시 반환하며, 파일 기록은 백그라운드에서 원자적으로 처리됩니다.
+    """
     if player_inventory is None:
         player_inventory = {}
 
     data = {
+        "version": SCHEMA_VERSIONS["game"],
         "score": score,
         "player_upgrades": player_upgrades,
         "current_ship": current_ship,
         "player_inventory": player_inventory,
     }
 
-    try:
-        with open(SAVE_FILE_PATH, "w") as f:
-            json.dump(data, f, indent=4)
+    if get_save_writer().submit(SAVE_FILE_PATH, data):
         print(f"INFO: Game data saved to {SAVE_FILE_PATH}")
-    except Exception as e:
-        print(f"ERROR: Could not save game data: {e}")
+    else:
+        print("ERROR: Could not save game data")
 
 
 def delete_save_file():
     """저장 파일을 삭제합니다."""
-    if SAVE_FILE_PATH.exists():
+    if get_save_writer().exists(SAVE_FILE_PATH):
         try:
-            SAVE_FILE_PATH.unlink()
+            get_save_writer().delete(SAVE_FILE_PATH)
             print(f"INFO: Save file deleted: {SAVE_FILE_PATH}")
         except Exception as e:
             print(f"ERROR: Could not delete save file: {e}")
@@ -137,7 +139,7 @@ def main():
     engine.shared_state["player_inventory"] = inventory
 
     # 7. 인트로 영상으로 시작 (영상 완료 후 메인 메뉴로 전환)
-    engine.push_mode(IntroVideoMode)
+    engine.push_mode("IntroVideoMode")
 
     # 8. 게임 루프 실행
     print("INFO: Starting game loop")
@@ -151,7 +153,8 @@ def main():
         engine.shared_state.get("player_inventory", {}),
     )
 
-    # 10. 정리
+    # 10. 정리 (대기 중인 저장 기록 완료 대기)
+    get_save_writer().close()
     pygame.quit()
     print("INFO: Game ended")
 
@@ -368,8 +368,12 @@ def _load_episode_from_json(episode_id: str) -> Optional[EpisodeData]:
         return None
 
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        from systems.content_store import get_content_store
+        store = get_content_store()
+        data = store.get_episode(json_path) if store else None
+        if data is None:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
 
         # scenes 데이터 (새 통합 구조)
         scenes = data.get("scenes", {})
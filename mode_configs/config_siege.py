@@ -44,6 +44,8 @@ FORMATION = {
     "sway_amplitude": 30,   # 좌우 흔들림 폭
     "sway_speed": 0.5,      # 흔들림 속도
     "formation_width_ratio": 0.6,  # 포메이션 너비 (화면의 60%)
+    "max_rows": 6,          # 웨이브 진행 시 최대 행 수 (FormationEngine 격자)
+    "max_cols": 10,         # 웨이브 진행 시 최대 열 수
 }
 
 # =========================================================
@@ -11,16 +11,26 @@
 - HangarMode: 격납고 모드 (신규)
 - WorkshopMode: 정비소 모드 (신규)
 - BriefingMode: 브리핑룸 모드 (신규)
+
+모드 모듈은 지연 로딩됩니다 (PEP 562).
+`from modes import WaveMode` 처럼 처음 접근할 때 해당 모듈만 import 하며,
+엔진에는 registry를 통해 이름으로 모드를 요청할 수 있습니다.
 """
 
-from .base_mode import GameMode, ModeConfig
-from .main_menu_mode import MainMenuMode
-from .wave_mode import WaveMode
-from .siege_mode import SiegeMode
-from .base_hub_mode import BaseHubMode
-from .hangar_mode import HangarMode
-from .workshop_mode import WorkshopMode
-from .briefing_mode import BriefingMode
+import importlib
+from typing import TYPE_CHECKING
+
+from .registry import MODE_REGISTRY, get_mode_class, register_mode, resolve_mode
+
+if TYPE_CHECKING:
+    from .base_mode import GameMode, ModeConfig
+    from .main_menu_mode import MainMenuMode
+    from .wave_mode import WaveMode
+    from .siege_mode import SiegeMode
+    from .base_hub_mode import BaseHubMode
+    from .hangar_mode import HangarMode
+    from .workshop_mode import WorkshopMode
+    from .briefing_mode import BriefingMode
 
 __all__ = [
     "GameMode",
@@ -32,4 +42,28 @@ __all__ = [
     "HangarMode",
     "WorkshopMode",
     "BriefingMode",
+    "MODE_REGISTRY",
+    "get_mode_class",
+    "register_mode",
+    "resolve_mode",
 ]
+
+_BASE_EXPORTS = {
+    "GameMode": ".base_mode",
+    "ModeConfig": ".base_mode",
+}
+
+
+def __getattr__(name: str):
+    if name in _BASE_EXPORTS:
+        value = getattr(importlib.import_module(_BASE_EXPORTS[name], __name__), name)
+    elif name in MODE_REGISTRY:
+        value = get_mode_class(name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(MODE_REGISTRY))
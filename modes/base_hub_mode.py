@@ -20,6 +20,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 import config
+from asset_bundle import get_asset_bundle
 from modes.base_mode import GameMode, ModeConfig
 from systems.save_system import get_save_system
 from systems.dialogue_loader import get_dialogue_loader
@@ -708,9 +709,13 @@ class BaseHubMode(GameMode):
             config.ASSET_DIR / "images" / "base" / "facilities" / "facility_bg.png",
         ]
 
+        bundle = get_asset_bundle(self.screen_size)
         for bg_path in bg_paths:
             try:
                 if bg_path.exists():
+                    img = bundle.load(bg_path, self.screen_size, smooth=True, alpha=False) if bundle else None
+                    if img is not None:
+                        return img
                     img = pygame.image.load(str(bg_path)).convert()
                     return pygame.transform.smoothscale(img, self.screen_size)
             except Exception as e:
@@ -16,8 +16,8 @@ import config
 # Entity imports from new modules
 from entities.player import Player
 from entities.enemies import Enemy
-from entities.weapons import Bullet
-from entities.collectibles import CoinGem, HealItem
+from entities.bullet_store import BulletStore
+from entities.collectible_field import CollectibleField
 from entities.support_units import Turret, Drone
 # Effect classes from effects modules and objects
 from effects.combat_effects import DamageNumberManager
@@ -106,8 +106,8 @@ class GameMode(ABC):
         # 공통 객체 리스트
         self.player: Optional[Player] = None
         self.enemies: List[Enemy] = []
-        self.bullets: List[Bullet] = []
-        self.gems: List[CoinGem | HealItem] = []
+        self.bullets = BulletStore(screen_height=self.screen_size[1])
+        self.gems = CollectibleField(screen_height=self.screen_size[1])
         self.effects: List = []
         self.damage_numbers: List = []  # (deprecated) 기존 호환용
         self.turrets: List[Turret] = []
@@ -291,6 +291,16 @@ class GameMode(ABC):
         """서브모드에서 반환된 데이터 처리 - 오버라이드 가능"""
         pass
 
+    def on_asset_reload(self, kind: str, key: str):
+        """
+        핫 리로드로 에셋이 다시 로드되었을 때 호출 - 오버라이드 가능
+
+        Args:
+            kind: "vfx_effect" / "vfx_image" / "episode" / "dialogue"
+            key: 바뀐 항목 (systems/hot_reload.py 참고)
+        """
+        pass
+
     # ===== 모드 전환 요청 메서드 =====
 
     def request_push_mode(self, mode_class, **kwargs):
@@ -369,8 +379,8 @@ class GameMode(ABC):
             return False
 
         mouse_pos = event.pos
-        import time
-        current_time = time.time()
+        # pygame 틱 기준 (리플레이 시 기록된 시각으로 재현됨)
+        current_time = pygame.time.get_ticks() / 1000.0
 
         # 좌클릭: 클릭 위치로 이동 또는 더블클릭 시 적 타겟팅
         if event.button == 1:
@@ -616,11 +626,9 @@ class GameMode(ABC):
             if not drone.is_alive:
                 self.drones.remove(drone)
 
-        # 총알 업데이트
-        for bullet in self.bullets[:]:
-            bullet.update(dt, self.screen_size)
-            if not bullet.is_alive:
-                self.bullets.remove(bullet)
+        # 총알 업데이트 (일괄 이동 + 화면 밖 제거 후 슬롯 회수)
+        self.bullets.update(dt, self.screen_size)
+        self.bullets.compact()
 
     # ===== 공통 렌더링 로직 =====
 
@@ -634,8 +642,7 @@ class GameMode(ABC):
         from game_logic import draw_visual_effects
 
         # 젬 그리기
-        for gem in self.gems:
-            gem.draw(screen)
+        self.gems.draw(screen)
 
         # 터렛 그리기
         for turret in self.turrets:
@@ -663,9 +670,7 @@ class GameMode(ABC):
 
         # Bacteria 그리기 (적과 같은 레이어)
         if hasattr(self, 'bacteria'):
-            for bacteria in self.bacteria:
-                if bacteria.is_alive:
-                    bacteria.draw(screen)
+            self.bacteria.draw(screen)
 
         # 적 그리기 (Y 위치 기준 정렬)
         sorted_enemies = sorted(self.enemies, key=lambda e: e.pos.y)
@@ -677,8 +682,7 @@ class GameMode(ABC):
             self.player.draw(screen)
 
         # 총알 그리기
-        for bullet in self.bullets:
-            bullet.draw(screen)
+        self.bullets.draw(screen)
 
         # 시각 효과 그리기
         screen_offset = getattr(self, 'screen_offset', (0, 0))
@@ -20,7 +20,9 @@ from mode_configs.config_episodes import (
     get_episode, EpisodeData, SegmentType
 )
 from systems.episode_resource_loader import get_episode_loader
+from systems.save_writer import get_save_writer
 from ui_components import UILayoutManager, TabData, TabState, UnifiedParticleSystem
+from ui_render import get_image_background
 
 
 @dataclass
@@ -134,12 +136,11 @@ class BriefingMode(GameMode):
     def _create_background(self) -> pygame.Surface:
         """배경 생성"""
         bg_path = config.ASSET_DIR / "images" / "base" / "facilities" / "facility_bg.png"
-        try:
-            if bg_path.exists():
-                bg = pygame.image.load(str(bg_path)).convert()
-                return pygame.transform.smoothscale(bg, self.screen_size)
-        except Exception as e:
-            print(f"WARNING: Failed to load facility_bg for briefing: {e}")
+        if bg_path.exists():
+            # 시설 화면들이 공유하는 스케일 캐시
+            bg = get_image_background(bg_path, self.screen_size)
+            if bg is not None:
+                return bg
 
         # 폴백: 기본 그라데이션 배경
         bg = self.ui_manager.create_gradient_background(
@@ -155,9 +156,8 @@ class BriefingMode(GameMode):
 
         save_path = Path("saves/campaign_progress.json")
         try:
-            if save_path.exists():
-                with open(save_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            data = get_save_writer().read(save_path)
+            if data is not None:
                 self.completed_episodes = data.get("completed_episodes", [])
                 self.current_act = data.get("current_act", 1)
 
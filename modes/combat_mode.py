@@ -30,6 +30,7 @@ from systems.skill_system import SkillSystem
 from systems.effect_system import EffectSystem
 from systems.spawn_system import SpawnSystem, SpawnConfig
 from systems.ui_system import UISystem, UIConfig
+from systems.segment_prefetcher import get_segment_prefetcher
 # Entity imports from new modules
 from entities.player import Player
 from entities.enemies import Enemy
@@ -220,7 +221,8 @@ class CombatMode(GameMode):
         for path in paths:
             if path.exists():
                 try:
-                    img = pygame.image.load(str(path)).convert()
+                    raw = get_segment_prefetcher().get(path)
+                    img = (raw if raw is not None else pygame.image.load(str(path))).convert()
                     self.story_background = pygame.transform.scale(img, self.screen_size)
                     print(f"INFO: Combat background loaded: {path}")
                     return
@@ -67,13 +67,7 @@ class EpisodeMode(GameMode):
         # 인트로 동영상 관련 상태
         self.intro_video_playing: bool = False
         self.intro_video_finished: bool = False
-        self.video_capture = None
-        self.frame_surface: Optional[pygame.Surface] = None
-        self.frame_offset_x: int = 0
-        self.frame_offset_y: int = 0
-        self.video_fps: float = 30
-        self.frame_timer: float = 0.0
-        self.frame_interval: float = 1.0 / 30
+        self.video_player = None  # VideoPlayer (백그라운드 디코딩)
         self.video_fade_alpha: int = 0
         self.video_fading_out: bool = False
         self.skip_hint_timer: float = 0.0
@@ -98,6 +92,9 @@ class EpisodeMode(GameMode):
         # 실제 로드된 에피소드 ID 사용 (별칭 변환 후)
         self.engine.shared_state["current_episode"] = self.episode_data.id
 
+        # 첫 세그먼트들의 배경/초상화/컷씬 이미지 선행 로드 (인트로 동영상 재생 중 진행)
+        self._prefetch_upcoming_segments(-1)
+
         print(f"INFO: Episode initialized: {self.episode_data.title}")
         print(f"INFO: Total segments: {len(self.episode_data.segments)}")
 
@@ -124,87 +121,22 @@ class EpisodeMode(GameMode):
             self.intro_video_finished = True
             return
 
-        # 동영상 로드
-        try:
-            import cv2
-            self.video_capture = cv2.VideoCapture(video_path)
-
-            if not self.video_capture.isOpened():
-                print(f"WARNING: Failed to open intro video: {video_path}")
-                self.intro_video_finished = True
-                return
-
-            # 영상 정보
-            self.video_fps = self.video_capture.get(cv2.CAP_PROP_FPS)
-            if self.video_fps <= 0:
-                self.video_fps = 30
-            self.frame_interval = 1.0 / self.video_fps
-
-            self.video_width = int(self.video_capture.get(cv2.CAP_PROP_FRAME_WIDTH))
-            self.video_height = int(self.video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
-
-            self.intro_video_playing = True
-            self.intro_video_finished = False
-            self.skip_hint_timer = 0.0
-
-            # 첫 프레임 읽기
-            self._read_next_video_frame()
-
-            # 마우스 커서 숨기기 (동영상 재생 중)
-            pygame.mouse.set_visible(False)
-
-            print(f"INFO: Intro video loaded: {video_path}")
-
-        except ImportError:
-            print("WARNING: cv2 not available, skipping intro video")
-            self.intro_video_finished = True
-        except Exception as e:
-            print(f"WARNING: Failed to load intro video: {e}")
+        # 동영상 로드 (디코더 스레드 시작)
+        from systems.video_player import VideoPlayer
+        player = VideoPlayer(video_path, self.screen_size)
+        if not player.open():
             self.intro_video_finished = True
+            return
 
-    def _read_next_video_frame(self) -> bool:
-        """다음 동영상 프레임 읽기"""
-        if not self.video_capture or not self.intro_video_playing:
-            return False
-
-        try:
-            import cv2
-            ret, frame = self.video_capture.read()
-
-            if not ret:
-                self.intro_video_playing = False
-                self.video_fading_out = True
-                return False
-
-            # BGR → RGB 변환
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            # 화면 크기에 맞게 스케일링 (비율 유지)
-            screen_w, screen_h = self.screen_size
-            video_aspect = self.video_width / self.video_height
-            screen_aspect = screen_w / screen_h
-
-            if video_aspect > screen_aspect:
-                new_width = screen_w
-                new_height = int(screen_w / video_aspect)
-            else:
-                new_height = screen_h
-                new_width = int(screen_h * video_aspect)
-
-            frame = cv2.resize(frame, (new_width, new_height))
-            frame = frame.swapaxes(0, 1)
-            self.frame_surface = pygame.surfarray.make_surface(frame)
-
-            self.frame_offset_x = (screen_w - new_width) // 2
-            self.frame_offset_y = (screen_h - new_height) // 2
+        self.video_player = player
+        self.intro_video_playing = True
+        self.intro_video_finished = False
+        self.skip_hint_timer = 0.0
 
-            return True
+        # 마우스 커서 숨기기 (동영상 재생 중)
+        pygame.mouse.set_visible(False)
 
-        except Exception as e:
-            print(f"WARNING: Failed to read video frame: {e}")
-            self.intro_video_playing = False
-            self.video_fading_out = True
-            return False
+        print(f"INFO: Intro video loaded: {video_path}")
 
     def _update_intro_video(self, dt: float):
         """인트로 동영상 업데이트"""
@@ -218,22 +150,19 @@ class EpisodeMode(GameMode):
                 self._finish_intro_video()
             return
 
-        # 프레임 업데이트
+        # 프레임 업데이트 (디코딩이 늦으면 이전 프레임 유지, 밀린 프레임은 버림)
         if self.intro_video_playing:
-            self.frame_timer += dt
-            while self.frame_timer >= self.frame_interval:
-                self.frame_timer -= self.frame_interval
-                if not self._read_next_video_frame():
-                    if not self.video_fading_out:
-                        self.video_fading_out = True
-                    break
+            self.video_player.update(dt)
+            if self.video_player.finished:
+                self.intro_video_playing = False
+                self.video_fading_out = True
 
     def _render_intro_video(self, screen: pygame.Surface):
         """인트로 동영상 렌더링"""
         screen.fill((0, 0, 0))
 
-        if self.frame_surface:
-            screen.blit(self.frame_surface, (self.frame_offset_x, self.frame_offset_y))
+        if self.video_player:
+            self.video_player.draw(screen)
 
         # 스킵 힌트 (2초 후 표시)
         if self.skip_hint_timer >= 2.0 and not self.video_fading_out:
@@ -266,15 +195,14 @@ class EpisodeMode(GameMode):
 
     def _finish_intro_video(self):
         """인트로 동영상 종료"""
-        if self.video_capture:
-            self.video_capture.release()
-            self.video_capture = None
+        if self.video_player:
+            self.video_player.close()
+            self.video_player = None
 
         self.intro_video_finished = True
         self.intro_video_playing = False
         self.video_fading_out = False
         self.video_fade_alpha = 0
-        self.frame_surface = None
 
         # 마우스 커서 복원
         pygame.mouse.set_visible(True)
@@ -314,6 +242,9 @@ class EpisodeMode(GameMode):
         self.segment_state = "running"
         print(f"INFO: Starting segment {self.current_segment_index + 1}/{len(self.episode_data.segments)}: {segment.type.name}")
 
+        # 현재 세그먼트가 진행되는 동안 다음 세그먼트 리소스 선행 로드
+        self._prefetch_upcoming_segments(self.current_segment_index)
+
         # 배경 로드
         if segment.background:
             self._load_background(segment.background)
@@ -326,6 +257,18 @@ class EpisodeMode(GameMode):
             print(f"WARNING: No handler for segment type: {segment.type}")
             self._advance_to_next_segment()
 
+    def _prefetch_upcoming_segments(self, current_index: int):
+        """current_index 다음 세그먼트들의 이미지를 워커 스레드에서 미리 디코딩 (시작 전에는 -1)"""
+        if not config.SEGMENT_PREFETCH_ENABLED:
+            return
+        try:
+            from systems.segment_prefetcher import get_segment_prefetcher
+            get_segment_prefetcher().prefetch_segments(
+                self.episode_data.id, self.episode_data.segments, current_index
+            )
+        except Exception as e:
+            print(f"WARNING: Segment prefetch failed: {e}")
+
     def _advance_to_next_segment(self):
         """다음 Segment로 진행"""
         self.current_segment_index += 1
@@ -825,10 +768,24 @@ class EpisodeMode(GameMode):
         super().on_enter()
 
     def on_exit(self):
-        # 비디오 리소스 정리
-        if self.video_capture:
-            self.video_capture.release()
-            self.video_capture = None
+        # 비디오 리소스 정리 (디코더 스레드 종료)
+        if self.video_player:
+            self.video_player.close()
+            self.video_player = None
+
+        # 선행 로드 결과 해제
+        if config.SEGMENT_PREFETCH_ENABLED:
+            from systems.segment_prefetcher import get_segment_prefetcher
+            prefetcher = get_segment_prefetcher()
+            stats = prefetcher.get_stats()
+            print(f"INFO: Segment prefetch - hits: {stats['hits']}, misses: {stats['misses']} "
+                  f"(late: {stats['late']}, over budget: {stats['over_budget']}), "
+                  f"hit rate: {stats['hit_rate']:.0%}, unused: {stats['unused']}")
+            prefetcher.clear()
+
+        # 컷씬 이미지 캐시 해제 (에피소드에서만 쓰는 원본/스케일 Surface)
+        from systems.cutscene_image_service import get_cutscene_image_service
+        get_cutscene_image_service().clear()
 
         super().on_exit()
 
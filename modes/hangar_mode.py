@@ -19,6 +19,7 @@ from dataclasses import dataclass
 
 import config
 from modes.base_mode import GameMode, ModeConfig
+from ui_render import get_background
 
 
 # config.py에서 함선 정의 가져오기
@@ -180,29 +181,11 @@ class HangarMode(GameMode):
 
     def _create_background(self) -> pygame.Surface:
         """그라데이션 우주 배경 생성"""
-        bg = pygame.Surface(self.screen_size)
-
-        # 수직 그라데이션
-        for y in range(self.screen_size[1]):
-            ratio = y / self.screen_size[1]
-            color = (
-                int(8 + 15 * ratio),
-                int(12 + 18 * ratio),
-                int(24 + 30 * ratio)
-            )
-            pygame.draw.line(bg, color, (0, y), (self.screen_size[0], y))
-
-        # 중앙 비네트 효과
-        vignette = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        center_x, center_y = self.screen_size[0] // 2, self.screen_size[1] // 2
-        max_radius = max(self.screen_size) * 0.8
-
-        for r in range(int(max_radius), 0, -20):
-            alpha = int(30 * (1 - r / max_radius))
-            pygame.draw.circle(vignette, (20, 40, 80, alpha), (center_x, center_y), r)
-
-        bg.blit(vignette, (0, 0))
-        return bg
+        # 수직 그라데이션 + 중앙 비네트 효과 (모드 간 공유 캐시)
+        return get_background(
+            self.screen_size, (8, 12, 24), (23, 30, 54),
+            radial_color=(20, 40, 80), radial_alpha=30, radial_extent=0.8,
+        )
 
     def _load_ship_images(self):
         """함선 이미지 로드"""
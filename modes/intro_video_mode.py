@@ -43,18 +43,8 @@ class IntroVideoMode(GameMode):
         self.video_finished = False
         self.skip_requested = False
 
-        # OpenCV 비디오 캡처
-        self.video_capture = None
-        self.frame_surface = None
-
-        # 프레임 오프셋 (화면 중앙 배치용)
-        self.frame_offset_x = 0
-        self.frame_offset_y = 0
-
-        # 타이밍
-        self.video_fps = 30
-        self.frame_timer = 0.0
-        self.frame_interval = 1.0 / self.video_fps
+        # 동영상 재생기 (백그라운드 디코딩, 화면 중앙 배치)
+        self.video_player = None
 
         # 페이드 효과
         self.fade_alpha = 0
@@ -69,78 +59,26 @@ class IntroVideoMode(GameMode):
         self._load_video()
 
     def _load_video(self):
-        """영상 파일 로드"""
+        """영상 파일 로드 (디코더 스레드 시작)"""
         if not self.video_path.exists():
             self.video_finished = True
             return
 
-        try:
-            import cv2
-            self.video_capture = cv2.VideoCapture(str(self.video_path))
-
-            if not self.video_capture.isOpened():
-                self.video_finished = True
-                return
-
-            # 영상 정보
-            self.video_fps = self.video_capture.get(cv2.CAP_PROP_FPS)
-            if self.video_fps <= 0:
-                self.video_fps = 30
-            self.frame_interval = 1.0 / self.video_fps
-
-            self.video_width = int(self.video_capture.get(cv2.CAP_PROP_FRAME_WIDTH))
-            self.video_height = int(self.video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
-
-            self.video_playing = True
-            self._read_next_frame()
-
-        except ImportError:
-            self.video_finished = True
-        except Exception:
+        # 첫 화면 표시 전 numpy/cv2 import를 피하기 위해 영상이 있을 때만 로드
+        from systems.video_player import VideoPlayer
+        player = VideoPlayer(self.video_path, self.screen_size)
+        if not player.open():
             self.video_finished = True
+            return
 
-    def _read_next_frame(self):
-        """다음 프레임 읽기"""
-        if not self.video_capture or not self.video_playing:
-            return False
-
-        try:
-            import cv2
-            ret, frame = self.video_capture.read()
-
-            if not ret:
-                self.video_playing = False
-                self.fading_out = True
-                return False
-
-            # BGR → RGB 변환
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            # 화면 크기에 맞게 스케일링
-            screen_w, screen_h = self.screen_size
-            video_aspect = self.video_width / self.video_height
-            screen_aspect = screen_w / screen_h
-
-            if video_aspect > screen_aspect:
-                new_width = screen_w
-                new_height = int(screen_w / video_aspect)
-            else:
-                new_height = screen_h
-                new_width = int(screen_h * video_aspect)
-
-            frame = cv2.resize(frame, (new_width, new_height))
-            frame = frame.swapaxes(0, 1)
-            self.frame_surface = pygame.surfarray.make_surface(frame)
-
-            self.frame_offset_x = (screen_w - new_width) // 2
-            self.frame_offset_y = (screen_h - new_height) // 2
-
-            return True
+        self.video_player = player
+        self.video_playing = True
 
-        except Exception:
-            self.video_playing = False
-            self.fading_out = True
-            return False
+    def _close_video(self):
+        """디코더 스레드 종료 및 영상 해제"""
+        if self.video_player:
+            self.video_player.close()
+            self.video_player = None
 
     def update(self, dt: float, current_time: float):
         """업데이트"""
@@ -158,22 +96,19 @@ class IntroVideoMode(GameMode):
                 self.video_finished = True
             return
 
-        # 프레임 업데이트
+        # 프레임 업데이트 (디코딩이 늦으면 이전 프레임 유지, 밀린 프레임은 버림)
         if self.video_playing:
-            self.frame_timer += dt
-            while self.frame_timer >= self.frame_interval:
-                self.frame_timer -= self.frame_interval
-                if not self._read_next_frame():
-                    if not self.fading_out:
-                        self.fading_out = True
-                    break
+            self.video_player.update(dt)
+            if self.video_player.finished:
+                self.video_playing = False
+                self.fading_out = True
 
     def render(self, screen: pygame.Surface):
         """렌더링"""
         screen.fill((0, 0, 0))
 
-        if self.frame_surface:
-            screen.blit(self.frame_surface, (self.frame_offset_x, self.frame_offset_y))
+        if self.video_player:
+            self.video_player.draw(screen)
 
         # 스킵 힌트 (2초 후 표시)
         if self.skip_hint_timer >= self.skip_hint_delay and not self.fading_out:
@@ -215,16 +150,12 @@ class IntroVideoMode(GameMode):
 
     def _go_to_main_menu(self):
         """인트로 종료 후 MainMenuMode로 전환 (배경 이미지 표시)"""
-        if self.video_capture:
-            self.video_capture.release()
-            self.video_capture = None
+        self._close_video()
 
         from modes.main_menu_mode import MainMenuMode
         self.request_switch_mode(MainMenuMode)
 
     def on_exit(self):
         """모드 종료 시 정리"""
-        if self.video_capture:
-            self.video_capture.release()
-            self.video_capture = None
+        self._close_video()
         super().on_exit()
@@ -32,6 +32,7 @@ from pathlib import Path
 from modes.base_mode import GameMode, ModeConfig
 from effects.visual_novel_effects import TextBoxExpand
 import config
+from ui_render import get_background
 
 
 # 빈 대화 템플릿 (Graceful 처리용)
@@ -350,6 +351,25 @@ class NarrativeMode(GameMode):
             first_seq.is_fading = True
             print(f"INFO: Activated first intro background sequence (dialogue 0)")
 
+    def on_asset_reload(self, kind: str, key: str):
+        """편집한 장면 JSON을 진행 중인 대화에 바로 반영 (핫 리로드, 현재 대화 위치 유지)"""
+        if kind not in ("episode", "dialogue") or not self.scene_id or self.dialogue_state == "delegate":
+            return
+        if kind == "episode" and key != self.engine.shared_state.get("current_episode", ""):
+            return
+        if kind == "dialogue" and key != self.scene_id:
+            return
+
+        # 인트로 배경 시퀀스는 진행 중인 것을 그대로 사용
+        sequences, self.intro_bg_sequences = self.intro_bg_sequences, []
+        bg_sequence_index = self.current_bg_sequence_index
+        self._load_scene_from_json()
+        self.intro_bg_sequences, self.current_bg_sequence_index = sequences, bg_sequence_index
+
+        if self.dialogues:
+            self.current_dialogue_index = min(self.current_dialogue_index, len(self.dialogues) - 1)
+        print(f"INFO: NarrativeMode reloaded scene {self.scene_id} ({len(self.dialogues)} dialogues)")
+
     def _update_intro_backgrounds(self):
         """대화 진행에 따라 인트로 배경 시퀀스 업데이트"""
         if not self.intro_bg_sequences:
@@ -463,8 +483,6 @@ class NarrativeMode(GameMode):
 
     def _create_gradient_background(self):
         """폴백용 그라데이션 배경 생성"""
-        self.background = pygame.Surface(self.screen_size)
-
         # 연출 타입에 따른 색상
         if self.narrative_type == "REFLECTION":
             top_color = (20, 20, 40)
@@ -476,13 +494,8 @@ class NarrativeMode(GameMode):
             top_color = (10, 15, 25)
             bottom_color = (25, 35, 55)
 
-        # 그라데이션 그리기
-        for y in range(self.screen_size[1]):
-            ratio = y / self.screen_size[1]
-            r = int(top_color[0] + (bottom_color[0] - top_color[0]) * ratio)
-            g = int(top_color[1] + (bottom_color[1] - top_color[1]) * ratio)
-            b = int(top_color[2] + (bottom_color[2] - top_color[2]) * ratio)
-            pygame.draw.line(self.background, (r, g, b), (0, y), (self.screen_size[0], y))
+        # 그라데이션 (모드 간 공유 캐시)
+        self.background = get_background(self.screen_size, top_color, bottom_color)
 
     def _create_color_overlay(self):
         """색상 오버레이 생성 (REFLECTION 전용)"""
@@ -503,6 +516,10 @@ class NarrativeMode(GameMode):
         # 레거시 크기 (StoryMode와 동일)
         target_size = (200, 200)
 
+        # 공유 이미지 서비스 (컷씬 효과와 같은 디코딩/스케일 결과 재사용)
+        from systems.cutscene_image_service import get_cutscene_image_service
+        image_service = get_cutscene_image_service()
+
         # EpisodeResourceLoader 준비
         episode_loader = None
         episode_id = self.engine.shared_state.get("current_episode", "")
@@ -523,8 +540,10 @@ class NarrativeMode(GameMode):
                     for ext in [".png", ".jpg"]:
                         resolved_path = episode_loader.get_portrait(f"portrait_{name}{ext}")
                         if resolved_path and resolved_path.exists():
-                            portrait = pygame.image.load(str(resolved_path)).convert_alpha()
-                            self.portraits[name.upper()] = pygame.transform.smoothscale(portrait, target_size)
+                            portrait = image_service.get_image(resolved_path, target_size)
+                            if portrait is None:
+                                continue
+                            self.portraits[name.upper()] = portrait
                             loaded = True
                             print(f"INFO: Loaded portrait {name.upper()} from episode: {resolved_path}")
                             break
@@ -538,8 +557,10 @@ class NarrativeMode(GameMode):
 
                     for path in paths:
                         if path.exists():
-                            portrait = pygame.image.load(str(path)).convert_alpha()
-                            self.portraits[name.upper()] = pygame.transform.smoothscale(portrait, target_size)
+                            portrait = image_service.get_image(path, target_size)
+                            if portrait is None:
+                                continue
+                            self.portraits[name.upper()] = portrait
                             loaded = True
                             print(f"INFO: Loaded portrait {name.upper()} from legacy: {path}")
                             break
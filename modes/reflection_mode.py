@@ -11,6 +11,7 @@ from dataclasses import dataclass
 
 from modes.base_mode import GameMode, ModeConfig
 import config
+from ui_render import get_background
 
 
 @dataclass
@@ -183,8 +184,6 @@ class ReflectionMode(GameMode):
 
     def _create_gradient_background(self):
         """폴백용 그라데이션 배경 생성"""
-        self.background = pygame.Surface(self.screen_size)
-
         # 씬 키에 따른 색상
         if "spring" in self.scene_key or "color" in self.scene_key or "flower" in self.scene_key:
             top_color = (60, 20, 40)
@@ -205,13 +204,8 @@ class ReflectionMode(GameMode):
             top_color = (20, 20, 40)
             bottom_color = (40, 40, 80)
 
-        # 그라데이션 그리기
-        for y in range(self.screen_size[1]):
-            ratio = y / self.screen_size[1]
-            r = int(top_color[0] + (bottom_color[0] - top_color[0]) * ratio)
-            g = int(top_color[1] + (bottom_color[1] - top_color[1]) * ratio)
-            b = int(top_color[2] + (bottom_color[2] - top_color[2]) * ratio)
-            pygame.draw.line(self.background, (r, g, b), (0, y), (self.screen_size[0], y))
+        # 그라데이션 (모드 간 공유 캐시)
+        self.background = get_background(self.screen_size, top_color, bottom_color)
 
     def _create_color_overlay(self):
         """색상 오버레이 생성"""
@@ -0,0 +1,73 @@
+# modes/registry.py
+"""
+모드 레지스트리 - 모드 이름 → 모듈 경로
+
+모드 모듈은 처음 push/switch 될 때 import 됩니다.
+(모드 모듈은 엔티티/효과/UI를 대량으로 import 하므로 시작 시 전부 불러오지 않음)
+
+사용:
+    engine.push_mode("WaveMode")          # 이름으로 요청 (최초 요청 시 import)
+    engine.push_mode(WaveMode)            # 클래스 직접 전달도 그대로 지원
+"""
+
+import importlib
+from typing import Dict, Type, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from modes.base_mode import GameMode
+
+
+# 모드 클래스 이름 → 정의 모듈
+MODE_REGISTRY: Dict[str, str] = {
+    "IntroVideoMode": "modes.intro_video_mode",
+    "MainMenuMode": "modes.main_menu_mode",
+    "BaseHubMode": "modes.base_hub_mode",
+    "WaveMode": "modes.wave_mode",
+    "SiegeMode": "modes.siege_mode",
+    "TrainingMode": "modes.training_mode",
+    "HangarMode": "modes.hangar_mode",
+    "WorkshopMode": "modes.workshop_mode",
+    "ShopMode": "modes.shop_mode",
+    "BriefingMode": "modes.briefing_mode",
+    "EpisodeMode": "modes.episode_mode",
+    "NarrativeMode": "modes.narrative_mode",
+    "CombatMode": "modes.combat_mode",
+    "ArchiveMode": "modes.archive_mode",
+    "ReflectionMode": "modes.reflection_mode",
+}
+
+# 이미 로드된 모드 클래스
+_loaded: Dict[str, Type["GameMode"]] = {}
+
+
+def register_mode(name: str, module_path: str):
+    """모드 등록 (확장 모드/테스트용)"""
+    MODE_REGISTRY[name] = module_path
+    _loaded.pop(name, None)
+
+
+def get_mode_class(name: str) -> Type["GameMode"]:
+    """등록된 모드 클래스 반환 (최초 요청 시 모듈 import)"""
+    mode_class = _loaded.get(name)
+    if mode_class is not None:
+        return mode_class
+
+    module_path = MODE_REGISTRY.get(name)
+    if module_path is None:
+        raise KeyError(f"Unknown mode: {name}")
+
+    mode_class = getattr(importlib.import_module(module_path), name)
+    _loaded[name] = mode_class
+    return mode_class
+
+
+def resolve_mode(mode: Union[str, Type["GameMode"]]) -> Type["GameMode"]:
+    """모드 이름 또는 클래스 → 클래스"""
+    if isinstance(mode, str):
+        return get_mode_class(mode)
+    return mode
+
+
+def is_mode_loaded(name: str) -> bool:
+    """모드 모듈이 이미 import 되었는지 여부"""
+    return name in _loaded
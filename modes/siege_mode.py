@@ -24,7 +24,8 @@ from systems.ui_system import UISystem, UIConfig
 # DamageFlash, LevelUpEffect, HPBarShake는 base_mode에서 제공
 
 # 갈라그 스타일 오브젝트
-from entities.siege_entities import FormationEnemy, WaveManager
+from entities.formation_engine import FormationEngine
+from entities.siege_entities import WaveManager
 
 # 갈라그 설정
 try:
@@ -87,7 +88,7 @@ class SiegeMode(GameMode):
         config.GAME_MODE = "siege"
 
         # 적 이미지 캐시 리셋 (크기 변경 적용)
-        FormationEnemy.reset_image_cache()
+        FormationEngine.reset_image_cache()
 
         # 시스템 초기화
         self.combat_system = CombatSystem()
@@ -303,46 +304,31 @@ class SiegeMode(GameMode):
         if not self.player:
             return
 
-        # 플레이어 총알 vs 적
-        enemy_rects = self.wave_manager.get_all_enemy_rects()
-
+        # 플레이어 총알 vs 적 (격자 셀 조회 + 다이버 리스트)
         for bullet in self.bullets[:]:
-            if bullet not in self.bullets:
-                continue
-
             bullet_rect = pygame.Rect(
                 bullet.pos.x - 5, bullet.pos.y - 5, 10, 10
             )
 
-            for enemy, enemy_rect in enemy_rects:
-                if not enemy.is_alive:
-                    continue
-
-                if bullet_rect.colliderect(enemy_rect):
-                    # 데미지 적용
-                    score = enemy.take_damage(bullet.damage)
-                    self.game_data['score'] += score
+            score = self.wave_manager.hit_first(bullet_rect, bullet.damage)
+            if score is not None:
+                self.game_data['score'] += score
 
-                    # 총알 제거
-                    if bullet in self.bullets:
-                        self.bullets.remove(bullet)
-                    break
+                # 총알 제거
+                if bullet in self.bullets:
+                    self.bullets.remove(bullet)
 
         # 플레이어 vs 적 충돌 (접촉 데미지)
-        for enemy, enemy_rect in enemy_rects:
-            if not enemy.is_alive:
-                continue
-
-            player_rect = pygame.Rect(
-                self.player.pos.x - 20, self.player.pos.y - 20, 40, 40
-            )
-
-            if player_rect.colliderect(enemy_rect):
-                # 접촉 데미지
-                self.player.take_damage(30)
-                # 적도 파괴
-                score = enemy.take_damage(9999)
-                self.game_data['score'] += score
+        player_rect = pygame.Rect(
+            self.player.pos.x - 20, self.player.pos.y - 20, 40, 40
+        )
+        formation = self.wave_manager.formation
+        for index in formation.query_rect(player_rect):
+            # 접촉 데미지
+            self.player.take_damage(30)
+            # 적도 파괴
+            if formation.damage(index, 9999):
+                self.game_data['score'] += 150
 
     def _start_next_wave(self):
         """다음 웨이브 시작"""
@@ -459,8 +459,8 @@ class TrainingMode(GameMode):
 
         # 죽은 적/총알/젬 제거
         self.enemies = [e for e in self.enemies if e.is_alive]
-        self.bullets = [b for b in self.bullets if b.is_alive]
-        self.gems = [g for g in self.gems if not g.collected]
+        self.bullets.compact()
+        self.gems.compact()
 
         # 드론 업데이트
         for drone in self.drones[:]:
@@ -678,14 +678,12 @@ class TrainingMode(GameMode):
             screen.blit(self.director_image, self.director_rect)
 
         # 게임 오브젝트
-        for gem in self.gems:
-            gem.draw(screen)
+        self.gems.draw(screen)
         for turret in self.turrets:
             turret.draw(screen)
         for enemy in self.enemies:
             enemy.draw(screen)
-        for bullet in self.bullets:
-            bullet.draw(screen)
+        self.bullets.draw(screen)
         for drone in self.drones:
             drone.draw(screen)
 
@@ -18,8 +18,10 @@ from systems.ui_system import UISystem, UIConfig
 # Entity imports from new modules
 from entities.player import Player
 from entities.enemies import Enemy
+from entities.enemy_archetypes import preload_enemy_archetypes
 from entities.weapons import Bullet
 from entities.support_units import Drone, Turret
+from entities.bacteria_swarm import BacteriaSwarm
 # Effect and background classes
 from effects.transitions import ParallaxLayer, BackgroundTransition
 from effects.game_animations import Meteor
@@ -133,6 +135,9 @@ class WaveMode(GameMode):
             upgrades=self.engine.shared_state.get('player_upgrades', {})
         )
 
+        # 적 타입별 공유 이미지/스탯 미리 생성 (첫 스폰 프레임 지연 방지)
+        preload_enemy_archetypes(self.screen_size[1])
+
         # 저장된 진행 불러오기
         if self.continue_from_save:
             self._load_saved_progress()
@@ -151,7 +156,7 @@ class WaveMode(GameMode):
 
         # 박테리아 시스템 (2단계)
         self.bacteria_generators = []  # BacteriaGenerator 리스트
-        self.bacteria = []  # Bacteria 리스트
+        self.bacteria = BacteriaSwarm(self.screen_size)  # 박테리아 군집 (배열 저장소)
         self.generator_spawned_this_wave = False  # 웨이브당 1회 스폰 제어
 
         # 배경 이미지 캐시 로드
@@ -441,8 +446,10 @@ class WaveMode(GameMode):
         hp_before = self.player.hp if self.player else 0
 
         # === Carrier 피격 처리 (플레이어 총알) ===
-        for bullet in self.bullets[:]:  # 복사본으로 순회
-            for carrier in self.carriers:
+        # 히트박스 겹침 후보만 배열 연산으로 추린 뒤 처리 (총알 핸들은 제거해도 안전)
+        carrier_hitboxes = [carrier.hitbox for carrier in self.carriers]
+        for bullet, candidate_indices in self.bullets.overlap_rects(carrier_hitboxes):
+            for carrier in (self.carriers[i] for i in candidate_indices):
                 if carrier.hitbox.colliderect(bullet.hitbox):  # bullet.rect → bullet.hitbox
                     # 피격 처리
                     should_drop_gem = carrier.take_damage(bullet.damage)
@@ -478,8 +485,9 @@ class WaveMode(GameMode):
                     break  # 다음 총알로
 
         # === SphereDroid 피격 처리 (플레이어 총알) ===
-        for bullet in self.bullets[:]:
-            for droid in self.sphere_droids:
+        droid_hitboxes = [droid.hitbox for droid in self.sphere_droids]
+        for bullet, candidate_indices in self.bullets.overlap_rects(droid_hitboxes):
+            for droid in (self.sphere_droids[i] for i in candidate_indices):
                 if droid.is_alive and droid.hitbox.colliderect(bullet.hitbox):
                     droid.take_damage(bullet.damage)
 
@@ -531,8 +539,7 @@ class WaveMode(GameMode):
 
         # === BacteriaGenerator 업데이트 (박테리아 투하) ===
         for generator in self.bacteria_generators[:]:
-            newly_spawned = generator.update(dt, current_time)
-            self.bacteria.extend(newly_spawned)  # 투하된 박테리아 추가
+            generator.update(dt, current_time, self.bacteria)  # 투하된 박테리아는 군집에 직접 추가
 
             # 박테리아 20개 생성 시점에 배경 전환
             if generator.bacteria_spawned == 20 and not self.bacteria_event_active:
@@ -543,21 +550,9 @@ class WaveMode(GameMode):
             if generator.dead:
                 self.bacteria_generators.remove(generator)
 
-        # === Bacteria 업데이트 (플레이어 추적 및 달라붙기) ===
+        # === Bacteria 업데이트 (플레이어 추적 및 달라붙기, 군집 일괄 처리) ===
         player_pos = self.player.pos if self.player else None
-        attached_count = 0
-        total_bacteria_damage = 0.0
-
-        for bacteria in self.bacteria[:]:
-            is_attached, damage = bacteria.update(dt, current_time, player_pos)
-
-            if is_attached:
-                attached_count += 1
-                total_bacteria_damage += damage
-
-            # 죽은 박테리아 제거
-            if bacteria.dead or not bacteria.is_alive:
-                self.bacteria.remove(bacteria)
+        attached_count, total_bacteria_damage = self.bacteria.update(dt, current_time, player_pos)
 
         # === Bacteria 배경 2단계 전환 (bacteria_bg_01 → bacteria_bg_02) ===
         if self.bacteria_event_active and hasattr(self, 'bacteria_bg_stage'):
@@ -589,26 +584,16 @@ class WaveMode(GameMode):
             if self.bacteria_event_active:
                 self.end_bacteria_event()
 
-        # === Bacteria 피격 처리 (특수 무기만) ===
-        # Static Field 피격 처리
-        if self.player and self.player.has_static_field:
-            static_field_radius = 150  # Static Field 범위
-            for bacteria in self.bacteria[:]:
-                if bacteria.is_alive:
-                    distance = (bacteria.pos - self.player.pos).length()
-                    if distance <= static_field_radius:
-                        bacteria.take_damage(100, is_special_weapon=True)  # 높은 데미지
-
-        # Lightning Chain 피격 처리 (총알 속성 확인 필요)
-        for bullet in self.bullets[:]:
-            # 번개 속성 총알인지 확인
-            has_lightning = getattr(bullet, 'has_lightning', False) or (self.player and self.player.has_lightning)
-
-            if has_lightning:
-                for bacteria in self.bacteria[:]:
-                    if bacteria.is_alive and bacteria.hitbox.colliderect(bullet.hitbox):
-                        bacteria.take_damage(bullet.damage, is_special_weapon=True)
-                        # 번개는 관통하므로 총알은 제거하지 않음
+        # === Bacteria 피격 처리 (특수 무기만, 군집 공간 조회) ===
+        if self.bacteria:
+            # Static Field 피격 처리
+            if self.player and self.player.has_static_field:
+                static_field_radius = 150  # Static Field 범위
+                self.bacteria.hit_radius(self.player.pos, static_field_radius, 100)  # 높은 데미지
+
+            # Lightning Chain 피격 처리 (번개는 관통하므로 총알은 제거하지 않음)
+            if self.player and self.player.has_lightning:
+                self.bacteria.hit_boxes(*self.bullets.hitbox_boxes())
 
         # HP 감소 감지 → 피격 효과 트리거 (base_mode 공통 메서드)
         self._trigger_damage_feedback(hp_before)
@@ -743,7 +728,7 @@ class WaveMode(GameMode):
         if self.player:
             self.player.disable_trail = True
             # 기존 트레일 파티클 모두 제거
-            self.player.trail_particles.clear()
+            self.player.trail_renderer.clear()
             print("INFO: Player trail disabled during wave transition")
 
         # 페이즈 변경
@@ -1693,9 +1678,6 @@ class WaveMode(GameMode):
 
     def _save_wave_progress(self):
         """현재 웨이브 진행 상황 저장"""
-        import json
-        from pathlib import Path
-
         progress_data = {
             'wave': self.game_data.get('current_wave', 1),
             'score': self.game_data.get('score', 0),
@@ -1706,46 +1688,27 @@ class WaveMode(GameMode):
             'player_upgrades': self.player.upgrades if self.player else {},
         }
 
-        save_path = Path("saves/wave_progress.json")
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-
-        try:
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(progress_data, f, indent=2, ensure_ascii=False)
+        if self.save_system.writer.submit(self.save_system.wave_save_file, progress_data):
             print(f"INFO: Wave progress saved (Wave {progress_data['wave']})")
-        except Exception as e:
-            print(f"ERROR: Failed to save wave progress: {e}")
+        else:
+            print("ERROR: Failed to save wave progress")
 
     def _load_wave_progress(self):
         """저장된 웨이브 진행 상황 로드"""
-        import json
-        from pathlib import Path
-
-        save_path = Path("saves/wave_progress.json")
-        if not save_path.exists():
+        progress_data = self.save_system.writer.read(self.save_system.wave_save_file)
+        if progress_data is None:
             return None
 
-        try:
-            with open(save_path, 'r', encoding='utf-8') as f:
-                progress_data = json.load(f)
-            print(f"INFO: Wave progress loaded (Wave {progress_data.get('wave', 1)})")
-            return progress_data
-        except Exception as e:
-            print(f"ERROR: Failed to load wave progress: {e}")
-            return None
+        print(f"INFO: Wave progress loaded (Wave {progress_data.get('wave', 1)})")
+        return progress_data
 
     def _clear_wave_progress(self):
         """저장된 웨이브 진행 상황 삭제"""
-        import json
-        from pathlib import Path
-
-        save_path = Path("saves/wave_progress.json")
-        if save_path.exists():
-            try:
-                save_path.unlink()
+        try:
+            if self.save_system.writer.delete(self.save_system.wave_save_file):
                 print("INFO: Wave progress cleared")
-            except Exception as e:
-                print(f"ERROR: Failed to clear wave progress: {e}")
+        except Exception as e:
+            print(f"ERROR: Failed to clear wave progress: {e}")
 
     def _return_to_base(self):
         """Base Hub로 귀환 (애니메이션 포함)"""
@@ -14,7 +14,7 @@ from dataclasses import dataclass
 
 import config
 from modes.base_mode import GameMode, ModeConfig
-from ui_render import render_text_with_emoji
+from ui_render import render_text_with_emoji, get_image_background
 from ui_components import UILayoutManager, TabData, TabState, UnifiedParticleSystem
 
 
@@ -191,12 +191,11 @@ class WorkshopMode(GameMode):
         """배경 생성 - facility_bg 이미지 사용"""
         # facility_bg 이미지 로드 시도
         bg_path = config.ASSET_DIR / "images" / "base" / "facilities" / "facility_bg.png"
-        try:
-            if bg_path.exists():
-                bg = pygame.image.load(str(bg_path)).convert()
-                return pygame.transform.smoothscale(bg, self.screen_size)
-        except Exception as e:
-            print(f"WARNING: Failed to load facility_bg for workshop: {e}")
+        if bg_path.exists():
+            # 시설 화면들이 공유하는 스케일 캐시
+            bg = get_image_background(bg_path, self.screen_size)
+            if bg is not None:
+                return bg
 
         # 폴백: 기본 그라데이션 배경
         bg = self.ui_manager.create_gradient_background(
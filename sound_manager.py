@@ -1,8 +1,9 @@
 # sound_manager.py
 
 import pygame
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import config
 
 
@@ -10,6 +11,17 @@ class SoundManager:
     """게임 사운드 및 음악 관리 클래스
 
     사운드 파일이 없어도 정상 작동하며, 파일이 있으면 자동으로 재생합니다.
+
+    BGM / 효과음 로드:
+    - BGM은 pygame.mixer.music으로 스트리밍 (곡 전체를 PCM으로 디코딩하지 않음)
+    - 곡 전환 시 이전 곡을 페이드아웃한 뒤 새 곡을 페이드인 (end_frame에서 전환)
+    - 효과음은 첫 재생 시 로드, config.SFX_PRELOAD만 시작 시 미리 로드
+
+    효과음 보이스 제한:
+    - 엔진이 프레임마다 end_frame()을 호출하면 play_sfx 요청을 모았다가
+      같은 효과음은 한 번만 (요청 수만큼 볼륨을 키워) 재생
+    - 효과음별 동시 재생 상한 (config.SFX_VOICE_LIMITS) 초과 시 버림
+    - 우선순위 높은 효과음(player_hit, boss 등)은 예약 채널에서 재생
     """
 
     def __init__(self):
@@ -18,16 +30,34 @@ class SoundManager:
         self.bgm_volume = config.DEFAULT_BGM_VOLUME
         self.sfx_volume = config.DEFAULT_SFX_VOLUME
 
-        # 사운드 딕셔너리
-        self.bgm: Dict[str, Optional[pygame.mixer.Sound]] = {}
+        # BGM은 파일 경로만 보관 (스트리밍), SFX는 로드된 Sound 캐시 (첫 사용 시 로드)
+        self.bgm: Dict[str, Optional[Path]] = {}
         self.sfx: Dict[str, Optional[pygame.mixer.Sound]] = {}
 
         # 현재 재생 중인 BGM 이름
         self.current_bgm: Optional[str] = None
 
+        # 페이드아웃이 끝나면 시작할 BGM (name, path, loops, fade_ms)
+        self._bgm_pending: Optional[tuple] = None
+        self._bgm_paused = False
+
+        # 프레임 단위 SFX 병합 {sfx_name: [요청 수, 최대 볼륨, 최대 우선순위]}
+        # end_frame()이 한 번이라도 호출되기 전에는 즉시 재생
+        self._frame_driven = False
+        self._pending_sfx: Dict[str, list] = {}
+
+        # 예약 채널 (우선순위 SFX 전용)
+        self._reserved_channels: List[pygame.mixer.Channel] = []
+        self._reserved_priority: Dict[int, int] = {}
+
+        # 재생 통계 (requested / played / merged / dropped / stolen)
+        self.sfx_stats: Counter = Counter()
+        self.sfx_dropped: Counter = Counter()
+
         # pygame mixer 초기화
         try:
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+            self._setup_channels()
             print("INFO: Sound system initialized successfully")
         except Exception as e:
             print(f"WARNING: Failed to initialize sound system: {e}")
@@ -37,37 +67,51 @@ class SoundManager:
         # 사운드 파일 로드
         self._load_sounds()
 
+    def _setup_channels(self):
+        """믹서 채널 수 설정 및 우선순위 SFX용 채널 예약"""
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), config.SFX_NUM_CHANNELS))
+        reserved = pygame.mixer.set_reserved(config.SFX_RESERVED_CHANNELS)
+        self._reserved_channels = [pygame.mixer.Channel(i) for i in range(reserved)]
+
     def _load_sounds(self):
-        """모든 사운드 파일을 로드합니다 (파일이 없으면 None으로 설정)"""
-        # BGM 로드
+        """BGM 파일 확인 및 미리 로드할 SFX 로드 (파일이 없으면 None으로 설정)"""
+        # BGM: 존재 여부만 확인 (재생 시 스트리밍)
         for name, path in config.BGM_FILES.items():
-            try:
-                if Path(path).exists():
-                    self.bgm[name] = pygame.mixer.Sound(str(path))
-                    print(f"INFO: Loaded BGM: {name} from {path}")
-                else:
-                    self.bgm[name] = None
-                    print(f"INFO: BGM file not found (will skip): {name} at {path}")
-            except Exception as e:
-                print(f"WARNING: Failed to load BGM {name}: {e}")
+            if Path(path).exists():
+                self.bgm[name] = Path(path)
+                print(f"INFO: Found BGM: {name} at {path}")
+            else:
                 self.bgm[name] = None
+                print(f"INFO: BGM file not found (will skip): {name} at {path}")
 
-        # SFX 로드
-        for name, path in config.SFX_FILES.items():
-            try:
-                if Path(path).exists():
-                    self.sfx[name] = pygame.mixer.Sound(str(path))
-                    self.sfx[name].set_volume(self.sfx_volume)
-                    print(f"INFO: Loaded SFX: {name} from {path}")
-                else:
-                    self.sfx[name] = None
-                    # print(f"INFO: SFX file not found (will skip): {name} at {path}")
-            except Exception as e:
-                print(f"WARNING: Failed to load SFX {name}: {e}")
-                self.sfx[name] = None
+        # SFX: 자주 쓰는 효과음만 미리 로드
+        for name in config.SFX_PRELOAD:
+            self.get_sfx(name)
+
+    def get_sfx(self, sfx_name: str) -> Optional[pygame.mixer.Sound]:
+        """효과음 반환 (처음 요청 시 로드, 파일이 없으면 None)"""
+        if sfx_name in self.sfx:
+            return self.sfx[sfx_name]
+
+        sound = None
+        path = config.SFX_FILES.get(sfx_name)
+        try:
+            if path is not None and Path(path).exists():
+                sound = pygame.mixer.Sound(str(path))
+                sound.set_volume(self.sfx_volume)
+                print(f"INFO: Loaded SFX: {sfx_name} from {path}")
+        except Exception as e:
+            print(f"WARNING: Failed to load SFX {sfx_name}: {e}")
+            sound = None
+
+        self.sfx[sfx_name] = sound
+        return sound
 
     def play_bgm(self, bgm_name: str, loops: int = -1, fade_ms: int = 1000):
-        """배경 음악 재생
+        """배경 음악 재생 (스트리밍)
+
+        다른 BGM이 재생 중이면 config.BGM_CROSSFADE_OUT_MS 동안 페이드아웃한 뒤
+        end_frame()에서 새 BGM을 페이드인합니다.
 
         Args:
             bgm_name: BGM 이름 (config.BGM_FILES 키)
@@ -77,23 +121,48 @@ class SoundManager:
         if not self.enabled:
             return
 
-        # 이미 같은 BGM이 재생 중이면 스킵
-        if self.current_bgm == bgm_name and pygame.mixer.get_busy():
+        # 이미 같은 BGM이 재생 중(또는 전환 대기 중)이면 스킵
+        if self.current_bgm == bgm_name and (
+            pygame.mixer.music.get_busy() or self._bgm_pending is not None or self._bgm_paused
+        ):
+            return
+
+        path = self.bgm.get(bgm_name)
+        if path is None:
+            # 새 BGM이 없으면 현재 BGM만 중지
+            self.stop_bgm(fade_ms=fade_ms)
             return
 
-        # 현재 BGM 중지
-        self.stop_bgm(fade_ms=fade_ms)
+        if self._frame_driven and pygame.mixer.music.get_busy():
+            # 현재 곡 페이드아웃 → 끝나면 end_frame에서 새 곡 시작
+            pygame.mixer.music.fadeout(config.BGM_CROSSFADE_OUT_MS)
+            self._bgm_pending = (bgm_name, path, loops, fade_ms)
+            self.current_bgm = bgm_name
+            return
 
-        # 새 BGM 재생
-        if bgm_name in self.bgm and self.bgm[bgm_name] is not None:
-            try:
-                channel = self.bgm[bgm_name].play(loops=loops, fade_ms=fade_ms)
-                if channel:
-                    channel.set_volume(self.bgm_volume)
-                    self.current_bgm = bgm_name
-                    print(f"INFO: Playing BGM: {bgm_name}")
-            except Exception as e:
-                print(f"WARNING: Failed to play BGM {bgm_name}: {e}")
+        self._start_bgm(bgm_name, path, loops, fade_ms)
+
+    def _start_bgm(self, bgm_name: str, path: Path, loops: int, fade_ms: int):
+        """BGM 스트림 열기 및 재생 (이전 스트림은 교체됨)"""
+        self._bgm_pending = None
+        try:
+            pygame.mixer.music.load(str(path))
+            # 새 곡을 로드하면 이전 곡의 일시정지 상태는 더 이상 유효하지 않음
+            self._bgm_paused = False
+            pygame.mixer.music.set_volume(self.bgm_volume)
+            pygame.mixer.music.play(loops=loops, fade_ms=fade_ms)
+            self.current_bgm = bgm_name
+            print(f"INFO: Playing BGM: {bgm_name}")
+        except Exception as e:
+            print(f"WARNING: Failed to play BGM {bgm_name}: {e}")
+            self.current_bgm = None
+
+    def _update_bgm(self):
+        """대기 중인 BGM 전환 처리 (이전 곡 페이드아웃이 끝났으면 새 곡 시작)"""
+        if self._bgm_pending is None or self._bgm_paused:
+            return
+        if not pygame.mixer.music.get_busy():
+            self._start_bgm(*self._bgm_pending)
 
     def stop_bgm(self, fade_ms: int = 1000):
         """배경 음악 중지
@@ -104,8 +173,9 @@ class SoundManager:
         if not self.enabled:
             return
 
+        self._bgm_pending = None
         try:
-            pygame.mixer.fadeout(fade_ms)
+            pygame.mixer.music.fadeout(fade_ms)
             self.current_bgm = None
         except Exception as e:
             print(f"WARNING: Failed to stop BGM: {e}")
@@ -117,6 +187,8 @@ class SoundManager:
 
         try:
             pygame.mixer.pause()
+            pygame.mixer.music.pause()
+            self._bgm_paused = True
         except Exception as e:
             print(f"WARNING: Failed to pause BGM: {e}")
 
@@ -127,41 +199,126 @@ class SoundManager:
 
         try:
             pygame.mixer.unpause()
+            pygame.mixer.music.unpause()
+            self._bgm_paused = False
         except Exception as e:
             print(f"WARNING: Failed to resume BGM: {e}")
 
-    def play_sfx(self, sfx_name: str, volume_override: Optional[float] = None):
+    def play_sfx(self, sfx_name: str, volume_override: Optional[float] = None, priority: Optional[int] = None):
         """효과음 재생
 
+        엔진 프레임 루프 안에서는 요청을 모았다가 end_frame()에서 한 번에 재생합니다.
+
         Args:
             sfx_name: SFX 이름 (config.SFX_FILES 키)
             volume_override: 볼륨 오버라이드 (None이면 기본 볼륨 사용)
+            priority: 우선순위 오버라이드 (None이면 config.SFX_PRIORITY)
         """
         if not self.enabled:
             return
 
-        if sfx_name in self.sfx and self.sfx[sfx_name] is not None:
-            try:
-                sound = self.sfx[sfx_name]
-                if volume_override is not None:
-                    sound.set_volume(volume_override)
-                else:
-                    sound.set_volume(self.sfx_volume)
-                sound.play()
-            except Exception as e:
-                print(f"WARNING: Failed to play SFX {sfx_name}: {e}")
+        if self.get_sfx(sfx_name) is not None:
+            volume = self.sfx_volume if volume_override is None else volume_override
+            if priority is None:
+                priority = config.SFX_PRIORITY.get(sfx_name, 0)
+            self.sfx_stats["requested"] += 1
+
+            if not self._frame_driven:
+                self._play_limited(sfx_name, volume, priority)
+                return
+
+            pending = self._pending_sfx.get(sfx_name)
+            if pending is None:
+                self._pending_sfx[sfx_name] = [1, volume, priority]
+            else:
+                pending[0] += 1
+                pending[1] = max(pending[1], volume)
+                pending[2] = max(pending[2], priority)
+
+    def end_frame(self):
+        """프레임 끝: BGM 전환 처리 후 모인 SFX 요청을 효과음별로 한 번씩 재생 (GameEngine.step에서 호출)"""
+        self._frame_driven = True
+        if self.enabled:
+            self._update_bgm()
+        if not self._pending_sfx:
+            return
+
+        pending = self._pending_sfx
+        self._pending_sfx = {}
+
+        # 우선순위 높은 효과음부터 채널 배정
+        for sfx_name, (count, volume, priority) in sorted(pending.items(), key=lambda item: -item[1][2]):
+            if count > 1:
+                self.sfx_stats["merged"] += count - 1
+                boost = min(1.0 + config.SFX_COALESCE_VOLUME_STEP * (count - 1), config.SFX_COALESCE_MAX_BOOST)
+                volume = min(1.0, volume * boost)
+            self._play_limited(sfx_name, volume, priority)
+
+    def _play_limited(self, sfx_name: str, volume: float, priority: int):
+        """보이스 상한/우선순위를 적용해 실제 재생"""
+        sound = self.sfx[sfx_name]
+        try:
+            if priority >= config.SFX_PRIORITY_RESERVED and self._reserved_channels:
+                channel = self._find_reserved_channel(priority)
+                if channel is None:
+                    self._drop(sfx_name)
+                    return
+                sound.set_volume(volume)
+                channel.play(sound)
+                self._reserved_priority[id(channel)] = priority
+                self.sfx_stats["played"] += 1
+                return
+
+            limit = config.SFX_VOICE_LIMITS.get(sfx_name, config.SFX_DEFAULT_VOICE_LIMIT)
+            if sound.get_num_channels() >= limit:
+                self._drop(sfx_name)
+                return
+
+            sound.set_volume(volume)
+            if sound.play() is None:
+                # 일반 채널이 모두 사용 중
+                self._drop(sfx_name)
+                return
+            self.sfx_stats["played"] += 1
+        except Exception as e:
+            print(f"WARNING: Failed to play SFX {sfx_name}: {e}")
+
+    def _find_reserved_channel(self, priority: int) -> Optional[pygame.mixer.Channel]:
+        """비어 있는 예약 채널, 없으면 가장 낮은 우선순위 재생을 끊을 수 있는 채널"""
+        victim = None
+        for channel in self._reserved_channels:
+            if not channel.get_busy():
+                return channel
+            channel_priority = self._reserved_priority.get(id(channel), 0)
+            if channel_priority <= priority and (
+                victim is None or channel_priority < self._reserved_priority.get(id(victim), 0)
+            ):
+                victim = channel
+        if victim is not None:
+            victim.stop()
+            self.sfx_stats["stolen"] += 1
+        return victim
+
+    def _drop(self, sfx_name: str):
+        self.sfx_stats["dropped"] += 1
+        self.sfx_dropped[sfx_name] += 1
+
+    def get_sfx_stats(self) -> Dict[str, int]:
+        """SFX 재생 통계 (requested, played, merged, dropped, stolen)"""
+        return {key: self.sfx_stats[key] for key in ("requested", "played", "merged", "dropped", "stolen")}
+
+    def reset_sfx_stats(self):
+        self.sfx_stats.clear()
+        self.sfx_dropped.clear()
 
     def set_bgm_volume(self, volume: float):
         """BGM 볼륨 설정 (0.0 ~ 1.0)"""
         self.bgm_volume = max(0.0, min(1.0, volume))
 
         # 현재 재생 중인 BGM 볼륨 조정
-        if self.current_bgm and pygame.mixer.get_busy():
+        if self.current_bgm:
             try:
-                for channel in range(pygame.mixer.get_num_channels()):
-                    ch = pygame.mixer.Channel(channel)
-                    if ch.get_busy():
-                        ch.set_volume(self.bgm_volume)
+                pygame.mixer.music.set_volume(self.bgm_volume)
             except Exception as e:
                 print(f"WARNING: Failed to set BGM volume: {e}")
 
@@ -169,7 +326,7 @@ class SoundManager:
         """SFX 볼륨 설정 (0.0 ~ 1.0)"""
         self.sfx_volume = max(0.0, min(1.0, volume))
 
-        # 모든 SFX 볼륨 업데이트
+        # 로드된 SFX 볼륨 업데이트
         for sound in self.sfx.values():
             if sound is not None:
                 sound.set_volume(self.sfx_volume)
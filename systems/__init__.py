@@ -1,9 +1,17 @@
 # systems/__init__.py
-from .combat_system import CombatSystem
-from .skill_system import SkillSystem
-from .effect_system import EffectSystem
-from .spawn_system import SpawnSystem
-from .ui_system import UISystem
+# 시스템 클래스는 처음 접근할 때 해당 모듈만 import (PEP 562 지연 로딩)
+# - save_writer / episode_resource_loader 등 가벼운 모듈을 쓸 때
+#   전투/스폰 시스템(엔티티, numpy)까지 끌려오지 않도록 함
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .combat_system import CombatSystem
+    from .skill_system import SkillSystem
+    from .effect_system import EffectSystem
+    from .spawn_system import SpawnSystem
+    from .ui_system import UISystem
+    from .video_player import VideoPlayer
 
 __all__ = [
     "CombatSystem",
@@ -11,4 +19,27 @@ __all__ = [
     "EffectSystem",
     "SpawnSystem",
     "UISystem",
+    "VideoPlayer",
 ]
+
+_LAZY_IMPORTS = {
+    "CombatSystem": ".combat_system",
+    "SkillSystem": ".skill_system",
+    "EffectSystem": ".effect_system",
+    "SpawnSystem": ".spawn_system",
+    "UISystem": ".ui_system",
+    "VideoPlayer": ".video_player",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,6 +5,7 @@ CombatSystem - 전투 로직 시스템
 모든 모드에서 공유
 """
 
+import numpy as np
 import pygame
 from typing import List, Optional, Tuple
 import config
@@ -12,7 +13,9 @@ import config
 from entities.player import Player
 from entities.enemies import Enemy
 from entities.weapons import Bullet
+from entities.bullet_store import BulletStore
 from entities.collectibles import CoinGem, HealItem
+from entities.collectible_field import CollectibleField, KIND_HEAL
 
 
 class CombatSystem:
@@ -32,9 +35,9 @@ class CombatSystem:
 
     def process_bullet_enemy_collision(
         self,
-        bullets: List[Bullet],
+        bullets: BulletStore,
         enemies: List[Enemy],
-        gems: List,
+        gems: CollectibleField,
         effects: List,
         damage_numbers: List,
         screen_shake,
@@ -47,9 +50,9 @@ class CombatSystem:
         총알-적 충돌 처리
 
         Args:
-            bullets: 총알 리스트
+            bullets: 총알 저장소 (BulletStore)
             enemies: 적 리스트
-            gems: 젬 리스트 (드롭용)
+            gems: 젬 저장소 (드롭용)
             effects: 이펙트 리스트
             damage_numbers: 데미지 넘버 리스트
             screen_shake: 화면 흔들림 매니저
@@ -71,11 +74,18 @@ class CombatSystem:
 
         kills = 0
 
-        for bullet in bullets[:]:
+        # 거리 기반 충돌 후보를 배열 연산으로 한 번에 계산 (broad-phase)
+        targets = list(enemies)
+        if not targets:
+            return kills
+        centers = np.array([(enemy.pos.x, enemy.pos.y) for enemy in targets], dtype=np.float64)
+        radii = np.array([enemy.hitbox.width / 2 for enemy in targets], dtype=np.float64)
+
+        for bullet, candidate_indices in bullets.overlap_circles(centers, radii):
             if not bullet.is_alive:
                 continue
 
-            for enemy in enemies[:]:
+            for enemy in (targets[i] for i in candidate_indices):
                 if not enemy.is_alive:
                     continue
 
@@ -222,61 +232,27 @@ class CombatSystem:
     def process_player_gem_collision(
         self,
         player: Player,
-        gems: List,
+        gems: CollectibleField,
         sound_manager,
         game_data: dict,
+        dt: float = 0.016,
     ) -> Tuple[int, int]:
         """
-        플레이어-젬 충돌 처리
+        플레이어-젬 충돌 처리 (자석 이동 + 획득 판정을 CollectibleField에서 일괄 처리)
 
         Args:
             player: 플레이어
-            gems: 젬 리스트
+            gems: 젬 저장소
             sound_manager: 사운드 매니저
             game_data: 게임 데이터
+            dt: 델타 타임 (자석 이동용, 기본 60fps 기준)
 
         Returns:
             (획득한 코인, 획득한 경험치) 튜플
         """
-        coins_collected = 0
-        exp_collected = 0
-
-        for gem in gems[:]:
-            if not gem.is_alive:
-                continue
-
-            # 자석 효과 (코인 마그넷)
-            magnet_range = config.GEM_MAGNET_RANGE
-            if player.has_coin_magnet:
-                magnet_range *= 2
-
-            distance = player.pos.distance_to(gem.pos)
-
-            # 자석 범위 내면 플레이어 방향으로 이동
-            if distance < magnet_range:
-                direction = (player.pos - gem.pos).normalize()
-                gem.pos += direction * config.GEM_MAGNET_SPEED * 0.016  # 60fps 기준
-
-            # 수집 범위
-            if distance < player.hitbox.width / 2 + gem.hitbox.width / 2:
-                if isinstance(gem, CoinGem):
-                    # 코인 획득
-                    value = int(gem.value * player.coin_drop_multiplier)
-                    game_data['score'] = game_data.get('score', 0) + value
-                    game_data['uncollected_score'] = game_data.get('uncollected_score', 0) + value
-                    coins_collected += value
-                    sound_manager.play_sfx("coin_pickup")
-
-                elif isinstance(gem, HealItem):
-                    # 힐 아이템 획득
-                    heal_amount = gem.heal_amount
-                    player.hp = min(player.hp + heal_amount, player.max_hp)
-                    sound_manager.play_sfx("heal_pickup")
-
-                gem.is_alive = False
-                gems.remove(gem)
-
-        return coins_collected, exp_collected
+        gems.update(dt, player)
+        coins_collected, _ = gems.collect(player, game_data, sound_manager)
+        return coins_collected, 0
 
     def _calculate_damage(self, bullet: Bullet, enemy: Enemy) -> float:
         """
@@ -305,7 +281,7 @@ class CombatSystem:
     def _spawn_drop(
         self,
         enemy: Enemy,
-        gems: List,
+        gems: CollectibleField,
         screen_size: Tuple[int, int],
         game_data: dict,
     ):
@@ -314,41 +290,29 @@ class CombatSystem:
 
         Args:
             enemy: 처치된 적
-            gems: 젬 리스트
+            gems: 젬 저장소
             screen_size: 화면 크기
             game_data: 게임 데이터
         """
         import random
 
-        # 코인 드롭
+        # 코인 드롭 (한 번에 떨어지는 코인은 값을 합친 코인 하나로 생성)
         coin_count = getattr(enemy, 'coin_drop', 1)
         if hasattr(enemy, 'is_boss') and enemy.is_boss:
-            coin_count = config.BOSS_COIN_DROP
-
-        for _ in range(coin_count):
-            offset = pygame.math.Vector2(
-                random.uniform(-20, 20),
-                random.uniform(-20, 20)
-            )
-            coin = CoinGem(
-                pos=enemy.pos + offset,
-                screen_height=screen_size[1],
-                value=getattr(enemy, 'coin_value', config.COIN_GEM_VALUE)
-            )
-            gems.append(coin)
+            coin_count = getattr(config, 'BOSS_COIN_DROP', coin_count)
+        coin_count = int(coin_count * getattr(enemy, 'coin_multiplier', 1.0))
+        gems.spawn_coins(
+            enemy.pos, coin_count,
+            getattr(enemy, 'coin_value', CoinGem.COIN_AMOUNT), screen_size[1],
+        )
 
         # 힐 아이템 드롭 (확률)
-        heal_chance = config.HEAL_DROP_CHANCE
+        heal_chance = getattr(config, 'HEAL_DROP_CHANCE', 0.0)
         if hasattr(enemy, 'is_boss') and enemy.is_boss:
-            heal_chance = config.BOSS_HEAL_DROP_CHANCE
+            heal_chance = getattr(config, 'BOSS_HEAL_DROP_CHANCE', heal_chance)
 
         if random.random() < heal_chance:
-            heal_item = HealItem(
-                pos=enemy.pos.copy(),
-                screen_height=screen_size[1],
-                heal_amount=config.HEAL_ITEM_AMOUNT
-            )
-            gems.append(heal_item)
+            gems.spawn(KIND_HEAL, enemy.pos, HealItem.HEAL_AMOUNT, screen_size[1])
 
 
 print("INFO: combat_system.py loaded")
@@ -0,0 +1,517 @@
+# systems/content_store.py
+"""
+컴파일된 대화/에피소드 콘텐츠 스토어 (SQLite 단일 파일)
+
+흩어져 있는 대화 콘텐츠를 빌드 단계에서 하나의 인덱스 파일(content.db)로 모읍니다.
+- assets/data/episodes/<ep>/<ep>.json : 에피소드 헤더 + 장면별 행
+- assets/data/episodes/**/scripts/*.json, assets/data/dialogues/**/*.json : 문서 단위 행
+- mode_configs/config_story_dialogue.py : 검색용 대사 행만 (런타임은 기존 상수 사용)
+
+모든 대사는 lines 테이블에 (에피소드, 장면, 순서, 화자, 텍스트)로 펼쳐 인덱싱하고,
+FTS5(trigram)가 있으면 전문 검색 인덱스도 만듭니다.
+
+런타임에는 EpisodeResourceLoader / DialogueLoader / DialogueJSONLoader가 JSON을 파싱하기 전에
+스토어를 먼저 조회합니다. 에피소드 장면은 접근할 때 한 장면씩 조회합니다.
+원본 파일의 mtime/크기가 빌드 시점과 다르면(stale) 스토어를 쓰지 않고 원본 JSON으로 폴백하므로,
+편집 중인 파일(핫 리로드 포함)은 항상 원본이 우선합니다.
+
+빌드:
+    python -m systems.content_store
+    → assets/bundles/content.db
+
+조회:
+    python -m systems.content_store --search "카오스" [--speaker PILOT] [--episode ep1]
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import config
+
+
+PathLike = Union[str, Path]
+
+STORE_FORMAT_VERSION = 1
+
+# 검색 결과 기본 최대 개수
+DEFAULT_SEARCH_LIMIT = 50
+
+
+def source_key(path: PathLike) -> str:
+    """원본 경로 → 스토어 키용 상대 경로 (assets 폴더의 상위 기준, posix)"""
+    root = os.path.dirname(os.path.abspath(config.ASSET_DIR))
+    absolute = os.path.abspath(path)
+    if absolute.startswith(root + os.sep):
+        absolute = absolute[len(root) + 1:]
+    return Path(absolute).as_posix()
+
+
+# =========================================================
+# 1. 런타임 스토어 (읽기 전용)
+# =========================================================
+
+class _SceneMap(Mapping):
+    """
+    에피소드 scenes dict 대용 - 장면 ID 목록만 들고 있다가 접근할 때 한 장면씩 조회
+
+    조회한 장면 dict는 캐시하므로 호출 측 수정(dialogues 기본값 등)이 유지됩니다.
+    """
+
+    def __init__(self, store: "ContentStore", episode_key: str, scene_ids: List[str]):
+        self._store = store
+        self._episode_key = episode_key
+        self._scene_ids = scene_ids
+        self._scene_set = set(scene_ids)
+        self._loaded: Dict[str, dict] = {}
+
+    def __getitem__(self, scene_id: str) -> dict:
+        if scene_id not in self._scene_set:
+            raise KeyError(scene_id)
+        scene = self._loaded.get(scene_id)
+        if scene is None:
+            scene = self._store._query_scene(self._episode_key, scene_id)
+            self._loaded[scene_id] = scene
+        return scene
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._scene_ids)
+
+    def __len__(self) -> int:
+        return len(self._scene_ids)
+
+    def __contains__(self, scene_id) -> bool:
+        return scene_id in self._scene_set
+
+
+class ContentStore:
+    """
+    content.db 조회 (읽기 전용, 여러 스레드에서 사용 가능)
+
+    get_episode() / get_document()가 None을 반환하면 호출 측은 기존처럼 JSON을 파싱합니다.
+    """
+
+    def __init__(self, db_path: PathLike):
+        self.db_path = Path(db_path)
+        self.has_fts = False
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._sources: Dict[str, Tuple[int, int]] = {}
+        self._stale_sources = set()
+
+        self.stats = {"hits": 0, "misses": 0, "stale": 0}
+
+    @property
+    def is_open(self) -> bool:
+        return self._conn is not None
+
+    def open(self) -> bool:
+        """DB 열기 + 버전/원본 목록 확인 (실패 시 False)"""
+        if not self.db_path.exists():
+            return False
+
+        try:
+            conn = sqlite3.connect(f"file:{self.db_path.as_posix()}?mode=ro", uri=True, check_same_thread=False)
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+            if int(meta.get("version", 0)) != STORE_FORMAT_VERSION:
+                print(f"WARNING: Content store {self.db_path} has version {meta.get('version')}, "
+                      f"expected {STORE_FORMAT_VERSION} - rebuild with python -m systems.content_store")
+                conn.close()
+                return False
+            self._sources = {
+                path: (mtime_ns, size)
+                for path, mtime_ns, size in conn.execute("SELECT path, mtime_ns, size FROM sources")
+            }
+            self.has_fts = meta.get("fts") == "1"
+        except sqlite3.Error as e:
+            print(f"WARNING: Content store unreadable: {self.db_path} - {e}")
+            return False
+
+        self._conn = conn
+        print(f"INFO: Content store opened: {self.db_path} ({len(self._sources)} sources)")
+        return True
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _usable(self, path: PathLike) -> Optional[str]:
+        """스토어에 있고 원본이 빌드 이후 바뀌지 않았으면 키 반환"""
+        if self._conn is None:
+            return None
+        key = source_key(path)
+        recorded = self._sources.get(key)
+        if recorded is None:
+            self.stats["misses"] += 1
+            return None
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        if stat is None or (stat.st_mtime_ns, stat.st_size) != recorded:
+            self.stats["stale"] += 1
+            if key not in self._stale_sources:
+                self._stale_sources.add(key)
+                print(f"WARNING: Content store entry is stale, parsing source instead: {key}")
+            return None
+
+        self.stats["hits"] += 1
+        return key
+
+    # ===== 로더용 조회 =====
+
+    def get_episode(self, json_path: PathLike) -> Optional[dict]:
+        """
+        에피소드 JSON과 같은 구조의 dict (scenes는 접근할 때 조회하는 Mapping)
+
+        Args:
+            json_path: 원본 에피소드 JSON 경로 (stale 확인 기준)
+        """
+        key = self._usable(json_path)
+        if key is None:
+            return None
+        rows = self._query("SELECT header, scene_ids FROM episodes WHERE source = ?", (key,))
+        if not rows:
+            return None
+
+        data = json.loads(rows[0][0])
+        data["scenes"] = _SceneMap(self, key, json.loads(rows[0][1]))
+        return data
+
+    def _query_scene(self, episode_key: str, scene_id: str) -> dict:
+        rows = self._query("SELECT data FROM scenes WHERE source = ? AND id = ?", (episode_key, scene_id))
+        return json.loads(rows[0][0]) if rows else {}
+
+    def get_document(self, json_path: PathLike) -> Optional[Any]:
+        """대화 JSON 파일 하나의 내용 (없거나 stale이면 None)"""
+        key = self._usable(json_path)
+        if key is None:
+            return None
+        rows = self._query("SELECT data FROM documents WHERE source = ?", (key,))
+        return json.loads(rows[0][0]) if rows else None
+
+    # ===== 대사 조회 / 검색 =====
+
+    def find_lines(
+        self,
+        episode: str = None,
+        scene: str = None,
+        speaker: str = None,
+        limit: int = None,
+    ) -> List[dict]:
+        """에피소드/장면/화자로 대사 조회 (원본 순서)"""
+        where, params = self._line_filters(episode, scene, speaker)
+        sql = f"SELECT source, episode, scene, idx, speaker, text FROM lines{where} ORDER BY id"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return [self._line_dict(row) for row in self._query(sql, tuple(params))]
+
+    def search(
+        self,
+        text: str,
+        episode: str = None,
+        scene: str = None,
+        speaker: str = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> List[dict]:
+        """
+        대사 전문 검색 (부분 문자열 일치)
+
+        FTS5 trigram 인덱스는 3글자 이상에서만 쓸 수 있으므로 짧은 검색어는 LIKE로 찾습니다.
+        """
+        where, params = self._line_filters(episode, scene, speaker, prefix="lines.")
+        if self.has_fts and len(text) >= 3:
+            phrase = '"' + text.replace('"', '""') + '"'
+            join = " AND " if where else " WHERE "
+            sql = (
+                "SELECT lines.source, lines.episode, lines.scene, lines.idx, lines.speaker, lines.text "
+                f"FROM lines_fts JOIN lines ON lines.id = lines_fts.rowid{where}{join}lines_fts MATCH ? "
+                "ORDER BY lines.id LIMIT ?"
+            )
+            params += [f"text : {phrase}", int(limit)]
+        else:
+            pattern = "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            join = " AND " if where else " WHERE "
+            sql = (
+                "SELECT lines.source, lines.episode, lines.scene, lines.idx, lines.speaker, lines.text "
+                f"FROM lines{where}{join}lines.text LIKE ? ESCAPE '\\' ORDER BY lines.id LIMIT ?"
+            )
+            params += [pattern, int(limit)]
+        return [self._line_dict(row) for row in self._query(sql, tuple(params))]
+
+    def speakers(self) -> List[Tuple[str, int]]:
+        """화자별 대사 수 (많은 순)"""
+        return self._query(
+            "SELECT speaker, COUNT(*) FROM lines WHERE speaker != '' GROUP BY speaker ORDER BY COUNT(*) DESC"
+        )
+
+    @staticmethod
+    def _line_filters(episode, scene, speaker, prefix: str = "") -> Tuple[str, list]:
+        clauses, params = [], []
+        for column, value in (("episode", episode), ("scene", scene), ("speaker", speaker)):
+            if value:
+                clauses.append(f"{prefix}{column} = ?")
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    @staticmethod
+    def _line_dict(row) -> dict:
+        source, episode, scene, idx, speaker, text = row
+        return {"source": source, "episode": episode, "scene": scene,
+                "index": idx, "speaker": speaker, "text": text}
+
+
+# =========================================================
+# 2. 스토어 빌드 (오프라인)
+# =========================================================
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE sources (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER);
+CREATE TABLE episodes (source TEXT PRIMARY KEY, id TEXT, header TEXT, scene_ids TEXT);
+CREATE TABLE scenes (source TEXT, id TEXT, ord INTEGER, data TEXT, PRIMARY KEY (source, id));
+CREATE TABLE documents (source TEXT PRIMARY KEY, data TEXT);
+CREATE TABLE lines (
+    id INTEGER PRIMARY KEY, source TEXT, episode TEXT, scene TEXT,
+    idx INTEGER, speaker TEXT, text TEXT
+);
+CREATE INDEX lines_episode_scene ON lines (episode, scene);
+CREATE INDEX lines_speaker ON lines (speaker);
+"""
+
+
+def default_content_sources() -> Tuple[List[Path], List[Path]]:
+    """
+    기본 빌드 대상 (에피소드 JSON 목록, 대화 문서 JSON 목록)
+    """
+    episodes_dir = config.ASSET_DIR / "data" / "episodes"
+    dialogues_dir = config.ASSET_DIR / "data" / "dialogues"
+
+    episodes = sorted(
+        path for path in episodes_dir.glob("*/*.json") if path.stem == path.parent.name
+    ) if episodes_dir.exists() else []
+    documents = sorted(episodes_dir.rglob("scripts/*.json")) if episodes_dir.exists() else []
+    if dialogues_dir.exists():
+        documents += sorted(dialogues_dir.rglob("*.json"))
+    return episodes, documents
+
+
+def _walk_lines(node: Any) -> Iterator[Tuple[str, str]]:
+    """중첩 dict/list에서 대사 (speaker, text) 추출 - "text" 문자열을 가진 dict"""
+    if isinstance(node, dict):
+        text = node.get("text")
+        if isinstance(text, str) and text:
+            speaker = node.get("speaker", "")
+            yield (speaker if isinstance(speaker, str) else "", text)
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                yield from _walk_lines(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _walk_lines(value)
+
+
+def _fts_available(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._fts_probe USING fts5(x, tokenize='trigram')")
+        conn.execute("DROP TABLE temp._fts_probe")
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def build_content_store(
+    episodes: List[Path] = None,
+    documents: List[Path] = None,
+    out_path: PathLike = None,
+    include_story_config: bool = True,
+) -> dict:
+    """
+    content.db 빌드
+
+    Returns:
+        빌드 요약 {"sources", "episodes", "scenes", "documents", "lines", "fts"}
+    """
+    if episodes is None or documents is None:
+        default_episodes, default_documents = default_content_sources()
+        episodes = default_episodes if episodes is None else episodes
+        documents = default_documents if documents is None else documents
+
+    out_path = Path(out_path) if out_path else config.CONTENT_STORE_PATH
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(str(tmp_path))
+    conn.executescript(_SCHEMA)
+    summary = {"sources": 0, "episodes": 0, "scenes": 0, "documents": 0, "lines": 0, "fts": False}
+
+    def add_source(path: Path) -> str:
+        key = source_key(path)
+        stat = os.stat(path)
+        conn.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?)", (key, stat.st_mtime_ns, stat.st_size))
+        summary["sources"] += 1
+        return key
+
+    def add_lines(key: str, episode: str, scene: str, node: Any):
+        rows = [(key, episode, scene, idx, speaker, text) for idx, (speaker, text) in enumerate(_walk_lines(node))]
+        conn.executemany(
+            "INSERT INTO lines (source, episode, scene, idx, speaker, text) VALUES (?, ?, ?, ?, ?, ?)", rows
+        )
+        summary["lines"] += len(rows)
+
+    def read_json(path: Path) -> Optional[Any]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"WARNING: Skipping {path}: {e}")
+            return None
+
+    for path in episodes:
+        data = read_json(path)
+        if not isinstance(data, dict):
+            continue
+        key = add_source(path)
+        episode_id = data.get("id", path.stem)
+        scenes = data.get("scenes", {}) or {}
+        header = {name: value for name, value in data.items() if name != "scenes"}
+        conn.execute("INSERT INTO episodes VALUES (?, ?, ?, ?)",
+                     (key, episode_id, json.dumps(header, ensure_ascii=False),
+                      json.dumps(list(scenes), ensure_ascii=False)))
+        for order, (scene_id, scene) in enumerate(scenes.items()):
+            conn.execute("INSERT INTO scenes VALUES (?, ?, ?, ?)",
+                         (key, scene_id, order, json.dumps(scene, ensure_ascii=False)))
+            add_lines(key, episode_id, scene_id, scene)
+        summary["episodes"] += 1
+        summary["scenes"] += len(scenes)
+
+    for path in documents:
+        data = read_json(path)
+        if data is None:
+            continue
+        key = add_source(path)
+        conn.execute("INSERT INTO documents VALUES (?, ?)", (key, json.dumps(data, ensure_ascii=False)))
+        # 최상위 키를 장면으로 (장면 파일 하나짜리 스크립트는 파일명)
+        if isinstance(data, dict) and "dialogues" not in data:
+            for scene, value in data.items():
+                add_lines(key, "", str(scene), value)
+        else:
+            add_lines(key, "", path.stem, data)
+        summary["documents"] += 1
+
+    # 파이썬 상수로 남아 있는 스토리 대사 (검색 전용 - 런타임은 모듈 상수를 그대로 사용)
+    if include_story_config:
+        from mode_configs import config_story_dialogue
+        module_path = Path(config_story_dialogue.__file__)
+        key = source_key(module_path)
+        for name, value in vars(config_story_dialogue).items():
+            if name.isupper() and isinstance(value, (dict, list)):
+                if isinstance(value, dict):
+                    for scene, scene_value in value.items():
+                        add_lines(key, "", f"{name}.{scene}", scene_value)
+                else:
+                    add_lines(key, "", name, value)
+
+    summary["fts"] = _fts_available(conn)
+    if summary["fts"]:
+        conn.executescript("""
+            CREATE VIRTUAL TABLE lines_fts USING fts5(
+                speaker, text, content='lines', content_rowid='id', tokenize='trigram'
+            );
+            INSERT INTO lines_fts (rowid, speaker, text) SELECT id, speaker, text FROM lines;
+        """)
+
+    conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+        ("version", str(STORE_FORMAT_VERSION)),
+        ("fts", "1" if summary["fts"] else "0"),
+    ])
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+
+    os.replace(tmp_path, out_path)
+    return summary
+
+
+# =========================================================
+# 3. 전역 스토어
+# =========================================================
+
+_content_store: Optional[ContentStore] = None
+_content_store_checked = False
+
+
+def get_content_store() -> Optional[ContentStore]:
+    """
+    전역 콘텐츠 스토어 반환 (없거나 비활성화면 None - 호출 측은 JSON 파싱)
+    """
+    global _content_store, _content_store_checked
+    if not getattr(config, "CONTENT_STORE_ENABLED", False):
+        return None
+    if not _content_store_checked:
+        _content_store_checked = True
+        store = ContentStore(config.CONTENT_STORE_PATH)
+        _content_store = store if store.open() else None
+    return _content_store
+
+
+def close_content_store():
+    """스토어 닫기 (다음 get_content_store()에서 다시 열림)"""
+    global _content_store, _content_store_checked
+    if _content_store is not None:
+        _content_store.close()
+    _content_store = None
+    _content_store_checked = False
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Build or query the compiled dialogue/episode content store")
+    parser.add_argument("--out", default=None, help="output file (default: %s)" % config.CONTENT_STORE_PATH)
+    parser.add_argument("--search", help="full-text search instead of building")
+    parser.add_argument("--speaker", help="filter lines by speaker")
+    parser.add_argument("--episode", help="filter lines by episode id")
+    parser.add_argument("--scene", help="filter lines by scene id")
+    parser.add_argument("--limit", type=int, default=DEFAULT_SEARCH_LIMIT)
+    args = parser.parse_args()
+
+    if args.search or args.speaker or args.episode or args.scene:
+        store = ContentStore(Path(args.out) if args.out else config.CONTENT_STORE_PATH)
+        if not store.open():
+            print("ERROR: Content store not found - build it first with python -m systems.content_store")
+            return
+        if args.search:
+            lines = store.search(args.search, args.episode, args.scene, args.speaker, args.limit)
+        else:
+            lines = store.find_lines(args.episode, args.scene, args.speaker, args.limit)
+        for line in lines:
+            location = f"{line['episode']}/{line['scene']}" if line["episode"] else line["scene"]
+            print(f"{line['source']} [{location} #{line['index']}] {line['speaker']}: {line['text']}")
+        print(f"INFO: {len(lines)} lines")
+        store.close()
+        return
+
+    start = time.perf_counter()
+    summary = build_content_store(out_path=args.out)
+    elapsed = time.perf_counter() - start
+    out_path = Path(args.out) if args.out else config.CONTENT_STORE_PATH
+    print(f"INFO: Built content store {out_path}: {summary['episodes']} episodes, {summary['scenes']} scenes, "
+          f"{summary['documents']} documents, {summary['lines']} lines "
+          f"(FTS: {'yes' if summary['fts'] else 'no'}) in {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+# systems/cutscene_image_service.py
+"""
+CutsceneImageService - 초상화/컷씬 이미지 공유 서비스
+
+컷씬 효과, NarrativeMode 등이 각자 pygame.image.load + smoothscale 하던
+초상화/배경/컷씬 이미지를 한 곳에서 디코딩하고 크기별로 공유합니다.
+
+- 경로 해석: EpisodeResourceLoader.resolve_path (에피소드 폴더 → shared 폴백)
+- 장면이 참조하는 배경/초상화/효과 이미지 경로 수집 (collect_scene_images)
+  선행 디코딩은 SegmentPrefetcher가 다음 세그먼트분만 백그라운드에서 수행
+  (convert/스케일은 메인 스레드에서 최초 요청 시)
+- 크기 지정 요청은 사전 빌드 에셋 번들(asset_bundle)에 있으면 디코딩 없이 생성
+- 반환 Surface는 공유 객체이므로 수정이 필요하면 copy() 후 사용
+- 디코딩 원본과 변환 Surface 캐시는 각각 바이트 상한 LRU
+  (config.CUTSCENE_IMAGE_DECODED_MAX_BYTES / CUTSCENE_IMAGE_SURFACE_MAX_BYTES)
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable, Iterable, List, Optional, Tuple, Union
+
+import pygame
+
+import config
+from asset_bundle import get_asset_bundle
+from systems.episode_resource_loader import EpisodeResourceLoader, get_episode_loader
+from systems.segment_prefetcher import get_segment_prefetcher
+
+
+PathLike = Union[str, Path]
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+# effect_data의 이미지 목록 키 → 리소스 폴더 (배경만 backgrounds, 나머지는 cutscene_images)
+_EFFECT_IMAGE_FOLDERS = {
+    "background": "backgrounds",
+}
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+class SurfaceLRU:
+    """바이트 상한 LRU Surface 캐시 (상한을 넘는 단일 Surface는 보관하지 않음)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evicted = 0
+        self._entries: "OrderedDict[Hashable, Tuple[pygame.Surface, int]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[pygame.Surface]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, surface: pygame.Surface):
+        self.pop(key)
+        size = _surface_bytes(surface)
+        if size > self.max_bytes:
+            return
+        while self._entries and self.bytes + size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evicted += 1
+        self._entries[key] = (surface, size)
+        self.bytes += size
+
+    def pop(self, key: Hashable) -> Optional[pygame.Surface]:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self.bytes -= entry[1]
+        return entry[0]
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CutsceneImageService:
+    """초상화/컷씬 이미지 디코딩 및 크기별 Surface 공유"""
+
+    def __init__(self, loader: EpisodeResourceLoader):
+        self.loader = loader
+
+        # 디코딩된 원본 (convert 전)
+        self._decoded = SurfaceLRU(config.CUTSCENE_IMAGE_DECODED_MAX_BYTES)
+        self._decoded_lock = threading.Lock()
+
+        # (경로, 크기, 알파, smooth) → 변환/스케일 완료 Surface (메인 스레드 전용)
+        self._surfaces = SurfaceLRU(config.CUTSCENE_IMAGE_SURFACE_MAX_BYTES)
+
+        self.stats = {"hits": 0, "misses": 0, "decoded": 0, "failed": 0}
+
+    # === 경로 해석 ===
+
+    def resolve_portrait(self, speaker: str, episode_id: str = None) -> Optional[Path]:
+        """
+        화자 초상화 경로 (CHARACTER_PORTRAITS → 에피소드/shared portraits)
+
+        NARRATOR는 android 이미지를 사용합니다.
+        """
+        if not speaker:
+            return None
+
+        try:
+            from mode_configs.config_story_dialogue import CHARACTER_PORTRAITS
+            configured = CHARACTER_PORTRAITS.get(speaker)
+        except ImportError:
+            configured = None
+
+        if configured and Path(configured).exists():
+            return Path(configured)
+
+        name = "android" if speaker.upper() == "NARRATOR" else speaker.lower()
+        for ext in (".png", ".jpg"):
+            path = self.loader.get_portrait(f"portrait_{name}{ext}", episode_id)
+            if path:
+                return path
+        return None
+
+    def resolve(self, resource_type: str, filename: str, episode_id: str = None) -> Optional[Path]:
+        """리소스 파일명 → 실제 경로 (이미 존재하는 경로면 그대로)"""
+        if not filename:
+            return None
+        path = self.loader.resolve_path(resource_type, filename, episode_id)
+        if path:
+            return path
+        direct = Path(filename)
+        return direct if direct.exists() else None
+
+    # === Surface 조회 ===
+
+    def get_image(
+        self,
+        path: Optional[PathLike],
+        size: Optional[Tuple[int, int]] = None,
+        alpha: bool = True,
+        smooth: bool = True,
+    ) -> Optional[pygame.Surface]:
+        """
+        이미지 Surface (공유) - 실패 시 None
+
+        Args:
+            path: 이미지 파일 경로
+            size: 스케일 크기 (None이면 원본 크기)
+            alpha: True면 convert_alpha(), False면 convert()
+            smooth: True면 smoothscale, False면 scale
+        """
+        if not path:
+            return None
+        key_path = str(path)
+        key = (key_path, tuple(size) if size else None, alpha, smooth)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.stats["hits"] += 1
+            return surface
+
+        self.stats["misses"] += 1
+
+        # 사전 빌드 번들에 같은 크기/스케일 방식 엔트리가 있으면 디코딩 생략
+        bundle = get_asset_bundle() if size else None
+        surface = bundle.load(key_path, size, smooth=smooth, alpha=alpha) if bundle else None
+        if surface is not None:
+            self._surfaces.put(key, surface)
+            return surface
+
+        raw = self._get_decoded(key_path)
+        if raw is None:
+            return None
+
+        surface = raw.convert_alpha() if alpha else raw.convert()
+        if size and surface.get_size() != tuple(size):
+            scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+            surface = scale(surface, tuple(size))
+        self._surfaces.put(key, surface)
+        return surface
+
+    def get_portrait(
+        self, speaker: str, size: Optional[Tuple[int, int]] = None, episode_id: str = None
+    ) -> Optional[pygame.Surface]:
+        """화자 초상화 (size None이면 원본 크기)"""
+        return self.get_image(self.resolve_portrait(speaker, episode_id), size)
+
+    def get_background(
+        self, filename: str, size: Tuple[int, int], episode_id: str = None
+    ) -> Optional[pygame.Surface]:
+        """배경 이미지 (불투명 convert + smoothscale)"""
+        path = self.resolve("backgrounds", filename, episode_id)
+        return self.get_image(path, size, alpha=False)
+
+    def get_effect_image(
+        self, filename: str, size: Optional[Tuple[int, int]] = None, episode_id: str = None
+    ) -> Optional[pygame.Surface]:
+        """컷씬 이미지 (메모리, 문서, 조각, 홀로그램 등)"""
+        return self.get_image(self.resolve("cutscene_images", filename, episode_id), size)
+
+    def _get_decoded(self, path: str) -> Optional[pygame.Surface]:
+        """디코딩된 원본 (캐시/선행 로드 결과가 없으면 즉시 디코딩)"""
+        with self._decoded_lock:
+            raw = self._decoded.get(path)
+        if raw is not None:
+            return raw
+
+        # 세그먼트 선행 로드 결과가 있으면 사용 (한 번 넘겨받으면 변환 Surface만 캐시 - 원본은 보관 안 함)
+        raw = get_segment_prefetcher().get(path)
+        if raw is not None:
+            return raw
+        raw = self._decode(path)
+        if raw is not None:
+            with self._decoded_lock:
+                if path not in self._decoded:
+                    self._decoded.put(path, raw)
+        return raw
+
+    def _decode(self, path: str) -> Optional[pygame.Surface]:
+        try:
+            raw = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError, OSError) as e:
+            print(f"WARNING: Failed to load cutscene image: {path} - {e}")
+            self.stats["failed"] += 1
+            return None
+        self.stats["decoded"] += 1
+        return raw
+
+    # === 장면 이미지 수집 (SegmentPrefetcher용) ===
+
+    def collect_scene_images(self, scene: dict, episode_id: str = None, portraits: bool = True) -> List[Path]:
+        """장면 하나가 참조하는 배경/효과 이미지 (+ 화자 초상화) 경로 목록"""
+        paths: List[Path] = []
+
+        def add(path: Optional[Path]):
+            if path and path not in paths:
+                paths.append(path)
+
+        add(self.resolve("backgrounds", scene.get("background", ""), episode_id))
+        speakers = []
+        for dialogue in scene.get("dialogues", []):
+            speaker = dialogue.get("speaker", "")
+            if speaker and speaker not in speakers:
+                speakers.append(speaker)
+            add(self.resolve("backgrounds", dialogue.get("background", ""), episode_id))
+        for key, value in scene.get("effect_data", {}).items():
+            folder = _EFFECT_IMAGE_FOLDERS.get(key, "cutscene_images")
+            for name in _image_names(value):
+                add(self.resolve(folder, name, episode_id) or self.resolve("backgrounds", name, episode_id))
+
+        if portraits:
+            for speaker in speakers:
+                add(self.resolve_portrait(speaker, episode_id))
+        return paths
+
+    # === 캐시 관리 ===
+
+    def get_cache_stats(self) -> dict:
+        with self._decoded_lock:
+            decoded = {"decoded_count": len(self._decoded), "decoded_bytes": self._decoded.bytes,
+                       "decoded_evicted": self._decoded.evicted}
+        return dict(self.stats, surface_count=len(self._surfaces), surface_bytes=self._surfaces.bytes,
+                    surface_evicted=self._surfaces.evicted, **decoded)
+
+    def clear(self):
+        """캐시 초기화 (에피소드 종료 / 에피소드 리소스 변경 시)"""
+        with self._decoded_lock:
+            self._decoded.clear()
+        self._surfaces.clear()
+
+
+def _image_names(value) -> Iterable[str]:
+    """effect_data 값에서 이미지 파일명만 추출 (문자열 또는 문자열 리스트)"""
+    values = value if isinstance(value, list) else [value]
+    for item in values:
+        if isinstance(item, str) and item.lower().endswith(IMAGE_EXTENSIONS):
+            yield item
+
+
+# === 전역 서비스 인스턴스 ===
+
+_global_image_service: Optional[CutsceneImageService] = None
+
+
+def get_cutscene_image_service() -> CutsceneImageService:
+    """전역 컷씬 이미지 서비스 반환 (싱글톤, 전역 에피소드 로더 사용)"""
+    global _global_image_service
+
+    if _global_image_service is None:
+        _global_image_service = CutsceneImageService(get_episode_loader())
+
+    return _global_image_service
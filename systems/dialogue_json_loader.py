@@ -7,6 +7,8 @@ import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+from systems.content_store import get_content_store
+
 
 class DialogueJSONLoader:
     """JSON 대화 파일 로더"""
@@ -22,6 +24,12 @@ class DialogueJSONLoader:
         if filepath_str in self._cache:
             return self._cache[filepath_str]
 
+        store = get_content_store()
+        data = store.get_document(filepath) if store else None
+        if data is not None:
+            self._cache[filepath_str] = data
+            return data
+
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -31,6 +39,10 @@ class DialogueJSONLoader:
             print(f"WARNING: Failed to load {filepath}: {e}")
             return {}
 
+    def invalidate(self, filepath: Path):
+        """파일 하나의 캐시만 제거 (다음 접근 시 다시 로드)"""
+        self._cache.pop(str(filepath), None)
+
     # =========================================================
     # Combat Dialogues
     # =========================================================
@@ -15,6 +15,8 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from systems.content_store import get_content_store
+
 
 class DialogueLoader:
     """JSON 기반 대화 스크립트 로더"""
@@ -55,8 +57,11 @@ class DialogueLoader:
             return self.EMPTY_SCENE.copy()
 
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            store = get_content_store()
+            data = store.get_document(json_path) if store else None
+            if data is None:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
 
             # dialogues 필드 보장
             if "dialogues" not in data:
@@ -24,6 +24,8 @@ import json
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+from systems.content_store import get_content_store
+
 
 class EpisodeResourceLoader:
     """에피소드별 리소스 통합 로더"""
@@ -88,8 +90,12 @@ class EpisodeResourceLoader:
             return self.EMPTY_EPISODE.copy()
 
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # 컴파일된 스토어 우선 (장면은 접근할 때 조회), 없거나 변경된 파일이면 JSON 파싱
+            store = get_content_store()
+            data = store.get_episode(json_path) if store else None
+            if data is None:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
 
             # 필수 필드 보장
             if "scenes" not in data:
@@ -111,6 +117,13 @@ class EpisodeResourceLoader:
             print(f"WARNING: Failed to load episode '{episode_id}': {e}")
             return self.EMPTY_EPISODE.copy()
 
+    def get_episode_data(self, episode_id: str = None) -> dict:
+        """에피소드 전체 데이터 (현재 에피소드를 바꾸지 않음, 캐시 사용)"""
+        ep_id = episode_id or self.current_episode_id
+        if ep_id == self.current_episode_id and self.current_episode_data:
+            return self.current_episode_data
+        return self._load_episode(ep_id)
+
     # === 에피소드 폴더 경로 ===
 
     def get_episode_path(self, episode_id: str = None) -> Path:
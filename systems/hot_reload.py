@@ -0,0 +1,234 @@
+# systems/hot_reload.py
+"""
+HotReloader - 에셋 파일 변경 감시 및 부분 리로드 (개발용)
+
+VFX 설정/이미지, 에피소드 JSON, 대화 JSON의 수정 시각(mtime)을 주기적으로 확인해
+바뀐 파일에 해당하는 항목만 다시 로드합니다. 추가 의존성 없이 os.scandir 폴링만 사용하며,
+엔진 루프가 매 프레임 poll()을 호출합니다 (config.HOT_RELOAD_POLL_INTERVAL마다 실제 확인).
+
+감시 대상:
+- assets/config/vfx_effects.json  → VFXManager.reload_config() (바뀐 효과만, 새 이미지만 디코딩)
+- assets/images/vfx/combat/**.png → VFXManager.reload_image() (그 이미지 하나만 디코딩)
+- assets/data/episodes/<ep>/<ep>.json → EpisodeResourceLoader.reload_episode(ep)
+- assets/data/episodes/**/scripts/*.json, assets/data/dialogues/**.json → 해당 장면/파일 캐시만 갱신
+
+리로드가 끝나면 subscribe()로 등록된 콜백에 (kind, key)를 알립니다.
+GameEngine은 이를 모드 스택의 GameMode.on_asset_reload()로 전달합니다.
+
+    kind: "vfx_effect"  key: "category/variant"
+          "vfx_image"   key: 이미지 경로 (슬래시 표기)
+          "episode"     key: 에피소드 ID
+          "dialogue"    key: 장면 ID (파일명)
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import config
+
+
+# 파일 상태 (mtime_ns, size) - 둘 중 하나라도 바뀌면 변경으로 판단
+FileStamp = Tuple[int, int]
+
+
+# =========================================================
+# 1. mtime 폴링 감시기
+# =========================================================
+
+class FileWatcher:
+    """
+    mtime 폴링 파일 감시기
+
+    watch()로 등록한 파일/폴더를 check()할 때마다 다시 스캔해
+    추가/수정/삭제된 파일 경로로 콜백을 호출합니다.
+    등록 시점의 상태를 기준으로 삼으므로 시작 직후에는 콜백이 호출되지 않습니다.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._targets: List[Tuple[Path, str, Callable[[Path], None]]] = []
+        self._stamps: List[Dict[Path, FileStamp]] = []
+        self._next_check = 0.0
+        self.stats = {"checks": 0, "changes": 0, "last_scan_ms": 0.0}
+
+    def watch(self, path: Path, callback: Callable[[Path], None], pattern: str = ""):
+        """
+        감시 대상 등록
+
+        Args:
+            path: 파일 또는 폴더 경로
+            callback: 바뀐 파일 경로를 받는 함수
+            pattern: 폴더일 때 파일 확장자 필터 (예: ".json", 하위 폴더 포함)
+        """
+        path = Path(path)
+        self._targets.append((path, pattern, callback))
+        self._stamps.append(self._scan(path, pattern))
+
+    def poll(self, now: Optional[float] = None) -> int:
+        """interval이 지났을 때만 check() (엔진 루프에서 매 프레임 호출)"""
+        now = time.monotonic() if now is None else now
+        if now < self._next_check:
+            return 0
+        self._next_check = now + self.interval
+        return self.check()
+
+    def check(self) -> int:
+        """모든 감시 대상을 즉시 스캔하고 바뀐 파일 수 반환"""
+        start = time.perf_counter()
+        changed: List[Tuple[Callable[[Path], None], Path]] = []
+
+        for index, (path, pattern, callback) in enumerate(self._targets):
+            old = self._stamps[index]
+            new = self._scan(path, pattern)
+            if new == old:
+                continue
+            for file_path in sorted(set(old) | set(new)):
+                if old.get(file_path) != new.get(file_path):
+                    changed.append((callback, file_path))
+            self._stamps[index] = new
+
+        self.stats["checks"] += 1
+        self.stats["changes"] += len(changed)
+        self.stats["last_scan_ms"] = (time.perf_counter() - start) * 1000.0
+
+        # 스캔을 모두 마친 뒤 콜백 (콜백 안에서 파일을 다시 읽어도 다음 check에 중복 감지되지 않음)
+        for callback, file_path in changed:
+            try:
+                callback(file_path)
+            except Exception as e:
+                print(f"ERROR: Hot reload failed for {file_path}: {e}")
+        return len(changed)
+
+    @staticmethod
+    def _scan(path: Path, pattern: str) -> Dict[Path, FileStamp]:
+        """파일/폴더의 현재 (mtime_ns, size) 스냅샷"""
+        stamps: Dict[Path, FileStamp] = {}
+        if path.is_file():
+            stat = path.stat()
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+            return stamps
+        if not path.is_dir():
+            return stamps
+
+        pending = [path]
+        while pending:
+            directory = pending.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(Path(entry.path))
+                elif entry.name.endswith(pattern):
+                    stat = entry.stat()
+                    stamps[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+
+# =========================================================
+# 2. 에셋 핫 리로더
+# =========================================================
+
+class HotReloader:
+    """VFX/에피소드/대화 파일 감시 → 바뀐 항목만 리로드 → 구독자 알림"""
+
+    VFX_CONFIG_PATH = Path("assets/config/vfx_effects.json")
+    VFX_IMAGE_DIR = Path("assets/images/vfx/combat")
+
+    def __init__(self, interval: float = None):
+        self.watcher = FileWatcher(config.HOT_RELOAD_POLL_INTERVAL if interval is None else interval)
+        self._listeners: List[Callable[[str, str], None]] = []
+        self.episodes_dir = config.ASSET_DIR / "data" / "episodes"
+        self.dialogues_dir = config.ASSET_DIR / "data" / "dialogues"
+
+        self.watcher.watch(self.VFX_CONFIG_PATH, self._on_vfx_config)
+        self.watcher.watch(self.VFX_IMAGE_DIR, self._on_vfx_image, ".png")
+        self.watcher.watch(self.episodes_dir, self._on_episode_file, ".json")
+        self.watcher.watch(self.dialogues_dir, self._on_dialogue_file, ".json")
+        print(f"INFO: HotReloader watching VFX/episode/dialogue files "
+              f"(every {self.watcher.interval:.1f}s)")
+
+    def subscribe(self, callback: Callable[[str, str], None]):
+        """리로드 알림 구독 - callback(kind, key)"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[str, str], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def poll(self, now: Optional[float] = None) -> int:
+        """엔진 루프에서 매 프레임 호출"""
+        return self.watcher.poll(now)
+
+    def _notify(self, kind: str, key: str):
+        for callback in list(self._listeners):
+            try:
+                callback(kind, key)
+            except Exception as e:
+                print(f"ERROR: Hot reload listener failed ({kind} {key}): {e}")
+
+    # ===== 파일별 처리 =====
+
+    @staticmethod
+    def _loaded_vfx_manager():
+        """이미 생성된 VFXManager만 반환 (리로드 때문에 전체 프리로드를 일으키지 않음)"""
+        from systems.vfx_manager import VFXManager
+        instance = VFXManager._instance
+        return instance if instance is not None and instance._initialized else None
+
+    def _on_vfx_config(self, path: Path):
+        vfx = self._loaded_vfx_manager()
+        if vfx is None:
+            return
+        for category, variant in vfx.reload_config():
+            self._notify("vfx_effect", f"{category}/{variant}")
+
+    def _on_vfx_image(self, path: Path):
+        vfx = self._loaded_vfx_manager()
+        if vfx is None:
+            return
+        # 감시 경로(Windows는 역슬래시)와 설정 JSON 경로(슬래시)를 같은 표기로 비교
+        if not vfx.reload_image(path.as_posix()) and path.exists():
+            # 폴더에 새로 추가된 이미지 - 폴더 스캔은 캐시에 없는 파일만 디코딩
+            vfx.load_from_folders()
+        self._notify("vfx_image", path.as_posix())
+
+    def _on_episode_file(self, path: Path):
+        # <ep>/<ep>.json: 에피소드 메타데이터 + 장면
+        if path.stem == path.parent.name:
+            from systems.episode_resource_loader import get_episode_loader
+            loader = get_episode_loader()
+            if path.stem in loader.cache or path.stem == loader.current_episode_id:
+                loader.reload_episode(path.stem)
+                print(f"INFO: Hot reloaded episode {path.stem}")
+            self._notify("episode", path.stem)
+        elif path.parent.name == "scripts":
+            self._reload_scene_script(path)
+
+    def _on_dialogue_file(self, path: Path):
+        from systems.dialogue_json_loader import get_dialogue_json_loader
+        get_dialogue_json_loader().invalidate(path)
+        self._reload_scene_script(path)
+
+    def _reload_scene_script(self, path: Path):
+        """레거시 DialogueLoader 장면 파일 (전역 로더에 캐시된 경우만 다시 읽음)"""
+        from systems.dialogue_loader import get_dialogue_loader
+        loader = get_dialogue_loader()
+        if loader.scripts_path.resolve() == path.parent.resolve() and path.stem in loader.cache:
+            loader.reload_scene(path.stem)
+        self._notify("dialogue", path.stem)
+
+
+_hot_reloader: Optional[HotReloader] = None
+
+
+def get_hot_reloader() -> HotReloader:
+    """전역 HotReloader 인스턴스 반환 (첫 호출 시 감시 시작)"""
+    global _hot_reloader
+    if _hot_reloader is None:
+        _hot_reloader = HotReloader()
+    return _hot_reloader
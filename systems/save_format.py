@@ -0,0 +1,386 @@
+# systems/save_format.py
+"""
+SaveFormat - 압축 바이너리 저장 포맷 + 스키마 버전/마이그레이션
+
+바이너리 포맷 (.sav, 리틀 엔디언):
+    [헤더]       magic "SSAV" | 포맷 버전 u16 | 스키마 버전 u16 | 섹션 수 u16 | 섹션 테이블 CRC32 u32
+    [섹션 테이블] (이름 길이 u8 | 플래그 u8 | 이름 | 오프셋 u32 | 길이 u32 | CRC32 u32) x 섹션 수
+    [섹션 데이터] 최상위 키별 압축 JSON (플래그 bit0 = zlib)
+
+- 저장 데이터의 최상위 키 하나가 섹션 하나 (inventory / progress 등)
+- 로드 시 CRC만 검증하고, 섹션 디코딩은 처음 접근할 때 수행 (LazySaveData)
+- "version" 키는 헤더의 스키마 버전으로 저장됨
+
+스키마 마이그레이션:
+    @register_migration("campaign", 1)
+    def _campaign_v1_to_v2(data): ...
+
+디버깅용 변환:
+    python -m systems.save_format info saves/campaign_progress.sav
+    python -m systems.save_format to-json saves/campaign_progress.sav out.json
+    python -m systems.save_format to-binary save_data.json save_data.sav
+"""
+
+import json
+import struct
+import zlib
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+MAGIC = b"SSAV"
+FORMAT_VERSION = 1
+BINARY_SUFFIX = ".sav"
+JSON_SUFFIX = ".json"
+
+_HEADER = struct.Struct("<4sHHHI")
+_ENTRY_PREFIX = struct.Struct("<BB")
+_ENTRY_BODY = struct.Struct("<III")
+
+FLAG_ZLIB = 0x01
+COMPRESS_MIN_BYTES = 64  # 이보다 작은 섹션은 압축하지 않음 (zlib 헤더 오버헤드)
+
+
+class SaveFormatError(ValueError):
+    """바이너리 저장 파일 손상/형식 오류"""
+
+
+# =========================================================
+# 스키마 버전 및 마이그레이션
+# =========================================================
+
+# 저장 종류별 현재 스키마 버전
+SCHEMA_VERSIONS: Dict[str, int] = {
+    "game": 1,       # save_data.json (크레딧, 영구 업그레이드, 인벤토리)
+    "wave": 2,       # saves/wave_progress.json
+    "campaign": 2,   # saves/campaign_progress.json
+}
+
+# (저장 종류, 원본 버전) → 다음 버전으로 변환하는 함수
+_MIGRATIONS: Dict[Tuple[str, int], Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+
+
+def register_migration(kind: str, from_version: int):
+    """from_version → from_version + 1 마이그레이션 함수 등록 데코레이터"""
+    def decorator(func: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        _MIGRATIONS[(kind, from_version)] = func
+        return func
+    return decorator
+
+
+def migrate(kind: str, data: Any) -> Any:
+    """
+    저장 데이터를 현재 스키마 버전까지 순차 마이그레이션
+
+    버전 키가 없는 데이터는 버전 0으로 간주합니다.
+    등록되지 않은 단계는 필드 변경 없이 버전만 올립니다.
+    """
+    target = SCHEMA_VERSIONS[kind]
+    version = data.get("version", 0)
+    if version >= target:
+        return data
+
+    print(f"INFO: Migrating {kind} save v{version} -> v{target}")
+    while version < target:
+        step = _MIGRATIONS.get((kind, version))
+        if step is not None:
+            data = step(data)
+        version += 1
+        data["version"] = version
+    return data
+
+
+@register_migration("campaign", 1)
+def _campaign_v1_to_v2(data: Dict[str, Any]) -> Dict[str, Any]:
+    """캠페인 v1 → v2: 필드 구조 동일 (버전 번호만 갱신)"""
+    return data
+
+
+# =========================================================
+# 스냅샷 (메인 스레드) / 패킹 (기록 스레드)
+# =========================================================
+
+class BinarySnapshot(NamedTuple):
+    """메인 스레드에서 만든 섹션별 JSON 스냅샷 (압축/패킹 전)"""
+    schema_version: int
+    sections: List[Tuple[str, bytes]]
+
+
+def snapshot_sections(data: Dict[str, Any]) -> BinarySnapshot:
+    """최상위 키별로 JSON 직렬화 (이후 data가 변경되어도 영향 없음)"""
+    version = data.get("version", 0)
+    if not isinstance(version, int):
+        version = 0
+
+    sections = []
+    for key, value in data.items():
+        if key == "version":
+            continue
+        encoded = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        sections.append((str(key), encoded))
+    return BinarySnapshot(version, sections)
+
+
+def pack_snapshot(snapshot: BinarySnapshot) -> bytes:
+    """스냅샷을 바이너리 포맷으로 패킹 (압축 + CRC)"""
+    blobs = []
+    entries = []
+    for name, raw in snapshot.sections:
+        flags = 0
+        blob = raw
+        if len(raw) >= COMPRESS_MIN_BYTES:
+            compressed = zlib.compress(raw, 6)
+            if len(compressed) < len(raw):
+                blob = compressed
+                flags |= FLAG_ZLIB
+        name_bytes = name.encode("utf-8")
+        if len(name_bytes) > 255:
+            raise SaveFormatError(f"section name too long: {name}")
+        blobs.append(blob)
+        entries.append((name_bytes, flags, blob))
+
+    table_size = sum(_ENTRY_PREFIX.size + len(n) + _ENTRY_BODY.size for n, _, _ in entries)
+    offset = _HEADER.size + table_size
+
+    table = bytearray()
+    for name_bytes, flags, blob in entries:
+        table += _ENTRY_PREFIX.pack(len(name_bytes), flags)
+        table += name_bytes
+        table += _ENTRY_BODY.pack(offset, len(blob), zlib.crc32(blob))
+        offset += len(blob)
+
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, snapshot.schema_version, len(entries), zlib.crc32(table)
+    )
+    return b"".join([header, bytes(table)] + blobs)
+
+
+def encode_binary(data: Dict[str, Any]) -> bytes:
+    """저장 데이터 → 바이너리 (스냅샷 + 패킹)"""
+    return pack_snapshot(snapshot_sections(data))
+
+
+# =========================================================
+# 로드 (섹션 지연 디코딩)
+# =========================================================
+
+class _SectionEntry(NamedTuple):
+    flags: int
+    offset: int
+    length: int
+    crc: int
+
+
+def _parse_table(buffer: bytes, check_bounds: bool = True) -> Tuple[int, Dict[str, _SectionEntry]]:
+    """헤더 + 섹션 테이블 파싱 및 CRC 검증"""
+    if len(buffer) < _HEADER.size:
+        raise SaveFormatError("file too short")
+    magic, fmt_version, schema_version, count, table_crc = _HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise SaveFormatError("bad magic")
+    if fmt_version > FORMAT_VERSION:
+        raise SaveFormatError(f"unsupported format version {fmt_version}")
+
+    entries: Dict[str, _SectionEntry] = {}
+    pos = _HEADER.size
+    try:
+        for _ in range(count):
+            name_len, flags = _ENTRY_PREFIX.unpack_from(buffer, pos)
+            pos += _ENTRY_PREFIX.size
+            name = bytes(buffer[pos:pos + name_len]).decode("utf-8")
+            pos += name_len
+            offset, length, crc = _ENTRY_BODY.unpack_from(buffer, pos)
+            pos += _ENTRY_BODY.size
+            entries[name] = _SectionEntry(flags, offset, length, crc)
+    except (struct.error, UnicodeDecodeError) as e:
+        raise SaveFormatError(f"bad section table: {e}")
+
+    if zlib.crc32(buffer[_HEADER.size:pos]) != table_crc:
+        raise SaveFormatError("section table checksum mismatch")
+
+    for name, entry in entries.items():
+        if check_bounds and entry.offset + entry.length > len(buffer):
+            raise SaveFormatError(f"section '{name}' truncated")
+
+    return schema_version, entries
+
+
+class LazySaveData(MutableMapping):
+    """
+    바이너리 저장 파일의 dict 호환 뷰
+
+    섹션 CRC는 생성 시 모두 검증하고, 압축 해제/JSON 파싱은
+    해당 키에 처음 접근할 때만 수행합니다.
+    """
+
+    def __init__(self, buffer: bytes):
+        self._buffer = buffer
+        schema_version, self._entries = _parse_table(buffer)
+
+        for name, entry in self._entries.items():
+            blob = buffer[entry.offset:entry.offset + entry.length]
+            if zlib.crc32(blob) != entry.crc:
+                raise SaveFormatError(f"section '{name}' checksum mismatch")
+
+        self._decoded: Dict[str, Any] = {}
+        self._order: List[str] = []
+        if schema_version:
+            self._decoded["version"] = schema_version
+            self._order.append("version")
+        self._order.extend(self._entries.keys())
+
+    @classmethod
+    def from_file(cls, path: Path) -> "LazySaveData":
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def _decode(self, key: str) -> Any:
+        entry = self._entries[key]
+        blob = self._buffer[entry.offset:entry.offset + entry.length]
+        if entry.flags & FLAG_ZLIB:
+            blob = zlib.decompress(blob)
+        return json.loads(blob.decode("utf-8"))
+
+    def is_loaded(self, key: str) -> bool:
+        """섹션이 이미 디코딩되었는지 여부"""
+        return key in self._decoded
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._decoded:
+            return self._decoded[key]
+        if key in self._entries:
+            value = self._decode(key)
+            self._decoded[key] = value
+            return value
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self._decoded and key not in self._entries:
+            self._order.append(key)
+        self._decoded[key] = value
+
+    def __delitem__(self, key: str):
+        if key not in self._decoded and key not in self._entries:
+            raise KeyError(key)
+        self._decoded.pop(key, None)
+        self._entries.pop(key, None)
+        self._order.remove(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._order))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """모든 섹션을 디코딩한 일반 dict (JSON 변환용)"""
+        return {key: self[key] for key in self._order}
+
+
+def snapshot_to_data(snapshot: BinarySnapshot) -> LazySaveData:
+    """기록 대기 중인 스냅샷을 로드 결과와 같은 형태로 변환"""
+    return LazySaveData(pack_snapshot(snapshot))
+
+
+def read_section(path: Path, name: str, default: Any = None) -> Any:
+    """
+    바이너리 저장 파일에서 섹션 하나만 읽기 (메뉴 요약 정보 등)
+
+    헤더/섹션 테이블과 해당 섹션 바이트만 읽습니다.
+    """
+    with open(path, "rb") as f:
+        head = f.read(_HEADER.size)
+        if len(head) < _HEADER.size:
+            raise SaveFormatError("file too short")
+        _, _, _, count, _ = _HEADER.unpack(head)
+        # 섹션 테이블 최대 크기만큼 읽기
+        table = f.read(count * (_ENTRY_PREFIX.size + 255 + _ENTRY_BODY.size))
+        _, entries = _parse_table(head + table, check_bounds=False)
+        entry = entries.get(name)
+        if entry is None:
+            return default
+        f.seek(entry.offset)
+        blob = f.read(entry.length)
+
+    if zlib.crc32(blob) != entry.crc:
+        raise SaveFormatError(f"section '{name}' checksum mismatch")
+    if entry.flags & FLAG_ZLIB:
+        blob = zlib.decompress(blob)
+    return json.loads(blob.decode("utf-8"))
+
+
+# =========================================================
+# 경로 / 변환 유틸리티
+# =========================================================
+
+def is_binary_path(path: Path) -> bool:
+    return Path(path).suffix == BINARY_SUFFIX
+
+
+def with_format(path: Path, binary: bool) -> Path:
+    """저장 파일 경로의 확장자를 포맷에 맞게 변경 (.json ↔ .sav)"""
+    path = Path(path)
+    if path.suffix not in (JSON_SUFFIX, BINARY_SUFFIX):
+        return path
+    return path.with_suffix(BINARY_SUFFIX if binary else JSON_SUFFIX)
+
+
+def convert_file(src: Path, dst: Path):
+    """JSON ↔ 바이너리 변환 (확장자로 방향 결정)"""
+    from systems.save_writer import verify_save_data
+
+    src, dst = Path(src), Path(dst)
+    if is_binary_path(src):
+        data = LazySaveData.from_file(src).to_dict()
+    else:
+        with open(src, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not verify_save_data(data):
+            raise SaveFormatError(f"checksum mismatch: {src}")
+
+    if is_binary_path(dst):
+        dst.write_bytes(encode_binary(data))
+    else:
+        with open(dst, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Save file converter (JSON <-> binary)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    info = sub.add_parser("info", help="show binary header and sections")
+    info.add_argument("path", type=Path)
+
+    to_json = sub.add_parser("to-json", help="binary .sav -> pretty JSON")
+    to_json.add_argument("src", type=Path)
+    to_json.add_argument("dst", type=Path, nargs="?")
+
+    to_bin = sub.add_parser("to-binary", help="JSON -> binary .sav")
+    to_bin.add_argument("src", type=Path)
+    to_bin.add_argument("dst", type=Path, nargs="?")
+
+    args = parser.parse_args()
+
+    if args.command == "info":
+        buffer = args.path.read_bytes()
+        schema_version, entries = _parse_table(buffer)
+        print(f"{args.path}: {len(buffer)} bytes, format v{FORMAT_VERSION}, schema v{schema_version}")
+        for name, entry in entries.items():
+            codec = "zlib" if entry.flags & FLAG_ZLIB else "raw"
+            print(f"  {name:<24} offset {entry.offset:>8}  {entry.length:>8} bytes  {codec}")
+    elif args.command == "to-json":
+        dst = args.dst or with_format(args.src, binary=False)
+        convert_file(args.src, dst)
+        print(f"Wrote {dst}")
+    else:
+        dst = args.dst or with_format(args.src, binary=True)
+        convert_file(args.src, dst)
+        print(f"Wrote {dst}")
+
+
+if __name__ == "__main__":
+    _main()
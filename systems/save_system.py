@@ -4,11 +4,13 @@ SaveSystem - 게임 진행 상황 저장/불러오기 시스템
 웨이브 모드의 진행 상황을 저장하여 다음 로그인 시 이어서 플레이 가능
 """
 
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from systems.save_format import SCHEMA_VERSIONS, migrate
+from systems.save_writer import get_save_writer
+
 
 class SaveSystem:
     """
@@ -24,7 +26,7 @@ class SaveSystem:
     - 캠페인 진행 상황 (ACT/Episode 해금, 함선, 업그레이드)
     """
 
-    SAVE_VERSION = 2  # 저장 파일 버전 (호환성 관리용)
+    SAVE_VERSION = SCHEMA_VERSIONS["campaign"]  # 저장 파일 버전 (마이그레이션: systems/save_format.py)
 
     def __init__(self, save_dir: str = "saves"):
         """
@@ -38,6 +40,9 @@ class SaveSystem:
         self.wave_save_file = self.save_dir / "wave_progress.json"
         self.campaign_save_file = self.save_dir / "campaign_progress.json"
 
+        # 원자적/백그라운드 기록기 (체크섬 + 회전 백업)
+        self.writer = get_save_writer()
+
     def save_wave_progress(
         self,
         game_data: Dict[str, Any],
@@ -57,7 +62,7 @@ class SaveSystem:
         """
         try:
             save_data = {
-                "version": self.SAVE_VERSION,
+                "version": SCHEMA_VERSIONS["wave"],
                 "saved_at": datetime.now().isoformat(),
                 "game_data": {
                     "current_wave": game_data.get("current_wave", 1),
@@ -69,8 +74,8 @@ class SaveSystem:
                 "player_upgrades": player_upgrades,
             }
 
-            with open(self.wave_save_file, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            if not self.writer.submit(self.wave_save_file, save_data):
+                return False
 
             print(f"INFO: Wave progress saved - Wave {game_data.get('current_wave', 1)}")
             return True
@@ -87,31 +92,28 @@ class SaveSystem:
             저장된 데이터 또는 None
         """
         try:
-            if not self.wave_save_file.exists():
+            if not self.writer.exists(self.wave_save_file):
                 print("INFO: No wave save file found")
                 return None
 
-            with open(self.wave_save_file, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = self.writer.read(self.wave_save_file)
+            if save_data is None:
+                print("ERROR: Corrupted save file (no valid backup)")
+                return None
 
-            # 버전 체크
-            if save_data.get("version") != self.SAVE_VERSION:
-                print(f"WARNING: Save version mismatch (file: {save_data.get('version')}, current: {self.SAVE_VERSION})")
-                # 현재는 버전 1만 있으므로 그냥 로드
+            # 버전 체크 (이전 버전이면 순차 마이그레이션)
+            save_data = migrate("wave", save_data)
 
             print(f"INFO: Wave progress loaded - Wave {save_data['game_data']['current_wave']}")
             return save_data
 
-        except json.JSONDecodeError as e:
-            print(f"ERROR: Corrupted save file: {e}")
-            return None
         except Exception as e:
             print(f"ERROR: Failed to load wave progress: {e}")
             return None
 
     def has_wave_save(self) -> bool:
         """저장된 웨이브 진행이 있는지 확인"""
-        return self.wave_save_file.exists()
+        return self.writer.exists(self.wave_save_file)
 
     def get_save_info(self) -> Optional[Dict[str, Any]]:
         """
@@ -134,8 +136,7 @@ class SaveSystem:
     def delete_wave_save(self) -> bool:
         """웨이브 저장 파일 삭제"""
         try:
-            if self.wave_save_file.exists():
-                self.wave_save_file.unlink()
+            if self.writer.delete(self.wave_save_file):
                 print("INFO: Wave save file deleted")
             return True
         except Exception as e:
@@ -169,7 +170,7 @@ class SaveSystem:
         """
         try:
             save_data = {
-                "version": self.SAVE_VERSION,
+                "version": SCHEMA_VERSIONS["campaign"],
                 "saved_at": datetime.now().isoformat(),
                 "campaign": {
                     "global_score": global_score,
@@ -181,8 +182,8 @@ class SaveSystem:
                 }
             }
 
-            with open(self.campaign_save_file, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            if not self.writer.submit(self.campaign_save_file, save_data):
+                return False
 
             print(f"INFO: Campaign progress saved - Score: {global_score}, ACT: {current_act}")
             return True
@@ -199,37 +200,29 @@ class SaveSystem:
             저장된 캠페인 데이터 또는 None
         """
         try:
-            if not self.campaign_save_file.exists():
+            if not self.writer.exists(self.campaign_save_file):
                 print("INFO: No campaign save file found")
                 return None
 
-            with open(self.campaign_save_file, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = self.writer.read(self.campaign_save_file)
+            if save_data is None:
+                print("ERROR: Corrupted campaign save file (no valid backup)")
+                return None
 
-            # 버전 체크
-            if save_data.get("version", 1) < self.SAVE_VERSION:
-                print(f"WARNING: Campaign save version mismatch, migrating...")
-                save_data = self._migrate_campaign_save(save_data)
+            # 버전 체크 (버전 키가 없는 파일은 v1로 간주)
+            save_data.setdefault("version", 1)
+            save_data = migrate("campaign", save_data)
 
             print(f"INFO: Campaign progress loaded - Score: {save_data['campaign']['global_score']}")
             return save_data.get("campaign", {})
 
-        except json.JSONDecodeError as e:
-            print(f"ERROR: Corrupted campaign save file: {e}")
-            return None
         except Exception as e:
             print(f"ERROR: Failed to load campaign progress: {e}")
             return None
 
-    def _migrate_campaign_save(self, old_data: Dict[str, Any]) -> Dict[str, Any]:
-        """이전 버전 저장 파일 마이그레이션"""
-        # 버전 1에서 2로 마이그레이션 (필요시 추가)
-        old_data["version"] = self.SAVE_VERSION
-        return old_data
-
     def has_campaign_save(self) -> bool:
         """저장된 캠페인 진행이 있는지 확인"""
-        return self.campaign_save_file.exists()
+        return self.writer.exists(self.campaign_save_file)
 
     def get_campaign_info(self) -> Optional[Dict[str, Any]]:
         """
@@ -258,8 +251,7 @@ class SaveSystem:
     def delete_campaign_save(self) -> bool:
         """캠페인 저장 파일 삭제"""
         try:
-            if self.campaign_save_file.exists():
-                self.campaign_save_file.unlink()
+            if self.writer.delete(self.campaign_save_file):
                 print("INFO: Campaign save file deleted")
             return True
         except Exception as e:
@@ -0,0 +1,441 @@
+# systems/save_writer.py
+"""
+SaveWriter - 원자적/백그라운드 저장 파일 기록기
+
+메인 스레드에서는 저장 데이터의 스냅샷(JSON 문자열)만 만들고,
+실제 파일 기록은 백그라운드 스레드에서 처리합니다.
+
+기록 절차:
+1. 임시 파일(<name>.tmp)에 기록 + fsync
+2. 기존 백업을 회전(<name>.1 → <name>.2 ...)하고, 기존 파일은 제자리에 둔 채
+   하드링크(미지원 시 복사)로 <name>.1 생성
+3. os.replace로 임시 파일을 원자적으로 교체 (어느 시점에 중단돼도 원본 파일이 존재)
+
+- 같은 파일에 대한 연속 저장은 하나로 합쳐짐 (마지막 스냅샷만 기록)
+- 파일에 체크섬("_checksum")을 포함하여 로드 시 손상 여부 검증
+- 손상된 경우 백업 파일에서 자동 복구
+- config.SAVE_FORMAT == "binary"이면 .json 경로를 .sav 바이너리로 기록
+  (systems/save_format.py, 다른 포맷의 기존 파일도 로드 가능)
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+
+import config
+from systems import save_format
+
+
+CHECKSUM_KEY = "_checksum"
+
+
+def serialize_snapshot(data: Dict[str, Any]) -> str:
+    """
+    저장 데이터를 압축 JSON 문자열로 직렬화 (체크섬 계산 기준)
+
+    키 순서는 dict 삽입 순서를 그대로 사용하므로, 로드한 데이터를 다시
+    직렬화하면 동일한 문자열이 나옵니다.
+    """
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def compute_checksum(payload: str) -> str:
+    """직렬화된 스냅샷의 SHA-256 체크섬"""
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _attach_checksum(payload: str) -> str:
+    """스냅샷 JSON 객체의 맨 앞에 체크섬 필드를 끼워넣음"""
+    checksum = compute_checksum(payload)
+    if payload == "{}":
+        return '{"%s":"%s"}' % (CHECKSUM_KEY, checksum)
+    return '{"%s":"%s",%s' % (CHECKSUM_KEY, checksum, payload[1:])
+
+
+def verify_save_data(data: Any) -> bool:
+    """
+    체크섬 검증 (체크섬 필드는 제거됨)
+
+    체크섬이 없는 이전 버전 파일은 유효한 것으로 간주합니다.
+    """
+    if not isinstance(data, dict):
+        return False
+    checksum = data.pop(CHECKSUM_KEY, None)
+    if checksum is None:
+        return True
+    return compute_checksum(serialize_snapshot(data)) == checksum
+
+
+def backup_path(path: Path, index: int) -> Path:
+    """회전 백업 파일 경로 (save.json → save.json.1)"""
+    return path.with_name(f"{path.name}.{index}")
+
+
+def backup_path_suffix(path: Path) -> str:
+    """백업 파일의 원래 확장자 (save.sav.2 → .sav)"""
+    if path.suffix[1:].isdigit():
+        return Path(path.stem).suffix
+    return path.suffix
+
+
+class SaveWriter:
+    """
+    백그라운드 저장 기록기
+
+    Attributes:
+        stats: 제출/기록/병합/실패 횟수 및 마지막 기록 시간
+    """
+
+    def __init__(
+        self,
+        backup_count: Optional[int] = None,
+        async_writes: Optional[bool] = None,
+        save_format_name: Optional[str] = None,
+    ):
+        """
+        Args:
+            backup_count: 회전 백업 개수 (None이면 config.SAVE_BACKUP_COUNT)
+            async_writes: 백그라운드 기록 여부 (None이면 config.SAVE_ASYNC_WRITES)
+            save_format_name: "json" 또는 "binary" (None이면 config.SAVE_FORMAT)
+        """
+        self.backup_count = (
+            backup_count if backup_count is not None
+            else getattr(config, "SAVE_BACKUP_COUNT", 3)
+        )
+        self.async_writes = (
+            async_writes if async_writes is not None
+            else getattr(config, "SAVE_ASYNC_WRITES", True)
+        )
+        self.binary = (
+            save_format_name or getattr(config, "SAVE_FORMAT", "json")
+        ) == "binary"
+
+        # 기록 대기 중인 스냅샷 {실제 경로: payload} - 같은 경로는 최신 것으로 덮어씀
+        # payload: JSON 문자열 또는 save_format.BinarySnapshot
+        self._pending: Dict[Path, Any] = {}
+        # 현재 기록 중인 경로와 payload
+        self._writing: Optional[Path] = None
+        self._writing_payload: Any = None
+
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        # 호출 스레드와 기록 스레드가 함께 갱신하므로 self._cond 잠금 상태에서만 변경
+        self.stats = {
+            "submitted": 0,
+            "written": 0,
+            "coalesced": 0,
+            "failed": 0,
+            "last_write_ms": 0.0,
+        }
+
+    # ==================== 경로 ====================
+
+    def target_path(self, path: Union[str, Path]) -> Path:
+        """논리 경로(.json)를 현재 저장 포맷의 실제 파일 경로로 변환"""
+        return save_format.with_format(Path(path), self.binary)
+
+    def _candidate_paths(self, path: Path):
+        """로드 후보 경로: 현재 포맷 → 백업 → 다른 포맷 → 그 백업"""
+        for target in (self.target_path(path), save_format.with_format(path, not self.binary)):
+            yield target
+            for i in range(1, self.backup_count + 1):
+                yield backup_path(target, i)
+
+    # ==================== 저장 ====================
+
+    def submit(self, path: Union[str, Path], data: Dict[str, Any]) -> bool:
+        """
+        저장 요청 (메인 스레드에서 스냅샷 직렬화 후 즉시 반환)
+
+        Args:
+            path: 저장 파일 경로
+            data: 저장할 딕셔너리 (호출 이후 변경되어도 스냅샷에 영향 없음)
+
+        Returns:
+            요청 접수 성공 여부 (직렬화 실패 시 False)
+        """
+        path = self.target_path(path)
+        try:
+            if save_format.is_binary_path(path):
+                payload = save_format.snapshot_sections(data)
+            else:
+                payload = serialize_snapshot(data)
+        except (TypeError, ValueError) as e:
+            print(f"ERROR: Failed to serialize save data for {path}: {e}")
+            return False
+
+        if not self.async_writes:
+            with self._cond:
+                self.stats["submitted"] += 1
+            return self._write_file(path, payload)
+
+        with self._cond:
+            if self._closed:
+                # 종료 이후의 저장은 동기 기록
+                self.stats["submitted"] += 1
+                return self._write_file(path, payload)
+
+            if path in self._pending:
+                self.stats["coalesced"] += 1
+            self._pending[path] = payload
+            self.stats["submitted"] += 1
+            self._ensure_thread()
+            self._cond.notify_all()
+
+        return True
+
+    def pending_snapshot(self, path: Union[str, Path]) -> Any:
+        """아직 디스크에 반영되지 않은 최신 스냅샷 (없으면 None)"""
+        path = self.target_path(path)
+        with self._cond:
+            if path in self._pending:
+                return self._pending[path]
+            if self._writing == path:
+                return self._writing_payload
+        return None
+
+    def discard(self, path: Union[str, Path]):
+        """대기 중인 저장을 취소하고 진행 중인 기록이 끝날 때까지 대기 (파일 삭제 전 호출)"""
+        path = self.target_path(path)
+        with self._cond:
+            self._pending.pop(path, None)
+            while self._writing == path:
+                self._cond.wait()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 모든 저장이 기록될 때까지 대기
+
+        Returns:
+            시간 내 모두 기록되었는지 여부
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._writing is not None:
+                if self._thread is None or not self._thread.is_alive():
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+
+            leftover = list(self._pending.items())
+            self._pending.clear()
+
+        # 기록 스레드가 없으면 남은 요청을 직접 기록
+        for path, payload in leftover:
+            self._write_file(path, payload)
+        return True
+
+    def close(self, timeout: Optional[float] = None):
+        """대기 중인 저장을 모두 기록하고 기록 스레드 종료"""
+        if timeout is None:
+            timeout = getattr(config, "SAVE_FLUSH_TIMEOUT", 5.0)
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def _ensure_thread(self):
+        """기록 스레드 지연 시작 (self._cond 잠금 상태에서 호출)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="SaveWriter", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        """기록 스레드 루프"""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending and self._closed:
+                    return
+                path, payload = next(iter(self._pending.items()))
+                del self._pending[path]
+                self._writing = path
+                self._writing_payload = payload
+
+            try:
+                self._write_file(path, payload)
+            finally:
+                with self._cond:
+                    self._writing = None
+                    self._writing_payload = None
+                    self._cond.notify_all()
+
+    def _write_file(self, path: Path, payload: Any) -> bool:
+        """임시 파일 기록 + fsync + 백업 회전 + 원자적 교체"""
+        start = time.perf_counter()
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(payload, save_format.BinarySnapshot):
+                content = save_format.pack_snapshot(payload)
+            else:
+                content = _attach_checksum(payload).encode("utf-8")
+
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._rotate_backups(path)
+            os.replace(tmp_path, path)
+            self._fsync_dir(path.parent)
+
+            with self._cond:
+                self.stats["written"] += 1
+                self.stats["last_write_ms"] = (time.perf_counter() - start) * 1000.0
+            return True
+
+        except (OSError, save_format.SaveFormatError) as e:
+            with self._cond:
+                self.stats["failed"] += 1
+            print(f"ERROR: Failed to write save file {path}: {e}")
+            try:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+            except OSError:
+                pass
+            return False
+
+    def _rotate_backups(self, path: Path):
+        """
+        save.json.1 → ... → save.json.N (가장 오래된 백업은 폐기), save.json → save.json.1
+
+        save.json은 이동하지 않고 하드링크(미지원 시 복사)로 .1을 만들어,
+        이후 os.replace가 실패하거나 중단돼도 원본 파일이 항상 남아 있게 합니다.
+        """
+        if self.backup_count <= 0 or not path.exists():
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            src = backup_path(path, index)
+            if src.exists():
+                os.replace(src, backup_path(path, index + 1))
+
+        first = backup_path(path, 1)
+        staging = first.with_name(first.name + ".tmp")
+        if staging.exists():
+            staging.unlink()
+        try:
+            os.link(path, staging)
+        except OSError:
+            shutil.copy2(path, staging)
+        os.replace(staging, first)
+
+    @staticmethod
+    def _fsync_dir(directory: Path):
+        """디렉토리 엔트리 변경(rename)을 디스크에 반영 (지원하지 않는 OS는 무시)"""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        try:
+            fd = os.open(str(directory), os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    # ==================== 로드 ====================
+
+    def read(self, path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+        """
+        저장 파일 로드 (체크섬 검증 + 백업 복구)
+
+        기록 대기 중인 스냅샷이 있으면 그것을 우선 반환합니다.
+        바이너리 파일은 섹션을 처음 접근할 때 디코딩하는 dict 호환 객체로 반환합니다.
+
+        Returns:
+            검증된 저장 데이터 또는 None (파일 없음/모두 손상)
+        """
+        path = Path(path)
+
+        pending = self.pending_snapshot(path)
+        if isinstance(pending, save_format.BinarySnapshot):
+            return save_format.snapshot_to_data(pending)
+        if pending is not None:
+            return json.loads(pending)
+
+        primary = self.target_path(path)
+        for candidate in self._candidate_paths(path):
+            if not candidate.exists():
+                continue
+            data = self._read_file(candidate)
+            if data is None:
+                continue
+            if candidate != primary:
+                print(f"WARNING: Restored save data from {candidate}")
+            return data
+
+        return None
+
+    @staticmethod
+    def _read_file(path: Path) -> Optional[Dict[str, Any]]:
+        """파일 하나를 포맷에 맞게 로드 + 검증 (실패 시 None)"""
+        if backup_path_suffix(path) == save_format.BINARY_SUFFIX:
+            try:
+                return save_format.LazySaveData.from_file(path)
+            except (OSError, save_format.SaveFormatError) as e:
+                print(f"WARNING: Corrupted save file {path}: {e}")
+                return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"WARNING: Corrupted save file {path}: {e}")
+            return None
+
+        if not verify_save_data(data):
+            print(f"WARNING: Save checksum mismatch: {path}")
+            return None
+        return data
+
+    def exists(self, path: Union[str, Path]) -> bool:
+        """저장 파일(또는 대기 중 스냅샷/백업/다른 포맷 파일) 존재 여부"""
+        path = Path(path)
+        if self.pending_snapshot(path) is not None:
+            return True
+        return any(candidate.exists() for candidate in self._candidate_paths(path))
+
+    def delete(self, path: Union[str, Path]) -> bool:
+        """저장 파일과 백업 모두 삭제 (두 포맷 모두, 대기 중인 저장도 취소)"""
+        path = Path(path)
+        self.discard(path)
+        deleted = False
+        targets = list(self._candidate_paths(path))
+        primary = self.target_path(path)
+        targets.append(primary.with_name(primary.name + ".tmp"))
+        targets.append(backup_path(primary, 1).with_name(backup_path(primary, 1).name + ".tmp"))
+        for target in targets:
+            if target.exists():
+                target.unlink()
+                deleted = True
+        return deleted
+
+
+# 전역 인스턴스
+_save_writer: Optional[SaveWriter] = None
+
+
+def get_save_writer() -> SaveWriter:
+    """전역 저장 기록기 인스턴스 반환"""
+    global _save_writer
+    if _save_writer is None:
+        _save_writer = SaveWriter()
+        atexit.register(_save_writer.close)
+    return _save_writer
@@ -0,0 +1,278 @@
+# systems/segment_prefetcher.py
+"""
+SegmentPrefetcher - 에피소드 세그먼트 선행 로드
+
+EpisodeMode가 세그먼트를 시작할 때마다 다음 N개(config.SEGMENT_PREFETCH_LOOKAHEAD) 세그먼트가
+참조하는 이미지를 워커 스레드에서 미리 디코딩해 둡니다.
+- 배경: 세그먼트/장면/대사 배경 (에피소드 폴더 → shared → 레거시 배경 폴더)
+- 초상화: 장면 대사의 화자
+- 컷씬 이미지: segment.images, effect_data (세그먼트 extra + 장면)
+- 장면 데이터: 콘텐츠 스토어의 지연 로드 장면을 미리 조회
+
+디코딩 결과(convert 전 원본)는 config.SEGMENT_PREFETCH_MAX_BYTES 안에서만 보관하고,
+get()으로 넘겨준 결과와 지나간 세그먼트 몫은 바로 해제합니다
+(호출 측은 convert/스케일한 Surface만 자체 캐시에 보관).
+CutsceneImageService / AssetManager / CombatMode는 디코딩 전에 get()으로 결과를 확인합니다.
+convert / 스케일은 기존처럼 메인 스레드에서 처리합니다.
+
+BGM은 mixer.music 스트리밍이고 음성은 TTS가 재생 시점에 합성하므로 선행 로드 대상이 아닙니다.
+
+통계 (get_stats):
+    hits: 사용 시점에 디코딩이 끝나 있던 이미지 수
+    misses: 선행 로드를 요청했지만 사용 시점에 결과가 없던 이미지 수 (호출 측에서 직접 디코딩)
+        late: 그중 아직 대기/디코딩 중이던 수
+        over_budget: 메모리 상한 때문에 보관하지 않은(또는 양보한) 이미지 수
+    hit_rate: hits / (hits + misses)
+    unused: 쓰이지 않고 해제된 이미지 수
+"""
+
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+import pygame
+
+import config
+
+
+PathLike = Union[str, Path]
+
+# 레거시 전투 배경 폴더 (CombatMode._load_background와 같은 순서)
+_LEGACY_BACKGROUND_DIRS = (
+    config.ASSET_DIR / "story_mode" / "backgrounds",
+    config.ASSET_DIR / "images" / "backgrounds",
+)
+
+
+def _key(path: PathLike) -> str:
+    """호출 측마다 다른 경로 표기(str/Path, ./)를 같은 키로"""
+    return os.path.normpath(str(path))
+
+
+class SegmentPrefetcher:
+    """다음 세그먼트 이미지 워커 스레드 디코딩 + 메모리 상한 관리"""
+
+    def __init__(self, max_bytes: int, lookahead: int):
+        self.max_bytes = max_bytes
+        self.lookahead = lookahead
+
+        # 경로 → (디코딩 원본, 바이트 수, 마지막으로 쓰는 세그먼트 인덱스) - 아직 넘겨주지 않은 결과만
+        self._ready: Dict[str, Tuple[pygame.Surface, int, int]] = {}
+        # 대기/디코딩 중인 경로 → 마지막으로 쓰는 세그먼트 인덱스
+        self._pending: Dict[str, int] = {}
+        # 메모리 상한 때문에 버린 경로 → 세그먼트 인덱스 (사용 시 miss로 집계)
+        self._dropped: Dict[str, int] = {}
+        self._used: Set[str] = set()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._episode_id = ""
+
+        self.stats = {"queued": 0, "decoded": 0, "hits": 0, "misses": 0, "late": 0,
+                      "over_budget": 0, "unused": 0, "failed": 0}
+
+    # === 세그먼트 진행 ===
+
+    def prefetch_segments(self, episode_id: str, segments: list, current_index: int):
+        """
+        현재 세그먼트 시작 시 호출 - 지나간 세그먼트 몫 해제 + 다음 세그먼트 이미지 요청
+
+        Args:
+            episode_id: 에피소드 ID (리소스 경로 해석용)
+            segments: EpisodeData.segments
+            current_index: 지금 시작하는 세그먼트 인덱스
+        """
+        if episode_id != self._episode_id:
+            self.clear()
+            self._episode_id = episode_id
+
+        self._release_before(current_index)
+
+        last = min(len(segments), current_index + 1 + self.lookahead)
+        for index in range(current_index + 1, last):
+            for path in self.collect_segment_images(episode_id, segments[index]):
+                self._request(path, index)
+
+    def collect_segment_images(self, episode_id: str, segment) -> List[Path]:
+        """세그먼트 하나가 참조하는 이미지 경로 목록 (장면 데이터도 미리 조회)"""
+        from systems.cutscene_image_service import get_cutscene_image_service, _image_names
+        service = get_cutscene_image_service()
+        paths: List[Path] = []
+
+        def add(path: Optional[Path]):
+            if path and path not in paths:
+                paths.append(path)
+
+        if segment.background:
+            add(service.resolve("backgrounds", segment.background, episode_id))
+            for folder in _LEGACY_BACKGROUND_DIRS:
+                candidate = folder / segment.background
+                if candidate.exists():
+                    add(candidate)
+                    break
+
+        for name in _image_names(segment.images or []):
+            add(service.resolve("cutscene_images", name, episode_id))
+        effect_data = (segment.extra or {}).get("effect_data", {})
+        for path in service.collect_scene_images({"effect_data": effect_data}, episode_id, portraits=False):
+            add(path)
+
+        scene_id = segment.dialogue_key or segment.scene_key
+        if scene_id:
+            data = service.loader.get_episode_data(episode_id)
+            scene = data.get("scenes", {}).get(scene_id)
+            if scene:
+                for path in service.collect_scene_images(scene, episode_id):
+                    add(path)
+        return paths
+
+    # === 조회 ===
+
+    def get(self, path: PathLike) -> Optional[pygame.Surface]:
+        """
+        선행 디코딩된 원본 (없으면 None - 호출 측에서 직접 디코딩)
+
+        결과는 한 번만 넘겨주고 바로 해제합니다 (메모리 상한에서 제외).
+        호출 측은 원본 대신 convert()/convert_alpha()/스케일 결과를 캐시하세요.
+        """
+        key = _key(path)
+        with self._lock:
+            entry = self._ready.pop(key, None)
+            first_use = key not in self._used
+            if entry is not None:
+                self._bytes -= entry[1]
+                self._used.add(key)
+                self.stats["hits"] += 1
+                return entry[0]
+            if not first_use:
+                return None
+            if key in self._pending:
+                # 아직 대기 중 - 호출 측이 직접 디코딩하므로 워커는 건너뜀
+                del self._pending[key]
+                self.stats["late"] += 1
+            elif self._dropped.pop(key, None) is None:
+                return None  # 선행 로드 대상이 아니었던 이미지
+            self._used.add(key)
+            self.stats["misses"] += 1
+        return None
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            used = self.stats["hits"] + self.stats["misses"]
+            return dict(
+                self.stats,
+                hit_rate=self.stats["hits"] / used if used else 0.0,
+                ready=len(self._ready),
+                pending=len(self._pending),
+                bytes=self._bytes,
+            )
+
+    def clear(self):
+        """보관 중인 결과/대기 요청 모두 해제 (에피소드 종료 시)"""
+        with self._lock:
+            self.stats["unused"] += len(self._ready)
+            self._ready.clear()
+            self._pending.clear()
+            self._dropped.clear()
+            self._used.clear()
+            self._bytes = 0
+        self._episode_id = ""
+
+    # === 내부 ===
+
+    def _request(self, path: Path, segment_index: int):
+        key = _key(path)
+        with self._lock:
+            if key in self._used:
+                return
+            entry = self._ready.get(key)
+            if entry is not None:
+                self._ready[key] = (entry[0], entry[1], max(entry[2], segment_index))
+                return
+            if key in self._pending:
+                self._pending[key] = max(self._pending[key], segment_index)
+                return
+            self._dropped.pop(key, None)
+            self._pending[key] = segment_index
+            self.stats["queued"] += 1
+
+        self._ensure_worker()
+        self._queue.put(key)
+
+    def _release_before(self, segment_index: int):
+        """segment_index 이전 세그먼트에서만 쓰는 결과 해제"""
+        with self._lock:
+            for key in [k for k, entry in self._ready.items() if entry[2] < segment_index]:
+                _, size, _ = self._ready.pop(key)
+                self._bytes -= size
+                self.stats["unused"] += 1
+            for key in [k for k, index in self._pending.items() if index < segment_index]:
+                del self._pending[key]
+            for key in [k for k, index in self._dropped.items() if index < segment_index]:
+                del self._dropped[key]
+
+    def _ensure_worker(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._worker, name="SegmentPrefetch", daemon=True)
+            self._thread.start()
+
+    def _worker(self):
+        while True:
+            key = self._queue.get()
+            if key is None:
+                return
+            with self._lock:
+                if key not in self._pending:
+                    continue  # 이미 사용됐거나 해제된 요청
+
+            try:
+                raw = pygame.image.load(key)
+            except (pygame.error, FileNotFoundError, OSError) as e:
+                print(f"WARNING: Segment prefetch failed: {key} - {e}")
+                with self._lock:
+                    self._pending.pop(key, None)
+                    self.stats["failed"] += 1
+                continue
+            size = raw.get_pitch() * raw.get_height()
+
+            with self._lock:
+                segment_index = self._pending.pop(key, None)
+                if segment_index is None:
+                    continue
+                self.stats["decoded"] += 1
+                # 상한 초과 시 더 나중 세그먼트 몫부터 양보
+                farther = sorted(
+                    (k for k, entry in self._ready.items() if entry[2] > segment_index),
+                    key=lambda k: self._ready[k][2], reverse=True,
+                )
+                while farther and self._bytes + size > self.max_bytes:
+                    evicted = farther.pop(0)
+                    _, evicted_size, evicted_index = self._ready.pop(evicted)
+                    self._bytes -= evicted_size
+                    self._dropped[evicted] = evicted_index
+                    self.stats["over_budget"] += 1
+                if self._bytes + size > self.max_bytes:
+                    self._dropped[key] = segment_index
+                    self.stats["over_budget"] += 1
+                    continue
+                self._ready[key] = (raw, size, segment_index)
+                self._bytes += size
+
+
+# === 전역 인스턴스 ===
+
+_segment_prefetcher: Optional[SegmentPrefetcher] = None
+
+
+def get_segment_prefetcher() -> SegmentPrefetcher:
+    """전역 세그먼트 선행 로더 반환"""
+    global _segment_prefetcher
+    if _segment_prefetcher is None:
+        _segment_prefetcher = SegmentPrefetcher(
+            config.SEGMENT_PREFETCH_MAX_BYTES, config.SEGMENT_PREFETCH_LOOKAHEAD
+        )
+    return _segment_prefetcher
@@ -8,7 +8,7 @@ JSON 설정 파일을 읽어서 다양한 VFX 효과를 자동으로 관리합
 import json
 import pygame
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 
 class VFXManager:
@@ -23,6 +23,9 @@ class VFXManager:
 
     _instance = None
 
+    # 이미지가 없을 때 쓰는 기본 링 이미지
+    DEFAULT_IMAGE = "assets/images/vfx/combat/purse_ring_effect.png"
+
     def __new__(cls):
         """싱글톤 패턴 구현"""
         if cls._instance is None:
@@ -96,7 +99,7 @@ class VFXManager:
                         else:
                             print(f"WARNING: VFX image not found: {image_path}")
                             # 폴백: 기본 링 이미지 사용
-                            default_path = "assets/images/vfx/combat/purse_ring_effect.png"
+                            default_path = self.DEFAULT_IMAGE
                             if default_path not in self._image_cache:
                                 self._image_cache[default_path] = pygame.image.load(default_path).convert_alpha()
                             self._image_cache[image_path] = self._image_cache[default_path]
@@ -145,10 +148,10 @@ class VFXManager:
             for image_file in category_folder.glob("*.png"):
                 variant_name = image_file.stem  # 파일명 (확장자 제외)
 
-                # 이미지 로드
+                # 이미지 로드 (이미 캐시된 이미지는 다시 디코딩하지 않음 - 바뀐 파일은 reload_image)
                 try:
-                    image = pygame.image.load(str(image_file)).convert_alpha()
-                    self._image_cache[str(image_file)] = image
+                    if str(image_file) not in self._image_cache:
+                        self._image_cache[str(image_file)] = pygame.image.load(str(image_file)).convert_alpha()
 
                     # 기본 설정으로 효과 생성
                     folder_effects[category_name][variant_name] = {
@@ -322,11 +325,84 @@ class VFXManager:
             effects_list[category] = list(effects.keys())
         return effects_list
 
-    def reload_config(self):
-        """설정 파일 다시 로드 (게임 중 효과 변경용)"""
-        self._image_cache.clear()
-        self.load_config()
-        print("INFO: VFXManager config reloaded")
+    def reload_config(self) -> List[Tuple[str, str]]:
+        """
+        설정 파일 다시 로드 (게임 중 효과 변경용)
+
+        이미지 캐시는 유지하고 새로 참조된 이미지만 디코딩합니다.
+        저장 도중이라 JSON이 깨져 있으면 기존 설정을 그대로 둡니다.
+
+        Returns:
+            추가/변경/삭제된 효과 (category, variant) 리스트
+        """
+        config_path = Path("assets/config/vfx_effects.json")
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"WARNING: VFX config reload skipped (keeping current config): {e}")
+            return []
+
+        old_config = self._effects_config
+        self.load_config(str(config_path))
+        self.load_from_folders()
+
+        changed = []
+        for category in set(old_config) | set(self._effects_config):
+            old_effects = old_config.get(category, {})
+            new_effects = self._effects_config.get(category, {})
+            for variant in set(old_effects) | set(new_effects):
+                if old_effects.get(variant) != new_effects.get(variant):
+                    changed.append((category, variant))
+
+        print(f"INFO: VFXManager config reloaded ({len(changed)} effects changed)")
+        return sorted(changed)
+
+    def reload_image(self, image_path: str) -> bool:
+        """
+        바뀐 이미지 파일 하나만 다시 디코딩
+
+        경로 표기(Windows 역슬래시 / 설정 JSON의 슬래시)가 달라도 같은 파일이면
+        캐시 키를 모두 찾아 교체합니다.
+        기본 링 이미지가 바뀌면 그것으로 폴백한 항목들도 함께 교체합니다.
+
+        Returns:
+            캐시가 갱신되었는지 여부 (참조하는 효과가 없거나 파일이 없으면 False)
+        """
+        target = _normalize_path(image_path)
+        keys = [key for key in self._image_cache if _normalize_path(key) == target]
+        if not keys:
+            # 아직 캐시에 없지만 설정이 참조하는 이미지 - 설정 표기 그대로 키로 사용
+            keys = sorted({
+                effect["image"]
+                for effects in self._effects_config.values() for effect in effects.values()
+                if effect.get("image") and _normalize_path(effect["image"]) == target
+            })
+        if not keys or not Path(target).exists():
+            return False
+
+        try:
+            image = pygame.image.load(target).convert_alpha()
+        except Exception as e:
+            print(f"WARNING: Failed to reload VFX image {image_path}: {e}")
+            return False
+
+        # 폴백 항목은 기본 링과 같은 Surface를 공유하므로 함께 교체
+        # (폴백이던 항목 자신의 파일이 생긴 경우에는 그 항목만 교체)
+        old_surfaces = [self._image_cache[key] for key in keys if key in self._image_cache]
+        if target == _normalize_path(self.DEFAULT_IMAGE) and old_surfaces:
+            for key, surface in list(self._image_cache.items()):
+                if any(surface is old for old in old_surfaces):
+                    self._image_cache[key] = image
+        for key in keys:
+            self._image_cache[key] = image
+        print(f"INFO: VFXManager reloaded image {target}")
+        return True
+
+
+def _normalize_path(path) -> str:
+    """캐시 키 비교용 경로 표기 통일 (역슬래시 → 슬래시, ./ 제거)"""
+    return Path(str(path).replace("\\", "/")).as_posix()
 
 
 # 싱글톤 인스턴스 전역 접근 함수
@@ -0,0 +1,306 @@
+# systems/video_player.py
+"""
+VideoPlayer - 백그라운드 디코딩 동영상 재생 컴포넌트
+
+IntroVideoMode / EpisodeMode 인트로 영상이 메인 스레드 update 안에서
+read → cvtColor → resize → swapaxes → make_surface 하던 경로를 대체합니다.
+
+- 디코딩/리사이즈/색 변환은 백그라운드 스레드에서 수행해
+  미리 할당한 링 버퍼 슬롯(BGRA numpy 배열)에 기록
+- 메인 스레드는 재생 시각에 해당하는 프레임 하나만 골라
+  재사용 Surface의 픽셀 버퍼로 한 번 복사 (프레임마다 Surface 생성 없음)
+- 재생이 디코딩보다 앞서면 멈추지 않고 지난 프레임을 버리며,
+  디코더도 크게 뒤처지면 grab()으로 디코딩 없이 건너뜀
+- 디코드/표시/드롭 통계 제공 (get_stats)
+
+OpenCV(cv2)가 없거나 파일을 열 수 없으면 open()이 False를 반환합니다.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pygame
+
+import config
+
+
+PathLike = Union[str, Path]
+
+# pygame 32비트 Surface 기본 마스크 (리틀 엔디안에서 메모리 배치 B, G, R, A)
+_BGRA_MASKS = (0xFF0000, 0x00FF00, 0x0000FF)
+
+
+def fit_size(video_size: Tuple[int, int], screen_size: Tuple[int, int]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """비율 유지하며 화면에 맞춘 크기와 중앙 배치 오프셋"""
+    video_w, video_h = video_size
+    screen_w, screen_h = screen_size
+    video_aspect = video_w / video_h
+    if video_aspect > screen_w / screen_h:
+        size = (screen_w, int(screen_w / video_aspect))
+    else:
+        size = (int(screen_h * video_aspect), screen_h)
+    offset = ((screen_w - size[0]) // 2, (screen_h - size[1]) // 2)
+    return size, offset
+
+
+class VideoPlayer:
+    """
+    동영상 재생기 (디코더 스레드 + 프레임 링 버퍼)
+
+    사용법:
+        player = VideoPlayer(path, screen_size)
+        if player.open():
+            ...
+            player.update(dt)       # 매 프레임
+            player.draw(screen)
+            if player.finished: ...
+        player.close()
+    """
+
+    def __init__(self, path: PathLike, screen_size: Tuple[int, int], buffer_frames: int = None):
+        self.path = Path(path)
+        self.screen_size = screen_size
+        self.buffer_frames = max(2, buffer_frames or config.VIDEO_BUFFER_FRAMES)
+
+        self.fps = 30.0
+        self.frame_interval = 1.0 / self.fps
+        self.video_size = (0, 0)
+        self.size = (0, 0)
+        self.offset = (0, 0)
+
+        self.surface: Optional[pygame.Surface] = None
+        self.position = 0.0  # 재생 시각 (초)
+        self.finished = False
+
+        self._capture = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._cond = threading.Condition()
+
+        # 링 버퍼: 슬롯 배열 + 슬롯별 프레임 번호, [read, write) 구간이 채워진 슬롯
+        self._slots = []
+        self._slot_frames = []
+        self._read = 0
+        self._write = 0
+        self._eof = False
+        self._target_frame = 0  # 디코더가 참고하는 현재 재생 프레임
+        self._presented_frame = -1
+        self._direct_upload = False
+
+        self.stats = {
+            "decoded": 0,  # 디코딩 완료 프레임
+            "skipped_decode": 0,  # 뒤처져서 grab()으로 건너뛴 프레임
+            "presented": 0,  # 화면에 올린 프레임
+            "dropped": 0,  # 디코딩했지만 시간이 지나 버린 프레임
+            "late": 0,  # 표시할 프레임이 아직 없어 이전 프레임을 유지한 횟수
+            "decode_ms": 0.0,  # 디코딩+변환 누적 시간
+            "upload_ms": 0.0,  # Surface 업로드 누적 시간
+        }
+
+    # === 열기 / 닫기 ===
+
+    def open(self) -> bool:
+        """파일 열기 및 디코더 스레드 시작 (실패 시 False)"""
+        if not self.path.exists():
+            print(f"INFO: Video not found: {self.path}")
+            return False
+
+        try:
+            import cv2
+        except ImportError:
+            print("WARNING: cv2 not available, skipping video")
+            return False
+
+        try:
+            capture = cv2.VideoCapture(str(self.path))
+            if not capture.isOpened():
+                print(f"WARNING: Failed to open video: {self.path}")
+                return False
+
+            fps = capture.get(cv2.CAP_PROP_FPS)
+            self.fps = fps if fps > 0 else 30.0
+            self.frame_interval = 1.0 / self.fps
+            self.video_size = (
+                int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            )
+            self.size, self.offset = fit_size(self.video_size, self.screen_size)
+        except Exception as e:
+            print(f"WARNING: Failed to load video {self.path}: {e}")
+            return False
+
+        self._capture = capture
+        width, height = self.size
+        self._slots = [np.empty((height, width, 4), dtype=np.uint8) for _ in range(self.buffer_frames)]
+        self._slot_frames = [-1] * self.buffer_frames
+
+        self.surface = pygame.Surface(self.size, 0, 32)
+        self.surface.fill((0, 0, 0))
+        self._direct_upload = (
+            self.surface.get_masks()[:3] == _BGRA_MASKS and self.surface.get_pitch() == width * 4
+        )
+
+        self._thread = threading.Thread(target=self._decode_loop, name="VideoDecoder", daemon=True)
+        self._thread.start()
+
+        # 첫 프레임은 기다렸다가 표시 (검은 화면 방지)
+        self._wait_first_frame()
+        return True
+
+    def close(self):
+        """
+        디코더 스레드 종료 요청
+
+        캡처는 디코더 스레드가 루프를 빠져나오며 직접 해제합니다.
+        (join이 시간 초과돼도 read() 도중인 캡처를 메인 스레드가 해제하지 않도록)
+        """
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            if self._thread.is_alive():
+                print(f"WARNING: Video decoder still busy, it will release the capture on exit ({self.path.name})")
+            self._thread = None
+        self._capture = None
+
+    # === 메인 스레드 ===
+
+    def update(self, dt: float):
+        """재생 시각 진행 후 해당 프레임 표시 (디코딩을 기다리지 않음)"""
+        if self.finished or self._capture is None:
+            return
+
+        self.position += dt
+        target = int(self.position * self.fps)
+        with self._cond:
+            self._target_frame = target
+            self._cond.notify_all()
+
+        self._present(target)
+
+    def draw(self, screen: pygame.Surface):
+        if self.surface is not None and self._presented_frame >= 0:
+            screen.blit(self.surface, self.offset)
+
+    def get_stats(self) -> Dict[str, float]:
+        """디코드/표시 통계 (평균 ms 포함)"""
+        stats = dict(self.stats)
+        stats["avg_decode_ms"] = stats["decode_ms"] / stats["decoded"] if stats["decoded"] else 0.0
+        stats["avg_upload_ms"] = stats["upload_ms"] / stats["presented"] if stats["presented"] else 0.0
+        return stats
+
+    def _present(self, target: int):
+        """버퍼에서 target 이하 중 가장 최신 프레임을 골라 업로드, 지난 프레임은 버림"""
+        slot_index = None
+        with self._cond:
+            while self._read != self._write:
+                index = self._read % self.buffer_frames
+                frame_number = self._slot_frames[index]
+                if frame_number > target:
+                    break
+                if slot_index is not None:
+                    # 더 최신 프레임이 있어 버리는 슬롯은 바로 반환
+                    self._slot_frames[slot_index] = -1
+                    self.stats["dropped"] += 1
+                slot_index = index
+                self._read += 1
+            buffer_empty = self._read == self._write
+            eof = self._eof
+
+        if slot_index is None:
+            if buffer_empty and eof:
+                self.finished = True
+            elif self._presented_frame < target:
+                self.stats["late"] += 1
+            return
+
+        start = time.perf_counter()
+        self._upload(self._slots[slot_index])
+        self.stats["upload_ms"] += (time.perf_counter() - start) * 1000.0
+        self.stats["presented"] += 1
+        self._presented_frame = self._slot_frames[slot_index]
+
+        # 업로드가 끝난 뒤 슬롯 반환 (디코더가 덮어쓸 수 있음)
+        with self._cond:
+            self._slot_frames[slot_index] = -1
+            self._cond.notify_all()
+
+    def _upload(self, pixels: np.ndarray):
+        """재사용 Surface로 픽셀 복사 (새 Surface 할당 없음)"""
+        if self._direct_upload:
+            view = self.surface.get_view("1")
+            np.frombuffer(view, dtype=np.uint8)[:] = pixels.reshape(-1)
+            del view  # 뷰가 남아 있으면 Surface가 잠긴 상태로 유지됨
+        else:
+            frame = pygame.image.frombuffer(pixels.data, self.size, "BGRA")
+            self.surface.blit(frame, (0, 0))
+
+    def _wait_first_frame(self, timeout: float = 2.0):
+        with self._cond:
+            self._cond.wait_for(lambda: self._read != self._write or self._eof, timeout=timeout)
+        self._present(0)
+
+    # === 디코더 스레드 ===
+
+    def _decode_loop(self):
+        capture = self._capture
+        try:
+            self._decode_frames(capture)
+        except Exception as e:
+            print(f"WARNING: Video decode failed ({self.path.name}): {e}")
+        finally:
+            # 캡처를 사용하는 스레드에서 해제 (close()는 해제하지 않음)
+            try:
+                capture.release()
+            except Exception as e:
+                print(f"WARNING: Failed to release video ({self.path.name}): {e}")
+            with self._cond:
+                self._eof = True
+                self._cond.notify_all()
+
+    def _decode_frames(self, capture):
+        import cv2
+
+        frame_number = 0
+        while not self._stop.is_set():
+            with self._cond:
+                # 빈 슬롯이 생길 때까지 대기 (표시 중인 슬롯도 사용 중으로 취급)
+                self._cond.wait_for(
+                    lambda: self._stop.is_set() or (
+                        self._write - self._read < self.buffer_frames
+                        and self._slot_frames[self._write % self.buffer_frames] == -1
+                    )
+                )
+                if self._stop.is_set():
+                    break
+                target = self._target_frame
+                slot_index = self._write % self.buffer_frames
+
+            # 재생 위치보다 크게 뒤처졌으면 디코딩 없이 건너뜀
+            if frame_number < target - config.VIDEO_SKIP_DECODE_BEHIND:
+                if not capture.grab():
+                    break
+                frame_number += 1
+                self.stats["skipped_decode"] += 1
+                continue
+
+            start = time.perf_counter()
+            ok, frame = capture.read()
+            if not ok:
+                break
+            slot = self._slots[slot_index]
+            if frame.shape[1::-1] != self.size:
+                frame = cv2.resize(frame, self.size, interpolation=cv2.INTER_LINEAR)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA, dst=slot)
+            self.stats["decode_ms"] += (time.perf_counter() - start) * 1000.0
+            self.stats["decoded"] += 1
+
+            with self._cond:
+                self._slot_frames[slot_index] = frame_number
+                self._write += 1
+                self._cond.notify_all()
+            frame_number += 1
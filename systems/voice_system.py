@@ -16,6 +16,30 @@ from typing import Dict, Optional
 from pathlib import Path
 
 
+# TTS 음성 재생 채널 (BGM이 pygame.mixer.music 스트림을 사용하므로 음성은 일반 채널로 재생)
+_voice_channel = None
+
+
+def _play_voice_clip(path: str):
+    """TTS 음성 파일을 Sound로 로드해 빈 믹서 채널에서 재생 (BGM 스트림을 끊지 않음)"""
+    global _voice_channel
+    import pygame
+
+    sound = pygame.mixer.Sound(path)
+    _voice_channel = pygame.mixer.find_channel(True)
+    _voice_channel.play(sound)
+    return _voice_channel
+
+
+def _stop_voice_clip():
+    if _voice_channel is not None:
+        _voice_channel.stop()
+
+
+def _voice_clip_busy() -> bool:
+    return _voice_channel is not None and _voice_channel.get_busy()
+
+
 class VoiceAdapter(ABC):
     """TTS 어댑터 추상 클래스"""
 
@@ -167,10 +191,9 @@ class OpenAIAdapter(VoiceAdapter):
                 response.stream_to_file(f.name)
 
                 # pygame으로 재생
-                pygame.mixer.music.load(f.name)
-                pygame.mixer.music.play()
+                _play_voice_clip(f.name)
 
-                while pygame.mixer.music.get_busy():
+                while _voice_clip_busy():
                     pygame.time.wait(100)
 
         except Exception as e:
@@ -180,8 +203,7 @@ class OpenAIAdapter(VoiceAdapter):
 
     def stop(self) -> None:
         try:
-            import pygame
-            pygame.mixer.music.stop()
+            _stop_voice_clip()
         except:
             pass
         self._speaking = False
@@ -307,10 +329,6 @@ class EdgeTTSAdapter(VoiceAdapter):
             if not pygame.mixer.get_init():
                 pygame.mixer.init()
 
-            # music 모듈 사용 가능 확인
-            if not hasattr(pygame.mixer, 'music'):
-                raise RuntimeError("pygame.mixer.music not available")
-
             # 치지직 효과음 재생 (음성 시작 전)
             self._play_static_effect()
 
@@ -335,10 +353,9 @@ class EdgeTTSAdapter(VoiceAdapter):
                     if not pygame.mixer.get_init():
                         pygame.mixer.init()
 
-                    pygame.mixer.music.load(temp_path)
-                    pygame.mixer.music.play()
+                    _play_voice_clip(temp_path)
 
-                    while pygame.mixer.music.get_busy():
+                    while _voice_clip_busy():
                         await asyncio.sleep(0.1)
                 finally:
                     # 재생 후 임시 파일 삭제
@@ -383,8 +400,7 @@ class EdgeTTSAdapter(VoiceAdapter):
 
     def stop(self) -> None:
         try:
-            import pygame
-            pygame.mixer.music.stop()
+            _stop_voice_clip()
         except:
             pass
 
@@ -397,10 +413,9 @@ class EdgeTTSAdapter(VoiceAdapter):
     def is_speaking(self) -> bool:
         if self._fallback_adapter and self._fallback_adapter.is_speaking():
             return True
-        # pygame mixer 상태도 확인 (실제 재생 중인지)
+        # 음성 채널 상태도 확인 (실제 재생 중인지)
         try:
-            import pygame
-            if pygame.mixer.get_init() and hasattr(pygame.mixer, 'music') and pygame.mixer.music.get_busy():
+            if _voice_clip_busy():
                 return True
         except Exception:
             pass
@@ -605,10 +620,9 @@ class VoiceSystem:
         # 어댑터가 재생 중이면 True
         if self._current_adapter is not None and self._current_adapter.is_speaking():
             return True
-        # pygame mixer 상태 직접 확인 (어댑터 상태와 별개로)
+        # 음성 채널 상태 직접 확인 (어댑터 상태와 별개로)
         try:
-            import pygame
-            if pygame.mixer.get_init() and hasattr(pygame.mixer, 'music') and pygame.mixer.music.get_busy():
+            if _voice_clip_busy():
                 return True
         except Exception:
             pass
@@ -15,7 +15,7 @@ from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 
 import config
-from ui_render import render_text_with_emoji
+from ui_render import render_text_with_emoji, get_background
 
 
 # =============================================================================
@@ -87,16 +87,9 @@ class UILayoutManager:
         if base_color is None:
             base_color = config.BG_LEVELS["SCREEN"]
 
-        bg = pygame.Surface(self.screen_size)
-
-        for y in range(self.screen_size[1]):
-            ratio = y / self.screen_size[1]
-            r = min(255, int(base_color[0] + variation * ratio))
-            g = min(255, int(base_color[1] + variation * ratio))
-            b = min(255, int(base_color[2] + variation * ratio))
-            pygame.draw.line(bg, (r, g, b), (0, y), (self.screen_size[0], y))
-
-        return bg
+        # (크기, 색상)당 한 번만 생성되는 공유 Surface - 그 위에 그리지 말 것
+        bottom_color = tuple(c + variation for c in base_color)
+        return get_background(self.screen_size, base_color, bottom_color)
 
     # =========================================================================
     # 타이틀 렌더링 (프리미엄 디자인)
@@ -8,10 +8,28 @@ from .helpers import (
     HPBarShake
 )
 
+# Cached UI surfaces (overlays, panels, cards)
+from .surfaces import (
+    SurfaceCache,
+    get_surface_cache,
+    get_overlay,
+    get_panel,
+    get_solid
+)
+
+# Procedural menu backgrounds
+from .backgrounds import (
+    get_background,
+    get_background_cache,
+    get_image_background
+)
+
 # HUD functions
 from .hud import (
     draw_hud,
-    draw_skill_indicators
+    draw_skill_indicators,
+    HudCompositor,
+    get_hud_compositor
 )
 
 # Menu functions
@@ -48,9 +66,23 @@ __all__ = [
     'render_text_with_emoji',
     'HPBarShake',
 
+    # Cached UI surfaces
+    'SurfaceCache',
+    'get_surface_cache',
+    'get_overlay',
+    'get_panel',
+    'get_solid',
+
+    # Procedural menu backgrounds
+    'get_background',
+    'get_background_cache',
+    'get_image_background',
+
     # HUD functions
     'draw_hud',
     'draw_skill_indicators',
+    'HudCompositor',
+    'get_hud_compositor',
 
     # Menu functions
     'draw_pause_and_over_screens',
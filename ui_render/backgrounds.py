@@ -0,0 +1,147 @@
+# ui_render/backgrounds.py
+# NumPy procedural backgrounds (gradient / radial glow / vignette / noise) for menu modes
+
+import pygame
+import numpy as np
+from typing import Optional, Tuple
+import config
+from .surfaces import SurfaceCache
+
+
+Color = Tuple[int, int, int]
+
+
+# =========================================================
+# 1. 배경 캐시
+# =========================================================
+
+_background_cache: Optional[SurfaceCache] = None
+
+
+def get_background_cache() -> SurfaceCache:
+    """전역 배경 Surface 캐시 반환 (전체 화면 크기라 UI Surface 캐시와 분리)"""
+    global _background_cache
+    if _background_cache is None:
+        settings = config.UI_BACKGROUND_CACHE_SETTINGS
+        _background_cache = SurfaceCache(settings["max_entries"], settings["max_bytes"])
+    return _background_cache
+
+
+# =========================================================
+# 2. 배경 생성
+# =========================================================
+
+
+def get_background(
+    size: Tuple[int, int],
+    top_color: Color,
+    bottom_color: Optional[Color] = None,
+    radial_color: Optional[Color] = None,
+    radial_alpha: int = 0,
+    radial_extent: float = 0.8,
+    vignette: float = 0.0,
+    noise: int = 0,
+    seed: int = 0,
+) -> pygame.Surface:
+    """
+    절차적 배경 (크기 + 파라미터당 한 번만 생성, 모드 간 공유)
+
+    반환된 Surface는 공유 객체이므로 그 위에 그리지 말고 blit만 하세요.
+
+    Args:
+        top_color / bottom_color: 수직 그라데이션 위/아래 색상 (bottom 없으면 단색)
+        radial_color / radial_alpha: 중앙 원형 글로우 색상과 중심 알파 (0~255)
+        radial_extent: 글로우 반경 (화면 긴 변 대비 비율)
+        vignette: 모서리 어둡게 강도 (0.0 ~ 1.0)
+        noise: 픽셀 노이즈 진폭 (0이면 없음)
+        seed: 노이즈 시드
+    """
+    size = (int(size[0]), int(size[1]))
+    top_color = tuple(int(c) for c in top_color)
+    bottom_color = tuple(int(c) for c in bottom_color) if bottom_color else top_color
+    radial_color = tuple(int(c) for c in radial_color) if radial_color and radial_alpha > 0 else None
+
+    key = ("background", size, top_color, bottom_color, radial_color, int(radial_alpha),
+           float(radial_extent), float(vignette), int(noise), int(seed))
+    return get_background_cache().get(
+        key,
+        lambda: _build_background(size, top_color, bottom_color, radial_color,
+                                  radial_alpha, radial_extent, vignette, noise, seed),
+    )
+
+
+def _build_background(
+    size: Tuple[int, int],
+    top_color: Color,
+    bottom_color: Color,
+    radial_color: Optional[Color],
+    radial_alpha: int,
+    radial_extent: float,
+    vignette: float,
+    noise: int,
+    seed: int,
+) -> pygame.Surface:
+    width, height = size
+
+    # 수직 그라데이션: 행 색상 1열만 계산해 가로로 늘림 (기존 draw.line 루프와 같은 값)
+    ratio = np.arange(height, dtype=np.float64) / height
+    top = np.array(top_color, dtype=np.float64)
+    bottom = np.array(bottom_color, dtype=np.float64)
+    column = np.clip(np.floor(top + (bottom - top) * ratio[:, None]), 0, 255).astype(np.uint8)
+    column_surface = pygame.Surface((1, height))
+    pygame.surfarray.blit_array(column_surface, column[None, :, :])
+    surface = pygame.transform.scale(column_surface, size)
+
+    if radial_color is not None or vignette > 0:
+        # 화면 중심으로부터의 거리 (w, h)
+        xs = np.arange(width, dtype=np.float32) - width // 2
+        ys = np.arange(height, dtype=np.float32) - height // 2
+        distance = np.sqrt(xs[:, None] ** 2 + ys[None, :] ** 2)
+
+        # 중앙 원형 글로우 (알파 맵만 NumPy로 만들고 합성은 blit에 맡김)
+        if radial_color is not None:
+            radius = max(size) * radial_extent
+            glow = pygame.Surface(size, pygame.SRCALPHA)
+            glow.fill(radial_color)
+            alpha = pygame.surfarray.pixels_alpha(glow)
+            alpha[:] = (np.clip(1.0 - distance / radius, 0.0, 1.0) * radial_alpha).astype(np.uint8)
+            del alpha
+            surface.blit(glow, (0, 0))
+
+        # 비네트: 모서리로 갈수록 어두운 회색 맵을 곱함
+        if vignette > 0:
+            edge = distance / np.sqrt((width / 2) ** 2 + (height / 2) ** 2)
+            shade = (np.clip(1.0 - vignette * edge ** 2, 0.0, 1.0) * 255).astype(np.uint8)
+            shade_surface = pygame.Surface(size)
+            pygame.surfarray.blit_array(shade_surface, np.repeat(shade[:, :, None], 3, axis=2))
+            surface.blit(shade_surface, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+
+    # 픽셀 노이즈 (밝기만 흔듦)
+    if noise > 0:
+        rng = np.random.default_rng(seed)
+        grain = rng.integers(-noise, noise + 1, (width, height, 1), dtype=np.int16)
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[:] = np.clip(pixels + grain, 0, 255).astype(np.uint8)
+        del pixels
+
+    return surface
+
+
+def get_image_background(path, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+    """
+    배경 이미지를 화면 크기로 smoothscale 해 캐시 (시설 화면처럼 여러 모드가 같은 배경을 쓸 때)
+
+    파일이 없거나 로드에 실패하면 None (호출 측에서 그라데이션으로 폴백)
+    """
+    size = (int(size[0]), int(size[1]))
+
+    def build():
+        image = pygame.image.load(str(path)).convert()
+        return pygame.transform.smoothscale(image, size)
+
+    key = ("image", str(path), size)
+    try:
+        return get_background_cache().get(key, build)
+    except (pygame.error, FileNotFoundError) as e:
+        print(f"WARNING: Failed to load background {path}: {e}")
+        return None
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Tuple, Dict, Optional
 import config
 from .helpers import get_font, render_text_with_emoji
+from .surfaces import get_overlay, get_panel, get_solid, get_surface_cache
 
 
 # Boss bar image cache
@@ -30,6 +31,37 @@ def _load_enemy_bar_image(bar_width: int, bar_height: int) -> Optional[pygame.Su
     return None
 
 
+# 체력 구간별 HP 바 색조 (RGBA_ADD) - None은 색조 없음
+_ENEMY_BAR_TINTS = {
+    "normal": None,
+    "warning": (255, 180, 100, 50),  # 경고 - 주황 틴트
+    "danger": (255, 100, 100, 80),  # 위험 - 붉은 틴트
+}
+
+
+def _get_enemy_bar_variant(bar_image: pygame.Surface, variant: str) -> pygame.Surface:
+    """HP 바 이미지의 어두운 배경/색조 버전 (전체 폭으로 한 번 만들어 캐시, 그릴 때 area로 자름)"""
+    bar_width, bar_height = bar_image.get_size()
+
+    def build():
+        if variant == "dark":
+            # 배경 (어두운 버전)
+            dark_bar = bar_image.copy()
+            dark_bar.fill((50, 50, 50), special_flags=pygame.BLEND_RGB_MULT)
+            return dark_bar
+
+        health_surface = pygame.Surface((bar_width, bar_height), pygame.SRCALPHA)
+        health_surface.blit(bar_image, (0, 0))
+        tint_color = _ENEMY_BAR_TINTS[variant]
+        if tint_color:
+            tint = pygame.Surface((bar_width, bar_height), pygame.SRCALPHA)
+            tint.fill(tint_color)
+            health_surface.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        return health_surface
+
+    return get_surface_cache().get(("enemy_bar", bar_width, bar_height, variant), build)
+
+
 def draw_boss_health_bar(
     screen: pygame.Surface,
     screen_size: Tuple[int, int],
@@ -86,8 +118,7 @@ def draw_boss_health_bar(
     screen.blit(name_text, name_rect)
 
     # 체력바 배경 패널
-    panel_bg = pygame.Surface((bar_width + 20, bar_height + 50), pygame.SRCALPHA)
-    panel_bg.fill((20, 20, 40, 200))
+    panel_bg = get_panel((bar_width + 20, bar_height + 50), (20, 20, 40, 200))
     screen.blit(panel_bg, (bar_x - 10, bar_y - 35))
 
     # 보스 웨이브(5, 10, 15, 20)에서는 이미지 HP 바 사용
@@ -99,32 +130,24 @@ def draw_boss_health_bar(
 
         if bar_image:
             # 배경 (어두운 버전)
-            dark_bar = bar_image.copy()
-            dark_bar.fill((50, 50, 50), special_flags=pygame.BLEND_RGB_MULT)
-            screen.blit(dark_bar, (bar_x, bar_y))
+            screen.blit(_get_enemy_bar_variant(bar_image, "dark"), (bar_x, bar_y))
 
             # 현재 체력 비율
             health_ratio = boss.hp / boss.max_hp
             current_health_width = int(bar_width * health_ratio)
 
             if current_health_width > 0:
-                # 체력 부분만 마스킹하여 표시
-                health_surface = pygame.Surface((current_health_width, bar_height), pygame.SRCALPHA)
-                health_surface.blit(bar_image, (0, 0))
-
                 # 체력에 따른 색조 변경
                 if health_ratio <= 0.25:
-                    # 위험 - 붉은 틴트
-                    tint = pygame.Surface((current_health_width, bar_height), pygame.SRCALPHA)
-                    tint.fill((255, 100, 100, 80))
-                    health_surface.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                    variant = "danger"
                 elif health_ratio <= 0.5:
-                    # 경고 - 주황 틴트
-                    tint = pygame.Surface((current_health_width, bar_height), pygame.SRCALPHA)
-                    tint.fill((255, 180, 100, 50))
-                    health_surface.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                    variant = "warning"
+                else:
+                    variant = "normal"
 
-                screen.blit(health_surface, (bar_x, bar_y))
+                # 체력 부분만 잘라서 표시
+                screen.blit(_get_enemy_bar_variant(bar_image, variant), (bar_x, bar_y),
+                            area=pygame.Rect(0, 0, current_health_width, bar_height))
 
             # 테두리 (이미지 위에)
             pygame.draw.rect(screen, config.UI_COLORS["DANGER"],
@@ -203,9 +226,7 @@ def draw_random_event_ui(screen: pygame.Surface, screen_size: Tuple[int, int], g
     # 1. 화면 틴트 효과
     screen_tint = event_data.get("screen_tint")
     if screen_tint:
-        tint_surf = pygame.Surface(screen_size, pygame.SRCALPHA)
-        tint_surf.fill(screen_tint)
-        screen.blit(tint_surf, (0, 0))
+        screen.blit(get_overlay(screen_size, screen_tint), (0, 0))
 
     # 2. 이벤트 알림 (처음 3초간 표시)
     if game_data.get("event_notification_timer", 0) > 0:
@@ -396,15 +417,13 @@ def draw_stage_transition_screen(screen: pygame.Surface, stage_num: int, stage_i
         alpha = 255
 
     # 배경 어둡게 처리
-    overlay = pygame.Surface((screen_width, screen_height))
+    overlay = get_solid((screen_width, screen_height), (0, 0, 0))
     overlay.set_alpha(min(200, alpha))
-    overlay.fill((0, 0, 0))
     screen.blit(overlay, (0, 0))
 
     # 스테이지 색상 강조 효과
-    color_overlay = pygame.Surface((screen_width, screen_height))
+    color_overlay = get_solid((screen_width, screen_height), stage_info["color"])
     color_overlay.set_alpha(min(50, alpha // 5))
-    color_overlay.fill(stage_info["color"])
     screen.blit(color_overlay, (0, 0))
 
     # 상단: "STAGE X" 텍스트
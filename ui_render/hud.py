@@ -3,7 +3,7 @@
 
 import pygame
 import math
-from typing import Tuple, TYPE_CHECKING
+from typing import Callable, Dict, Optional, Tuple, TYPE_CHECKING
 import config
 from game_logic import get_next_level_threshold
 from .helpers import get_font, render_text_with_emoji
@@ -12,6 +12,108 @@ if TYPE_CHECKING:
     from entities.player import Player
 
 
+# =========================================================
+# 1. HUD 패널 캐시
+# =========================================================
+
+
+class HudCompositor:
+    """
+    HUD 패널 캐시 (표시 값이 바뀔 때만 다시 그림)
+
+    패널마다 바인딩 값(key)과 미리 그린 Surface를 보관하고, key가 같으면 그대로 재사용합니다.
+    쿨다운처럼 연속으로 변하는 값은 호출 측에서 양자화해 key로 넘깁니다.
+    프레임마다 다시 그린 패널 수(rebuilt)와 재사용한 패널 수(reused)를 집계합니다.
+    """
+
+    def __init__(self):
+        self._panels: Dict[str, Tuple[tuple, pygame.Surface]] = {}
+        self._glyphs: Dict[tuple, pygame.Surface] = {}
+        self.frame_stats = {"rebuilt": 0, "reused": 0}
+        self.last_frame_stats = {"rebuilt": 0, "reused": 0}
+
+    def begin_frame(self):
+        """프레임 시작 - 직전 프레임 통계 보관 후 초기화 (draw_hud에서 호출)"""
+        self.last_frame_stats = self.frame_stats
+        self.frame_stats = {"rebuilt": 0, "reused": 0}
+
+    def panel(self, name: str, key: tuple, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """key가 이전과 같으면 캐시된 패널, 다르면 build()로 다시 그린 패널"""
+        cached = self._panels.get(name)
+        if cached is not None and cached[0] == key:
+            self.frame_stats["reused"] += 1
+            return cached[1]
+
+        surface = build()
+        self._panels[name] = (key, surface)
+        self.frame_stats["rebuilt"] += 1
+        return surface
+
+    def glyph(self, key: tuple, render: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """변하지 않는 텍스트/아이콘 렌더 결과 캐시 (스킬명, 이모지 아이콘 등)"""
+        surface = self._glyphs.get(key)
+        if surface is None:
+            surface = render()
+            self._glyphs[key] = surface
+        return surface
+
+    def invalidate(self, name: Optional[str] = None):
+        """패널 캐시 무효화 (name이 없으면 전체, 폰트 변경 시 등)"""
+        if name is None:
+            self._panels.clear()
+            self._glyphs.clear()
+        else:
+            self._panels.pop(name, None)
+
+    def get_frame_stats(self) -> Dict[str, int]:
+        """직전 프레임의 패널 재생성/재사용 수"""
+        return dict(self.last_frame_stats)
+
+
+_hud_compositor: Optional[HudCompositor] = None
+
+
+def get_hud_compositor() -> HudCompositor:
+    """전역 HUD 패널 캐시 반환"""
+    global _hud_compositor
+    if _hud_compositor is None:
+        _hud_compositor = HudCompositor()
+    return _hud_compositor
+
+
+def _quantize_cooldown(remaining: float, step: float) -> int:
+    """남은 쿨다운을 step 단위 칸 수로 올림 (표시는 step초마다 갱신)"""
+    if remaining <= 0:
+        return 0
+    return math.ceil(remaining / step - 1e-6)
+
+
+def _draw_cooldown_pie(
+    surface: pygame.Surface, center: Tuple[int, int], radius: int, ratio: float, color: Tuple[int, int, int]
+):
+    """12시 방향부터 시계방향으로 채워지는 부채꼴 게이지"""
+    center_x, center_y = center
+    start_angle = -math.pi / 2
+    end_angle = start_angle + (2 * math.pi * ratio)
+
+    points = [(center_x, center_y)]
+    for i in range(int(ratio * 100) + 1):
+        angle = start_angle + (end_angle - start_angle) * i / 100
+        x = center_x + int(radius * math.cos(angle))
+        y = center_y + int(radius * math.sin(angle))
+        points.append((x, y))
+
+    if len(points) > 2:
+        pygame.draw.polygon(surface, color, points)
+
+
+def _panel_surface(width: int, height: int) -> pygame.Surface:
+    """반투명 패널 배경 - 통일된 색상"""
+    panel = pygame.Surface((width, height), pygame.SRCALPHA)
+    panel.fill((*config.BG_LEVELS["PANEL"], 200))
+    return panel
+
+
 # =========================================================
 # 2. HUD 그리기 함수
 # =========================================================
@@ -26,28 +128,22 @@ def draw_hud(
 ):
     """
     HUD (Head-Up Display)를 그립니다. (HP 바, 레벨, 점수)
+
+    각 패널은 HudCompositor에 캐시되며 표시 값이 바뀐 패널만 다시 그립니다.
     """
     SCREEN_WIDTH, SCREEN_HEIGHT = screen_size
-    center_x = SCREEN_WIDTH // 2
+    compositor = get_hud_compositor()
+    compositor.begin_frame()
+    cooldown_step = config.HUD_CACHE_SETTINGS["cooldown_step"]
 
     # ==================== 좌상단 패널 (HP, 레벨, 킬) ====================
     panel_margin = 20
     panel_padding = 12
-    panel_x = panel_margin
-    panel_y = panel_margin
 
-    # 패널 배경 (반투명) - 웨이브 정보 추가로 높이 증가 - 통일된 색상
+    # 패널 크기 - 웨이브 정보 추가로 높이 증가
     panel_width = 300
     panel_height = 115  # 90 → 115 (웨이브 정보 공간)
-    panel_bg = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-    panel_bg.fill((*config.BG_LEVELS["PANEL"], 200))
-    screen.blit(panel_bg, (panel_x, panel_y))
-
-    # 1. HP 바 (패널 내부)
     bar_width = panel_width - (panel_padding * 2)
-    bar_height = 28
-    bar_x = panel_x + panel_padding
-    bar_y = panel_y + panel_padding
 
     health_ratio = player.hp / player.max_hp if player.max_hp > 0 else 0
 
@@ -59,12 +155,126 @@ def draw_hud(
     else:
         hp_color = config.STATE_COLORS["SUCCESS"]
 
+    status_key = (
+        id(font_medium), int(player.hp), int(player.max_hp), int(bar_width * health_ratio), hp_color,
+        game_data["player_level"], game_data["kill_count"], game_data.get("current_wave", 1),
+        game_data.get("wave_kills", 0), game_data.get("wave_target_kills", 20),
+    )
+    status_panel = compositor.panel(
+        "status", status_key,
+        lambda: _build_status_panel(
+            (panel_width, panel_height), panel_padding, font_medium, player, game_data, health_ratio, hp_color
+        ),
+    )
+    screen.blit(status_panel, (panel_margin, panel_margin))
+
+    # ==================== 우상단 패널 (코인) ====================
+    coin_panel_width = 200
+    coin_panel_height = 50
+    coin_panel_x = SCREEN_WIDTH - coin_panel_width - panel_margin
+
+    coin_panel = compositor.panel(
+        "coin", (id(font_medium), game_data["score"]),
+        lambda: _build_coin_panel((coin_panel_width, coin_panel_height), font_medium, game_data["score"]),
+    )
+    screen.blit(coin_panel, (coin_panel_x, panel_margin))
+
+    # ==================== 상단 중앙 (EXP 게이지) ====================
+    level_threshold = get_next_level_threshold(game_data["player_level"])
+    progress_ratio = min(1.0, game_data["uncollected_score"] / level_threshold)
+
+    exp_panel_width = 400
+    exp_panel_height = 45
+    exp_panel_x = (SCREEN_WIDTH - exp_panel_width) // 2
+    gauge_width = exp_panel_width - (panel_padding * 2)
+
+    exp_key = (id(font_medium), game_data["uncollected_score"], level_threshold, int(gauge_width * progress_ratio))
+    exp_panel = compositor.panel(
+        "exp", exp_key,
+        lambda: _build_exp_panel(
+            (exp_panel_width, exp_panel_height), panel_padding, font_medium,
+            game_data["uncollected_score"], level_threshold, progress_ratio,
+        ),
+    )
+    screen.blit(exp_panel, (exp_panel_x, panel_margin))
+
+    # 6. 무기 쿨다운 인디케이터 (화면 하단 중앙)
+    # 플레이어의 무기 쿨다운 상태 표시 (0.1초 단위 갱신)
+    weapon = player.weapon
+    weapon_steps = _quantize_cooldown(weapon.cooldown - weapon.time_since_last_shot, cooldown_step)
+    cooldown_ratio = max(0.0, 1.0 - weapon_steps * cooldown_step / weapon.cooldown) if weapon_steps else 1.0
+
+    indicator_size = 80
+    indicator_x = SCREEN_WIDTH // 2
+    indicator_y = SCREEN_HEIGHT - 60
+    icon_font = get_font("icon")
+
+    weapon_indicator = compositor.panel(
+        "weapon", (id(icon_font), weapon.cooldown, weapon_steps),
+        lambda: _build_weapon_indicator(indicator_size, icon_font, cooldown_ratio),
+    )
+    screen.blit(weapon_indicator, weapon_indicator.get_rect(center=(indicator_x, indicator_y)))
+
+    # ==================== Ship Ability 인디케이터 (무기 인디케이터 왼쪽) ====================
+    ability_info = None
+    if hasattr(player, 'get_ship_ability_info'):
+        ability_info = player.get_ship_ability_info()
+
+    if ability_info:
+        ability_indicator_x = indicator_x - 120  # 무기 인디케이터 왼쪽에 위치
+        ability_indicator_y = indicator_y
+        ability_radius = 35
+
+        ability_cooldown = ability_info.get('cooldown', 0)
+        ability_steps = _quantize_cooldown(ability_info.get('remaining', 0), cooldown_step)
+        ability_key = (
+            ability_info.get('name', 'Ability'), ability_info.get('ready', False),
+            ability_info.get('active', False), ability_cooldown, ability_steps,
+        )
+        ability_indicator, ability_center = compositor.panel(
+            "ability", ability_key,
+            lambda: _build_ability_indicator(ability_radius, ability_info, ability_steps * cooldown_step),
+        )
+        screen.blit(ability_indicator, (ability_indicator_x - ability_center[0],
+                                        ability_indicator_y - ability_center[1]))
+
+    # ==================== 좌하단 (환생 아이콘) ====================
+    reincarnation_count = player.upgrades.get("REINCARNATION", 0)
+    if reincarnation_count > 0:
+        reincarnation_panel_margin = 20
+        reincarnation_panel_y = SCREEN_HEIGHT - 80
+
+        reincarnation_icons, icon_margin = compositor.panel(
+            "reincarnation", (reincarnation_count,),
+            lambda: _build_reincarnation_icons(reincarnation_count),
+        )
+        screen.blit(reincarnation_icons, (reincarnation_panel_margin - icon_margin,
+                                          reincarnation_panel_y - icon_margin))
+
+
+def _build_status_panel(
+    size: Tuple[int, int],
+    padding: int,
+    font_medium: pygame.font.Font,
+    player: "Player",
+    game_data: dict,
+    health_ratio: float,
+    hp_color: Tuple[int, int, int],
+) -> pygame.Surface:
+    """좌상단 패널 (HP 바, 레벨, 킬, 웨이브)"""
+    panel = _panel_surface(*size)
+
+    # 1. HP 바 (패널 내부)
+    bar_width = size[0] - (padding * 2)
+    bar_height = 28
+    bar_x = padding
+    bar_y = padding
+
     # HP 바 배경 (테두리 없음) - 통일된 색상
-    pygame.draw.rect(screen, config.BG_LEVELS["ELEVATED"], (bar_x, bar_y, bar_width, bar_height))
+    pygame.draw.rect(panel, config.BG_LEVELS["ELEVATED"], (bar_x, bar_y, bar_width, bar_height))
     # HP 바 (현재 체력)
     if health_ratio > 0:
-        pygame.draw.rect(screen, hp_color,
-                        (bar_x, bar_y, int(bar_width * health_ratio), bar_height))
+        pygame.draw.rect(panel, hp_color, (bar_x, bar_y, int(bar_width * health_ratio), bar_height))
 
     # HP 텍스트 (바 중앙)
     hp_text = render_text_with_emoji(
@@ -73,8 +283,7 @@ def draw_hud(
         config.WHITE,
         "MEDIUM"
     )
-    text_rect = hp_text.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2))
-    screen.blit(hp_text, text_rect)
+    panel.blit(hp_text, hp_text.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2)))
 
     # 2. 레벨 & 킬 카운트 (HP 바 아래, 패널 내부) - 통일된 색상
     info_y = bar_y + bar_height + 10
@@ -86,7 +295,7 @@ def draw_hud(
         config.STATE_COLORS["GOLD"],
         "MEDIUM"
     )
-    screen.blit(level_text, (bar_x, info_y))
+    panel.blit(level_text, (bar_x, info_y))
 
     # 킬 카운트 (오른쪽)
     kill_text = render_text_with_emoji(
@@ -95,7 +304,7 @@ def draw_hud(
         config.TEXT_LEVELS["PRIMARY"],
         "MEDIUM"
     )
-    screen.blit(kill_text, (bar_x + bar_width - kill_text.get_width(), info_y))
+    panel.blit(kill_text, (bar_x + bar_width - kill_text.get_width(), info_y))
 
     # 3. 웨이브 정보 (레벨/킬 카운트 아래) - 통일된 색상
     wave_y = info_y + 25
@@ -109,81 +318,75 @@ def draw_hud(
         config.STATE_COLORS["INFO"],
         "MEDIUM"
     )
-    screen.blit(wave_text, (bar_x, wave_y))
+    panel.blit(wave_text, (bar_x, wave_y))
+    return panel
 
-    # ==================== 우상단 패널 (코인) ====================
-    coin_panel_width = 200
-    coin_panel_height = 50
-    coin_panel_x = SCREEN_WIDTH - coin_panel_width - panel_margin
-    coin_panel_y = panel_margin
 
-    # 코인 패널 배경 (테두리 없음) - 통일된 색상
-    coin_bg = pygame.Surface((coin_panel_width, coin_panel_height), pygame.SRCALPHA)
-    coin_bg.fill((*config.BG_LEVELS["PANEL"], 200))
-    screen.blit(coin_bg, (coin_panel_x, coin_panel_y))
+def _build_coin_panel(size: Tuple[int, int], font_medium: pygame.font.Font, score: int) -> pygame.Surface:
+    """우상단 코인 패널"""
+    panel = _panel_surface(*size)
 
     # 코인 텍스트 (중앙 정렬) - 통일된 색상
     coin_text = render_text_with_emoji(
-        f"{config.UI_ICONS['COIN']} {game_data['score']}",
+        f"{config.UI_ICONS['COIN']} {score}",
         font_medium,
         config.STATE_COLORS["GOLD"],
         "MEDIUM"
     )
-    coin_rect = coin_text.get_rect(center=(coin_panel_x + coin_panel_width // 2,
-                                            coin_panel_y + coin_panel_height // 2))
-    screen.blit(coin_text, coin_rect)
+    panel.blit(coin_text, coin_text.get_rect(center=(size[0] // 2, size[1] // 2)))
+    return panel
 
-    # ==================== 상단 중앙 (EXP 게이지) ====================
-    level_threshold = get_next_level_threshold(game_data["player_level"])
-    progress_ratio = min(1.0, game_data["uncollected_score"] / level_threshold)
-
-    exp_panel_width = 400
-    exp_panel_height = 45
-    exp_panel_x = (SCREEN_WIDTH - exp_panel_width) // 2
-    exp_panel_y = panel_margin
 
-    # EXP 패널 배경 (테두리 없음) - 통일된 색상
-    exp_bg = pygame.Surface((exp_panel_width, exp_panel_height), pygame.SRCALPHA)
-    exp_bg.fill((*config.BG_LEVELS["PANEL"], 200))
-    screen.blit(exp_bg, (exp_panel_x, exp_panel_y))
+def _build_exp_panel(
+    size: Tuple[int, int],
+    padding: int,
+    font_medium: pygame.font.Font,
+    uncollected_score: int,
+    level_threshold: int,
+    progress_ratio: float,
+) -> pygame.Surface:
+    """상단 중앙 EXP 게이지 패널"""
+    panel = _panel_surface(*size)
 
     # EXP 게이지 (패널 내부)
-    gauge_width = exp_panel_width - (panel_padding * 2)
+    gauge_width = size[0] - (padding * 2)
     gauge_height = 24
-    gauge_x = exp_panel_x + panel_padding
-    gauge_y = exp_panel_y + (exp_panel_height - gauge_height) // 2
+    gauge_x = padding
+    gauge_y = (size[1] - gauge_height) // 2
 
     # 게이지 배경 (테두리 없음) - 통일된 색상
-    pygame.draw.rect(screen, config.BG_LEVELS["ELEVATED"], (gauge_x, gauge_y, gauge_width, gauge_height))
+    pygame.draw.rect(panel, config.BG_LEVELS["ELEVATED"], (gauge_x, gauge_y, gauge_width, gauge_height))
 
     # EXP 바 (진행도) - 통일된 색상
     if progress_ratio > 0:
-        pygame.draw.rect(screen, config.STATE_COLORS["INFO"],
-                        (gauge_x, gauge_y, int(gauge_width * progress_ratio), gauge_height))
+        pygame.draw.rect(panel, config.STATE_COLORS["INFO"],
+                         (gauge_x, gauge_y, int(gauge_width * progress_ratio), gauge_height))
 
     # 게이지 텍스트 (중앙)
     gauge_value_text = render_text_with_emoji(
-        f"{config.UI_ICONS['EXP']} {game_data['uncollected_score']}/{level_threshold}",
+        f"{config.UI_ICONS['EXP']} {uncollected_score}/{level_threshold}",
         font_medium,
         config.WHITE,
         "MEDIUM"
     )
-    text_rect = gauge_value_text.get_rect(center=(gauge_x + gauge_width // 2, gauge_y + gauge_height // 2))
-    screen.blit(gauge_value_text, text_rect)
+    panel.blit(gauge_value_text, gauge_value_text.get_rect(center=(gauge_x + gauge_width // 2, gauge_y + gauge_height // 2)))
+    return panel
 
-    # 6. 무기 쿨다운 인디케이터 (화면 하단 중앙)
-    # 플레이어의 무기 쿨다운 상태 표시
-    weapon = player.weapon
-    cooldown_ratio = min(1.0, weapon.time_since_last_shot / weapon.cooldown)
 
-    # 원형 쿨다운 인디케이터
-    indicator_size = 80
-    indicator_x = SCREEN_WIDTH // 2
-    indicator_y = SCREEN_HEIGHT - 60
+def _build_weapon_indicator(indicator_size: int, icon_font: pygame.font.Font, cooldown_ratio: float) -> pygame.Surface:
+    """무기 쿨다운 원형 인디케이터 (중앙 아이콘 포함)"""
+    icon_text = get_hud_compositor().glyph(
+        ("weapon_icon", id(icon_font)),
+        lambda: render_text_with_emoji(config.UI_ICONS["GUN"], icon_font, config.WHITE, "MEDIUM"),
+    )
+    width = max(indicator_size, icon_text.get_width())
+    height = max(indicator_size, icon_text.get_height())
+    indicator = pygame.Surface((width, height), pygame.SRCALPHA)
+    center = (width // 2, height // 2)
     radius = indicator_size // 2
 
     # 배경 원 - 통일된 색상
-    pygame.draw.circle(screen, config.BG_LEVELS["ELEVATED"], (indicator_x, indicator_y), radius)
+    pygame.draw.circle(indicator, config.BG_LEVELS["ELEVATED"], center, radius)
 
     # 쿨다운 진행도 원 (시계방향으로 채워짐) - 통일된 색상
     if cooldown_ratio < 1.0:
@@ -193,127 +396,98 @@ def draw_hud(
         # 발사 가능 (초록색)
         color = config.STATE_COLORS["SUCCESS"]
 
-    # 부채꼴 게이지 그리기
     if cooldown_ratio > 0:
-        start_angle = -math.pi / 2  # 12시 방향부터 시작
-        end_angle = start_angle + (2 * math.pi * cooldown_ratio)
+        _draw_cooldown_pie(indicator, center, radius, cooldown_ratio, color)
+
+    # 중앙 아이콘 (더 크게)
+    indicator.blit(icon_text, icon_text.get_rect(center=center))
+    return indicator
 
-        # 부채꼴 모양으로 그리기
-        points = [(indicator_x, indicator_y)]
-        for i in range(int(cooldown_ratio * 100) + 1):
-            angle = start_angle + (end_angle - start_angle) * i / 100
-            x = indicator_x + int(radius * math.cos(angle))
-            y = indicator_y + int(radius * math.sin(angle))
-            points.append((x, y))
 
-        if len(points) > 2:
-            pygame.draw.polygon(screen, color, points)
+def _build_ability_indicator(
+    ability_radius: int, ability_info: dict, ability_remaining: float
+) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Ship Ability 인디케이터 - (Surface, Surface 내 원 중심) 반환"""
+    ability_cooldown = ability_info.get('cooldown', 0)
+    ability_ready = ability_info.get('ready', False)
+    ability_active = ability_info.get('active', False)
 
-    # 중앙 아이콘 (더 크게)
-    icon_font = get_font("icon")
-    icon_text = render_text_with_emoji(config.UI_ICONS["GUN"], icon_font, config.WHITE, "MEDIUM")
-    icon_rect = icon_text.get_rect(center=(indicator_x, indicator_y))
-    screen.blit(icon_text, icon_rect)
+    # 쿨다운 비율 계산
+    if ability_cooldown > 0:
+        ability_ratio = 1.0 - (ability_remaining / ability_cooldown)
+    else:
+        ability_ratio = 1.0
 
-    # ==================== Ship Ability 인디케이터 (무기 인디케이터 왼쪽) ====================
-    ability_info = None
-    if hasattr(player, 'get_ship_ability_info'):
-        ability_info = player.get_ship_ability_info()
+    # 능력 이름 (아이콘 아래) - 크기 계산을 위해 먼저 렌더링
+    ability_name = ability_info.get('name', 'Ability')[:8]  # 최대 8글자
+    ability_name_text = get_font("tiny").render(ability_name, True, config.WHITE)
 
-    if ability_info:
-        ability_indicator_x = indicator_x - 120  # 무기 인디케이터 왼쪽에 위치
-        ability_indicator_y = indicator_y
-        ability_radius = 35
+    width = max(ability_radius * 2, ability_name_text.get_width()) + 2
+    height = ability_radius * 2 + 12 + ability_name_text.get_height() // 2 + 2
+    indicator = pygame.Surface((width, height), pygame.SRCALPHA)
+    center = (width // 2, ability_radius)
 
-        # 쿨다운 비율 계산
-        ability_cooldown = ability_info.get('cooldown', 0)
-        ability_remaining = ability_info.get('remaining', 0)
-        ability_ready = ability_info.get('ready', False)
-        ability_active = ability_info.get('active', False)
+    # 배경 원 - 통일된 색상
+    pygame.draw.circle(indicator, config.BG_LEVELS["ELEVATED"], center, ability_radius)
+
+    # 상태에 따른 색상 - 통일된 색상
+    if ability_active:
+        # 능력 활성화 중 - 노란색 테두리 + 펄스 효과
+        ability_color = config.STATE_COLORS["WARNING"]
+        pygame.draw.circle(indicator, ability_color, center, ability_radius, 4)
+    elif ability_ready:
+        # 사용 가능 - 초록색
+        ability_color = config.STATE_COLORS["SUCCESS"]
+    else:
+        # 쿨다운 중 - 빨간색에서 초록색으로 전환
+        ability_color = config.STATE_COLORS["DANGER"]
 
-        if ability_cooldown > 0:
-            ability_ratio = 1.0 - (ability_remaining / ability_cooldown)
-        else:
-            ability_ratio = 1.0
-
-        # 배경 원 - 통일된 색상
-        pygame.draw.circle(screen, config.BG_LEVELS["ELEVATED"], (ability_indicator_x, ability_indicator_y), ability_radius)
-
-        # 상태에 따른 색상 - 통일된 색상
-        if ability_active:
-            # 능력 활성화 중 - 노란색 테두리 + 펄스 효과
-            ability_color = config.STATE_COLORS["WARNING"]
-            pygame.draw.circle(screen, ability_color, (ability_indicator_x, ability_indicator_y), ability_radius, 4)
-        elif ability_ready:
-            # 사용 가능 - 초록색
-            ability_color = config.STATE_COLORS["SUCCESS"]
-        else:
-            # 쿨다운 중 - 빨간색에서 초록색으로 전환
-            ability_color = config.STATE_COLORS["DANGER"]
-
-        # 쿨다운 진행도 원 그리기
-        if ability_ratio > 0 and not ability_active:
-            start_angle = -math.pi / 2
-            end_angle = start_angle + (2 * math.pi * ability_ratio)
-
-            points = [(ability_indicator_x, ability_indicator_y)]
-            for i in range(int(ability_ratio * 100) + 1):
-                angle = start_angle + (end_angle - start_angle) * i / 100
-                x = ability_indicator_x + int(ability_radius * math.cos(angle))
-                y = ability_indicator_y + int(ability_radius * math.sin(angle))
-                points.append((x, y))
-
-            if len(points) > 2:
-                pygame.draw.polygon(screen, ability_color, points)
-
-        # 능력 아이콘 (E키 표시)
-        ability_font = get_font("large")
-        ability_icon_text = ability_font.render("E", True, config.WHITE)
-        ability_icon_rect = ability_icon_text.get_rect(center=(ability_indicator_x, ability_indicator_y - 5))
-        screen.blit(ability_icon_text, ability_icon_rect)
-
-        # 능력 이름 (아이콘 아래)
-        ability_name_font = get_font("tiny")
-        ability_name = ability_info.get('name', 'Ability')[:8]  # 최대 8글자
-        ability_name_text = ability_name_font.render(ability_name, True, config.WHITE)
-        ability_name_rect = ability_name_text.get_rect(center=(ability_indicator_x, ability_indicator_y + ability_radius + 12))
-        screen.blit(ability_name_text, ability_name_rect)
-
-        # 쿨다운 시간 표시 (쿨다운 중일 때만)
-        if not ability_ready and ability_remaining > 0:
-            cooldown_font = get_font("small")
-            cooldown_text = cooldown_font.render(f"{ability_remaining:.1f}s", True, config.WHITE)
-            cooldown_rect = cooldown_text.get_rect(center=(ability_indicator_x, ability_indicator_y + 10))
-            screen.blit(cooldown_text, cooldown_rect)
+    # 쿨다운 진행도 원 그리기
+    if ability_ratio > 0 and not ability_active:
+        _draw_cooldown_pie(indicator, center, ability_radius, ability_ratio, ability_color)
 
-    # ==================== 좌하단 (환생 아이콘) ====================
-    reincarnation_count = player.upgrades.get("REINCARNATION", 0)
-    if reincarnation_count > 0:
-        reincarnation_panel_margin = 20
-        reincarnation_panel_x = reincarnation_panel_margin
-        reincarnation_panel_y = SCREEN_HEIGHT - 80
+    # 능력 아이콘 (E키 표시)
+    ability_icon_text = get_font("large").render("E", True, config.WHITE)
+    indicator.blit(ability_icon_text, ability_icon_text.get_rect(center=(center[0], center[1] - 5)))
 
-        # 환생 아이콘 크기
-        icon_size = 40
-        icon_spacing = 10
+    indicator.blit(ability_name_text, ability_name_text.get_rect(center=(center[0], center[1] + ability_radius + 12)))
 
-        for i in range(reincarnation_count):
-            icon_x = reincarnation_panel_x + i * (icon_size + icon_spacing)
-            icon_y = reincarnation_panel_y
+    # 쿨다운 시간 표시 (쿨다운 중일 때만)
+    if not ability_ready and ability_remaining > 0:
+        cooldown_text = get_font("small").render(f"{ability_remaining:.1f}s", True, config.WHITE)
+        indicator.blit(cooldown_text, cooldown_text.get_rect(center=(center[0], center[1] + 10)))
 
-            # 배경 원 (반투명 검정)
-            pygame.draw.circle(screen, (0, 0, 0, 150), (icon_x + icon_size // 2, icon_y + icon_size // 2), icon_size // 2 + 2)
+    return indicator, center
 
-            # 환생 아이콘
-            reincarnation_font = get_font("large")
-            reincarnation_icon = render_text_with_emoji(
-                config.UI_ICONS["REINCARNATION"],
-                reincarnation_font,
-                config.UI_COLORS["DANGER"],
-                "MEDIUM"
-            )
-            icon_rect = reincarnation_icon.get_rect(center=(icon_x + icon_size // 2, icon_y + icon_size // 2))
-            screen.blit(reincarnation_icon, icon_rect)
+
+def _build_reincarnation_icons(reincarnation_count: int) -> Tuple[pygame.Surface, int]:
+    """환생 아이콘 줄 - (Surface, 바깥 여백) 반환 (아이콘이 원보다 커도 잘리지 않도록 여백 포함)"""
+    # 환생 아이콘 크기
+    icon_size = 40
+    icon_spacing = 10
+    margin = 12
+
+    reincarnation_font = get_font("large")
+    reincarnation_icon = render_text_with_emoji(
+        config.UI_ICONS["REINCARNATION"],
+        reincarnation_font,
+        config.UI_COLORS["DANGER"],
+        "MEDIUM"
+    )
+
+    width = reincarnation_count * (icon_size + icon_spacing) + margin * 2
+    icons = pygame.Surface((width, icon_size + margin * 2), pygame.SRCALPHA)
+
+    for i in range(reincarnation_count):
+        center = (margin + i * (icon_size + icon_spacing) + icon_size // 2, margin + icon_size // 2)
+
+        # 배경 원 (검정)
+        pygame.draw.circle(icons, (0, 0, 0), center, icon_size // 2 + 2)
+
+        # 환생 아이콘
+        icons.blit(reincarnation_icon, reincarnation_icon.get_rect(center=center))
+
+    return icons, margin
 
 
 def draw_skill_indicators(
@@ -384,36 +558,36 @@ def _draw_single_skill_box(
     emoji_font: pygame.font.Font,
     text_font: pygame.font.Font
 ):
-    """개별 스킬을 네모 박스로 그립니다 (개선된 스타일)"""
+    """개별 스킬을 네모 박스로 그립니다 (개선된 스타일, 상태가 바뀔 때만 다시 그림)"""
     pos_x, pos_y = pos
     skill_type = skill_info['type']
-    icon_emoji = skill_info['icon']
-    skill_name_text = skill_info['name']
     skill_color = skill_info['color']
+    cache_settings = config.HUD_CACHE_SETTINGS
+    compositor = get_hud_compositor()
 
     # 획득 여부
     is_acquired = skill_name in player.acquired_skills
     has_synergy = is_acquired and _has_synergy_with_skill(skill_name, player)
 
-    # 네모 박스 위치 (중앙 기준)
-    box_x = pos_x - box_size // 2
-    box_y = pos_y - box_size // 2
-
-    # 트리거 스킬의 쿨다운 비율 계산
+    # 트리거 스킬의 쿨다운 비율 계산 (0.1초 단위 갱신)
     cooldown_ratio = 1.0
     if skill_type == 'trigger' and is_acquired:
         last_trigger = player.skill_last_trigger.get(skill_name, 0.0)
         time_since_trigger = current_time - last_trigger
         skill_cooldown = skill_info.get('cooldown', 1.0)
-        cooldown_ratio = min(1.0, time_since_trigger / skill_cooldown)
+        steps = _quantize_cooldown(skill_cooldown - time_since_trigger, cache_settings["cooldown_step"])
+        if steps:
+            cooldown_ratio = max(0.0, 1.0 - steps * cache_settings["cooldown_step"] / skill_cooldown)
 
     # 배경색 결정
     if not is_acquired:
         # 미획득: 전체 어둡게
         bg_color = (40, 40, 40)
     elif skill_type == 'passive':
-        # 패시브: 고유색 + 깜박임
-        blink_factor = 0.7 + 0.3 * math.sin(current_time * settings["passive_blink_speed"] * math.pi * 2)
+        # 패시브: 고유색 + 깜박임 (밝기 단계 양자화)
+        levels = cache_settings["blink_levels"]
+        wave = math.sin(current_time * settings["passive_blink_speed"] * math.pi * 2)
+        blink_factor = 0.7 + 0.3 * round(wave * levels) / levels
         bg_color = tuple(int(c * blink_factor) for c in skill_color)
     else:
         # 트리거: 쿨다운에 따라 색상 회전 변화
@@ -439,58 +613,85 @@ def _draw_single_skill_box(
             # 발사 가능: 초록색 - 통일된 색상
             bg_color = config.STATE_COLORS["SUCCESS"]
 
-    # 네모 박스 그리기
-    pygame.draw.rect(screen, bg_color, (box_x, box_y, box_size, box_size))
+    box_key = (id(emoji_font), is_acquired, has_synergy, bg_color, cooldown_ratio)
+    box, margin = compositor.panel(
+        f"skill:{skill_name}", box_key,
+        lambda: _build_skill_box(
+            skill_name, skill_info, box_size, settings, emoji_font,
+            is_acquired, has_synergy, bg_color, cooldown_ratio,
+        ),
+    )
+    screen.blit(box, (pos_x - box_size // 2 - margin, pos_y - box_size // 2 - margin))
 
-    # 쿨다운 게이지 (트리거 스킬만)
-    if skill_type == 'trigger' and is_acquired and cooldown_ratio < 1.0:
-        # 부채꼴 형태로 쿨다운 표시
-        start_angle = -math.pi / 2  # 12시 방향부터
-        end_angle = start_angle + (2 * math.pi * cooldown_ratio)
+    # 하단에 스킬명 표시 (밝은 흰색, 더 크게)
+    name_surf = compositor.glyph(
+        ("skill_name", skill_name, id(text_font)),
+        lambda: text_font.render(skill_info['name'], True, (255, 255, 255)),
+    )
+    name_rect = name_surf.get_rect(center=(pos_x, pos_y + box_size // 2 + settings["text_offset_y"]))
+    screen.blit(name_surf, name_rect)
 
-        points = [(pos_x, pos_y)]
-        for i in range(int(cooldown_ratio * 100) + 1):
-            angle = start_angle + (end_angle - start_angle) * i / 100
-            x = pos_x + int((box_size // 2) * math.cos(angle))
-            y = pos_y + int((box_size // 2) * math.sin(angle))
-            points.append((x, y))
 
-        if len(points) > 2:
-            pygame.draw.polygon(screen, bg_color, points)
+def _build_skill_box(
+    skill_name: str,
+    skill_info: dict,
+    box_size: int,
+    settings: dict,
+    emoji_font: pygame.font.Font,
+    is_acquired: bool,
+    has_synergy: bool,
+    bg_color: Tuple[int, int, int],
+    cooldown_ratio: float,
+) -> Tuple[pygame.Surface, int]:
+    """스킬 박스 (배경, 쿨다운 게이지, 테두리, 아이콘, 시너지 별) - (Surface, 바깥 여백) 반환"""
+    # 시너지 별이 박스 모서리를 살짝 넘어가므로 여백 포함
+    margin = 8
+    box = pygame.Surface((box_size + margin * 2, box_size + margin * 2), pygame.SRCALPHA)
+    box_x = box_y = margin
+    center = (margin + box_size // 2, margin + box_size // 2)
 
-    # 테두리 (3px)
-    border_color = (100, 100, 100) if not is_acquired else config.WHITE
-    pygame.draw.rect(screen, border_color, (box_x, box_y, box_size, box_size), settings["border_width"])
+    # 네모 박스 그리기
+    pygame.draw.rect(box, bg_color, (box_x, box_y, box_size, box_size))
 
-    # 이모지 아이콘 렌더링
-    icon_surf = emoji_font.render(icon_emoji, True, (255, 255, 255))
+    # 쿨다운 게이지 (트리거 스킬만) - 부채꼴 형태로 쿨다운 표시
+    if skill_info['type'] == 'trigger' and is_acquired and cooldown_ratio < 1.0:
+        _draw_cooldown_pie(box, center, box_size // 2, cooldown_ratio, bg_color)
 
-    # 미획득 시 어둡게
-    if not is_acquired:
-        dim_overlay = pygame.Surface(icon_surf.get_size(), pygame.SRCALPHA)
-        dim_value = int(255 * settings["inactive_dim"])
-        dim_overlay.fill((dim_value, dim_value, dim_value))
-        temp_surf = icon_surf.copy()
-        temp_surf.blit(dim_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        icon_surf = temp_surf
+    # 테두리 (3px)
+    border_color = (100, 100, 100) if not is_acquired else config.WHITE
+    pygame.draw.rect(box, border_color, (box_x, box_y, box_size, box_size), settings["border_width"])
 
-    # 중앙 정렬
-    icon_rect = icon_surf.get_rect(center=(pos_x, pos_y))
-    screen.blit(icon_surf, icon_rect)
+    # 이모지 아이콘 (획득 상태별로 한 번만 렌더링)
+    icon_surf = get_hud_compositor().glyph(
+        ("skill_icon", skill_name, is_acquired, id(emoji_font)),
+        lambda: _render_skill_icon(skill_info['icon'], emoji_font, is_acquired, settings),
+    )
+    box.blit(icon_surf, icon_surf.get_rect(center=center))
 
     # 시너지 표시 (우상단 별)
     if has_synergy:
         star_font = config.EMOJI_FONTS.get("SMALL")
         if star_font:
             star_surf = star_font.render('✨', True, (255, 255, 100))
-            star_rect = star_surf.get_rect(center=(box_x + box_size - 10, box_y + 10))
-            screen.blit(star_surf, star_rect)
+            box.blit(star_surf, star_surf.get_rect(center=(box_x + box_size - 10, box_y + 10)))
 
-    # 하단에 스킬명 표시 (밝은 흰색, 더 크게)
-    name_font = get_font("micro")
-    name_surf = name_font.render(skill_name_text, True, (255, 255, 255))
-    name_rect = name_surf.get_rect(center=(pos_x, pos_y + box_size // 2 + settings["text_offset_y"]))
-    screen.blit(name_surf, name_rect)
+    return box, margin
+
+
+def _render_skill_icon(
+    icon_emoji: str, emoji_font: pygame.font.Font, is_acquired: bool, settings: dict
+) -> pygame.Surface:
+    """스킬 이모지 아이콘 렌더링 (미획득 시 어둡게)"""
+    icon_surf = emoji_font.render(icon_emoji, True, (255, 255, 255))
+
+    if not is_acquired:
+        dim_overlay = pygame.Surface(icon_surf.get_size(), pygame.SRCALPHA)
+        dim_value = int(255 * settings["inactive_dim"])
+        dim_overlay.fill((dim_value, dim_value, dim_value))
+        icon_surf = icon_surf.copy()
+        icon_surf.blit(dim_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+
+    return icon_surf
 
 
 def _has_synergy_with_skill(skill_name: str, player: "Player") -> bool:
@@ -6,6 +6,7 @@ import time
 from typing import Tuple, Dict
 import config
 from .helpers import get_font, render_text_with_emoji
+from .surfaces import get_overlay, get_panel
 
 
 def draw_pause_and_over_screens(
@@ -26,9 +27,7 @@ def draw_pause_and_over_screens(
     button_rects: Dict[str, pygame.Rect] = {}
 
     SCREEN_WIDTH, SCREEN_HEIGHT = screen_size
-    overlay = pygame.Surface(screen_size, pygame.SRCALPHA)
-    overlay.fill(config.UI_COLORS["OVERLAY"])
-    screen.blit(overlay, (0, 0))
+    screen.blit(get_overlay(screen_size, config.UI_COLORS["OVERLAY"]), (0, 0))
 
     center_x = SCREEN_WIDTH // 2
     center_y = SCREEN_HEIGHT // 2
@@ -40,8 +39,7 @@ def draw_pause_and_over_screens(
     menu_y = center_y - menu_height // 2
 
     # 패널 배경 - 통일된 색상 사용
-    panel_bg = pygame.Surface((menu_width, menu_height), pygame.SRCALPHA)
-    panel_bg.fill((*config.BG_LEVELS["PANEL"], 240))
+    panel_bg = get_panel((menu_width, menu_height), (*config.BG_LEVELS["PANEL"], 240))
     screen.blit(panel_bg, (menu_x, menu_y))
 
     # 현재 마우스 위치 (호버 효과용)
@@ -89,14 +87,12 @@ def draw_pause_and_over_screens(
             is_hovered = btn_bg_rect.collidepoint(mouse_pos)
             if is_hovered:
                 # 호버 시: 밝은 배경 + 테두리
-                btn_bg = pygame.Surface((btn_bg_width, btn_bg_height), pygame.SRCALPHA)
-                btn_bg.fill((*config.BG_LEVELS["ELEVATED"], 200))
+                btn_bg = get_panel((btn_bg_width, btn_bg_height), (*config.BG_LEVELS["ELEVATED"], 200))
                 screen.blit(btn_bg, btn_bg_rect)
                 pygame.draw.rect(screen, color, btn_bg_rect, 2, border_radius=6)
             else:
                 # 일반: 기본 배경
-                btn_bg = pygame.Surface((btn_bg_width, btn_bg_height), pygame.SRCALPHA)
-                btn_bg.fill((*config.BG_LEVELS["CARD"], 160))
+                btn_bg = get_panel((btn_bg_width, btn_bg_height), (*config.BG_LEVELS["CARD"], 160))
                 screen.blit(btn_bg, btn_bg_rect)
 
             # 버튼 텍스트
@@ -122,8 +118,9 @@ def draw_pause_and_over_screens(
         score_rect = score_text.get_rect(center=(center_x, menu_y + 130))
 
         # 점수 배경 - 통일된 색상
-        score_bg = pygame.Surface((score_text.get_width() + 50, score_text.get_height() + 25), pygame.SRCALPHA)
-        score_bg.fill((*config.BG_LEVELS["ELEVATED"], 180))
+        score_bg = get_panel(
+            (score_text.get_width() + 50, score_text.get_height() + 25), (*config.BG_LEVELS["ELEVATED"], 180)
+        )
         score_bg_rect = score_bg.get_rect(center=score_rect.center)
         screen.blit(score_bg, score_bg_rect)
         screen.blit(score_text, score_rect)
@@ -161,14 +158,12 @@ def draw_pause_and_over_screens(
             is_hovered = btn_bg_rect.collidepoint(mouse_pos)
             if is_hovered:
                 # 호버 시: 밝은 배경 + 테두리
-                btn_bg = pygame.Surface((btn_bg_width, btn_bg_height), pygame.SRCALPHA)
-                btn_bg.fill((*config.BG_LEVELS["ELEVATED"], 200))
+                btn_bg = get_panel((btn_bg_width, btn_bg_height), (*config.BG_LEVELS["ELEVATED"], 200))
                 screen.blit(btn_bg, btn_bg_rect)
                 pygame.draw.rect(screen, color, btn_bg_rect, 2, border_radius=6)
             else:
                 # 일반: 기본 배경
-                btn_bg = pygame.Surface((btn_bg_width, btn_bg_height), pygame.SRCALPHA)
-                btn_bg.fill((*config.BG_LEVELS["CARD"], 160))
+                btn_bg = get_panel((btn_bg_width, btn_bg_height), (*config.BG_LEVELS["CARD"], 160))
                 screen.blit(btn_bg, btn_bg_rect)
 
             # 버튼 텍스트
@@ -186,9 +181,7 @@ def draw_settings_menu(screen: pygame.Surface, screen_size: Tuple[int, int],
     center_y = SCREEN_HEIGHT // 2
 
     # 반투명 오버레이 - 통일된 색상
-    overlay = pygame.Surface(screen_size, pygame.SRCALPHA)
-    overlay.fill(config.UI_COLORS["OVERLAY"])
-    screen.blit(overlay, (0, 0))
+    screen.blit(get_overlay(screen_size, config.UI_COLORS["OVERLAY"]), (0, 0))
 
     # 메뉴 패널 크기
     panel_width = 700
@@ -197,8 +190,7 @@ def draw_settings_menu(screen: pygame.Surface, screen_size: Tuple[int, int],
     panel_y = center_y - panel_height // 2
 
     # 패널 배경 - 통일된 색상
-    panel_bg = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-    panel_bg.fill((*config.BG_LEVELS["PANEL"], 240))
+    panel_bg = get_panel((panel_width, panel_height), (*config.BG_LEVELS["PANEL"], 240))
     screen.blit(panel_bg, (panel_x, panel_y))
 
     # 타이틀 - 통일된 색상
@@ -222,8 +214,7 @@ def draw_settings_menu(screen: pygame.Surface, screen_size: Tuple[int, int],
     bgm_card_x = center_x - card_width // 2
 
     # 카드 배경 - 통일된 색상
-    card_surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
-    card_surface.fill((*config.BG_LEVELS["CARD"], 220))
+    card_surface = get_panel((card_width, card_height), (*config.BG_LEVELS["CARD"], 220))
     screen.blit(card_surface, (bgm_card_x, bgm_card_y))
 
     # 아이콘 및 라벨 - 통일된 색상
@@ -270,8 +261,7 @@ def draw_settings_menu(screen: pygame.Surface, screen_size: Tuple[int, int],
     sfx_card_x = center_x - card_width // 2
 
     # 카드 배경 - 통일된 색상
-    card_surface_sfx = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
-    card_surface_sfx.fill((*config.BG_LEVELS["CARD"], 220))
+    card_surface_sfx = get_panel((card_width, card_height), (*config.BG_LEVELS["CARD"], 220))
     screen.blit(card_surface_sfx, (sfx_card_x, sfx_card_y))
 
     # 아이콘 및 라벨 - 통일된 색상
@@ -347,8 +337,7 @@ def draw_death_effect_ui(screen: pygame.Surface, screen_size: Tuple[int, int],
     # UI 패널 배경 (화면 하단) - 통일된 색상
     panel_height = config.DEATH_EFFECT_UI_HEIGHT
     panel_rect = pygame.Rect(0, SCREEN_HEIGHT - panel_height, SCREEN_WIDTH, panel_height)
-    panel_surface = pygame.Surface((SCREEN_WIDTH, panel_height), pygame.SRCALPHA)
-    panel_surface.fill((*config.BG_LEVELS["PANEL"], 200))  # 반투명 어두운 배경
+    panel_surface = get_panel((SCREEN_WIDTH, panel_height), (*config.BG_LEVELS["PANEL"], 200))  # 반투명 어두운 배경
     screen.blit(panel_surface, panel_rect)
 
     # 제목 텍스트 - 통일된 색상
@@ -6,6 +6,7 @@ import time
 from typing import Tuple, Dict
 import config
 from .helpers import get_font, render_text_with_emoji
+from .surfaces import get_overlay, get_panel
 
 
 # =========================================================
@@ -23,9 +24,7 @@ def draw_shop_screen(
 ):
     """상점 화면을 그립니다. (영구 업그레이드) - 개선된 카드 스타일"""
     SCREEN_WIDTH, SCREEN_HEIGHT = screen_size
-    overlay = pygame.Surface(screen_size, pygame.SRCALPHA)
-    overlay.fill(config.UI_COLORS["OVERLAY"])
-    screen.blit(overlay, (0, 0))
+    screen.blit(get_overlay(screen_size, config.UI_COLORS["OVERLAY"]), (0, 0))
 
     center_x = SCREEN_WIDTH // 2
 
@@ -95,8 +94,7 @@ def draw_shop_screen(
 
         # 카드 배경
         card_bg_color = config.UI_COLORS["CARD_BG"] if can_afford else (40, 30, 30, 230)
-        card_surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
-        card_surface.fill(card_bg_color)
+        card_surface = get_panel((card_width, card_height), card_bg_color)
         screen.blit(card_surface, (card_x, card_y))
 
         # 왼쪽: 번호 박스
@@ -175,9 +173,7 @@ def draw_tactical_menu(
     통일된 색상 시스템 사용
     """
     SCREEN_WIDTH, SCREEN_HEIGHT = screen_size
-    overlay = pygame.Surface(screen_size, pygame.SRCALPHA)
-    overlay.fill(config.UI_COLORS["OVERLAY"])
-    screen.blit(overlay, (0, 0))
+    screen.blit(get_overlay(screen_size, config.UI_COLORS["OVERLAY"]), (0, 0))
 
     center_x = SCREEN_WIDTH // 2
 
@@ -243,11 +239,10 @@ def draw_tactical_menu(
         is_hovered = card_rect.collidepoint(mouse_pos)
 
         # 카드 배경 (반투명) - 통일된 색상 + 호버 효과
-        card_surface = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
         if is_hovered:
-            card_surface.fill((*config.BG_LEVELS["CARD"], 255))  # 호버시 더 밝게
+            card_surface = get_panel((card_width, card_height), (*config.BG_LEVELS["CARD"], 255))  # 호버시 더 밝게
         else:
-            card_surface.fill((*config.BG_LEVELS["CARD"], 220))
+            card_surface = get_panel((card_width, card_height), (*config.BG_LEVELS["CARD"], 220))
         screen.blit(card_surface, (card_x, card_y))
 
         # 호버시 테두리 추가
@@ -0,0 +1,140 @@
+# ui_render/surfaces.py
+# Cached overlay / panel / card surfaces for modal UI screens
+
+import pygame
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+import config
+
+
+Color = Tuple[int, ...]
+
+
+# =========================================================
+# 1. UI Surface LRU 캐시
+# =========================================================
+
+
+class SurfaceCache:
+    """
+    UI 배경 Surface LRU 캐시
+
+    오버레이/패널/카드처럼 (크기, 색상, 알파, 모서리, 테두리)만으로 결정되는 Surface를
+    한 번만 만들고 재사용합니다. 항목 수와 총 픽셀 메모리 두 상한을 넘으면
+    가장 오래 쓰지 않은 항목부터 버립니다.
+
+    반환된 Surface는 여러 화면이 공유하므로 그 위에 그리면 안 됩니다.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self._bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """key에 해당하는 Surface (없으면 build()로 생성 후 캐시)"""
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return surface
+
+        surface = build()
+        self.stats["misses"] += 1
+        self._entries[key] = surface
+        self._bytes += _surface_bytes(surface)
+
+        # 상한 초과 시 오래된 항목부터 제거 (방금 넣은 항목은 유지)
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= _surface_bytes(evicted)
+            self.stats["evictions"] += 1
+
+        return surface
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """hits / misses / evictions / entries / bytes"""
+        return {**self.stats, "entries": len(self._entries), "bytes": self._bytes}
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+_surface_cache: Optional[SurfaceCache] = None
+
+
+def get_surface_cache() -> SurfaceCache:
+    """전역 UI Surface 캐시 반환"""
+    global _surface_cache
+    if _surface_cache is None:
+        settings = config.UI_SURFACE_CACHE_SETTINGS
+        _surface_cache = SurfaceCache(settings["max_entries"], settings["max_bytes"])
+    return _surface_cache
+
+
+# =========================================================
+# 2. 캐시된 UI 기본 도형
+# =========================================================
+
+
+def get_overlay(size: Tuple[int, int], color: Color) -> pygame.Surface:
+    """화면 전체 반투명 오버레이 (color는 RGBA)"""
+    def build():
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill(color)
+        return overlay
+
+    return get_surface_cache().get(("overlay", tuple(size), tuple(color)), build)
+
+
+def get_panel(
+    size: Tuple[int, int],
+    color: Color,
+    radius: int = 0,
+    border: int = 0,
+    border_color: Optional[Color] = None,
+) -> pygame.Surface:
+    """
+    패널/카드/버튼 배경 (color는 RGB 또는 RGBA)
+
+    Args:
+        radius: 모서리 반경 (0이면 직사각형)
+        border: 테두리 두께 (0이면 없음)
+        border_color: 테두리 색상
+    """
+    def build():
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        rect = panel.get_rect()
+        if radius > 0:
+            pygame.draw.rect(panel, color, rect, border_radius=radius)
+        else:
+            panel.fill(color)
+        if border > 0 and border_color is not None:
+            pygame.draw.rect(panel, border_color, rect, border, border_radius=radius)
+        return panel
+
+    key = ("panel", tuple(size), tuple(color), radius, border, tuple(border_color) if border_color else None)
+    return get_surface_cache().get(key, build)
+
+
+def get_solid(size: Tuple[int, int], color: Color) -> pygame.Surface:
+    """
+    단색 불투명 Surface (페이드용 - 호출 측에서 blit 직전에 set_alpha)
+
+    같은 (크기, 색상)을 쓰는 화면끼리 공유하므로 매번 set_alpha로 알파를 지정해야 합니다.
+    """
+    def build():
+        solid = pygame.Surface(size)
+        solid.fill(color)
+        return solid
+
+    return get_surface_cache().get(("solid", tuple(size), tuple(color)), build)
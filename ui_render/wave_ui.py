@@ -6,6 +6,7 @@ import math
 from typing import Tuple, Dict
 import config
 from .helpers import get_font, render_text_with_emoji
+from .surfaces import get_overlay, get_panel
 
 
 # =========================================================
@@ -26,9 +27,7 @@ def draw_wave_prepare_screen(
     center_y = SCREEN_HEIGHT // 2
 
     # 반투명 배경 - 통일된 색상
-    overlay = pygame.Surface(screen_size, pygame.SRCALPHA)
-    overlay.fill(config.UI_COLORS["OVERLAY"])
-    screen.blit(overlay, (0, 0))
+    screen.blit(get_overlay(screen_size, config.UI_COLORS["OVERLAY"]), (0, 0))
 
     # 메인 패널 (크기 축소)
     panel_width = 500
@@ -37,8 +36,7 @@ def draw_wave_prepare_screen(
     panel_y = center_y - panel_height // 2
 
     # 패널 배경 - 통일된 색상
-    panel_bg = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-    panel_bg.fill((*config.BG_LEVELS["PANEL"], 240))
+    panel_bg = get_panel((panel_width, panel_height), (*config.BG_LEVELS["PANEL"], 240))
     screen.blit(panel_bg, (panel_x, panel_y))
 
     current_wave = game_data.get("current_wave", 1)
@@ -100,9 +98,7 @@ def draw_wave_clear_screen(
     center_y = SCREEN_HEIGHT // 2
 
     # 반투명 배경 - 통일된 색상
-    overlay = pygame.Surface(screen_size, pygame.SRCALPHA)
-    overlay.fill(config.UI_COLORS["OVERLAY"])
-    screen.blit(overlay, (0, 0))
+    screen.blit(get_overlay(screen_size, config.UI_COLORS["OVERLAY"]), (0, 0))
 
     # 메인 패널 (크기 축소)
     panel_width = 450
@@ -111,8 +107,7 @@ def draw_wave_clear_screen(
     panel_y = center_y - panel_height // 2
 
     # 패널 배경 - 통일된 색상 (성공 컬러 틴트)
-    panel_bg = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-    panel_bg.fill((*config.STATE_COLORS["SUCCESS_DIM"], 240))
+    panel_bg = get_panel((panel_width, panel_height), (*config.STATE_COLORS["SUCCESS_DIM"], 240))
     screen.blit(panel_bg, (panel_x, panel_y))
 
     current_wave = game_data.get("current_wave", 1)
@@ -200,9 +195,7 @@ def draw_victory_screen(
     center_y = SCREEN_HEIGHT // 2
 
     # 반투명 오버레이 - 통일된 색상
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill(config.UI_COLORS["OVERLAY"])
-    screen.blit(overlay, (0, 0))
+    screen.blit(get_overlay((SCREEN_WIDTH, SCREEN_HEIGHT), config.UI_COLORS["OVERLAY"]), (0, 0))
 
     # 메인 패널 (다른 화면과 통일감 있는 크기)
     panel_width = 550
@@ -211,9 +204,10 @@ def draw_victory_screen(
     panel_y = center_y - panel_height // 2
 
     # 패널 배경 - 통일된 색상 (성공 컬러 틴트)
-    panel_bg = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-    panel_bg.fill((*config.STATE_COLORS["SUCCESS_DIM"], 240))
-    pygame.draw.rect(panel_bg, config.STATE_COLORS["SUCCESS"], (0, 0, panel_width, panel_height), 3)
+    panel_bg = get_panel(
+        (panel_width, panel_height), (*config.STATE_COLORS["SUCCESS_DIM"], 240),
+        border=3, border_color=config.STATE_COLORS["SUCCESS"],
+    )
     screen.blit(panel_bg, (panel_x, panel_y))
 
     # VICTORY 타이틀 (크기 축소) - 통일된 색상
@@ -291,8 +285,7 @@ def draw_victory_screen(
     base_button_x = center_x - base_button_width // 2
 
     # 버튼 배경 (초록색 강조)
-    base_btn_surface = pygame.Surface((base_button_width, base_button_height), pygame.SRCALPHA)
-    base_btn_surface.fill((*config.STATE_COLORS["SUCCESS_DIM"], 200))
+    base_btn_surface = get_panel((base_button_width, base_button_height), (*config.STATE_COLORS["SUCCESS_DIM"], 200))
     screen.blit(base_btn_surface, (base_button_x, base_button_y))
     pygame.draw.rect(screen, config.STATE_COLORS["SUCCESS"],
                     (base_button_x, base_button_y, base_button_width, base_button_height), 3, border_radius=8)
@@ -356,10 +349,10 @@ def draw_boss_clear_choice(
     choice_y = 30
 
     # 반투명 배경
-    choice_bg = pygame.Surface((choice_width, choice_height), pygame.SRCALPHA)
-    choice_bg.fill((*config.STATE_COLORS["SUCCESS_DIM"], 220))
-    pygame.draw.rect(choice_bg, config.STATE_COLORS["SUCCESS"],
-                    (0, 0, choice_width, choice_height), 3, border_radius=8)
+    choice_bg = get_panel(
+        (choice_width, choice_height), (*config.STATE_COLORS["SUCCESS_DIM"], 220),
+        radius=8, border=3, border_color=config.STATE_COLORS["SUCCESS"],
+    )
     screen.blit(choice_bg, (choice_x, choice_y))
 
     # 타이틀
@@ -386,8 +379,7 @@ def draw_boss_clear_choice(
     is_continue_hover = continue_rect.collidepoint(mouse_pos)
 
     continue_color = config.STATE_COLORS["SUCCESS"] if is_continue_hover else (*config.STATE_COLORS["SUCCESS_DIM"], 180)
-    continue_surface = pygame.Surface((button_width, button_height), pygame.SRCALPHA)
-    continue_surface.fill(continue_color)
+    continue_surface = get_panel((button_width, button_height), continue_color)
     screen.blit(continue_surface, (button_x, continue_y))
     pygame.draw.rect(screen, config.STATE_COLORS["SUCCESS"],
                     (button_x, continue_y, button_width, button_height), 2, border_radius=6)
@@ -404,8 +396,7 @@ def draw_boss_clear_choice(
     is_return_hover = return_rect.collidepoint(mouse_pos)
 
     return_color = config.STATE_COLORS["WARNING"] if is_return_hover else (*config.STATE_COLORS["WARNING_DIM"], 180)
-    return_surface = pygame.Surface((button_width, button_height), pygame.SRCALPHA)
-    return_surface.fill(return_color)
+    return_surface = get_panel((button_width, button_height), return_color)
     screen.blit(return_surface, (button_x, return_y))
     pygame.draw.rect(screen, config.STATE_COLORS["WARNING"],
                     (button_x, return_y, button_width, button_height), 2, border_radius=6)
@@ -5,6 +5,7 @@ VFX Editor - 이미지 효과 제작 툴
 
 import pygame
 import pygame_gui
+import os
 import sys
 import json
 from pathlib import Path
@@ -357,9 +358,11 @@ class VFXEditor:
             "description": f"Created with VFX Editor"
         }
 
-        # JSON 저장
-        with open(json_path, 'w', encoding='utf-8') as f:
+        # JSON 저장 (임시 파일에 쓴 뒤 교체 - 게임의 핫 리로드가 반쯤 쓴 파일을 읽지 않도록)
+        tmp_path = json_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(config, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, json_path)
 
         print(f"\n✓ Configuration saved!")
         print(f"  Category: {category}")